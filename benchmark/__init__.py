@@ -0,0 +1 @@
+"""Benchmarks of jacoco_summary on synthetic JaCoCo reports."""
@@ -0,0 +1,307 @@
+"""Generate synthetic JaCoCo xml reports.
+
+The reports have the layout of the ones written by JaCoCo: a DOCTYPE, a
+sessioninfo element, and packages made of classes with methods, then source
+files with lines, every element ending with counters consistent with its
+content. The same arguments always generate the same report.
+
+Usage:
+    python -m benchmark.report_generator OUTPUT [--packages N] [--classes N]
+        [--methods N] [--lines N] [--seed N]
+"""
+
+from __future__ import annotations
+
+import argparse
+from random import Random
+import sys
+from typing import TextIO
+
+from jacoco_summary.counter_type import CounterType
+
+
+XML_HEADER: str = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<!DOCTYPE report PUBLIC "-//JACOCO//DTD Report 1.1//EN" "report.dtd">'
+)
+COUNTER_TYPES: tuple[CounterType, ...] = (
+    CounterType.INSTRUCTION,
+    CounterType.BRANCH,
+    CounterType.LINE,
+    CounterType.COMPLEXITY,
+    CounterType.METHOD,
+    CounterType.CLASS,
+)
+BRANCH_PROBABILITY: float = 0.25
+MAX_LINE_INSTRUCTIONS: int = 6
+
+
+class Counters:
+    '''Missed and covered counts of each counter type of an element.'''
+
+    __slots__ = ('missed', 'covered')
+
+    def __init__(self) -> None:
+        self.missed: dict[CounterType, int] = dict.fromkeys(COUNTER_TYPES, 0)
+        self.covered: dict[CounterType, int] = dict.fromkeys(COUNTER_TYPES, 0)
+
+    def add(self, counter_type: CounterType, missed: int, covered: int
+            ) -> None:
+        self.missed[counter_type] += missed
+        self.covered[counter_type] += covered
+
+    def add_counters(self, other: Counters) -> None:
+        for counter_type in COUNTER_TYPES:
+            self.add(counter_type, other.missed[counter_type],
+                     other.covered[counter_type])
+
+    def to_xml(self) -> str:
+        """Return the counter elements, the empty counters being omitted like
+        JaCoCo does."""
+        return ''.join(
+            f'<counter type="{counter_type.value}"'
+            f' missed="{self.missed[counter_type]}"'
+            f' covered="{self.covered[counter_type]}"/>'
+            for counter_type in COUNTER_TYPES
+            if self.missed[counter_type] or self.covered[counter_type]
+        )
+
+
+class ReportGenerator:
+    '''Generator of a synthetic JaCoCo report.
+
+    Each class gets its own coverage ratio, so the report mixes covered,
+    partially covered and missed classes.
+    '''
+
+    def __init__(
+        self,
+        packages: int = 10,
+        classes: int = 10,
+        methods: int = 5,
+        lines: int = 4,
+        seed: int = 0,
+    ) -> None:
+        """
+        Args:
+            packages: the number of packages
+            classes: the number of classes per package
+            methods: the number of methods per class
+            lines: the number of lines per method
+            seed: the seed of the random generator
+        """
+        self.packages = packages
+        self.classes = classes
+        self.methods = methods
+        self.lines = lines
+        self.seed = seed
+        self.random = Random(seed)
+
+    @staticmethod
+    def get_package_name(package_index: int) -> str:
+        return f'com/example/p{package_index}'
+
+    @staticmethod
+    def get_class_file_name(class_index: int) -> str:
+        return f'Class{class_index}.java'
+
+    @classmethod
+    def get_class_name(cls, package_index: int, class_index: int) -> str:
+        return f'{cls.get_package_name(package_index)}/Class{class_index}'
+
+    @staticmethod
+    def get_method_name(method_index: int) -> str:
+        if method_index == 0:
+            return '&lt;init&gt;'
+        return f'method{method_index}'
+
+    def get_method_first_line(self, method_index: int) -> int:
+        return 3 + method_index * (self.lines + 2)
+
+    def write(self, file: TextIO) -> None:
+        """Write the report in a file.
+
+        Args:
+            file: the file to write the report in
+        """
+        self.random.seed(self.seed)
+        report_counters = Counters()
+        file.write(XML_HEADER)
+        file.write(
+            f'<report name="benchmark-{self.seed}">'
+            f'<sessioninfo id="benchmark-{self.seed}" start="0" dump="1"/>'
+        )
+        for package_index in range(self.packages):
+            package_counters = Counters()
+            file.write(self.generate_package(package_index, package_counters))
+            report_counters.add_counters(package_counters)
+        file.write(f'{report_counters.to_xml()}</report>')
+
+    def write_diff(self, file: TextIO, class_step: int = 10) -> None:
+        """Write a unified diff adding the lines of the first method of some
+        classes of the report.
+
+        Args:
+            file: the file to write the diff in
+            class_step: the diff changes one class out of this number of
+                classes of each package
+        """
+        first_line = self.get_method_first_line(0)
+        for package_index in range(self.packages):
+            for class_index in range(0, self.classes, class_step):
+                path = (
+                    f'src/main/java/{self.get_package_name(package_index)}/'
+                    f'{self.get_class_file_name(class_index)}'
+                )
+                file.write(
+                    f'--- a/{path}\n'
+                    f'+++ b/{path}\n'
+                    f'@@ -{first_line - 1},0 +{first_line},{self.lines} @@\n'
+                )
+                for line_number in range(first_line,
+                                         first_line + self.lines):
+                    file.write(f'+    line {line_number}\n')
+
+    def generate_package(self, package_index: int, counters: Counters) -> str:
+        """Return a package element and add its counters.
+
+        Args:
+            package_index: the index of the package in the report
+            counters: the counters to add the package counters to
+        """
+        classes: list[str] = []
+        source_files: list[str] = []
+        for class_index in range(self.classes):
+            class_counters = Counters()
+            class_xml, lines_xml = self.generate_class(package_index,
+                                                       class_index,
+                                                       class_counters)
+            counters_xml = class_counters.to_xml()
+            classes.append(f'{class_xml}{counters_xml}</class>')
+            source_files.append(
+                f'<sourcefile name="{self.get_class_file_name(class_index)}">'
+                f'{lines_xml}{counters_xml}</sourcefile>'
+            )
+            counters.add_counters(class_counters)
+        return (
+            f'<package name="{self.get_package_name(package_index)}">'
+            + ''.join(classes)
+            + ''.join(source_files)
+            + counters.to_xml()
+            + '</package>'
+        )
+
+    def generate_class(self, package_index: int, class_index: int,
+                       counters: Counters) -> tuple[str, str]:
+        """Return a class element without its counters and closing tag, and
+        the line elements of its source file, and add the class counters.
+
+        Args:
+            package_index: the index of the package of the class
+            class_index: the index of the class in the package
+            counters: the counters to add the class counters to
+        """
+        coverage_ratio = self.random.random()
+        methods: list[str] = [
+            f'<class name="{self.get_class_name(package_index, class_index)}"'
+            f' sourcefilename="{self.get_class_file_name(class_index)}">'
+        ]
+        lines: list[str] = []
+        for method_index in range(self.methods):
+            method_counters = Counters()
+            first_line = self.get_method_first_line(method_index)
+            self.generate_lines(first_line, coverage_ratio, lines,
+                                method_counters)
+            methods.append(
+                f'<method name="{self.get_method_name(method_index)}"'
+                f' desc="()V" line="{first_line}">'
+                f'{method_counters.to_xml()}</method>'
+            )
+            counters.add_counters(method_counters)
+
+        if counters.covered[CounterType.METHOD]:
+            counters.add(CounterType.CLASS, 0, 1)
+        else:
+            counters.add(CounterType.CLASS, 1, 0)
+        return ''.join(methods), ''.join(lines)
+
+    def generate_lines(self, first_line: int, coverage_ratio: float,
+                       lines: list[str], counters: Counters) -> None:
+        """Append the line elements of a method and add the method counters.
+
+        Args:
+            first_line: the number of the first line of the method
+            coverage_ratio: the probability of a line to be covered
+            lines: the list to append the line elements to
+            counters: the counters to add the method counters to
+        """
+        for line_number in range(first_line, first_line + self.lines):
+            instructions = self.random.randint(1, MAX_LINE_INSTRUCTIONS)
+            branches = 0
+            if self.random.random() < BRANCH_PROBABILITY:
+                branches = 2
+            if self.random.random() < coverage_ratio:
+                missed_instructions, covered_instructions = 0, instructions
+                covered_branches = self.random.randint(0, branches)
+                counters.add(CounterType.LINE, 0, 1)
+            else:
+                missed_instructions, covered_instructions = instructions, 0
+                covered_branches = 0
+                counters.add(CounterType.LINE, 1, 0)
+            missed_branches = branches - covered_branches
+            counters.add(CounterType.INSTRUCTION, missed_instructions,
+                         covered_instructions)
+            counters.add(CounterType.BRANCH, missed_branches, covered_branches)
+            lines.append(
+                f'<line nr="{line_number}" mi="{missed_instructions}"'
+                f' ci="{covered_instructions}" mb="{missed_branches}"'
+                f' cb="{covered_branches}"/>'
+            )
+
+        complexity = (
+            counters.missed[CounterType.BRANCH]
+            + counters.covered[CounterType.BRANCH]
+        ) // 2 + 1
+        if counters.covered[CounterType.INSTRUCTION]:
+            missed_complexity = counters.missed[CounterType.BRANCH] // 2
+            counters.add(CounterType.METHOD, 0, 1)
+        else:
+            missed_complexity = complexity
+            counters.add(CounterType.METHOD, 1, 0)
+        counters.add(CounterType.COMPLEXITY, missed_complexity,
+                     complexity - missed_complexity)
+
+
+def main(args: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmark.report_generator',
+        description='Generate a synthetic JaCoCo xml report.'
+    )
+    parser.add_argument('output', metavar='OUTPUT',
+                        help='the path of the report to write')
+    parser.add_argument('--packages', metavar='N', type=int, default=10,
+                        help='the number of packages')
+    parser.add_argument('--classes', metavar='N', type=int, default=10,
+                        help='the number of classes per package')
+    parser.add_argument('--methods', metavar='N', type=int, default=5,
+                        help='the number of methods per class')
+    parser.add_argument('--lines', metavar='N', type=int, default=4,
+                        help='the number of lines per method')
+    parser.add_argument('--seed', metavar='N', type=int, default=0,
+                        help='the seed of the random generator')
+    parsed_args = parser.parse_args(args)
+
+    output: str = parsed_args.output
+    packages: int = parsed_args.packages
+    classes: int = parsed_args.classes
+    methods: int = parsed_args.methods
+    lines: int = parsed_args.lines
+    seed: int = parsed_args.seed
+    generator = ReportGenerator(packages, classes, methods, lines, seed)
+    with open(output, 'w', encoding='utf-8') as file:
+        generator.write(file)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,339 @@
+"""Check the startup of the command line interface against a budget.
+
+Each scenario runs the command line in a new process with -X importtime, on
+the small report of the tests, and measures the time of the process, the
+time spent importing modules and the set of imported modules, without those
+imported by an empty interpreter. A scenario exceeds its budget when it
+imports a module missing from the budget, or when one of its times is more
+than the tolerance times the recorded one.
+
+Usage:
+    python -m benchmark.startup [--record] [--budget FILE] [--repeat N]
+        [--tolerance RATIO]
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Iterator
+from contextlib import contextmanager
+import json
+import os
+import platform
+import signal
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+import time
+
+from jacoco_summary.table import print_table
+
+from .suite import PROJECT_DIRECTORY, format_ratio
+
+
+BUDGET_PATH: str = os.path.join(PROJECT_DIRECTORY, 'benchmark',
+                                'startup-budget.json')
+REPORT_PATH: str = os.path.join(PROJECT_DIRECTORY, 'test', 'jacoco.xml')
+DEFAULT_REPEAT: int = 5
+DEFAULT_TOLERANCE: float = 1.5
+SERVER_START_TIMEOUT: float = 10
+IMPORT_TIME_PREFIX: str = 'import time:'
+CLASS_ARGS: list[str] = ['--file', REPORT_PATH, 'class', 'test1.Class1']
+# The scenarios run with a server answering the queries.
+SERVED_SCENARIOS: tuple[str, ...] = ('class-served',)
+SCENARIOS: dict[str, list[str]] = {
+    'version': ['--version'],
+    'help': ['--help'],
+    'package-list': ['--file', REPORT_PATH, '--no-cache', 'package',
+                     '--list-packages'],
+    'class': ['--file', REPORT_PATH, '--no-cache', 'class', 'test1.Class1'],
+    'class-cached': CLASS_ARGS,
+    'class-served': CLASS_ARGS,
+}
+
+
+class StartupMeasure:
+    '''Startup time and imported modules of a scenario.'''
+
+    __slots__ = ('seconds', 'import_seconds', 'modules')
+
+    def __init__(self, seconds: float, import_seconds: float,
+                 modules: list[str]) -> None:
+        """
+        Args:
+            seconds: the time of the process
+            import_seconds: the time spent importing the modules
+            modules: the sorted names of the imported modules
+        """
+        self.seconds = seconds
+        self.import_seconds = import_seconds
+        self.modules = modules
+
+    def to_json(self) -> dict[str, float | list[str]]:
+        return {
+            'seconds': self.seconds,
+            'import_seconds': self.import_seconds,
+            'modules': self.modules,
+        }
+
+    @classmethod
+    def from_json(cls, measure: object) -> StartupMeasure:
+        """Build a measure from its decoded JSON object.
+
+        Raises:
+            ValueError: if the object is not a valid measure
+        """
+        if not isinstance(measure, dict):
+            raise ValueError(f'invalid startup measure: {measure!r}')
+        seconds: object = measure.get('seconds')
+        import_seconds: object = measure.get('import_seconds')
+        modules: object = measure.get('modules')
+        if (not isinstance(seconds, (int, float))
+                or not isinstance(import_seconds, (int, float))
+                or not isinstance(modules, list)):
+            raise ValueError(f'invalid startup measure: {measure!r}')
+        names: list[object] = modules
+        module_names = [name for name in names if isinstance(name, str)]
+        if len(module_names) != len(names):
+            raise ValueError(f'invalid startup measure: {measure!r}')
+        return cls(seconds, import_seconds, module_names)
+
+
+def parse_import_times(output: str) -> dict[str, int]:
+    """Return the self import time of each module, in microseconds, from the
+    output of -X importtime."""
+    import_times: dict[str, int] = {}
+    for line in output.splitlines():
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        fields = line[len(IMPORT_TIME_PREFIX):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # the header of the output
+            continue
+        import_times[fields[2].strip()] = int(fields[0])
+    return import_times
+
+
+def run_with_import_times(args: list[str], environment: dict[str, str]
+                          ) -> tuple[float, dict[str, int]]:
+    """Run the python interpreter with -X importtime.
+
+    Args:
+        args: the arguments of the interpreter after -X importtime
+        environment: the environment of the process
+
+    Returns:
+        the time of the process and the import time of each module
+    """
+    command = [sys.executable, '-X', 'importtime', *args]
+    start = time.perf_counter()
+    process = subprocess.run(command, env=environment, check=True,
+                             stdout=subprocess.DEVNULL,
+                             stderr=subprocess.PIPE, text=True)
+    seconds = time.perf_counter() - start
+    return seconds, parse_import_times(process.stderr)
+
+
+def measure_scenario(args: list[str], environment: dict[str, str],
+                     repeat: int) -> StartupMeasure:
+    """Run the command line several times and keep the fastest run.
+
+    A first run, not measured, fills the caches of the parsed reports and of
+    the compiled modules. The modules imported by an empty interpreter are
+    not counted.
+    """
+    _, interpreter_modules = run_with_import_times(['-c', 'pass'],
+                                                   environment)
+    run_with_import_times(['-m', 'jacoco_summary', *args], environment)
+    best: StartupMeasure | None = None
+    for _ in range(repeat):
+        seconds, import_times = run_with_import_times(
+            ['-m', 'jacoco_summary', *args],
+            environment
+        )
+        modules = sorted(set(import_times) - set(interpreter_modules))
+        import_seconds = sum(import_times[name] for name in modules) / 1e6
+        if best is None or seconds < best.seconds:
+            best = StartupMeasure(seconds, import_seconds, modules)
+    assert best is not None, 'repeat must be positive'
+    return best
+
+
+@contextmanager
+def run_server(environment: dict[str, str]) -> Iterator[None]:
+    """Run a server on the report of the tests while in the context.
+
+    Raises:
+        RuntimeError: if the server doesn't start
+    """
+    socket_path = os.path.join(environment['XDG_RUNTIME_DIR'],
+                               'jacoco-summary.sock')
+    command = [sys.executable, '-m', 'jacoco_summary', '--file', REPORT_PATH,
+               'serve']
+    with subprocess.Popen(command, env=environment,
+                          stdout=subprocess.DEVNULL) as process:
+        try:
+            deadline = time.monotonic() + SERVER_START_TIMEOUT
+            while not os.path.exists(socket_path):
+                if time.monotonic() > deadline or process.poll() is not None:
+                    raise RuntimeError('the server did not start')
+                time.sleep(0.01)
+            yield
+        finally:
+            process.send_signal(signal.SIGINT)
+            process.wait()
+
+
+def get_environment(directory: str) -> dict[str, str]:
+    """Return the environment of the measured processes, with their cache
+    and runtime directories in a directory."""
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(
+        path
+        for path in (PROJECT_DIRECTORY, environment.get('PYTHONPATH'))
+        if path
+    )
+    environment['XDG_CACHE_HOME'] = os.path.join(directory, 'cache')
+    environment['XDG_RUNTIME_DIR'] = os.path.join(directory, 'run')
+    return environment
+
+
+def measure_startup(repeat: int) -> dict[str, StartupMeasure]:
+    """Measure each scenario, in an environment with its own cache and
+    runtime directories."""
+    measures: dict[str, StartupMeasure] = {}
+    with TemporaryDirectory() as directory:
+        environment = get_environment(directory)
+        for name, args in SCENARIOS.items():
+            if name in SERVED_SCENARIOS:
+                with run_server(environment):
+                    measures[name] = measure_scenario(args, environment,
+                                                      repeat)
+            else:
+                measures[name] = measure_scenario(args, environment, repeat)
+    return measures
+
+
+def check_measure(measure: StartupMeasure, budget: StartupMeasure,
+                  tolerance: float) -> list[str]:
+    """Return the reasons why a measure exceeds its budget, empty if it
+    doesn't."""
+    reasons: list[str] = []
+    new_modules = sorted(set(measure.modules) - set(budget.modules))
+    if new_modules:
+        reasons.append('new modules: ' + ', '.join(new_modules))
+    if measure.seconds > budget.seconds * tolerance:
+        reasons.append(f'time {format_ratio(measure.seconds, budget.seconds)}'
+                       ' the budget')
+    if measure.import_seconds > budget.import_seconds * tolerance:
+        ratio = format_ratio(measure.import_seconds, budget.import_seconds)
+        reasons.append(f'import time {ratio} the budget')
+    return reasons
+
+
+def read_budget(path: str) -> dict[str, StartupMeasure]:
+    """Read the budget of each scenario.
+
+    Raises:
+        ValueError: if the file doesn't contain a budget
+    """
+    with open(path, encoding='utf-8') as budget_file:
+        content: object = json.load(budget_file)
+    if not isinstance(content, dict):
+        raise ValueError(f'{path}: invalid startup budget')
+    scenarios: object = content.get('scenarios')
+    if not isinstance(scenarios, dict):
+        raise ValueError(f'{path}: invalid startup budget')
+    budget: dict[str, StartupMeasure] = {}
+    for name in SCENARIOS:
+        measure: object = scenarios.get(name)
+        if measure is not None:
+            budget[name] = StartupMeasure.from_json(measure)
+    return budget
+
+
+def write_budget(path: str, measures: dict[str, StartupMeasure]) -> None:
+    content: dict[str, object] = {
+        'python': platform.python_version(),
+        'scenarios': {
+            name: measure.to_json() for name, measure in measures.items()
+        },
+    }
+    with open(path, 'w', encoding='utf-8') as budget_file:
+        json.dump(content, budget_file, indent=2)
+        budget_file.write('\n')
+
+
+def print_measures(measures: dict[str, StartupMeasure],
+                   budget: dict[str, StartupMeasure]) -> None:
+    tab: list[list[str]] = [
+        ['Scenario', 'Time', 'Import time', 'Modules', 'Time ratio',
+         'Import time ratio'],
+    ]
+    for name, measure in measures.items():
+        line: list[str] = [
+            name,
+            f'{measure.seconds * 1000:.1f}ms',
+            f'{measure.import_seconds * 1000:.1f}ms',
+            str(len(measure.modules)),
+        ]
+        scenario_budget = budget.get(name)
+        if scenario_budget is None:
+            line += ['n/a', 'n/a']
+        else:
+            line += [
+                format_ratio(measure.seconds, scenario_budget.seconds),
+                format_ratio(measure.import_seconds,
+                             scenario_budget.import_seconds),
+            ]
+        tab.append(line)
+    print_table(tab)
+
+
+def main(args: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmark.startup',
+        description='Check the startup of the command line interface against '
+                    'a budget.'
+    )
+    parser.add_argument('--record', action='store_true',
+                        help='save the measures as the new budget')
+    parser.add_argument('--budget', metavar='FILE', default=BUDGET_PATH,
+                        help='the file of the budget')
+    parser.add_argument('--repeat', metavar='N', type=int,
+                        default=DEFAULT_REPEAT,
+                        help='the number of runs of each scenario, the '
+                             'fastest one being kept')
+    parser.add_argument('--tolerance', metavar='RATIO', type=float,
+                        default=DEFAULT_TOLERANCE,
+                        help='the ratio of the budgeted times above which a '
+                             'scenario fails')
+    parsed_args = parser.parse_args(args)
+    record: bool = parsed_args.record
+    budget_path: str = parsed_args.budget
+    repeat: int = parsed_args.repeat
+    tolerance: float = parsed_args.tolerance
+
+    measures = measure_startup(repeat)
+    if record:
+        write_budget(budget_path, measures)
+        print_measures(measures, {})
+        return 0
+
+    budget = read_budget(budget_path)
+    print_measures(measures, budget)
+    status = 0
+    for name, measure in measures.items():
+        scenario_budget = budget.get(name)
+        if scenario_budget is None:
+            print(f'{name}: no budget', file=sys.stderr)
+            status = 1
+            continue
+        for reason in check_measure(measure, scenario_budget, tolerance):
+            print(f'{name}: {reason}', file=sys.stderr)
+            status = 1
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,355 @@
+"""Benchmark jacoco_summary on synthetic reports of increasing size.
+
+For each size, a report is generated and the following steps are measured:
+loading it with Report.from_xml_file, building the table of its classes with
+generate_table, rendering that table with print_table, then running each
+subcommand end to end in a new process, with a generated diff and a baseline
+report for the diff and compare subcommands. The results are saved as JSON
+and can be compared with the results of another commit.
+
+Usage:
+    python -m benchmark.suite [--sizes N [N ...]] [--output FILE]
+        [--compare FILE] [--directory DIR]
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from contextlib import redirect_stdout
+from datetime import datetime, timezone
+import json
+import os
+import platform
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+import time
+import tracemalloc
+from typing import TypeVar
+
+from jacoco_summary.config import COLUMNS_ORDER
+from jacoco_summary.report import Report
+from jacoco_summary.table import generate_table, print_table
+
+from .report_generator import ReportGenerator
+
+
+T = TypeVar('T')
+
+DEFAULT_SIZES: list[int] = [10_000, 100_000, 1_000_000]
+CLASSES_PER_PACKAGE: int = 100
+PROJECT_DIRECTORY: str = os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))
+)
+# The arguments of each measured command line, where {diff} and {baseline}
+# are replaced by the paths of the generated diff and baseline report.
+SUBCOMMANDS: dict[str, list[str]] = {
+    'default': [],
+    'package': ['package', 'com.example.p0'],
+    'package-list': ['package', '--list-packages'],
+    'class': ['class', 'com.example.p0.Class0'],
+    'file': ['file'],
+    'file-list': ['file', '--list-files'],
+    'lines': ['lines', 'com/example/p0/Class0.java'],
+    'diff': ['diff', '{diff}'],
+    'compare': ['compare', '{baseline}'],
+    'summary': ['summary'],
+    'tree': ['tree'],
+    'tree-depth': ['tree', '--depth', '2'],
+}
+# The seed of the baseline report, whose classes get other coverage ratios.
+BASELINE_SEED: int = 1
+
+
+class BenchmarkResult:
+    '''Measure of a step of the benchmark on a report size.'''
+
+    __slots__ = ('classes', 'step', 'seconds', 'peak_memory')
+
+    def __init__(self, classes: int, step: str, seconds: float,
+                 peak_memory: int) -> None:
+        """
+        Args:
+            classes: the number of classes of the report
+            step: the name of the measured step
+            seconds: the time taken by the step
+            peak_memory: the peak of memory used by the step, in bytes, this
+                is the peak of Python allocations for the steps run in this
+                process and the maximum resident set size for the subcommands
+        """
+        self.classes = classes
+        self.step = step
+        self.seconds = seconds
+        self.peak_memory = peak_memory
+
+    def to_json(self) -> dict[str, int | float | str]:
+        return {
+            'classes': self.classes,
+            'step': self.step,
+            'seconds': self.seconds,
+            'peak_memory': self.peak_memory,
+        }
+
+    @classmethod
+    def from_json(cls, result: object) -> BenchmarkResult:
+        """Build a result from its decoded JSON object.
+
+        Raises:
+            ValueError: if the object is not a valid result
+        """
+        if not isinstance(result, dict):
+            raise ValueError(f'invalid benchmark result: {result!r}')
+        classes: object = result.get('classes')
+        step: object = result.get('step')
+        seconds: object = result.get('seconds')
+        peak_memory: object = result.get('peak_memory')
+        if (not isinstance(classes, int) or not isinstance(step, str)
+                or not isinstance(seconds, (int, float))
+                or not isinstance(peak_memory, int)):
+            raise ValueError(f'invalid benchmark result: {result!r}')
+        return cls(classes, step, seconds, peak_memory)
+
+
+def get_commit() -> str | None:
+    """Return the current commit of the project, if it's a git repository."""
+    try:
+        process = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=PROJECT_DIRECTORY,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return process.stdout.strip()
+
+
+def measure(function: Callable[[], T]) -> tuple[float, int, T]:
+    """Run a function twice, to measure its time without tracing the memory,
+    then its peak of memory allocated in Python.
+
+    Returns:
+        the time in seconds, the memory peak in bytes, and the value returned
+        by the function
+    """
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        value = function()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak_memory, value
+
+
+def measure_subcommand(report_path: str, args: list[str]
+                       ) -> tuple[float, int]:
+    """Run the command line in a new process on a report.
+
+    Returns:
+        the time in seconds and the maximum resident set size in bytes
+    """
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join(
+        path
+        for path in (PROJECT_DIRECTORY, environment.get('PYTHONPATH'))
+        if path
+    )
+    command = [sys.executable, '-m', 'jacoco_summary', '--file', report_path,
+               '--no-cache', '--jobs', '1', *args]
+    start = time.perf_counter()
+    with subprocess.Popen(command, env=environment,
+                          stdout=subprocess.DEVNULL) as process:
+        _, status, resource_usage = os.wait4(process.pid, 0)
+        process.returncode = os.waitstatus_to_exitcode(status)
+    seconds = time.perf_counter() - start
+    if process.returncode != 0:
+        raise subprocess.CalledProcessError(process.returncode, command)
+    # ru_maxrss is in kibibytes on Linux
+    return seconds, resource_usage.ru_maxrss * 1024
+
+
+def run_size(classes: int, directory: str) -> list[BenchmarkResult]:
+    """Run the benchmark on a report with a number of classes.
+
+    Args:
+        classes: the number of classes of the report
+        directory: the directory to write the report in
+    """
+    results: list[BenchmarkResult] = []
+    report_path = os.path.join(directory, f'jacoco-{classes}.xml')
+    generator = ReportGenerator(
+        packages=max(1, classes // CLASSES_PER_PACKAGE),
+        classes=min(classes, CLASSES_PER_PACKAGE)
+    )
+    with open(report_path, 'w', encoding='utf-8') as report_file:
+        generator.write(report_file)
+    inputs: dict[str, str] = {
+        'diff': os.path.join(directory, f'changes-{classes}.diff'),
+        'baseline': os.path.join(directory, f'baseline-{classes}.xml'),
+    }
+    with open(inputs['diff'], 'w', encoding='utf-8') as diff_file:
+        generator.write_diff(diff_file)
+    baseline_generator = ReportGenerator(
+        packages=generator.packages,
+        classes=generator.classes,
+        seed=BASELINE_SEED
+    )
+    with open(inputs['baseline'], 'w', encoding='utf-8') as baseline_file:
+        baseline_generator.write(baseline_file)
+
+    def load() -> Report:
+        return Report.from_xml_file(report_path)
+
+    seconds, peak_memory, report = measure(load)
+    results.append(
+        BenchmarkResult(classes, 'from_xml_file', seconds, peak_memory)
+    )
+
+    def build_table() -> list[list[str]]:
+        return generate_table(report.get_classes(), COLUMNS_ORDER)
+
+    seconds, peak_memory, tab = measure(build_table)
+    results.append(
+        BenchmarkResult(classes, 'generate_table', seconds, peak_memory)
+    )
+
+    def render_table() -> None:
+        with open(os.devnull, 'w', encoding='utf-8') as devnull:
+            with redirect_stdout(devnull):
+                print_table(tab)
+
+    render_measure: tuple[float, int, None] = measure(render_table)
+    seconds, peak_memory, _ = render_measure
+    results.append(
+        BenchmarkResult(classes, 'print_table', seconds, peak_memory)
+    )
+    del report, tab
+
+    for name, args in SUBCOMMANDS.items():
+        seconds, peak_memory = measure_subcommand(
+            report_path,
+            [arg.format(**inputs) for arg in args]
+        )
+        results.append(
+            BenchmarkResult(classes, f'cli {name}', seconds, peak_memory)
+        )
+
+    os.remove(report_path)
+    for input_path in inputs.values():
+        os.remove(input_path)
+    return results
+
+
+def read_results(path: str) -> list[BenchmarkResult]:
+    """Read the results saved by a previous run.
+
+    Raises:
+        ValueError: if the file doesn't contain benchmark results
+    """
+    with open(path, encoding='utf-8') as results_file:
+        content: object = json.load(results_file)
+    if not isinstance(content, dict):
+        raise ValueError(f'{path}: invalid benchmark results')
+    results: object = content.get('results')
+    if not isinstance(results, list):
+        raise ValueError(f'{path}: invalid benchmark results')
+    return [BenchmarkResult.from_json(result) for result in results]
+
+
+def write_results(path: str, results: list[BenchmarkResult]) -> None:
+    content: dict[str, object] = {
+        'commit': get_commit(),
+        'date': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'results': [result.to_json() for result in results],
+    }
+    with open(path, 'w', encoding='utf-8') as results_file:
+        json.dump(content, results_file, indent=2)
+        results_file.write('\n')
+
+
+def format_ratio(new: float, old: float) -> str:
+    if old == 0:
+        return 'n/a'
+    return f'{new / old:.2f}x'
+
+
+def print_results(results: list[BenchmarkResult],
+                  baseline: list[BenchmarkResult] | None = None) -> None:
+    """Print a table of the results, compared to a baseline if any.
+
+    Args:
+        results: the results to print
+        baseline: the results of a previous run to compare with
+    """
+    baseline_results: dict[tuple[int, str], BenchmarkResult] = {
+        (result.classes, result.step): result for result in baseline or []
+    }
+    header: list[str] = ['Classes', 'Step', 'Time', 'Peak memory']
+    if baseline is not None:
+        header += ['Time ratio', 'Memory ratio']
+    tab: list[list[str]] = [header]
+    for result in results:
+        line: list[str] = [
+            str(result.classes),
+            result.step,
+            f'{result.seconds:.3f}s',
+            f'{result.peak_memory / (1 << 20):.1f} MiB',
+        ]
+        if baseline is not None:
+            previous = baseline_results.get((result.classes, result.step))
+            if previous is None:
+                line += ['n/a', 'n/a']
+            else:
+                line += [
+                    format_ratio(result.seconds, previous.seconds),
+                    format_ratio(result.peak_memory, previous.peak_memory),
+                ]
+        tab.append(line)
+    print_table(tab)
+
+
+def main(args: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmark.suite',
+        description='Benchmark jacoco_summary on synthetic reports.'
+    )
+    parser.add_argument('--sizes', metavar='N', type=int, nargs='+',
+                        default=DEFAULT_SIZES,
+                        help='the numbers of classes of the reports')
+    parser.add_argument('--output', metavar='FILE',
+                        default='benchmark-results.json',
+                        help='the file to save the results in')
+    parser.add_argument('--compare', metavar='FILE',
+                        help='the results of a previous run to compare with')
+    parser.add_argument('--directory', metavar='DIR',
+                        help='the directory to generate the reports in, '
+                             'a temporary one by default')
+    parsed_args = parser.parse_args(args)
+    sizes: list[int] = parsed_args.sizes
+    output: str = parsed_args.output
+    compare: str | None = parsed_args.compare
+    directory: str | None = parsed_args.directory
+
+    baseline: list[BenchmarkResult] | None = None
+    if compare is not None:
+        baseline = read_results(compare)
+
+    results: list[BenchmarkResult] = []
+    with TemporaryDirectory(dir=directory) as reports_directory:
+        for size in sizes:
+            results += run_size(size, reports_directory)
+
+    write_results(output, results)
+    print_results(results, baseline)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
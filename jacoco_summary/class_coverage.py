@@ -1,14 +1,22 @@
 from __future__ import annotations
 
-import re
+from collections.abc import Sequence
 from xml.etree.ElementTree import Element
 
 from .coverage import Coverage
+from .coverage_columns import CoverageColumns
+from .extra_counters import ExtraCounters
 from .method_coverage import MethodCoverage
+from .parse_plan import ParsePlan
+
+
+CLASS_NAME_SEPARATORS: dict[int, int] = str.maketrans('$/', '..')
 
 
 class ClassCoverage(Coverage):
 
+    __slots__ = ('methods',)
+
     def __init__(
         self,
         name: str,
@@ -18,7 +26,8 @@ class ClassCoverage(Coverage):
         line_covered: int = 0,
         method_missed: int = 0,
         method_covered: int = 0,
-        methods: list[MethodCoverage] = None
+        methods: Sequence[MethodCoverage] = None,
+        extra_counters: ExtraCounters | None = None
     ) -> None:
         super().__init__(
             name,
@@ -27,20 +36,45 @@ class ClassCoverage(Coverage):
             line_missed,
             line_covered,
             method_missed,
-            method_covered
+            method_covered,
+            extra_counters
         )
         if methods is None:
             methods = []
         self.methods = methods
 
     @classmethod
-    def from_xml_element(cls, element: Element) -> ClassCoverage:
-        base_instance = super().from_xml_element(element)
+    def from_xml_element(
+        cls,
+        element: Element,
+        plan: ParsePlan = ParsePlan.ALL,
+        method_columns: CoverageColumns[MethodCoverage] | None = None
+    ) -> ClassCoverage:
+        """Create a ClassCoverage from a class element.
+
+        Args:
+            element: the class element
+            plan: the parts of the report to build
+            method_columns: the columns where the methods are stored when the
+                plan is compact, shared between the classes to keep the
+                overhead of the arrays low
+        """
+        base_instance = super().from_xml_element(element, plan)
 
-        methods: list[MethodCoverage] = []
-        for child in element:
-            if child.tag == 'method':
-                methods.append(MethodCoverage.from_xml_element(child))
+        methods: Sequence[MethodCoverage] = []
+        if ParsePlan.METHODS in plan and ParsePlan.COMPACT in plan:
+            if method_columns is None:
+                method_columns = CoverageColumns(MethodCoverage)
+            start = len(method_columns)
+            for child in element:
+                if child.tag == 'method':
+                    method_columns.append(
+                        MethodCoverage.from_xml_element(child, plan)
+                    )
+            methods = method_columns.view(start)
+        elif ParsePlan.METHODS in plan:
+            methods = [MethodCoverage.from_xml_element(child, plan)
+                       for child in element if child.tag == 'method']
 
         return cls(
             base_instance.name,
@@ -50,8 +84,9 @@ class ClassCoverage(Coverage):
             base_instance.line_covered,
             base_instance.method_missed,
             base_instance.method_covered,
-            methods
+            methods,
+            base_instance.extra_counters
         )
 
     def get_name(self) -> str:
-        return re.sub(r'[\$\/]', '.', self.name)
+        return self.name.translate(CLASS_NAME_SEPARATORS)
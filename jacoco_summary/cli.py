@@ -1,29 +1,228 @@
+# pylint: disable=too-many-lines
+
+from __future__ import annotations
+
 import argparse
+from collections.abc import Callable, Sequence
 import os
 import sys
-from typing import NoReturn
-from xml.etree.ElementTree import ParseError
+from typing import TYPE_CHECKING, NoReturn, TextIO
 
 from . import __version__
-from .config import COLUMNS_ORDER, JACOCO_XML_FILE_PATH
-from .report import Report
-from .source_file_coverage import SourceFileCoverage
-from .table import generate_table, print_table
-from .xml_parsing_exception import XmlParsingException
+from .comparison_level import ComparisonLevel
+from .column_name import ColumnName
+from .config import COLUMNS_ORDER, JACOCO_XML_FILE_PATH, STDIN_PATH
+from .history_level import HistoryLevel
+from .output_format import OutputFormat
+from .parse_plan import ParsePlan
+from .sort_key import SortKey
+
+if TYPE_CHECKING:
+    from .coverage import Coverage
+    from .coverage_sorting import C
+    from .name_filter import NameFilter
+    from .report import Report
+    from .report_loader import ReportFileError
+    from .source_file_coverage import SourceFileCoverage
+
+# The modules loading, formatting and comparing the reports are imported where
+# they are used, so that a command only imports what it needs: the version
+# doesn't import any of them, the queries answered by a server don't parse any
+# report, and the listings don't format any table.
+# pylint: disable=import-outside-toplevel
 
 
 EXIT_SUCCESS: int = 0
 EXIT_FAILURE: int = 1
+# The subcommands printing coverages, None being the list of the classes.
+COVERAGE_SUBCOMMANDS: tuple[str | None, ...] = (
+    None,
+    'package',
+    'class',
+    'file',
+    'summary',
+    'tree',
+)
+# The options of the --columns option, like line-missed.
+COLUMN_OPTIONS: tuple[str, ...] = tuple(
+    column.name.lower().replace('_', '-') for column in ColumnName
+)
+# The subcommands that a server can run, None being the list of the classes.
+SERVED_SUBCOMMANDS: tuple[str | None, ...] = (
+    None,
+    'package',
+    'class',
+    'file',
+    'lines',
+)
+
+
+def print_names(names: list[str], output_format: OutputFormat) -> None:
+    if output_format is not OutputFormat.TABLE:
+        from .records import NAME_FIELDS, generate_name_records, write_records
+        write_records(generate_name_records(sorted(names)), NAME_FIELDS,
+                      output_format)
+        return
+    for name in sorted(names):
+        print(name)
+
+
+def print_packages(jacoco_report: Report, output_format: OutputFormat) -> None:
+    print_names(jacoco_report.get_packages_names(), output_format)
+
+
+def print_files(jacoco_report: Report, output_format: OutputFormat) -> None:
+    print_names(jacoco_report.get_source_files_names(), output_format)
+
+
+def print_coverages(coverages: Sequence[Coverage],
+                    columns: list[ColumnName], output_format: OutputFormat,
+                    stream: bool = False,
+                    names_width: int | None = None) -> None:
+    """Print the table of some coverages, or write their records.
+
+    Args:
+        coverages: the coverages of the lines
+        columns: the columns of the table, or the columns whose counters are
+            written in the records
+        output_format: the format of the output
+        stream: whether to print the lines of the table one at a time, the
+            width of the names and the counts being measured first
+        names_width: the width of the names of a streamed table, the longer
+            names being truncated, the width of the longest name fitting in
+            the terminal by default
+    """
+    if output_format is OutputFormat.TABLE and stream and coverages:
+        from .table import get_stream_columns_size, print_coverage_table
+        stdout: TextIO = sys.stdout
+        print_coverage_table(coverages, columns, get_stream_columns_size(
+            coverages,
+            columns,
+            names_width,
+            stdout.isatty()
+        ))
+    elif output_format is OutputFormat.TABLE:
+        from .table import generate_table, print_table
+        print_table(generate_table(coverages, columns))
+    else:
+        from .records import (
+            generate_coverage_records,
+            get_coverage_field_names,
+            write_records,
+        )
+        write_records(generate_coverage_records(coverages, columns),
+                      get_coverage_field_names(columns), output_format)
+
+
+def get_parse_plan(subcommand: str | None, parsed_args: argparse.Namespace,
+                   xml_file_paths: Sequence[str]) -> ParsePlan:
+    """Return the parts of the report needed to run a subcommand.
+
+    Args:
+        subcommand: the subcommand to run
+        parsed_args: the arguments of the subcommand
+        xml_file_paths: the paths of the report files
+    """
+    match subcommand:
+        case 'package':
+            list_packages: bool = parsed_args.list_packages
+            if list_packages:
+                return ParsePlan.NAMES
+            return ParsePlan.CLASSES
+
+        case 'class':
+            return ParsePlan.CLASSES | ParsePlan.METHODS
+
+        case 'file':
+            return ParsePlan.SOURCE_FILES
+
+        case 'lines' | 'diff':
+            return ParsePlan.SOURCE_FILES | ParsePlan.LINES
+
+        case 'compare':
+            from .report_comparison import get_comparison_plan
+            level: str = parsed_args.level
+            return get_comparison_plan(ComparisonLevel(level))
+
+        case 'summary':
+            return ParsePlan.TOTALS
+
+        case 'record':
+            return ParsePlan.PACKAGE_COUNTERS | ParsePlan.CLASSES \
+                | ParsePlan.EXTRA_COUNTERS
 
+        case 'tree':
+            from .package_tree import get_tree_plan
+            depth: int | None = parsed_args.depth
+            return get_tree_plan(xml_file_paths, depth)
 
-def print_packages(jacoco_report: Report) -> None:
-    for package_name in sorted(jacoco_report.get_packages_names()):
-        print(package_name)
+        case _:
+            return ParsePlan.CLASSES
 
 
-def print_files(jacoco_report: Report) -> None:
-    for file_name in sorted(jacoco_report.get_source_files_names()):
-        print(file_name)
+def positive_int(value: str) -> int:
+    """Argument type of the strictly positive integers."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number <= 0:
+        raise argparse.ArgumentTypeError(
+            f'invalid positive integer: {repr(value)}'
+        )
+    return number
+
+
+def columns_list(value: str) -> list[ColumnName]:
+    """Argument type of the comma separated lists of columns."""
+    columns: list[ColumnName] = []
+    for column_option in value.split(','):
+        try:
+            columns.append(
+                ColumnName[column_option.strip().upper().replace('-', '_')]
+            )
+        except KeyError:
+            raise argparse.ArgumentTypeError(
+                f'invalid column: {repr(column_option)} (choose from '
+                f'{", ".join(COLUMN_OPTIONS)})'
+            ) from None
+    return columns
+
+
+def percentage(value: str) -> float:
+    """Argument type of the percentages between 0 and 100."""
+    try:
+        number = float(value)
+    except ValueError:
+        number = -1
+    if not 0 <= number <= 100:
+        raise argparse.ArgumentTypeError(
+            f'invalid percentage: {repr(value)}'
+        )
+    return number
+
+
+def get_line_percentage(coverage: Coverage) -> float:
+    """Return the percentage of covered lines checked by --fail-under, 100
+    when there is no line."""
+    lines_count = coverage.line_missed + coverage.line_covered
+    if lines_count == 0:
+        return 100
+    return 100 * coverage.line_covered / lines_count
+
+
+def get_loading_error_message(error: ReportFileError) -> str:
+    """Return the message to print when a report file can't be loaded."""
+    from xml.etree.ElementTree import ParseError
+    match error.error:
+        case FileNotFoundError():
+            return f'{error.path}: no such file or directory'
+
+        case ParseError():
+            return f'{error.path}: failed to parse file: {error.error}'
+
+        case _:
+            return f'{error.path}: {error.error}'
 
 
 class ArgumentParser(argparse.ArgumentParser):
@@ -38,7 +237,22 @@ class ArgumentParser(argparse.ArgumentParser):
         sys.exit(status)
 
 
-def cli(args: list[str]) -> int:
+def cli(args: list[str],
+        load_reports: Callable[[], list[Report]] | None = None) -> int:
+    """Run a command line.
+
+    When a server serves the report files of the command line, it runs the
+    command. Otherwise the report files are loaded.
+
+    Args:
+        args: the arguments of the command line, starting with the name of
+            the program
+        load_reports: the function loading the report, used by the server
+            instead of loading the report files
+
+    Returns:
+        the exit status of the command
+    """
     assert args, 'args is empty'
 
     program_name = os.path.basename(args[0])
@@ -56,8 +270,98 @@ def cli(args: list[str]) -> int:
         '-f',
         '--file',
         metavar='FILE',
-        default=JACOCO_XML_FILE_PATH,
-        help='the path JaCoCo report xml file to use'
+        action='append',
+        help='the path JaCoCo report xml file to use, can be a glob pattern, '
+             '- for the standard input, be compressed with gzip, xz or zstd '
+             'and be repeated to merge several reports'
+    )
+    global_parser.add_argument(
+        '-j',
+        '--jobs',
+        metavar='N',
+        type=positive_int,
+        default=os.cpu_count() or 1,
+        help='the number of report files to parse in parallel'
+    )
+    global_parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='don\'t read or write the cache of the parsed reports'
+    )
+    global_parser.add_argument(
+        '--clear-cache',
+        action='store_true',
+        help='remove the cache of the parsed reports'
+    )
+    global_parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='keep running and print the output again each time a report '
+             'file changes'
+    )
+    global_parser.add_argument(
+        '--include',
+        metavar='PATTERN',
+        action='append',
+        help='only keep the packages, classes and source files whose name, '
+             'like com/acme/Main, or whose package name matches a glob '
+             'pattern, where ** matches across the slashes, or a regular '
+             'expression prefixed with re:, can be repeated'
+    )
+    global_parser.add_argument(
+        '--exclude',
+        metavar='PATTERN',
+        action='append',
+        help='remove the packages, classes and source files whose name or '
+             'whose package name matches a pattern, can be repeated'
+    )
+    global_parser.add_argument(
+        '--format',
+        choices=[output_format.value for output_format in OutputFormat],
+        default=OutputFormat.TABLE.value,
+        help='the format of the output, csv, json and ndjson give the counts '
+             'and the ratios of covered items, table by default'
+    )
+    global_parser.add_argument(
+        '--sort',
+        choices=[sort_key.value for sort_key in SortKey],
+        help='the column to sort the rows by, from the worst coverage or the '
+             'most missed lines, the order of the report by default'
+    )
+    global_parser.add_argument(
+        '--reverse',
+        action='store_true',
+        help='reverse the order of the rows'
+    )
+    global_parser.add_argument(
+        '--top',
+        metavar='N',
+        type=positive_int,
+        help='only print the N first rows'
+    )
+    global_parser.add_argument(
+        '--columns',
+        metavar='COLUMNS',
+        type=columns_list,
+        help='the comma separated columns of the coverage tables and records, '
+             'among name, the percentage bars branch, line, method, '
+             'instruction, complexity and class, and their counts like '
+             'line-missed and line-covered, name,branch,line,method by '
+             'default'
+    )
+    global_parser.add_argument(
+        '--stream',
+        action=argparse.BooleanOptionalAction,
+        help='print the rows of the coverage tables as they are formatted, '
+             'the width of the names being measured first, by default when '
+             'the output is not a terminal'
+    )
+    global_parser.add_argument(
+        '--name-width',
+        metavar='N',
+        type=positive_int,
+        help='the width of the names of the streamed tables, the beginning '
+             'of the longer names being truncated, implies --stream'
     )
 
     main_parser = ArgumentParser(
@@ -127,81 +431,610 @@ def cli(args: list[str]) -> int:
         help='list files in the report'
     )
 
+    lines_parser = subparsers.add_parser(
+        'lines',
+        help='print the lines of a file that are not fully covered',
+        description='Print the ranges of lines of a file that are not '
+                    'covered or partly covered.',
+        parents=[global_parser]
+    )
+    lines_parser.add_argument(
+        'java_file',
+        metavar=file_metavar,
+        help='the path to a file in the report to display'
+    )
+
+    diff_parser = subparsers.add_parser(
+        'diff',
+        help='print the coverage of the lines changed by a diff',
+        description='Print the coverage of the lines added or modified by a '
+                    'unified diff, like the output of git diff.',
+        parents=[global_parser]
+    )
+    diff_parser.add_argument(
+        'diff_file',
+        metavar='DIFF_FILE',
+        nargs='?',
+        default='-',
+        help='the path to the unified diff, the standard input by default'
+    )
+    diff_parser.add_argument(
+        '--fail-under',
+        metavar='PERCENT',
+        type=percentage,
+        help='exit with an error if the coverage of the changed lines is '
+             'under this percentage'
+    )
+
+    compare_parser = subparsers.add_parser(
+        'compare',
+        help='print the coverage changes since a baseline report',
+        description='Print the coverage changes between a baseline report and '
+                    'the current one, and the added and removed entries.',
+        parents=[global_parser]
+    )
+    compare_parser.add_argument(
+        'baseline',
+        metavar='BASELINE',
+        help='the path to the JaCoCo report xml file to compare with, can be '
+             'a glob pattern'
+    )
+    compare_parser.add_argument(
+        '--level',
+        choices=[level.value for level in ComparisonLevel],
+        default=ComparisonLevel.CLASS.value,
+        help='the entries of the reports to compare, classes by default'
+    )
+    compare_parser.add_argument(
+        '--only-regressions',
+        action='store_true',
+        help='only print the entries whose coverage decreased'
+    )
+
+    summary_parser = subparsers.add_parser(
+        'summary',
+        help='print the total coverage of the report',
+        description='Print the total coverage of the report. Only the end of '
+                    'the report files is read when they have the layout '
+                    'written by JaCoCo.',
+        parents=[global_parser]
+    )
+    summary_parser.add_argument(
+        '--fail-under',
+        metavar='PERCENT',
+        type=percentage,
+        help='exit with an error if the line coverage is under this '
+             'percentage, or if the report has no lines'
+    )
+
+    tree_parser = subparsers.add_parser(
+        'tree',
+        help='print the coverage of the hierarchy of the packages',
+        description='Print the coverage of the packages as a tree of their '
+                    'names, like com and com/acme, with their classes and '
+                    'their methods, each node counting everything under it. '
+                    'The sorting and the number of rows apply to the entries '
+                    'of each level.',
+        parents=[global_parser]
+    )
+    tree_parser.add_argument(
+        '--depth',
+        metavar='N',
+        type=positive_int,
+        help='only print the N first levels under the report, the deeper '
+             'entries being counted in their ancestors'
+    )
+
+    record_parser = subparsers.add_parser(
+        'record',
+        help='record the coverage of a build in the history',
+        description='Record the total coverage of the report and the '
+                    'coverage of its packages and classes in the history of '
+                    'the builds, replacing the coverage recorded before for '
+                    'the same build.',
+        parents=[global_parser]
+    )
+    record_parser.add_argument(
+        'build_id',
+        metavar='BUILD_ID',
+        help='the identifier of the build, like its number'
+    )
+    record_parser.add_argument(
+        '--commit',
+        metavar='COMMIT',
+        help='the commit of the build'
+    )
+    database_help: str = 'the path of the SQLite database of the history, ' \
+        'in the data directory of the user by default'
+    record_parser.add_argument(
+        '--database',
+        metavar='FILE',
+        help=database_help
+    )
+
+    history_parser = subparsers.add_parser(
+        'history',
+        help='print the coverage of the recorded builds',
+        description='Print the coverage of the report, of a package or of a '
+                    'class in the recorded builds, from the oldest to the '
+                    'newest.',
+        parents=[global_parser]
+    )
+    history_parser.add_argument(
+        'name',
+        metavar='NAME',
+        nargs='?',
+        help='the name of the package or of the class, the whole report by '
+             'default'
+    )
+    history_parser.add_argument(
+        '--level',
+        choices=[HistoryLevel.PACKAGE.value, HistoryLevel.CLASS.value],
+        default=HistoryLevel.CLASS.value,
+        help='whether the name is a package or a class, a class by default'
+    )
+    history_parser.add_argument(
+        '--last',
+        metavar='N',
+        type=positive_int,
+        help='only print the N most recent builds'
+    )
+    history_parser.add_argument(
+        '--database',
+        metavar='FILE',
+        help=database_help
+    )
+
+    subparsers.add_parser(
+        'serve',
+        help='answer the other subcommands from the reports kept in memory',
+        description='Keep the reports in memory, reloaded when their files '
+                    'change, and answer the package, class, file and lines '
+                    'subcommands run with the same report files, which use '
+                    'the server when it is running.',
+        parents=[global_parser]
+    )
+
     # Display the right usage message when there is an error in parsing args.
     global_parser.print_usage = main_parser.print_usage  # type: ignore
 
     global_args, remaining_args = global_parser.parse_known_args(args[1:])
     parsed_args: argparse.Namespace = main_parser.parse_args(remaining_args)
-    file: str = global_args.file
+    files: list[str] | None = global_args.file
+    if files is None:
+        files = [JACOCO_XML_FILE_PATH]
+    jobs: int = global_args.jobs
+    no_cache: bool = global_args.no_cache
+    clear_cache_option: bool = global_args.clear_cache
+    if clear_cache_option:
+        from .report_cache import clear_cache
+        clear_cache()
+    format_name: str = global_args.format
+    watch: bool = global_args.watch
+    sort_name: str | None = global_args.sort
+    sort_key = None if sort_name is None else SortKey(sort_name)
+    reverse: bool = global_args.reverse
+    top: int | None = global_args.top
+    columns: list[ColumnName] | None = global_args.columns
+    if columns is None:
+        columns = COLUMNS_ORDER
+    stream_option: bool | None = global_args.stream
+    names_width: int | None = global_args.name_width
+    output_format = OutputFormat(format_name)
     subcommand: str | None = parsed_args.subcommand
+    includes: list[str] | None = global_args.include
+    excludes: list[str] | None = global_args.exclude
+    name_filter: NameFilter | None = None
+    if includes or excludes:
+        from .name_filter import NameFilter
+        try:
+            name_filter = NameFilter(includes or [], excludes or [])
+        except ValueError as error:
+            print_error(str(error))
+            return EXIT_FAILURE
 
-    try:
-        project_coverage = Report.from_xml_file(file)
-    except FileNotFoundError:
-        print_error(f'{file}: no such file or directory')
-        return EXIT_FAILURE
-    except ParseError as error:
-        print_error(f'{file}: failed to parse file: {error}')
-        return EXIT_FAILURE
-    except XmlParsingException as exception:
-        print_error(f'{file}: {exception}')
+    from .report_paths import expand_report_paths
+
+    report_groups: list[list[str]] = [expand_report_paths(files)]
+    if subcommand == 'compare':
+        baseline_file_name: str = parsed_args.baseline
+        report_groups.append(expand_report_paths([baseline_file_name]))
+    diff_file_name: str | None = None
+    if subcommand == 'diff':
+        diff_file_name = parsed_args.diff_file
+
+    stdin_uses = sum(group.count(STDIN_PATH) for group in report_groups)
+    if diff_file_name == STDIN_PATH:
+        stdin_uses += 1
+    if stdin_uses > 1:
+        print_error('the standard input can only be read once')
         return EXIT_FAILURE
 
-    if subcommand == 'package':
-        list_packages: bool = parsed_args.list_packages
-        if list_packages:
-            print_packages(project_coverage)
+    changed_lines: dict[str, list[tuple[int, int]]] = {}
+    if diff_file_name is not None:
+        from .unified_diff import parse_unified_diff
+        try:
+            if diff_file_name == STDIN_PATH:
+                changed_lines = parse_unified_diff(sys.stdin)
+            else:
+                with open(diff_file_name, encoding='utf-8',
+                          errors='replace') as diff_file:
+                    changed_lines = parse_unified_diff(diff_file)
+        except FileNotFoundError:
+            print_error(f'{diff_file_name}: no such file or directory')
+            return EXIT_FAILURE
+
+    stream = stream_option
+    if stream is None:
+        standard_output: TextIO = sys.stdout
+        stream = names_width is not None or not standard_output.isatty()
+
+    def sort(coverages: Sequence[C]) -> list[C]:
+        from .coverage_sorting import sort_coverages
+        return sort_coverages(coverages, sort_key, reverse, top)
+
+    database_path: str | None = None
+    if subcommand in ('record', 'history'):
+        database_path = parsed_args.database
+        if database_path is None:
+            from .history_store import get_history_path
+            database_path = get_history_path()
+
+    def display(reports: list[Report]) -> int:
+        """Print the output of the subcommand for the loaded reports.
+
+        Args:
+            reports: the current report, followed by the baseline report for
+                the compare subcommand
+        """
+        project_coverage = reports[0]
+
+        if subcommand == 'package':
+            list_packages: bool = parsed_args.list_packages
+            if list_packages:
+                print_packages(project_coverage, output_format)
+                return EXIT_SUCCESS
+            package_name: str | None = parsed_args.package
+            if package_name is None:
+                package_parser.error(
+                    f'the following arguments are required: {package_metavar}'
+                )
+            package = project_coverage.get_package(package_name)
+            if package is None:
+                print_error(f'package {repr(package_name)} doesn\'t exists')
+                return EXIT_FAILURE
+            if len(package.classes) == 0 \
+                    and output_format is OutputFormat.TABLE:
+                print('There is no class in this package.')
+                return EXIT_SUCCESS
+            print_coverages(sort(package.classes), columns, output_format,
+                            stream, names_width)
             return EXIT_SUCCESS
-        package_name: str | None = parsed_args.package
-        if package_name is None:
-            package_parser.error(
-                f'the following arguments are required: {package_metavar}'
+
+        if subcommand == 'class':
+            java_class_name: str = parsed_args.java_class
+            java_class = project_coverage.get_class(java_class_name)
+            if java_class is None:
+                print_error(f'class {repr(java_class_name)} doesn\'t exists')
+                return EXIT_FAILURE
+            if len(java_class.methods) == 0 \
+                    and output_format is OutputFormat.TABLE:
+                print('No methods found in this class.')
+                return EXIT_SUCCESS
+            print_coverages(sort(java_class.methods), columns, output_format,
+                            stream, names_width)
+            return EXIT_SUCCESS
+
+        if subcommand == 'file':
+            list_files: bool = parsed_args.list_files
+            if list_files:
+                print_files(project_coverage, output_format)
+                return EXIT_SUCCESS
+
+            java_file_name: str | None = parsed_args.java_file
+            source_files: list[SourceFileCoverage]
+            if java_file_name is not None:
+                java_file = project_coverage.get_source_file(java_file_name)
+                if java_file is None:
+                    print_error(f'file {repr(java_file_name)} doesn\'t exists')
+                    return EXIT_FAILURE
+                source_files = [java_file]
+            else:
+                source_files = project_coverage.get_source_files()
+            print_coverages(sort(source_files), columns, output_format,
+                            stream, names_width)
+            return EXIT_SUCCESS
+
+        if subcommand == 'lines':
+            lines_file_name: str = parsed_args.java_file
+            lines_file = project_coverage.get_source_file(lines_file_name)
+            if lines_file is None:
+                print_error(f'file {repr(lines_file_name)} doesn\'t exists')
+                return EXIT_FAILURE
+            assert lines_file.lines is not None, 'the lines were not loaded'
+            if output_format is not OutputFormat.TABLE:
+                from .records import (
+                    LINES_FIELDS,
+                    generate_lines_records,
+                    write_records,
+                )
+                write_records(generate_lines_records(lines_file.lines),
+                              LINES_FIELDS, output_format)
+                return EXIT_SUCCESS
+            from .table import generate_lines_table, print_table
+            if len(lines_file.lines) == 0:
+                print('No lines found in this file.')
+                return EXIT_SUCCESS
+            lines_tab = generate_lines_table(lines_file.lines)
+            if len(lines_tab) == 1:
+                print('All the lines of this file are covered.')
+                return EXIT_SUCCESS
+            print_table(lines_tab)
+            return EXIT_SUCCESS
+
+        if subcommand == 'diff':
+            from .coverage import Coverage
+            from .diff_coverage import get_diff_coverage
+            from .records import (
+                DIFF_FIELDS,
+                generate_diff_records,
+                write_records,
             )
-        package = project_coverage.get_package(package_name)
-        if package is None:
-            print_error(f'package {repr(package_name)} doesn\'t exists')
-            return EXIT_FAILURE
-        if len(package.classes) == 0:
-            print('There is no class in this package.')
+            from .table import generate_diff_table, print_table
+            files_coverage = get_diff_coverage(project_coverage, changed_lines)
+            if output_format is not OutputFormat.TABLE:
+                write_records(generate_diff_records(sort(files_coverage)),
+                              DIFF_FIELDS, output_format)
+            elif not files_coverage:
+                print('No changed lines found in the report.')
+                return EXIT_SUCCESS
+            total = Coverage('Total')
+            for file_coverage in files_coverage:
+                total.add_counters(file_coverage)
+            if output_format is OutputFormat.TABLE:
+                print_table(generate_diff_table(sort(files_coverage), total))
+
+            fail_under: float | None = parsed_args.fail_under
+            covered_percentage = get_line_percentage(total)
+            if fail_under is not None and covered_percentage < fail_under:
+                print_error(
+                    'the coverage of the changed lines is '
+                    f'{covered_percentage:.2f}%, under {fail_under:g}%'
+                )
+                return EXIT_FAILURE
             return EXIT_SUCCESS
-        print_table(generate_table(package.classes, COLUMNS_ORDER))
-        return EXIT_SUCCESS
 
-    if subcommand == 'class':
-        java_class_name: str = parsed_args.java_class
-        java_class = project_coverage.get_class(java_class_name)
-        if java_class is None:
-            print_error(f'class {repr(java_class_name)} doesn\'t exists')
-            return EXIT_FAILURE
-        if len(java_class.methods) == 0:
-            print('No methods found in this class.')
+        if subcommand == 'compare':
+            from .records import (
+                COMPARISON_FIELDS,
+                generate_comparison_records,
+                write_records,
+            )
+            from .report_comparison import compare_reports, sort_changes
+            from .table import generate_comparison_table, print_table
+            compare_level: str = parsed_args.level
+            only_regressions: bool = parsed_args.only_regressions
+            changes = compare_reports(reports[1], project_coverage,
+                                      ComparisonLevel(compare_level))
+            added = [change.name for change in changes
+                     if change.baseline is None]
+            removed = [change.name for change in changes
+                       if change.current is None]
+            changed = [
+                change for change in changes
+                if change.baseline is not None and change.current is not None
+                and change.is_changed()
+                and (not only_regressions or change.is_regression())
+            ]
+            if output_format is not OutputFormat.TABLE:
+                changed_and_added_and_removed = sort_changes(
+                    changed, top, sort_key, reverse
+                ) + [
+                    change for change in changes
+                    if change.baseline is None or change.current is None
+                ]
+                write_records(
+                    generate_comparison_records(changed_and_added_and_removed),
+                    COMPARISON_FIELDS,
+                    output_format
+                )
+                return EXIT_SUCCESS
+            if not changed and not added and not removed:
+                print('No coverage change.')
+                return EXIT_SUCCESS
+            if changed:
+                print_table(generate_comparison_table(
+                    sort_changes(changed, top, sort_key, reverse)
+                ))
+            for title, names in ('Added', added), ('Removed', removed):
+                if names:
+                    print(f'{title}:')
+                    for name in sorted(names):
+                        print(f'  {name}')
             return EXIT_SUCCESS
-        print_table(generate_table(java_class.methods, COLUMNS_ORDER))
-        return EXIT_SUCCESS
 
-    if subcommand == 'file':
-        list_files: bool = parsed_args.list_files
-        if list_files:
-            print_files(project_coverage)
+        if subcommand == 'summary':
+            print_coverages([project_coverage], columns, output_format,
+                            stream, names_width)
+
+            summary_fail_under: float | None = parsed_args.fail_under
+            # a report without lines fails the check, so that a wrong path or
+            # filter doesn't pass it silently
+            if summary_fail_under is not None \
+                    and project_coverage.line_missed \
+                    + project_coverage.line_covered == 0:
+                print_error('the report has no lines, their coverage can\'t be '
+                            'checked')
+                return EXIT_FAILURE
+            line_percentage = get_line_percentage(project_coverage)
+            if summary_fail_under is not None \
+                    and line_percentage < summary_fail_under:
+                print_error(
+                    f'the line coverage is {line_percentage:.2f}%, under '
+                    f'{summary_fail_under:g}%'
+                )
+                return EXIT_FAILURE
             return EXIT_SUCCESS
 
-        java_file_name: str | None = parsed_args.java_file
-        source_files: list[SourceFileCoverage]
-        if java_file_name is not None:
-            java_file = project_coverage.get_source_file(java_file_name)
-            if java_file is None:
-                print_error(f'file {repr(java_file_name)} doesn\'t exists')
+        if subcommand == 'tree':
+            from .package_tree import build_package_tree, get_tree_rows
+            tree_depth: int | None = parsed_args.depth
+            tree = build_package_tree(project_coverage, tree_depth)
+            print_coverages(
+                get_tree_rows(tree, tree_depth,
+                              indent=output_format is OutputFormat.TABLE,
+                              sort_key=sort_key, reverse=reverse, top=top),
+                columns,
+                output_format,
+                stream,
+                names_width
+            )
+            return EXIT_SUCCESS
+
+        if subcommand == 'record':
+            import sqlite3
+            import time
+            from .history_store import open_history, record_report
+            assert database_path is not None, 'no history database'
+            build_id: str = parsed_args.build_id
+            commit: str | None = parsed_args.commit
+            try:
+                with open_history(database_path) as connection:
+                    entries = record_report(connection, project_coverage,
+                                            build_id, commit,
+                                            int(time.time()))
+            except (OSError, ValueError, sqlite3.Error) as error:
+                print_error(f'{database_path}: {error}')
                 return EXIT_FAILURE
-            source_files = [java_file]
-        else:
-            source_files = project_coverage.get_source_files()
-        print_table(generate_table(source_files, COLUMNS_ORDER))
+            if output_format is not OutputFormat.TABLE:
+                from .records import BUILD_FIELDS, write_records
+                write_records([(build_id, commit, entries)], BUILD_FIELDS,
+                              output_format)
+                return EXIT_SUCCESS
+            print(f'Recorded {entries} entries for the build '
+                  f'{repr(build_id)}.')
+            return EXIT_SUCCESS
+
+        classes = project_coverage.get_classes()
+        if not classes and output_format is OutputFormat.TABLE:
+            print('No classes found.')
+            return EXIT_SUCCESS
+        print_coverages(sort(classes), columns, output_format,
+                        stream, names_width)
         return EXIT_SUCCESS
 
-    classes = project_coverage.get_classes()
-    if not classes:
-        print('No classes found.')
+    def on_loading_error(error: ReportFileError) -> int:
+        print_error(get_loading_error_message(error))
+        return EXIT_FAILURE
+
+    if load_reports is not None:
+        if watch or subcommand not in SERVED_SUBCOMMANDS:
+            print_error('only the package, class, file and lines subcommands '
+                        'can be served')
+            return EXIT_FAILURE
+        from .report_loader import ReportFileError
+        try:
+            reports = load_reports()
+        except ReportFileError as error:
+            return on_loading_error(error)
+        if name_filter is not None:
+            # the server keeps the whole reports
+            reports = [name_filter.filter_report(report)
+                       for report in reports]
+        return display(reports)
+
+    if subcommand == 'serve':
+        from .report_client import get_socket_path
+        from .report_server import create_server, serve_reports
+        if stdin_uses > 0:
+            print_error('the standard input can\'t be served')
+            return EXIT_FAILURE
+        socket_path = get_socket_path()
+        try:
+            server = create_server(
+                socket_path,
+                [os.path.abspath(path) for path in report_groups[0]],
+                cli
+            )
+        except OSError as error:
+            print_error(str(error))
+            return EXIT_FAILURE
+        print(f'Serving the reports on {socket_path}.', flush=True)
+        serve_reports(server)
         return EXIT_SUCCESS
-    tab = generate_table(project_coverage.get_classes(), COLUMNS_ORDER)
-    print_table(tab)
-    return EXIT_SUCCESS
+
+    if subcommand == 'history':
+        import sqlite3
+        from .history_store import open_history, query_history
+        assert database_path is not None, 'no history database'
+        entry_name: str | None = parsed_args.name
+        level_name: str = parsed_args.level
+        history_level = HistoryLevel.REPORT if entry_name is None \
+            else HistoryLevel(level_name)
+        last: int | None = parsed_args.last
+        try:
+            with open_history(database_path, create=False) as connection:
+                history = query_history(
+                    connection,
+                    history_level,
+                    entry_name or '',
+                    last,
+                    detailed_names=output_format is OutputFormat.TABLE
+                )
+        except FileNotFoundError:
+            print_error(f'{database_path}: no such file or directory')
+            return EXIT_FAILURE
+        except (OSError, ValueError, sqlite3.Error) as error:
+            print_error(f'{database_path}: {error}')
+            return EXIT_FAILURE
+        if history is None:
+            if entry_name is None:
+                print('No build recorded.')
+                return EXIT_SUCCESS
+            print_error(f'{history_level.value} {repr(entry_name)} was never '
+                        'recorded')
+            return EXIT_FAILURE
+        print_coverages(sort(history), columns, output_format, stream,
+                        names_width)
+        return EXIT_SUCCESS
+
+    plan = get_parse_plan(subcommand, parsed_args, report_groups[0])
+    if columns is not COLUMNS_ORDER and subcommand in COVERAGE_SUBCOMMANDS:
+        from .coverage import get_columns_plan
+        plan |= get_columns_plan(columns)
+    if name_filter is not None:
+        from .name_filter import get_filter_plan
+        plan = get_filter_plan(plan)
+    if watch:
+        if stdin_uses > 0:
+            print_error('the standard input can\'t be watched')
+            return EXIT_FAILURE
+        from .report_watcher import watch_reports
+        return watch_reports(report_groups, plan, display, on_loading_error,
+                             name_filter=name_filter)
+
+    if subcommand in SERVED_SUBCOMMANDS and stdin_uses == 0:
+        from .report_client import get_socket_path, query_server
+        response = query_server(
+            get_socket_path(),
+            args,
+            [os.path.abspath(path) for path in report_groups[0]]
+        )
+        if response is not None:
+            status, stdout, stderr = response
+            print(stdout, end='')
+            print(stderr, end='', file=sys.stderr)
+            return status
+
+    from .report_loader import ReportFileError, load_report_groups
+    try:
+        reports = load_report_groups(
+            report_groups,
+            plan,
+            use_cache=not no_cache,
+            jobs=jobs,
+            name_filter=name_filter
+        )
+    except ReportFileError as error:
+        return on_loading_error(error)
+    return display(reports)
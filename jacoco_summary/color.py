@@ -2,10 +2,11 @@ from enum import Enum
 
 
 class Color(Enum):
-    RESET = '\x1b[0m'
-    GRAY  = '\x1b[30m'
-    RED   = '\x1b[31m'
-    GREEN = '\x1b[32m'
+    RESET  = '\x1b[0m'
+    GRAY   = '\x1b[30m'
+    RED    = '\x1b[31m'
+    GREEN  = '\x1b[32m'
+    YELLOW = '\x1b[33m'
 
     def __str__(self) -> str:
         return self.value
@@ -2,7 +2,22 @@ from enum import Enum
 
 
 class ColumnName(Enum):
-    NAME   = 'Name'
-    BRANCH = 'Branch'
-    LINE   = 'Line'
-    METHOD = 'Method'
+    NAME                = 'Name'
+    BRANCH              = 'Branch'
+    LINE                = 'Line'
+    METHOD              = 'Method'
+    INSTRUCTION         = 'Instruction'
+    COMPLEXITY          = 'Complexity'
+    CLASS               = 'Class'
+    BRANCH_MISSED       = 'Branch missed'
+    BRANCH_COVERED      = 'Branch covered'
+    LINE_MISSED         = 'Line missed'
+    LINE_COVERED        = 'Line covered'
+    METHOD_MISSED       = 'Method missed'
+    METHOD_COVERED      = 'Method covered'
+    INSTRUCTION_MISSED  = 'Instruction missed'
+    INSTRUCTION_COVERED = 'Instruction covered'
+    COMPLEXITY_MISSED   = 'Complexity missed'
+    COMPLEXITY_COVERED  = 'Complexity covered'
+    CLASS_MISSED        = 'Class missed'
+    CLASS_COVERED       = 'Class covered'
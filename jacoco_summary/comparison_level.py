@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class ComparisonLevel(Enum):
+    CLASS   = 'class'
+    PACKAGE = 'package'
+    FILE    = 'file'
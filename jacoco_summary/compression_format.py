@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from enum import Enum
+
+
+class CompressionFormat(Enum):
+    '''Compression of a report file, detected from its first bytes.'''
+    GZIP = 'gzip'
+    XZ   = 'xz'
+    ZSTD = 'zstd'
+
+    @classmethod
+    def from_magic_number(cls, data: bytes) -> CompressionFormat | None:
+        """Return the compression of a file starting with some bytes, None if
+        the file is not compressed."""
+        for compression_format, magic_number in MAGIC_NUMBERS.items():
+            if data.startswith(magic_number):
+                return compression_format
+        return None
+
+
+MAGIC_NUMBERS: dict[CompressionFormat, bytes] = {
+    CompressionFormat.GZIP: b'\x1f\x8b',
+    CompressionFormat.XZ:   b'\xfd7zXZ\x00',
+    CompressionFormat.ZSTD: b'\x28\xb5\x2f\xfd',
+}
+MAGIC_NUMBER_SIZE: int = max(len(magic) for magic in MAGIC_NUMBERS.values())
@@ -2,7 +2,22 @@ from .column_name import ColumnName
 
 
 JACOCO_XML_FILE_PATH: str = 'target/site/jacoco/jacoco.xml'
+# The report file path reading the report from the standard input.
+STDIN_PATH: str = '-'
 CSV_SEPARATOR: str = ','
+PERCENTAGE_BAR_WIDTH: int = 10
+STRING_WIDTH_CACHE_SIZE: int = 1 << 12
+XML_READ_CHUNK_SIZE: int = 1 << 16
+
+CACHE_MAX_SIZE: int = 256 << 20
+CACHE_FINGERPRINT_SIZE: int = 1 << 16
+
+# in seconds
+WATCH_INTERVAL: float = 0.5
+WATCH_SETTLE_TIME: float = 0.3
+SERVE_TIMEOUT: float = 60
+
+SERVE_MESSAGE_MAX_SIZE: int = 1 << 24
 
 COLUMNS_ORDER: list[ColumnName] = [
     ColumnName.NAME,
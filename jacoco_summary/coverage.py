@@ -3,12 +3,68 @@ from __future__ import annotations
 from xml.etree.ElementTree import Element
 
 from .column_name import ColumnName
+from .config import PERCENTAGE_BAR_WIDTH
 from .counter_type import CounterType
+from .extra_counters import EXTRA_COUNTER_TYPES, ExtraCounters
+from .parse_plan import ParsePlan
 from .utils import percentage_bar
 
 
+# The counter shown by each column, as a percentage bar or as a count.
+BAR_COLUMNS: dict[ColumnName, CounterType] = {
+    ColumnName.BRANCH: CounterType.BRANCH,
+    ColumnName.LINE: CounterType.LINE,
+    ColumnName.METHOD: CounterType.METHOD,
+    ColumnName.INSTRUCTION: CounterType.INSTRUCTION,
+    ColumnName.COMPLEXITY: CounterType.COMPLEXITY,
+    ColumnName.CLASS: CounterType.CLASS,
+}
+MISSED_COLUMNS: dict[ColumnName, CounterType] = {
+    ColumnName.BRANCH_MISSED: CounterType.BRANCH,
+    ColumnName.LINE_MISSED: CounterType.LINE,
+    ColumnName.METHOD_MISSED: CounterType.METHOD,
+    ColumnName.INSTRUCTION_MISSED: CounterType.INSTRUCTION,
+    ColumnName.COMPLEXITY_MISSED: CounterType.COMPLEXITY,
+    ColumnName.CLASS_MISSED: CounterType.CLASS,
+}
+COVERED_COLUMNS: dict[ColumnName, CounterType] = {
+    ColumnName.BRANCH_COVERED: CounterType.BRANCH,
+    ColumnName.LINE_COVERED: CounterType.LINE,
+    ColumnName.METHOD_COVERED: CounterType.METHOD,
+    ColumnName.INSTRUCTION_COVERED: CounterType.INSTRUCTION,
+    ColumnName.COMPLEXITY_COVERED: CounterType.COMPLEXITY,
+    ColumnName.CLASS_COVERED: CounterType.CLASS,
+}
+
+
+def get_column_counter(column_name: ColumnName) -> CounterType | None:
+    """Return the counter shown by a column, None for the names."""
+    return BAR_COLUMNS.get(column_name) \
+        or MISSED_COLUMNS.get(column_name) \
+        or COVERED_COLUMNS.get(column_name)
+
+
+def get_columns_plan(columns: list[ColumnName]) -> ParsePlan:
+    """Return the counters to load to show some columns."""
+    if any(get_column_counter(column) in EXTRA_COUNTER_TYPES
+           for column in columns):
+        return ParsePlan.EXTRA_COUNTERS
+    return ParsePlan.NAMES
+
+
 class Coverage:
 
+    __slots__ = (
+        'name',
+        'branch_missed',
+        'branch_covered',
+        'line_missed',
+        'line_covered',
+        'method_missed',
+        'method_covered',
+        'extra_counters',
+    )
+
     def __init__(
         self,
         name: str,
@@ -17,7 +73,8 @@ class Coverage:
         line_missed: int = 0,
         line_covered: int = 0,
         method_missed: int = 0,
-        method_covered: int = 0
+        method_covered: int = 0,
+        extra_counters: ExtraCounters | None = None
     ) -> None:
         self.name = name
         self.branch_missed = branch_missed
@@ -26,15 +83,30 @@ class Coverage:
         self.line_covered = line_covered
         self.method_missed = method_missed
         self.method_covered = method_covered
+        # None when the instruction, complexity and class counters were not
+        # loaded
+        self.extra_counters = extra_counters
 
     @classmethod
-    def from_xml_element(cls, element: Element) -> Coverage:
+    def from_xml_element(cls, element: Element,
+                         plan: ParsePlan = ParsePlan.ALL) -> Coverage:
+        """Create a coverage from the counters of an element.
+
+        Args:
+            element: the element with the counters
+            plan: the parts of the report to build, the instruction,
+                complexity and class counters are only decoded when they
+                are in the plan
+        """
         branch_missed: int = 0
         branch_covered: int = 0
         line_missed: int = 0
         line_covered: int = 0
         method_missed: int = 0
         method_covered: int = 0
+        extra_counters: ExtraCounters | None = None
+        if ParsePlan.EXTRA_COUNTERS in plan:
+            extra_counters = ExtraCounters()
 
         for child in element:
             if child.tag != 'counter':
@@ -55,7 +127,12 @@ class Coverage:
                     method_covered = int(child.attrib['covered'])
 
                 case _:
-                    pass
+                    if extra_counters is not None:
+                        extra_counters.set_counter(
+                            counter_type,
+                            int(child.attrib['missed']),
+                            int(child.attrib['covered'])
+                        )
 
         return cls(
             element.attrib['name'],
@@ -64,25 +141,74 @@ class Coverage:
             line_missed,
             line_covered,
             method_missed,
-            method_covered
+            method_covered,
+            extra_counters=extra_counters
         )
 
+    def add_counters(self, other: Coverage) -> None:
+        """Add the counters of another coverage to this one."""
+        self.branch_missed += other.branch_missed
+        self.branch_covered += other.branch_covered
+        self.line_missed += other.line_missed
+        self.line_covered += other.line_covered
+        self.method_missed += other.method_missed
+        self.method_covered += other.method_covered
+        if other.extra_counters is not None:
+            if self.extra_counters is None:
+                self.extra_counters = ExtraCounters()
+            self.extra_counters.add_counters(other.extra_counters)
+
+    def get_counter(self, counter_type: CounterType) -> tuple[int, int]:
+        """Return the missed and covered counts of a counter, none for the
+        instruction, complexity and class counters when they were not
+        loaded."""
+        match counter_type:
+            case CounterType.BRANCH:
+                return self.branch_missed, self.branch_covered
+
+            case CounterType.LINE:
+                return self.line_missed, self.line_covered
+
+            case CounterType.METHOD:
+                return self.method_missed, self.method_covered
+
+            case _:
+                if self.extra_counters is None:
+                    return 0, 0
+                return self.extra_counters.get_counter(counter_type)
+
     def get_name(self) -> str:
         return self.name
 
-    def get_field(self, column_name: ColumnName) -> str:
+    def get_field(self, column_name: ColumnName,
+                  bar_width: int = PERCENTAGE_BAR_WIDTH) -> str:
         match column_name:
             case ColumnName.NAME:
                 return self.get_name()
 
             case ColumnName.BRANCH:
-                return percentage_bar(self.branch_missed, self.branch_covered)
+                return percentage_bar(self.branch_missed, self.branch_covered,
+                                      bar_width)
 
             case ColumnName.LINE:
-                return percentage_bar(self.line_missed, self.line_covered)
+                return percentage_bar(self.line_missed, self.line_covered,
+                                      bar_width)
 
             case ColumnName.METHOD:
-                return percentage_bar(self.method_missed, self.method_covered)
+                return percentage_bar(self.method_missed, self.method_covered,
+                                      bar_width)
+
+            case _ if column_name in BAR_COLUMNS:
+                return percentage_bar(
+                    *self.get_counter(BAR_COLUMNS[column_name]),
+                    bar_width
+                )
+
+            case _ if column_name in MISSED_COLUMNS:
+                return str(self.get_counter(MISSED_COLUMNS[column_name])[0])
+
+            case _ if column_name in COVERED_COLUMNS:
+                return str(self.get_counter(COVERED_COLUMNS[column_name])[1])
 
             case _:
                 assert False, 'unreachable'
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterator, Sequence
+import sys
+from typing import Generic, TypeAlias, TypeVar, overload
+
+from .coverage import Coverage
+from .extra_counters import ExtraCounters
+
+
+C = TypeVar('C', bound=Coverage)
+IndexSlice: TypeAlias = 'slice[int | None, int | None, int | None]'
+
+
+class CoverageColumns(Generic[C]):
+    '''Compact storage of many coverages of the same type.
+
+    The counters are stored in one array per counter and the names are
+    interned, instead of keeping one object per coverage. The instruction,
+    complexity and class counters are only stored for the rows that have
+    them. The rows are read through views, which create the coverage objects
+    on access.
+    '''
+
+    __slots__ = (
+        'row_type',
+        'names',
+        'branch_missed',
+        'branch_covered',
+        'line_missed',
+        'line_covered',
+        'method_missed',
+        'method_covered',
+        'extra_counters',
+    )
+
+    def __init__(self, row_type: type[C]) -> None:
+        self.row_type = row_type
+        self.names: list[str] = []
+        self.branch_missed = array('l')
+        self.branch_covered = array('l')
+        self.line_missed = array('l')
+        self.line_covered = array('l')
+        self.method_missed = array('l')
+        self.method_covered = array('l')
+        self.extra_counters: dict[int, tuple[int, int, int, int, int, int]] \
+            = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def append(self, coverage: C) -> None:
+        """Add a row at the end of the columns."""
+        extra_counters = coverage.extra_counters
+        if extra_counters is not None:
+            self.extra_counters[len(self.names)] = (
+                extra_counters.instruction_missed,
+                extra_counters.instruction_covered,
+                extra_counters.complexity_missed,
+                extra_counters.complexity_covered,
+                extra_counters.class_missed,
+                extra_counters.class_covered,
+            )
+        self.names.append(sys.intern(coverage.name))
+        self.branch_missed.append(coverage.branch_missed)
+        self.branch_covered.append(coverage.branch_covered)
+        self.line_missed.append(coverage.line_missed)
+        self.line_covered.append(coverage.line_covered)
+        self.method_missed.append(coverage.method_missed)
+        self.method_covered.append(coverage.method_covered)
+
+    def get_row(self, index: int) -> C:
+        """Return a new coverage object with the values of a row."""
+        extra_counters = self.extra_counters.get(index)
+        return self.row_type(
+            self.names[index],
+            self.branch_missed[index],
+            self.branch_covered[index],
+            self.line_missed[index],
+            self.line_covered[index],
+            self.method_missed[index],
+            self.method_covered[index],
+            extra_counters=None if extra_counters is None
+            else ExtraCounters(*extra_counters)
+        )
+
+    def view(self, start: int = 0, stop: int | None = None
+             ) -> CoverageColumnsView[C]:
+        """Return a read-only sequence over the rows from start to stop."""
+        if stop is None:
+            stop = len(self)
+        return CoverageColumnsView(self, start, stop)
+
+
+class CoverageColumnsView(Sequence[C]):
+    '''Read-only sequence over a range of rows of a CoverageColumns.
+
+    The coverage objects are created on access, so modifying them doesn't
+    change the columns.
+    '''
+
+    __slots__ = ('columns', 'start', 'stop')
+
+    def __init__(self, columns: CoverageColumns[C], start: int, stop: int
+                 ) -> None:
+        self.columns = columns
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    @overload
+    def __getitem__(self, index: int) -> C: ...
+
+    @overload
+    def __getitem__(self, index: IndexSlice) -> list[C]: ...
+
+    def __getitem__(self, index: int | IndexSlice) -> C | list[C]:
+        if not isinstance(index, int):
+            return [self.columns.get_row(self.start + i)
+                    for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('coverage columns index out of range')
+        return self.columns.get_row(self.start + index)
+
+    def __iter__(self) -> Iterator[C]:
+        for i in range(self.start, self.stop):
+            yield self.columns.get_row(i)
@@ -0,0 +1,107 @@
+"""Sort the rows of the tables and select the first ones."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+import heapq
+import math
+from typing import TypeVar
+
+from .coverage import Coverage
+from .sort_key import SortKey
+
+
+T = TypeVar('T')
+C = TypeVar('C', bound=Coverage)
+K = TypeVar('K', str, float)
+
+
+def get_ratio_key(missed: int, covered: int, reverse: bool) -> float:
+    """Return the ratio of covered items, sorted after the other ratios when
+    there is no item, whatever the direction of the sort."""
+    total = missed + covered
+    if total == 0:
+        return -math.inf if reverse else math.inf
+    return covered / total
+
+
+def get_sort_keys(coverages: Sequence[Coverage], sort_key: SortKey,
+                  reverse: bool) -> list[float]:
+    """Return the numeric key of each coverage, the lowest keys being the
+    worst coverages.
+
+    Args:
+        coverages: the coverages to sort
+        sort_key: the column to sort by, other than the name
+        reverse: whether the coverages are sorted from the best one
+    """
+    match sort_key:
+        case SortKey.BRANCH:
+            return [get_ratio_key(coverage.branch_missed,
+                                  coverage.branch_covered, reverse)
+                    for coverage in coverages]
+
+        case SortKey.LINE:
+            return [get_ratio_key(coverage.line_missed,
+                                  coverage.line_covered, reverse)
+                    for coverage in coverages]
+
+        case SortKey.METHOD:
+            return [get_ratio_key(coverage.method_missed,
+                                  coverage.method_covered, reverse)
+                    for coverage in coverages]
+
+        case SortKey.MISSED_LINES:
+            return [-coverage.line_missed for coverage in coverages]
+
+        case _:
+            assert False, 'unreachable'
+
+
+def select_rows(rows: Sequence[T], keys: Sequence[K], reverse: bool = False,
+                top: int | None = None) -> list[T]:
+    """Return the rows sorted by their keys, keeping the order of the rows
+    with the same key.
+
+    When only the first rows are kept, they are selected with a heap, so the
+    cost is linear in the number of rows instead of a full sort.
+
+    Args:
+        rows: the rows to sort
+        keys: the key of each row
+        reverse: whether to sort from the highest key
+        top: the number of rows to keep, all by default
+    """
+    def get_key(index: int) -> K:
+        return keys[index]
+
+    indexes = range(len(rows))
+    if top is None:
+        order = sorted(indexes, key=get_key, reverse=reverse)
+    elif reverse:
+        order = heapq.nlargest(top, indexes, key=get_key)
+    else:
+        order = heapq.nsmallest(top, indexes, key=get_key)
+    return [rows[index] for index in order]
+
+
+def sort_coverages(coverages: Sequence[C], sort_key: SortKey | None = None,
+                   reverse: bool = False, top: int | None = None
+                   ) -> list[C]:
+    """Return the coverages sorted from the worst to the best one, or by
+    name.
+
+    Args:
+        coverages: the coverages to sort
+        sort_key: the column to sort by, the order of the report by default
+        reverse: whether to reverse the order
+        top: the number of coverages to keep, all by default
+    """
+    if sort_key is None:
+        ordered = coverages[::-1] if reverse else coverages
+        return list(ordered[:top])
+    if sort_key is SortKey.NAME:
+        names = [coverage.get_name() for coverage in coverages]
+        return select_rows(coverages, names, reverse, top)
+    return select_rows(coverages, get_sort_keys(coverages, sort_key, reverse),
+                       reverse, top)
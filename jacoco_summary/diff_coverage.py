@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+
+from .coverage import Coverage
+from .report import Report
+from .source_file_coverage import SourceFileCoverage
+
+
+class DiffCoverage(Coverage):
+    '''Coverage of the lines of a source file changed by a diff.
+
+    Only the line counters are set, and the missed lines are kept as ranges of
+    consecutive lines with code.
+    '''
+
+    __slots__ = ('missed_lines',)
+
+    def __init__(
+        self,
+        name: str,
+        branch_missed: int = 0,
+        branch_covered: int = 0,
+        line_missed: int = 0,
+        line_covered: int = 0,
+        method_missed: int = 0,
+        method_covered: int = 0,
+        missed_lines: list[tuple[int, int]] = None
+    ) -> None:
+        super().__init__(
+            name,
+            branch_missed,
+            branch_covered,
+            line_missed,
+            line_covered,
+            method_missed,
+            method_covered
+        )
+        if missed_lines is None:
+            missed_lines = []
+        self.missed_lines = missed_lines
+
+    @classmethod
+    def from_source_file(cls, source_file: SourceFileCoverage,
+                         ranges: Sequence[tuple[int, int]]) -> DiffCoverage:
+        """Return the coverage of the lines of a source file in some ranges.
+
+        Args:
+            source_file: a source file loaded with its lines
+            ranges: the sorted ranges of changed lines of the file
+        """
+        assert source_file.lines is not None, 'the lines were not loaded'
+        covered, missed, missed_lines = \
+            source_file.lines.get_ranges_coverage(ranges)
+        return cls(
+            source_file.name,
+            line_missed=missed,
+            line_covered=covered,
+            missed_lines=missed_lines
+        )
+
+
+def find_source_file(report: Report, path: str) -> SourceFileCoverage | None:
+    """Return the source file of the report matching the path of a file in the
+    repository.
+
+    The source files are named by their package path, which ends the path of
+    the file in the repository, so the suffixes of the path starting after a
+    '/' are looked up from the longest one.
+
+    Args:
+        report: the report to search in
+        path: the path of a file in the repository
+    """
+    start = 0
+    while True:
+        source_file = report.get_source_file(path[start:])
+        if source_file is not None:
+            return source_file
+        start = path.find('/', start) + 1
+        if start == 0:
+            return None
+
+
+def get_diff_coverage(report: Report,
+                      changed_lines: Mapping[str, Sequence[tuple[int, int]]]
+                      ) -> list[DiffCoverage]:
+    """Return the coverage of the changed lines of each file of the report.
+
+    The files not in the report and the files whose changed lines contain no
+    code are omitted.
+
+    Args:
+        report: a report loaded with the lines of its source files
+        changed_lines: the sorted ranges of changed lines of each file path
+    """
+    files_coverage: list[DiffCoverage] = []
+    for path, ranges in changed_lines.items():
+        source_file = find_source_file(report, path)
+        if source_file is None:
+            continue
+        file_coverage = DiffCoverage.from_source_file(source_file, ranges)
+        if file_coverage.line_missed + file_coverage.line_covered > 0:
+            files_coverage.append(file_coverage)
+    return files_coverage
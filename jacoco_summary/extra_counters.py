@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from .counter_type import CounterType
+
+
+# The counters of a coverage that are only loaded when a column shows them.
+EXTRA_COUNTER_TYPES: frozenset[CounterType] = frozenset((
+    CounterType.INSTRUCTION,
+    CounterType.COMPLEXITY,
+    CounterType.CLASS,
+))
+
+
+class ExtraCounters:
+    '''Instruction, complexity and class counters of a coverage.
+
+    They are kept apart from the branch, line and method counters, so the
+    coverages loaded without them only hold a None.
+    '''
+
+    __slots__ = (
+        'instruction_missed',
+        'instruction_covered',
+        'complexity_missed',
+        'complexity_covered',
+        'class_missed',
+        'class_covered',
+    )
+
+    def __init__(
+        self,
+        instruction_missed: int = 0,
+        instruction_covered: int = 0,
+        complexity_missed: int = 0,
+        complexity_covered: int = 0,
+        class_missed: int = 0,
+        class_covered: int = 0
+    ) -> None:
+        self.instruction_missed = instruction_missed
+        self.instruction_covered = instruction_covered
+        self.complexity_missed = complexity_missed
+        self.complexity_covered = complexity_covered
+        self.class_missed = class_missed
+        self.class_covered = class_covered
+
+    def get_counter(self, counter_type: CounterType) -> tuple[int, int]:
+        """Return the missed and covered counts of a counter."""
+        match counter_type:
+            case CounterType.INSTRUCTION:
+                return self.instruction_missed, self.instruction_covered
+
+            case CounterType.COMPLEXITY:
+                return self.complexity_missed, self.complexity_covered
+
+            case CounterType.CLASS:
+                return self.class_missed, self.class_covered
+
+            case _:
+                assert False, 'unreachable'
+
+    def set_counter(self, counter_type: CounterType, missed: int,
+                    covered: int) -> None:
+        """Set the missed and covered counts of a counter."""
+        match counter_type:
+            case CounterType.INSTRUCTION:
+                self.instruction_missed = missed
+                self.instruction_covered = covered
+
+            case CounterType.COMPLEXITY:
+                self.complexity_missed = missed
+                self.complexity_covered = covered
+
+            case CounterType.CLASS:
+                self.class_missed = missed
+                self.class_covered = covered
+
+            case _:
+                assert False, 'unreachable'
+
+    def add_counters(self, other: ExtraCounters) -> None:
+        """Add the counters of another one to these ones."""
+        self.instruction_missed += other.instruction_missed
+        self.instruction_covered += other.instruction_covered
+        self.complexity_missed += other.complexity_missed
+        self.complexity_covered += other.complexity_covered
+        self.class_missed += other.class_missed
+        self.class_covered += other.class_covered
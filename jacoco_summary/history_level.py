@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class HistoryLevel(Enum):
+    REPORT  = 'report'
+    PACKAGE = 'package'
+    CLASS   = 'class'
@@ -0,0 +1,277 @@
+"""History of the coverage of the builds, kept in a SQLite database."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+import errno
+import os
+import sqlite3
+import time
+
+from .counter_type import CounterType
+from .coverage import Coverage
+from .extra_counters import ExtraCounters
+from .history_level import HistoryLevel
+from .report import Report
+
+
+HISTORY_FILE_NAME: str = 'history.sqlite3'
+# Bump when the schema of the database changes.
+HISTORY_VERSION: int = 1
+# The counters of the entries, in the order of the arguments of Coverage and
+# then of ExtraCounters.
+HISTORY_COUNTER_TYPES: tuple[CounterType, ...] = (
+    CounterType.BRANCH,
+    CounterType.LINE,
+    CounterType.METHOD,
+    CounterType.INSTRUCTION,
+    CounterType.COMPLEXITY,
+    CounterType.CLASS,
+)
+COUNTER_COLUMNS: tuple[str, ...] = tuple(
+    f'{counter_type.name.lower()}_{count}'
+    for counter_type in HISTORY_COUNTER_TYPES
+    for count in ('missed', 'covered')
+)
+# The number of counts passed to Coverage, the others to ExtraCounters.
+COVERAGE_COUNTS: int = 6
+# The name of the entry of the totals of the reports, whose names may change
+# between the builds.
+REPORT_ENTRY_NAME: str = ''
+COMMIT_ABBREVIATION_LENGTH: int = 10
+TIMESTAMP_FORMAT: str = '%Y-%m-%d %H:%M'
+# The counters of an entry are clustered by entry then by build, so the trend
+# of an entry is a range scan whatever the number of builds, and the index on
+# the builds finds the counters of a build recorded again.
+HISTORY_SCHEMA: str = '''
+CREATE TABLE builds (
+    id INTEGER PRIMARY KEY,
+    build_id TEXT NOT NULL UNIQUE,
+    commit_id TEXT,
+    timestamp INTEGER NOT NULL
+);
+CREATE TABLE entries (
+    id INTEGER PRIMARY KEY,
+    level TEXT NOT NULL,
+    name TEXT NOT NULL,
+    UNIQUE (level, name)
+);
+CREATE TABLE counters (
+    entry INTEGER NOT NULL REFERENCES entries (id),
+    build INTEGER NOT NULL REFERENCES builds (id),
+    {counter_columns},
+    PRIMARY KEY (entry, build)
+) WITHOUT ROWID;
+CREATE INDEX counters_build ON counters (build);
+'''
+
+
+def get_history_path() -> str:
+    """Return the default path of the history database."""
+    data_home = os.environ.get('XDG_DATA_HOME') \
+        or os.path.join(os.path.expanduser('~'), '.local', 'share')
+    return os.path.join(data_home, 'jacoco-summary', HISTORY_FILE_NAME)
+
+
+def initialize_history(connection: sqlite3.Connection) -> None:
+    """Create the tables of an empty database, and check the version of the
+    other ones.
+
+    Raises:
+        ValueError: if the database was written by an incompatible version
+        sqlite3.Error: if the file is not a database
+    """
+    version_row: tuple[int] = \
+        connection.execute('PRAGMA user_version').fetchone()
+    version = version_row[0]
+    if version == HISTORY_VERSION:
+        return
+    if version != 0:
+        raise ValueError(f'unsupported history version: {version}')
+    counter_columns = ',\n    '.join(f'{column} INTEGER NOT NULL'
+                                     for column in COUNTER_COLUMNS)
+    connection.executescript(
+        HISTORY_SCHEMA.format(counter_columns=counter_columns)
+        + f'PRAGMA user_version = {HISTORY_VERSION};'
+    )
+
+
+@contextmanager
+def open_history(database_path: str,
+                 create: bool = True) -> Iterator[sqlite3.Connection]:
+    """Open the history database while in the context.
+
+    Args:
+        database_path: the path of the database
+        create: whether to create the database and its directory when they
+            don't exist
+
+    Raises:
+        FileNotFoundError: if the database doesn't exist and is not created
+        OSError: if the directory of the database can't be created
+        ValueError: if the database was written by an incompatible version
+        sqlite3.Error: if the file is not a database
+    """
+    if create:
+        directory = os.path.dirname(database_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    elif not os.path.exists(database_path):
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT),
+                                database_path)
+    connection = sqlite3.connect(database_path)
+    try:
+        # the readers don't wait for the recording of a build, which is only
+        # written to disk once
+        connection.execute('PRAGMA journal_mode = WAL')
+        connection.execute('PRAGMA synchronous = NORMAL')
+        initialize_history(connection)
+        yield connection
+    finally:
+        connection.close()
+
+
+def get_counts(coverage: Coverage) -> list[int]:
+    """Return the counts of a coverage, in the order of COUNTER_COLUMNS."""
+    return [count
+            for counter_type in HISTORY_COUNTER_TYPES
+            for count in coverage.get_counter(counter_type)]
+
+
+def get_report_entries(report: Report
+                       ) -> list[tuple[HistoryLevel, str, Coverage]]:
+    """Return the recorded entries of a report: its totals, its packages and
+    its classes, named like in the package and class subcommands."""
+    entries: list[tuple[HistoryLevel, str, Coverage]] = [
+        (HistoryLevel.REPORT, REPORT_ENTRY_NAME, report),
+    ]
+    for package in report.packages:
+        entries.append((HistoryLevel.PACKAGE, package.get_name(), package))
+        entries.extend((HistoryLevel.CLASS, java_class.get_name(), java_class)
+                       for java_class in package.classes)
+    return entries
+
+
+def record_report(connection: sqlite3.Connection, report: Report,
+                  build_id: str, commit: str | None,
+                  timestamp: int) -> int:
+    """Record the counters of a report for a build, replacing those recorded
+    before for the same build.
+
+    The new names are added and the counters are inserted with one
+    executemany each, in a single transaction. When two classes have the same
+    name, the first one is recorded, like the class subcommand shows.
+
+    Args:
+        connection: the history database
+        report: the report, with the counters of its packages and classes
+        build_id: the identifier of the build
+        commit: the commit of the build, if known
+        timestamp: the time of the build, in seconds since the epoch
+
+    Returns:
+        the number of recorded entries
+
+    Raises:
+        sqlite3.Error: if the database can't be written
+    """
+    entries = get_report_entries(report)
+    with connection:
+        connection.execute(
+            'DELETE FROM counters WHERE build IN '
+            '(SELECT id FROM builds WHERE build_id = ?)',
+            (build_id,)
+        )
+        connection.execute('DELETE FROM builds WHERE build_id = ?',
+                           (build_id,))
+        build = connection.execute(
+            'INSERT INTO builds (build_id, commit_id, timestamp) '
+            'VALUES (?, ?, ?)',
+            (build_id, commit, timestamp)
+        ).lastrowid
+        connection.executemany(
+            'INSERT OR IGNORE INTO entries (level, name) VALUES (?, ?)',
+            [(level.value, name) for level, name, _ in entries]
+        )
+        # each entry is found with the unique index on the names, so the
+        # cost doesn't grow with the names recorded by the previous builds
+        placeholders = ', '.join('?' * len(COUNTER_COLUMNS))
+        connection.executemany(
+            'INSERT OR IGNORE INTO counters '
+            f'(entry, build, {", ".join(COUNTER_COLUMNS)}) '
+            f'SELECT id, ?, {placeholders} FROM entries '
+            'WHERE level = ? AND name = ?',
+            [(build, *get_counts(coverage), level.value, name)
+             for level, name, coverage in entries]
+        )
+    return len(entries)
+
+
+def get_build_name(build_id: str, commit: str | None, timestamp: int) -> str:
+    """Return the name of the row of a build, with its abbreviated commit and
+    its local time."""
+    name = build_id
+    if commit:
+        name += f' {commit[:COMMIT_ABBREVIATION_LENGTH]}'
+    local_time = time.localtime(timestamp)
+    return f'{name} {time.strftime(TIMESTAMP_FORMAT, local_time)}'
+
+
+def create_coverage(name: str, counts: Sequence[int]) -> Coverage:
+    """Create a coverage from counts in the order of COUNTER_COLUMNS."""
+    branch_missed, branch_covered, line_missed, line_covered, \
+        method_missed, method_covered = counts[:COVERAGE_COUNTS]
+    return Coverage(name, branch_missed, branch_covered, line_missed,
+                    line_covered, method_missed, method_covered,
+                    ExtraCounters(*counts[COVERAGE_COUNTS:]))
+
+
+def query_history(connection: sqlite3.Connection, level: HistoryLevel,
+                  name: str = REPORT_ENTRY_NAME, last: int | None = None,
+                  detailed_names: bool = True) -> list[Coverage] | None:
+    """Return the coverage of an entry in the recorded builds, from the
+    oldest to the newest by their times, then in the order they were
+    recorded.
+
+    Args:
+        connection: the history database
+        level: the level of the entry
+        name: the name of the entry, like in the package and class
+            subcommands, ignored for the report
+        last: the number of most recent builds to return, all by default
+        detailed_names: whether the rows are named after the builds, their
+            commits and their times, or after the builds only
+
+    Returns:
+        a coverage per build recording the entry, None if no build recorded
+        it
+
+    Raises:
+        sqlite3.Error: if the database can't be read
+    """
+    if level is HistoryLevel.REPORT:
+        name = REPORT_ENTRY_NAME
+    entry_row: tuple[int] | None = connection.execute(
+        'SELECT id FROM entries WHERE level = ? AND name = ?',
+        (level.value, name)
+    ).fetchone()
+    if entry_row is None:
+        return None
+    rows: list[tuple[str, str | None, int, *tuple[int, ...]]] = \
+        connection.execute(
+            'SELECT builds.build_id, builds.commit_id, builds.timestamp, '
+            + ', '.join(f'counters.{column}' for column in COUNTER_COLUMNS)
+            + ' FROM counters JOIN builds ON builds.id = counters.build'
+            ' WHERE counters.entry = ?'
+            ' ORDER BY builds.timestamp DESC, counters.build DESC LIMIT ?',
+            (entry_row[0], -1 if last is None else last)
+        ).fetchall()
+    coverages: list[Coverage] = []
+    for build_id, commit, timestamp, *counts in reversed(rows):
+        coverages.append(create_coverage(
+            get_build_name(build_id, commit, timestamp) if detailed_names
+            else build_id,
+            counts
+        ))
+    return coverages
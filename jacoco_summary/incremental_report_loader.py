@@ -0,0 +1,141 @@
+"""Reload a report file, parsing only the packages that changed."""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+from xml.etree.ElementTree import ParseError
+
+from .name_filter import NameFilter
+from .package_coverage import PackageCoverage
+from .parse_plan import ParsePlan
+from .report import Report
+from .report_cache import load_report
+from .report_file import map_report_file
+from .report_parser import (
+    ReportParser,
+    find_package_ranges,
+    get_package_name,
+)
+from .report_totals import find_report_totals
+from .xml_parsing_exception import XmlParsingException
+
+
+PACKAGE_DIGEST_SIZE: int = 16
+
+FileState = tuple[int, int]
+
+
+def get_file_state(xml_file_path: str) -> FileState:
+    """Return the modification time and the size of a file.
+
+    Raises:
+        OSError: if the file can't be accessed
+    """
+    stat = os.stat(xml_file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class IncrementalReportLoader:
+    '''Loader of a report file that reuses the packages of the previous load
+    whose content didn't change.
+
+    The packages are found by their byte ranges in the file, hashed, and only
+    the ranges whose digest is new are parsed. The counters of the report are
+    read from the end of the file. The files without the layout written by
+    JaCoCo and the compressed files are parsed entirely.
+    '''
+
+    def __init__(self, xml_file_path: str, plan: ParsePlan = ParsePlan.ALL,
+                 name_filter: NameFilter | None = None) -> None:
+        self.xml_file_path = xml_file_path
+        self.plan = plan
+        self.name_filter = name_filter
+        # the number of package ranges parsed by the last load, None if the
+        # whole file was parsed
+        self.parsed_packages: int | None = None
+        self._state: FileState | None = None
+        self._report: Report | None = None
+        self._packages: dict[bytes, list[PackageCoverage]] = {}
+
+    def load(self) -> Report:
+        """Return the report, reparsed if the file changed since the last
+        load.
+
+        Raises:
+            OSError: if the file can't be read
+            ParseError: if the file is not a valid xml file
+            XmlParsingException: if the file is not a JaCoCo report
+        """
+        state = get_file_state(self.xml_file_path)
+        if self._report is not None and state == self._state:
+            return self._report
+
+        report: Report | None = None
+        if ParsePlan.TOTALS not in self.plan:
+            with map_report_file(self.xml_file_path) as data:
+                if data is not None:
+                    report = self._load_packages(data)
+        if report is None:
+            self._packages = {}
+            self.parsed_packages = None
+            report = load_report(self.xml_file_path, self.plan,
+                                 use_cache=False, name_filter=self.name_filter)
+
+        self._state = state
+        self._report = report
+        return report
+
+    def _load_packages(self, data: mmap.mmap) -> Report | None:
+        """Return the report with the packages that didn't change reused, None
+        if the file doesn't have the expected layout or can't be parsed by
+        packages."""
+        report = find_report_totals(data, self.plan)
+        ranges = find_package_ranges(data)
+        if report is None or ranges is None:
+            return None
+
+        digests: list[bytes] = []
+        with memoryview(data) as view:
+            for start, end in ranges:
+                digests.append(hashlib.blake2b(
+                    view[start:end],
+                    digest_size=PACKAGE_DIGEST_SIZE
+                ).digest())
+
+        packages: dict[bytes, list[PackageCoverage]] = {}
+        parsed_packages = 0
+        parser = ReportParser(self.plan, self.name_filter)
+        try:
+            parser.feed(b'<report name="">')
+            for digest, (start, end) in zip(digests, ranges):
+                if digest in packages:
+                    continue
+                previous_packages = self._packages.get(digest)
+                if previous_packages is not None:
+                    packages[digest] = previous_packages
+                    continue
+                if self.name_filter is not None:
+                    name = get_package_name(data, start)
+                    if name is not None \
+                            and not self.name_filter.accepts_package(name):
+                        packages[digest] = []
+                        continue
+                parser.feed(data[start:end])
+                packages[digest] = parser.read_packages()
+                parsed_packages += 1
+            parser.feed(b'</report>')
+            parser.close()
+        except (ParseError, XmlParsingException):
+            return None
+
+        self.parsed_packages = parsed_packages
+        self._packages = packages
+        report.packages = [
+            package for digest in digests for package in packages[digest]
+        ]
+        if self.name_filter is not None:
+            # the counters of the report count the filtered out entries
+            return self.name_filter.filter_report(report)
+        return report
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from enum import Flag
+
+
+class LineStatus(Flag):
+    '''Coverage status of a source line, computed like JaCoCo does.
+
+    The status of a line is the union of the status of its instructions and
+    of its branches, so a line with both missed and covered items is partly
+    covered.
+    '''
+    EMPTY          = 0
+    NOT_COVERED    = 1
+    FULLY_COVERED  = 2
+    PARTLY_COVERED = 3
+
+    @classmethod
+    def from_counter(cls, missed: int, covered: int) -> LineStatus:
+        """Return the status of a counter of a line."""
+        status = cls.EMPTY
+        if missed:
+            status |= cls.NOT_COVERED
+        if covered:
+            status |= cls.FULLY_COVERED
+        return status
+
+    @classmethod
+    def from_counters(cls, missed_instructions: int, covered_instructions: int,
+                      missed_branches: int, covered_branches: int
+                      ) -> LineStatus:
+        """Return the status of a line from its counters."""
+        return (
+            cls.from_counter(missed_instructions, covered_instructions)
+            | cls.from_counter(missed_branches, covered_branches)
+        )
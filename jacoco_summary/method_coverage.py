@@ -3,13 +3,17 @@ from __future__ import annotations
 from xml.etree.ElementTree import Element
 
 from .coverage import Coverage
+from .parse_plan import ParsePlan
 
 
 class MethodCoverage(Coverage):
 
+    __slots__ = ()
+
     @classmethod
-    def from_xml_element(cls, element: Element) -> MethodCoverage:
-        base_instance = super().from_xml_element(element)
+    def from_xml_element(cls, element: Element,
+                         plan: ParsePlan = ParsePlan.ALL) -> MethodCoverage:
+        base_instance = super().from_xml_element(element, plan)
         return cls(
             base_instance.name,
             base_instance.branch_missed,
@@ -17,5 +21,6 @@ class MethodCoverage(Coverage):
             base_instance.line_missed,
             base_instance.line_covered,
             base_instance.method_missed,
-            base_instance.method_covered
+            base_instance.method_covered,
+            base_instance.extra_counters
         )
@@ -0,0 +1,253 @@
+"""Filter the packages, classes and source files of a report by their names."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+import re
+
+from .package_coverage import PackageCoverage
+from .parse_plan import ParsePlan
+from .report import Report
+
+
+REGEX_PATTERN_PREFIX: str = 're:'
+# The characters starting a special sequence of a regular expression, the
+# literal prefix of a pattern ends at the first of them.
+REGEX_SPECIAL_CHARACTERS: frozenset[str] = frozenset('.^$*+?{}[]\\|()')
+# The characters making the previous character of a regular expression
+# optional.
+REGEX_OPTIONAL_QUANTIFIERS: frozenset[str] = frozenset('*?{')
+GLOB_SPECIAL_CHARACTERS: frozenset[str] = frozenset('*?[')
+
+
+def glob_to_regex(pattern: str) -> str:
+    """Translate a glob pattern into a regular expression matching the same
+    names.
+
+    * and ? match within a component of a name, ** matches any number of
+    components, and a trailing /** also matches the name before it, so
+    com/acme/** matches the package com/acme and everything in it.
+    """
+    regex: list[str] = []
+    index = 0
+    while index < len(pattern):
+        if pattern.startswith('**/', index):
+            regex.append('(?:.*/)?')
+            index += 3
+        elif pattern.startswith('/**', index) and index + 3 == len(pattern):
+            regex.append('(?:/.*)?')
+            index += 3
+        elif pattern.startswith('**', index):
+            regex.append('.*')
+            index += 2
+        elif pattern[index] == '*':
+            regex.append('[^/]*')
+            index += 1
+        elif pattern[index] == '?':
+            regex.append('[^/]')
+            index += 1
+        elif pattern[index] == '[' and ']' in pattern[index + 2:]:
+            end = pattern.index(']', index + 2)
+            characters = pattern[index + 1:end].replace('\\', '\\\\')
+            if characters.startswith('!'):
+                characters = '^' + characters[1:]
+            elif characters.startswith('^'):
+                characters = '\\' + characters
+            regex.append(f'[{characters}]')
+            index = end + 1
+        else:
+            regex.append(re.escape(pattern[index]))
+            index += 1
+    return ''.join(regex)
+
+
+def get_pattern_regex(pattern: str) -> str:
+    """Return the regular expression of a glob pattern, or of a regular
+    expression prefixed with re:."""
+    if pattern.startswith(REGEX_PATTERN_PREFIX):
+        return pattern[len(REGEX_PATTERN_PREFIX):]
+    return glob_to_regex(pattern)
+
+
+def get_literal_prefix(pattern: str) -> str:
+    """Return the beginning shared by all the names matched by a pattern.
+
+    Args:
+        pattern: a glob pattern, or a regular expression prefixed with re:
+    """
+    if not pattern.startswith(REGEX_PATTERN_PREFIX):
+        for index, character in enumerate(pattern):
+            if character in GLOB_SPECIAL_CHARACTERS:
+                return pattern[:index]
+        return pattern
+
+    regex = pattern[len(REGEX_PATTERN_PREFIX):]
+    if '|' in regex:
+        # the alternatives may start with anything
+        return ''
+    for index, character in enumerate(regex):
+        if character in REGEX_SPECIAL_CHARACTERS:
+            if character in REGEX_OPTIONAL_QUANTIFIERS:
+                return regex[:max(index - 1, 0)]
+            return regex[:index]
+    return regex
+
+
+def compile_patterns(patterns: Sequence[str]) -> re.Pattern[str] | None:
+    """Compile patterns into one regular expression matching the names
+    matched by any of them, None if there is no pattern.
+
+    Raises:
+        ValueError: if a regular expression is not valid
+    """
+    if not patterns:
+        return None
+    regexes: list[str] = []
+    for pattern in patterns:
+        regex = get_pattern_regex(pattern)
+        try:
+            re.compile(regex)
+        except re.error as error:
+            raise ValueError(
+                f'invalid regular expression: {repr(pattern)}, {error.msg}'
+            ) from error
+        regexes.append(f'(?:{regex})')
+    try:
+        return re.compile('|'.join(regexes))
+    except re.error as error:
+        # like a group name used by two patterns
+        raise ValueError(f'invalid patterns: {error.msg}') from error
+
+
+def get_filter_plan(plan: ParsePlan) -> ParsePlan:
+    """Return the parse plan building what a filter needs to count the
+    coverage of the kept entries.
+
+    The counters of the packages and of the report are summed from their
+    kept classes or source files, so they are built when the plan doesn't
+    build any of them, and the totals can't be read from the end of the
+    files.
+    """
+    if ParsePlan.TOTALS in plan:
+        return ParsePlan.CLASSES | (plan & ParsePlan.EXTRA_COUNTERS)
+    if plan & (ParsePlan.CLASSES | ParsePlan.SOURCE_FILES):
+        return plan
+    return plan | ParsePlan.CLASSES
+
+
+class NameFilter:
+    '''Filter of the packages, classes and source files of a report.
+
+    The patterns match the slash separated names of the report, like
+    com/acme/Main for a class and com/acme/Main.java for a source file. An
+    entry is kept when neither it nor its package matches an exclude pattern
+    and, when there are include patterns, when it or its package matches one
+    of them. The packages left without classes and source files are removed.
+
+    The include and exclude patterns are compiled into one regular expression,
+    so each name is matched once. The packages that can't contain a kept
+    entry are found from the literal prefixes of the include patterns, so
+    the parser skips them without building anything.
+    '''
+
+    def __init__(self, includes: Sequence[str] = (),
+                 excludes: Sequence[str] = ()) -> None:
+        """
+        Args:
+            includes: the glob patterns or the regular expressions prefixed
+                with re: of the names to keep, all the names when empty
+            excludes: the patterns of the names to remove
+
+        Raises:
+            ValueError: if a regular expression is not valid
+        """
+        self.includes = tuple(includes)
+        self.excludes = tuple(excludes)
+        self._include = compile_patterns(self.includes)
+        self._exclude = compile_patterns(self.excludes)
+        include_regex = '.*' if self._include is None else \
+            self._include.pattern
+        exclude_lookahead = '' if self._exclude is None else \
+            f'(?!(?:{self._exclude.pattern})\\Z)'
+        try:
+            self._matcher = re.compile(
+                f'{exclude_lookahead}(?:{include_regex})'
+            )
+        except re.error as error:
+            # like a group name used by an include and an exclude pattern
+            raise ValueError(f'invalid patterns: {error.msg}') from error
+        self._include_prefixes = tuple(
+            get_literal_prefix(pattern) for pattern in self.includes
+        )
+
+    def get_key(self) -> str:
+        """Return a string identifying the patterns of the filter."""
+        return '\0'.join([f'+{pattern}' for pattern in self.includes]
+                         + [f'-{pattern}' for pattern in self.excludes])
+
+    def includes_package(self, package_name: str) -> bool:
+        """Return whether the entries of a package are included by its
+        name."""
+        return self._include is None \
+            or self._include.fullmatch(package_name) is not None
+
+    def accepts_package(self, package_name: str) -> bool:
+        """Return whether a package may contain a kept entry."""
+        if self._exclude is not None \
+                and self._exclude.fullmatch(package_name) is not None:
+            return False
+        if self.includes_package(package_name):
+            return True
+        # the names of the entries of the package start with its name
+        entry_prefix = package_name + '/'
+        return any(entry_prefix.startswith(prefix)
+                   or prefix.startswith(entry_prefix)
+                   for prefix in self._include_prefixes)
+
+    def accepts(self, name: str, package_included: bool) -> bool:
+        """Return whether a class or a source file is kept.
+
+        Args:
+            name: the name of the class or of the source file
+            package_included: whether the package of the entry is accepted
+                and included by its name
+        """
+        if package_included:
+            return self._exclude is None \
+                or self._exclude.fullmatch(name) is None
+        return self._matcher.fullmatch(name) is not None
+
+    def filter_package(self, package: PackageCoverage
+                       ) -> PackageCoverage | None:
+        """Return a package with only its kept classes and source files, and
+        their counters, None if none is kept."""
+        if not self.accepts_package(package.name):
+            return None
+        package_included = self.includes_package(package.name)
+        classes = [java_class for java_class in package.classes
+                   if self.accepts(java_class.name, package_included)]
+        source_files = [file for file in package.source_files
+                        if self.accepts(file.name, package_included)]
+        if not classes and not source_files:
+            return None
+        filtered_package = PackageCoverage(package.name, classes=classes,
+                                           source_files=source_files)
+        for coverage in classes or source_files:
+            filtered_package.add_counters(coverage)
+        return filtered_package
+
+    def filter_report(self, report: Report) -> Report:
+        """Return a report with only its kept entries, and their counters.
+
+        The plan of the report must build the classes or the source files,
+        like the plans returned by get_filter_plan.
+        """
+        filtered_report = Report(report.name)
+        packages: list[PackageCoverage] = []
+        for package in report.packages:
+            filtered_package = self.filter_package(package)
+            if filtered_package is not None:
+                packages.append(filtered_package)
+                filtered_report.add_counters(filtered_package)
+        filtered_report.packages = packages
+        return filtered_report
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class OutputFormat(Enum):
+    TABLE  = 'table'
+    CSV    = 'csv'
+    JSON   = 'json'
+    NDJSON = 'ndjson'
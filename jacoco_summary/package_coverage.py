@@ -4,12 +4,18 @@ from xml.etree.ElementTree import Element
 
 from .class_coverage import ClassCoverage
 from .coverage import Coverage
+from .coverage_columns import CoverageColumns
+from .extra_counters import ExtraCounters
+from .method_coverage import MethodCoverage
+from .parse_plan import ParsePlan
 from .source_file_coverage import SourceFileCoverage
 from .xml_parsing_exception import XmlParsingException
 
 
 class PackageCoverage(Coverage):
 
+    __slots__ = ('classes', 'source_files')
+
     def __init__(
         self,
         name: str,
@@ -20,7 +26,8 @@ class PackageCoverage(Coverage):
         method_missed: int = 0,
         method_covered: int = 0,
         classes: list[ClassCoverage] = None,
-        source_files: list[SourceFileCoverage] = None
+        source_files: list[SourceFileCoverage] = None,
+        extra_counters: ExtraCounters | None = None
     ) -> None:
         super().__init__(
             name,
@@ -29,7 +36,8 @@ class PackageCoverage(Coverage):
             line_missed,
             line_covered,
             method_missed,
-            method_covered
+            method_covered,
+            extra_counters
         )
         if classes is None:
             classes = []
@@ -39,18 +47,36 @@ class PackageCoverage(Coverage):
         self.source_files = source_files
 
     @classmethod
-    def from_xml_element(cls, element: Element) -> PackageCoverage:
-        base_instance = super().from_xml_element(element)
+    def from_xml_element(cls, element: Element,
+                         plan: ParsePlan = ParsePlan.ALL) -> PackageCoverage:
+        base_instance: Coverage
+        if ParsePlan.PACKAGE_COUNTERS in plan:
+            base_instance = super().from_xml_element(element, plan)
+        else:
+            base_instance = Coverage(element.attrib['name'])
+
+        method_columns: CoverageColumns[MethodCoverage] | None = None
+        if ParsePlan.COMPACT in plan:
+            method_columns = CoverageColumns(MethodCoverage)
 
         classes: list[ClassCoverage] = []
         source_files: list[SourceFileCoverage] = []
         for child in element:
             if child.tag == 'class':
-                classes.append(ClassCoverage.from_xml_element(child))
+                if ParsePlan.CLASSES in plan:
+                    classes.append(ClassCoverage.from_xml_element(
+                        child,
+                        plan,
+                        method_columns
+                    ))
                 continue
 
             if child.tag == 'sourcefile':
-                source_files.append(SourceFileCoverage.from_xml_element(child))
+                if ParsePlan.SOURCE_FILES not in plan:
+                    continue
+                source_files.append(
+                    SourceFileCoverage.from_xml_element(child, plan)
+                )
                 source_files[-1].name = \
                                  f'{base_instance.name}/{source_files[-1].name}'
                 continue
@@ -70,7 +96,8 @@ class PackageCoverage(Coverage):
             base_instance.method_missed,
             base_instance.method_covered,
             classes,
-            source_files
+            source_files,
+            base_instance.extra_counters
         )
 
     def get_name(self) -> str:
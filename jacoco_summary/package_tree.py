@@ -0,0 +1,243 @@
+"""Roll the coverage of the packages up the hierarchy of their names."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from .class_coverage import CLASS_NAME_SEPARATORS, ClassCoverage
+from .coverage import Coverage
+from .coverage_sorting import sort_coverages
+from .package_coverage import PackageCoverage
+from .parse_plan import ParsePlan
+from .report import Report
+from .report_file import map_report_file
+from .report_parser import find_package_ranges, get_package_name
+from .sort_key import SortKey
+
+
+# The indentation of a level of the tree.
+TREE_INDENT: str = '  '
+PACKAGE_SEPARATOR: str = '/'
+
+
+def get_package_depth(package_name: str) -> int:
+    """Return the level of the node of a package in the tree, 0 for the
+    default package whose classes are under the report."""
+    if not package_name:
+        return 0
+    return package_name.count(PACKAGE_SEPARATOR) + 1
+
+
+def get_min_package_depth(xml_file_paths: Sequence[str]) -> int | None:
+    """Return the lowest level of the packages of some report files, read
+    from the names of their package elements without parsing them.
+
+    None is returned when a file doesn't have the layout written by JaCoCo
+    or doesn't have any package, or when it can't be opened or mapped in
+    memory, the error being reported when the file is loaded.
+    """
+    min_depth: int | None = None
+    for xml_file_path in xml_file_paths:
+        try:
+            with map_report_file(xml_file_path) as data:
+                if data is None:
+                    return None
+                ranges = find_package_ranges(data)
+                if not ranges:
+                    return None
+                for start, _ in ranges:
+                    package_name = get_package_name(data, start)
+                    if package_name is None:
+                        return None
+                    depth = get_package_depth(package_name)
+                    if min_depth is None or depth < min_depth:
+                        min_depth = depth
+        except OSError:
+            return None
+    return min_depth
+
+
+def get_tree_plan(xml_file_paths: Sequence[str],
+                  max_depth: int | None) -> ParsePlan:
+    """Return the parts of the reports needed to print their tree.
+
+    The classes are only built when the shallowest package is above the depth
+    limit, and their methods when it is two levels above, so a top-level
+    overview only builds the counters of the packages.
+
+    Args:
+        xml_file_paths: the paths of the report files
+        max_depth: the deepest level of the tree, None for the whole tree
+    """
+    plan = ParsePlan.PACKAGE_COUNTERS | ParsePlan.CLASSES | ParsePlan.METHODS
+    if max_depth is None:
+        return plan
+    min_depth = get_min_package_depth(xml_file_paths)
+    if min_depth is None:
+        return plan
+    if max_depth <= min_depth:
+        return ParsePlan.PACKAGE_COUNTERS
+    if max_depth == min_depth + 1:
+        return ParsePlan.PACKAGE_COUNTERS | ParsePlan.CLASSES
+    return plan
+
+
+def copy_coverage(coverage: Coverage, name: str) -> Coverage:
+    """Return a coverage with the counters of another one and a new name."""
+    return Coverage(
+        name,
+        coverage.branch_missed,
+        coverage.branch_covered,
+        coverage.line_missed,
+        coverage.line_covered,
+        coverage.method_missed,
+        coverage.method_covered,
+        coverage.extra_counters
+    )
+
+
+class PackageTree(Coverage):
+    '''Node of the hierarchy of the package names, like acme for com/acme.
+
+    The counters of a node are the sum of those of the packages under it,
+    they are rolled up once the whole tree is built.
+    '''
+
+    __slots__ = ('path', 'children', 'packages')
+
+    def __init__(self, name: str, path: str = '') -> None:
+        """
+        Args:
+            name: the last component of the path of the node
+            path: the slash separated path of the node, like com/acme
+        """
+        super().__init__(name)
+        self.path = path
+        self.children: dict[str, PackageTree] = {}
+        # the packages ending at this node, or below it when the tree is cut
+        # at this node
+        self.packages: list[PackageCoverage] = []
+
+    def get_child(self, name: str) -> PackageTree:
+        """Return a child node, added if it doesn't exist."""
+        child = self.children.get(name)
+        if child is None:
+            path = f'{self.path}{PACKAGE_SEPARATOR}{name}' if self.path \
+                else name
+            child = PackageTree(name, path)
+            self.children[name] = child
+        return child
+
+    def roll_up_counters(self) -> None:
+        """Sum the counters of the packages of each node into the node and
+        all its ancestors, in a single post-order pass."""
+        stack: list[tuple[PackageTree, bool]] = [(self, False)]
+        while stack:
+            node, visited = stack.pop()
+            if not visited:
+                stack.append((node, True))
+                stack.extend((child, False)
+                             for child in node.children.values())
+                continue
+            for package in node.packages:
+                node.add_counters(package)
+            for child in node.children.values():
+                node.add_counters(child)
+
+
+def build_package_tree(report: Report,
+                       max_depth: int | None = None) -> PackageTree:
+    """Build the tree of the packages of a report, with rolled up counters.
+
+    Args:
+        report: the report, whose packages have their counters
+        max_depth: the deepest level of the nodes, the packages below it
+            being counted in their ancestor at that level, None for the whole
+            tree
+
+    Returns:
+        the root node, named after the report
+    """
+    root = PackageTree(report.name)
+    for package in report.packages:
+        node = root
+        components = package.name.split(PACKAGE_SEPARATOR) \
+            if package.name else []
+        for component in components[:max_depth]:
+            node = node.get_child(component)
+        node.packages.append(package)
+    root.roll_up_counters()
+    return root
+
+
+def get_class_label(java_class: ClassCoverage) -> str:
+    """Return the name of a class without its package, like Outer.Inner."""
+    return java_class.name.rpartition(PACKAGE_SEPARATOR)[2] \
+        .translate(CLASS_NAME_SEPARATORS)
+
+
+def get_tree_rows(root: PackageTree, max_depth: int | None = None,
+                  indent: bool = True, sort_key: SortKey | None = None,
+                  reverse: bool = False,
+                  top: int | None = None) -> list[Coverage]:
+    """Return the rows of the tree of the packages, their classes and their
+    methods, in depth-first order.
+
+    The nodes below the depth limit are neither visited nor copied, the
+    classes of a node come before its children. The children of a node, its
+    classes and the methods of a class are each sorted and trimmed like the
+    rows of the other subcommands, the children being in the order of their
+    names and the classes and methods in the order of the report by default.
+
+    Args:
+        root: the root of the tree
+        max_depth: the deepest level of the rows, the root being at level 0,
+            None for the whole tree
+        indent: whether the names are the last components indented by their
+            level, or the full names, like com.acme.Main.main
+        sort_key: the column to sort the entries of a level by
+        reverse: whether to reverse the order of the entries of a level
+        top: the number of entries to keep at each level, all by default
+
+    Returns:
+        coverages with the counters of the nodes and the names of the rows
+    """
+    def get_row(coverage: Coverage, level: int, label: str,
+                full_name: str) -> Coverage:
+        return copy_coverage(
+            coverage,
+            TREE_INDENT * level + label if indent else full_name
+        )
+
+    rows: list[Coverage] = []
+    stack: list[tuple[PackageTree, int]] = [(root, 0)]
+    while stack:
+        node, level = stack.pop()
+        rows.append(get_row(node, level, node.name,
+                            node.path.replace(PACKAGE_SEPARATOR, '.')
+                            or node.name))
+        if max_depth is not None and level >= max_depth:
+            continue
+        classes = sort_coverages(
+            [java_class for package in node.packages
+             for java_class in package.classes],
+            sort_key, reverse, top
+        )
+        for java_class in classes:
+            class_name = java_class.get_name()
+            rows.append(get_row(java_class, level + 1,
+                                get_class_label(java_class), class_name))
+            if max_depth is not None and level + 1 >= max_depth:
+                continue
+            rows.extend(
+                get_row(method, level + 2, method.get_name(),
+                        f'{class_name}.{method.get_name()}')
+                for method in sort_coverages(java_class.methods, sort_key,
+                                             reverse, top)
+            )
+        children = sort_coverages(
+            [node.children[name] for name in sorted(node.children)],
+            sort_key, reverse, top
+        )
+        stack.extend((child, level + 1) for child in reversed(children))
+    return rows
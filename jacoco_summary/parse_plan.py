@@ -0,0 +1,29 @@
+from enum import Flag
+
+
+class ParsePlan(Flag):
+    '''Parts of a JaCoCo report to build when loading it.
+
+    The name and the counters of the report and the names of the packages are
+    always loaded, everything else is only built when it is in the plan.
+
+    EXTRA_COUNTERS are the instruction, complexity and class counters of
+    everything built, which are only decoded when a column shows them.
+
+    COMPACT is not a part of the report but a layout option: the methods of
+    each class are stored in a CoverageColumns instead of a list of objects.
+
+    TOTALS is not a part of the report either: only the name and the counters
+    of the report are loaded, from the end of the file when possible, and the
+    other parts of the plan but the extra counters are ignored.
+    '''
+    NAMES            = 0
+    PACKAGE_COUNTERS = 1
+    CLASSES          = 2
+    METHODS          = 4
+    SOURCE_FILES     = 8
+    LINES            = 16
+    EXTRA_COUNTERS   = 32
+    ALL              = 63
+    COMPACT          = 64
+    TOTALS           = 128
@@ -0,0 +1,277 @@
+"""Write the coverage as CSV, JSON or NDJSON records.
+
+The records are written one by one as they are generated, unlike the tables
+whose columns are sized from all the rows before printing, so the output can
+be consumed while it is written and the memory used doesn't depend on the
+number of rows.
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+import csv
+import json
+import sys
+from typing import TextIO, TypeAlias
+
+from .column_name import ColumnName
+from .config import CSV_SEPARATOR
+from .counter_type import CounterType
+from .coverage import BAR_COLUMNS, MISSED_COLUMNS, Coverage, get_column_counter
+from .diff_coverage import DiffCoverage
+from .line_status import LineStatus
+from .output_format import OutputFormat
+from .report_comparison import CoverageChange
+from .source_file_lines import SourceFileLines
+from .utils import format_line_range
+
+
+Value: TypeAlias = str | int | float | None
+Record: TypeAlias = tuple[Value, ...]
+
+COUNTER_TYPES: tuple[CounterType, ...] = (
+    CounterType.BRANCH,
+    CounterType.LINE,
+    CounterType.METHOD,
+)
+COUNTER_NAMES: tuple[str, ...] = tuple(counter_type.value.lower()
+                                       for counter_type in COUNTER_TYPES)
+# The fields of a counter in the records, in the order of the values of
+# CoverageField.
+COUNTER_FIELDS: tuple[str, ...] = ('missed', 'covered', 'ratio')
+NAME_FIELDS: tuple[str, ...] = ('name',)
+COVERAGE_FIELDS: tuple[str, ...] = NAME_FIELDS + tuple(
+    f'{counter}_{field}'
+    for counter in COUNTER_NAMES
+    for field in COUNTER_FIELDS
+)
+LINES_FIELDS: tuple[str, ...] = ('first_line', 'last_line', 'status')
+BUILD_FIELDS: tuple[str, ...] = ('build_id', 'commit', 'entries')
+DIFF_FIELDS: tuple[str, ...] = (
+    'name',
+    'line_missed',
+    'line_covered',
+    'line_ratio',
+    'missed_lines',
+)
+COMPARISON_FIELDS: tuple[str, ...] = ('name', 'change') + tuple(
+    field
+    for counter in COUNTER_NAMES
+    for field in (
+        f'baseline_{counter}_missed',
+        f'baseline_{counter}_covered',
+        f'current_{counter}_missed',
+        f'current_{counter}_covered',
+        f'{counter}_delta',
+    )
+)
+
+# The counter of a field of the coverage records, None for the name, and the
+# index of the field in the COUNTER_FIELDS.
+CoverageField: TypeAlias = tuple[CounterType | None, int]
+
+LINE_STATUS_NAMES: dict[LineStatus, str] = {
+    LineStatus.NOT_COVERED: 'not covered',
+    LineStatus.PARTLY_COVERED: 'partly covered',
+}
+
+
+def get_coverage_fraction(missed: int, covered: int) -> float | None:
+    """Return the fraction of covered items, between 0 and 1, None if there
+    is no item."""
+    total = missed + covered
+    if total == 0:
+        return None
+    return covered / total
+
+
+def get_ratio_delta(baseline_missed: int, baseline_covered: int,
+                    current_missed: int, current_covered: int) -> float | None:
+    """Return the change of a ratio of covered items, None if there is no item
+    in one of the coverages.
+
+    The difference is computed with a single division, so that it is rounded
+    like the ratios.
+    """
+    baseline_total = baseline_missed + baseline_covered
+    current_total = current_missed + current_covered
+    if baseline_total == 0 or current_total == 0:
+        return None
+    return (
+        (current_covered * baseline_total - baseline_covered * current_total)
+        / (baseline_total * current_total)
+    )
+
+
+def generate_name_records(names: Iterable[str]) -> Iterator[Record]:
+    for name in names:
+        yield (name,)
+
+
+def get_column_fields(column: ColumnName) -> list[CoverageField]:
+    """Return the fields of the records showing a column, the counts and the
+    ratio of a counter for a column of percentage bars."""
+    counter_type = get_column_counter(column)
+    if counter_type is None:
+        return [(None, 0)]
+    if column in BAR_COLUMNS:
+        return [(counter_type, index) for index in range(len(COUNTER_FIELDS))]
+    if column in MISSED_COLUMNS:
+        return [(counter_type, 0)]
+    return [(counter_type, 1)]
+
+
+def get_coverage_fields(columns: Sequence[ColumnName]) -> list[CoverageField]:
+    """Return the fields of the coverage records showing some columns, each
+    field only once."""
+    fields: list[CoverageField] = []
+    for column in columns:
+        fields += [field for field in get_column_fields(column)
+                   if field not in fields]
+    return fields
+
+
+def get_coverage_field_names(columns: Sequence[ColumnName]
+                             ) -> tuple[str, ...]:
+    """Return the names of the fields of the coverage records showing some
+    columns, the COVERAGE_FIELDS for the default columns."""
+    return tuple(
+        'name' if counter_type is None
+        else f'{counter_type.value.lower()}_{COUNTER_FIELDS[index]}'
+        for counter_type, index in get_coverage_fields(columns)
+    )
+
+
+def generate_coverage_records(coverages: Iterable[Coverage],
+                              columns: Sequence[ColumnName]
+                              ) -> Iterator[Record]:
+    """Generate the records of the counters and ratios of some coverages, with
+    the fields returned by get_coverage_field_names."""
+    fields = get_coverage_fields(columns)
+    for coverage in coverages:
+        values: list[Value] = []
+        for counter_type, index in fields:
+            if counter_type is None:
+                values.append(coverage.get_name())
+                continue
+            missed, covered = coverage.get_counter(counter_type)
+            values.append(
+                (missed, covered, get_coverage_fraction(missed, covered))[index]
+            )
+        yield tuple(values)
+
+
+def generate_lines_records(lines: SourceFileLines) -> Iterator[Record]:
+    """Generate the records of the ranges of lines not fully covered, with the
+    LINES_FIELDS."""
+    for first, last, status in lines.get_ranges():
+        status_name = LINE_STATUS_NAMES.get(status)
+        if status_name is not None:
+            yield first, last, status_name
+
+
+def generate_diff_records(files_coverage: Iterable[DiffCoverage]
+                          ) -> Iterator[Record]:
+    """Generate the records of the coverage of the changed lines of some
+    files, with the DIFF_FIELDS."""
+    for file_coverage in files_coverage:
+        yield (
+            file_coverage.get_name(),
+            file_coverage.line_missed,
+            file_coverage.line_covered,
+            get_coverage_fraction(file_coverage.line_missed,
+                                  file_coverage.line_covered),
+            ', '.join(format_line_range(first, last)
+                      for first, last in file_coverage.missed_lines),
+        )
+
+
+def generate_comparison_records(changes: Iterable[CoverageChange]
+                                ) -> Iterator[Record]:
+    """Generate the records of the changes of coverage between two reports,
+    with the COMPARISON_FIELDS.
+
+    The change is 'added', 'removed' or 'changed', and the deltas are the
+    differences of the ratios, None when a ratio is not available.
+    """
+    for change in changes:
+        baseline = change.baseline
+        current = change.current
+        if baseline is None:
+            change_type = 'added'
+        elif current is None:
+            change_type = 'removed'
+        else:
+            change_type = 'changed'
+        # the ratios of a missing entry are not available, like its deltas
+        if baseline is None:
+            baseline = Coverage(change.name)
+        if current is None:
+            current = Coverage(change.name)
+
+        record: list[Value] = [change.name, change_type]
+        for counter_type in COUNTER_TYPES:
+            baseline_missed, baseline_covered = \
+                baseline.get_counter(counter_type)
+            current_missed, current_covered = current.get_counter(counter_type)
+            delta = get_ratio_delta(baseline_missed, baseline_covered,
+                                    current_missed, current_covered)
+            record += (baseline_missed, baseline_covered, current_missed,
+                       current_covered, delta)
+        yield tuple(record)
+
+
+def format_json_record(record: Record, fields: Sequence[str]) -> str:
+    json_object: dict[str, Value] = dict(zip(fields, record))
+    return json.dumps(json_object)
+
+
+def write_csv(records: Iterable[Record], fields: Sequence[str],
+              file: TextIO) -> None:
+    writer = csv.writer(file, delimiter=CSV_SEPARATOR, lineterminator='\n')
+    writer.writerow(fields)
+    for record in records:
+        writer.writerow(record)
+
+
+def write_json(records: Iterable[Record], fields: Sequence[str],
+               file: TextIO) -> None:
+    separator = '\n'
+    file.write('[')
+    for record in records:
+        file.write(separator)
+        file.write(format_json_record(record, fields))
+        separator = ',\n'
+    file.write('\n]\n')
+
+
+def write_ndjson(records: Iterable[Record], fields: Sequence[str],
+                 file: TextIO) -> None:
+    for record in records:
+        file.write(format_json_record(record, fields))
+        file.write('\n')
+
+
+def write_records(records: Iterable[Record], fields: Sequence[str],
+                  output_format: OutputFormat, file: TextIO | None = None
+                  ) -> None:
+    """Write records to a file as they are generated.
+
+    Args:
+        records: the records to write, each value matching a field
+        fields: the names of the fields of the records
+        output_format: the format to write, except TABLE
+        file: the file to write to, the standard output by default
+    """
+    if file is None:
+        file = sys.stdout
+    match output_format:
+        case OutputFormat.CSV:
+            write_csv(records, fields, file)
+
+        case OutputFormat.JSON:
+            write_json(records, fields, file)
+
+        case OutputFormat.NDJSON:
+            write_ndjson(records, fields, file)
+
+        case _:
+            assert False, 'unreachable'
@@ -1,16 +1,35 @@
 from __future__ import annotations
 
-from xml.etree.ElementTree import Element, parse
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from xml.etree.ElementTree import Element
 
 from .class_coverage import ClassCoverage
+from .config import XML_READ_CHUNK_SIZE
 from .coverage import Coverage
+from .extra_counters import ExtraCounters
+from .method_coverage import MethodCoverage
 from .package_coverage import PackageCoverage
+from .parse_plan import ParsePlan
 from .source_file_coverage import SourceFileCoverage
+from .source_file_lines import SourceFileLines
+from .report_file import map_report_file, open_report_file
+from .report_parser import ReportParser
 from .xml_parsing_exception import XmlParsingException
 
+if TYPE_CHECKING:
+    from .name_filter import NameFilter
+
 
 class Report(Coverage):
 
+    __slots__ = (
+        '_packages',
+        '_classes_index',
+        '_packages_index',
+        '_source_files_index',
+    )
+
     def __init__(
         self,
         name: str,
@@ -21,6 +40,7 @@ class Report(Coverage):
         method_missed: int = 0,
         method_covered: int = 0,
         packages: list[PackageCoverage] = None,
+        extra_counters: ExtraCounters | None = None,
     ) -> None:
         super().__init__(
             name,
@@ -29,29 +49,89 @@ class Report(Coverage):
             line_missed,
             line_covered,
             method_missed,
-            method_covered
+            method_covered,
+            extra_counters
         )
         if packages is None:
             packages = []
-        self.packages = packages
+        self._packages = packages
+        self._classes_index: dict[str, ClassCoverage] | None = None
+        self._packages_index: dict[str, PackageCoverage] | None = None
+        self._source_files_index: dict[str, SourceFileCoverage] | None = None
+
+    @property
+    def packages(self) -> list[PackageCoverage]:
+        """The packages of the report.
+
+        The lookup indexes are built from the packages on first use, so the
+        list must not be modified in place once a lookup has been done; assign
+        a new list instead, which resets the indexes.
+        """
+        return self._packages
+
+    @packages.setter
+    def packages(self, packages: list[PackageCoverage]) -> None:
+        self._packages = packages
+        self._classes_index = None
+        self._packages_index = None
+        self._source_files_index = None
 
     @classmethod
-    def from_xml_file(cls, xml_file_path: str) -> Report:
-        # Raises PArse Error
-        tree = parse(xml_file_path)
-        root: Element = tree.getroot()
-        if root.tag != 'report':
-            raise XmlParsingException(root)
-        return cls.from_xml_element(root)
+    def from_xml_file(cls, xml_file_path: str,
+                      plan: ParsePlan = ParsePlan.ALL,
+                      name_filter: NameFilter | None = None) -> Report:
+        """Load a report from a JaCoCo xml file.
+
+        The file is parsed incrementally: each package is converted as soon as
+        its closing tag is read and its element is then dropped, so the memory
+        used is bounded by the biggest package instead of the whole document.
+        Compressed files are decompressed while they are parsed. The
+        entries filtered out are skipped by the parser, the packages of the
+        files with the layout written by JaCoCo without being read, and the
+        counters of the report only count the kept entries.
+
+        Args:
+            xml_file_path: the path of the xml file to load, '-' for the
+                standard input
+            plan: the parts of the report to build
+            name_filter: the filter of the entries to build, all of them by
+                default
+
+        Raises:
+            OSError: if the file can't be read
+            ParseError: if the file is not a valid xml file
+            XmlParsingException: if the file is not a JaCoCo report
+        """
+        parser = ReportParser(plan, name_filter)
+        packages: list[PackageCoverage] = []
+        is_fed = False
+        if name_filter is not None:
+            with map_report_file(xml_file_path) as data:
+                if data is not None:
+                    is_fed = parser.feed_filtered_document(data)
+        if not is_fed:
+            with open_report_file(xml_file_path) as xml_file:
+                while chunk := xml_file.read(XML_READ_CHUNK_SIZE):
+                    parser.feed(chunk)
+                    packages.extend(parser.read_packages())
+        root = parser.close()
+        packages.extend(parser.read_packages())
+
+        report = cls.from_xml_element(root, plan)
+        report.packages = packages
+        if name_filter is not None:
+            return name_filter.filter_report(report)
+        return report
 
     @classmethod
-    def from_xml_element(cls, element: Element) -> Report:
-        base_instance = super().from_xml_element(element)
+    def from_xml_element(cls, element: Element,
+                         plan: ParsePlan = ParsePlan.ALL) -> Report:
+        base_instance = super().from_xml_element(element, plan)
 
         packages: list[PackageCoverage] = []
         for child in element:
             if child.tag == 'package':
-                packages.append(PackageCoverage.from_xml_element(child))
+                packages.append(PackageCoverage.from_xml_element(child, plan))
                 continue
 
             if child.tag == 'sessioninfo':
@@ -72,16 +152,95 @@ class Report(Coverage):
             base_instance.line_covered,
             base_instance.method_missed,
             base_instance.method_covered,
-            packages
+            packages,
+            base_instance.extra_counters
         )
 
-    def get_class(self, class_name: str) -> ClassCoverage | None:
-        for package in self.packages:
-            java_class = package.get_class(class_name)
-            if java_class is not None:
-                return java_class
+    @classmethod
+    def merge(cls, reports: Sequence[Report]) -> Report:
+        """Merge reports into a new one.
+
+        The counters of the packages, classes, source files and methods with
+        the same name are summed. Methods are matched by name and by rank
+        among the methods with that name, so overloads stay separate, and the
+        lines of the source files by number. The merged report takes the name
+        of the first report.
+
+        Args:
+            reports: the reports to merge, the list must not be empty
+        """
+        assert reports, 'no report to merge'
+
+        merged = cls(reports[0].name)
+        packages: dict[str, PackageCoverage] = {}
+        classes: dict[str, tuple[ClassCoverage, list[MethodCoverage]]] = {}
+        methods: dict[tuple[str, str, int], MethodCoverage] = {}
+        source_files: dict[str, SourceFileCoverage] = {}
+        source_files_lines: dict[str, list[SourceFileLines]] = {}
+        for report in reports:
+            merged.add_counters(report)
+            for package in report.packages:
+                merged_package = packages.get(package.name)
+                if merged_package is None:
+                    merged_package = PackageCoverage(package.name)
+                    packages[package.name] = merged_package
+                merged_package.add_counters(package)
+
+                for java_class in package.classes:
+                    if java_class.name not in classes:
+                        class_methods: list[MethodCoverage] = []
+                        classes[java_class.name] = (
+                            ClassCoverage(java_class.name,
+                                          methods=class_methods),
+                            class_methods
+                        )
+                        merged_package.classes.append(
+                            classes[java_class.name][0]
+                        )
+                    merged_class, merged_methods = classes[java_class.name]
+                    merged_class.add_counters(java_class)
 
-        return None
+                    ranks: dict[str, int] = {}
+                    for method in java_class.methods:
+                        rank = ranks.get(method.name, 0)
+                        ranks[method.name] = rank + 1
+                        key = java_class.name, method.name, rank
+                        merged_method = methods.get(key)
+                        if merged_method is None:
+                            merged_method = MethodCoverage(method.name)
+                            methods[key] = merged_method
+                            merged_methods.append(merged_method)
+                        merged_method.add_counters(method)
+
+                for file in package.source_files:
+                    merged_file = source_files.get(file.name)
+                    if merged_file is None:
+                        merged_file = SourceFileCoverage(file.name)
+                        source_files[file.name] = merged_file
+                        merged_package.source_files.append(merged_file)
+                    merged_file.add_counters(file)
+                    if file.lines is not None:
+                        source_files_lines.setdefault(file.name, []).append(
+                            file.lines
+                        )
+
+        for file_name, lines_list in source_files_lines.items():
+            if len(lines_list) == 1:
+                source_files[file_name].lines = lines_list[0]
+            else:
+                source_files[file_name].lines = \
+                    SourceFileLines.merge(lines_list)
+
+        merged.packages = list(packages.values())
+        return merged
+
+    def get_class(self, class_name: str) -> ClassCoverage | None:
+        if self._classes_index is None:
+            self._classes_index = {}
+            for java_class in self.get_classes():
+                self._classes_index.setdefault(java_class.get_name(),
+                                               java_class)
+        return self._classes_index.get(class_name)
 
     def get_classes(self) -> list[ClassCoverage]:
         """Return all the class in the packages of the report."""
@@ -90,21 +249,22 @@ class Report(Coverage):
                 for java_class in package.classes]
 
     def get_package(self, package_name: str) -> PackageCoverage | None:
-        for package in self.packages:
-            if package.get_name() == package_name:
-                return package
-        return None
+        if self._packages_index is None:
+            self._packages_index = {}
+            for package in self.packages:
+                self._packages_index.setdefault(package.get_name(), package)
+        return self._packages_index.get(package_name)
 
     def get_packages_names(self) -> list[str]:
         """Return the list of the packages's name in the report."""
         return [package.get_name() for package in self.packages]
 
     def get_source_file(self, file_name: str) -> SourceFileCoverage | None:
-        for package in self.packages:
-            for file in package.source_files:
-                if file_name == file.name:
-                    return file
-        return None
+        if self._source_files_index is None:
+            self._source_files_index = {}
+            for file in self.get_source_files():
+                self._source_files_index.setdefault(file.name, file)
+        return self._source_files_index.get(file_name)
 
     def get_source_files(self) -> list[SourceFileCoverage]:
         return [
@@ -0,0 +1,183 @@
+"""On disk cache of the parsed reports."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import shutil
+from typing import TYPE_CHECKING
+
+from . import __version__
+from .config import CACHE_FINGERPRINT_SIZE, CACHE_MAX_SIZE, STDIN_PATH
+from .parse_plan import ParsePlan
+from .report import Report
+from .report_totals import read_report_totals
+
+if TYPE_CHECKING:
+    from .name_filter import NameFilter
+
+
+CACHE_FILE_EXTENSION: str = '.pickle'
+# Bump when the layout of the pickled classes changes.
+CACHE_FORMAT: int = 4
+
+CacheKey = tuple[str, int, str, int, str, int, int, str]
+
+
+def get_cache_directory() -> str:
+    """Return the directory where the parsed reports are cached."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') \
+        or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'jacoco-summary')
+
+
+def get_file_fingerprint(xml_file_path: str, size: int) -> str:
+    """Return a hash of the content of a file.
+
+    Only the beginning and the end of the file are hashed, so the fingerprint
+    of a big report is computed in constant time. Combined with the size and
+    the modification time of the file, it is enough to detect a rewritten
+    report.
+
+    Args:
+        xml_file_path: the path of the file to hash
+        size: the size of the file in bytes
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(xml_file_path, 'rb') as xml_file:
+        digest.update(xml_file.read(CACHE_FINGERPRINT_SIZE))
+        if size > CACHE_FINGERPRINT_SIZE:
+            xml_file.seek(max(CACHE_FINGERPRINT_SIZE,
+                              size - CACHE_FINGERPRINT_SIZE))
+            digest.update(xml_file.read(CACHE_FINGERPRINT_SIZE))
+    return digest.hexdigest()
+
+
+def get_cache_key(xml_file_path: str, plan: ParsePlan,
+                  name_filter: NameFilter | None = None) -> CacheKey:
+    """Return the key identifying a parsed report in the cache.
+
+    Raises:
+        FileNotFoundError: if the file doesn't exists
+    """
+    path = os.path.abspath(xml_file_path)
+    stat = os.stat(path)
+    return (
+        __version__,
+        CACHE_FORMAT,
+        path,
+        plan.value,
+        '' if name_filter is None else name_filter.get_key(),
+        stat.st_size,
+        stat.st_mtime_ns,
+        get_file_fingerprint(path, stat.st_size),
+    )
+
+
+def get_cache_file_path(key: CacheKey) -> str:
+    """Return the path of the cache file of a key."""
+    path, plan, filter_key = key[2], key[3], key[4]
+    name = hashlib.blake2b(f'{path}\0{plan}\0{filter_key}'.encode(),
+                           digest_size=16)
+    return os.path.join(get_cache_directory(),
+                        name.hexdigest() + CACHE_FILE_EXTENSION)
+
+
+def read_cache(key: CacheKey) -> Report | None:
+    """Return the cached report for a key, or None if it is not cached."""
+    cache_file_path = get_cache_file_path(key)
+    try:
+        with open(cache_file_path, 'rb') as cache_file:
+            cached_key: object = pickle.load(cache_file)
+            if cached_key != key:
+                return None
+            report: object = pickle.load(cache_file)
+        # Keep track of the last use for the eviction.
+        os.utime(cache_file_path)
+    except (OSError, EOFError, AttributeError, ImportError,
+            pickle.UnpicklingError):
+        return None
+
+    if not isinstance(report, Report):
+        return None
+    return report
+
+
+def write_cache(key: CacheKey, report: Report) -> None:
+    """Store a parsed report in the cache and evict the oldest entries."""
+    cache_directory = get_cache_directory()
+    cache_file_path = get_cache_file_path(key)
+    temporary_file_path = f'{cache_file_path}.{os.getpid()}'
+    try:
+        os.makedirs(cache_directory, mode=0o700, exist_ok=True)
+        with open(temporary_file_path, 'wb') as cache_file:
+            pickle.dump(key, cache_file, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(report, cache_file, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_file_path, cache_file_path)
+        evict_cache(CACHE_MAX_SIZE)
+    except OSError:
+        # The cache is only an optimization.
+        try:
+            os.remove(temporary_file_path)
+        except OSError:
+            pass
+
+
+def evict_cache(max_size: int) -> None:
+    """Remove the least recently used entries until the cache fits in
+    max_size bytes."""
+    entries: list[tuple[int, int, str]] = []
+    with os.scandir(get_cache_directory()) as directory:
+        for entry in directory:
+            if entry.name.endswith(CACHE_FILE_EXTENSION):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_size <= max_size:
+            break
+        os.remove(path)
+        total_size -= size
+
+
+def clear_cache() -> None:
+    """Remove all the cached reports."""
+    shutil.rmtree(get_cache_directory(), ignore_errors=True)
+
+
+def load_report(xml_file_path: str, plan: ParsePlan = ParsePlan.ALL,
+                use_cache: bool = True,
+                name_filter: NameFilter | None = None) -> Report:
+    """Load a report from a JaCoCo xml file, using the cache when possible.
+
+    The totals of a report are read in constant time and the standard input
+    can't be fingerprinted, so they are never cached.
+
+    Args:
+        xml_file_path: the path of the xml file to load, '-' for the standard
+            input
+        plan: the parts of the report to build, which can't be the totals
+            when there is a filter
+        use_cache: whether to read and update the cache
+        name_filter: the filter of the entries to build, all of them by
+            default
+
+    Raises:
+        OSError: if the file can't be read
+        ParseError: if the file is not a valid xml file
+        XmlParsingException: if the file is not a JaCoCo report
+    """
+    if ParsePlan.TOTALS in plan:
+        assert name_filter is None, 'the totals of a report can\'t be filtered'
+        return read_report_totals(xml_file_path, plan)
+    if not use_cache or xml_file_path == STDIN_PATH:
+        return Report.from_xml_file(xml_file_path, plan, name_filter)
+
+    key = get_cache_key(xml_file_path, plan, name_filter)
+    report = read_cache(key)
+    if report is None:
+        report = Report.from_xml_file(xml_file_path, plan, name_filter)
+        write_cache(key, report)
+    return report
@@ -0,0 +1,122 @@
+"""Send the queries of the command line interface to a server keeping the
+reports in memory, over a Unix socket.
+
+The client sends one line with a JSON object holding the arguments of the
+command line and the absolute paths of its report files:
+
+    {"args": ["jacoco-summary", "class", "Main"], "files": ["/a/jacoco.xml"]}
+
+and the server answers with one line holding the exit status and the output
+of the command:
+
+    {"status": 0, "stdout": "...", "stderr": ""}
+
+or with an error, when the server can't answer the query:
+
+    {"error": "..."}
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import socket
+
+from .config import SERVE_MESSAGE_MAX_SIZE, SERVE_TIMEOUT
+
+
+SOCKET_FILE_NAME: str = 'jacoco-summary.sock'
+
+Message = dict[str, int | str | list[str]]
+
+
+def get_socket_path() -> str:
+    """Return the path of the socket of the server."""
+    runtime_directory = os.environ.get('XDG_RUNTIME_DIR')
+    if not runtime_directory:
+        # the cache module imports the parsing of the reports
+        # pylint: disable-next=import-outside-toplevel
+        from .report_cache import get_cache_directory
+        runtime_directory = get_cache_directory()
+    return os.path.join(runtime_directory, SOCKET_FILE_NAME)
+
+
+def encode_message(message: Message) -> bytes:
+    return json.dumps(message).encode() + b'\n'
+
+
+def read_message(file: io.BufferedIOBase) -> object:
+    """Read a message from a stream, None if it is not a JSON document
+    ending with a new line."""
+    line = file.readline(SERVE_MESSAGE_MAX_SIZE)
+    if not line.endswith(b'\n'):
+        return None
+    try:
+        message: object = json.loads(line)
+    except ValueError:
+        return None
+    return message
+
+
+def get_member(message: object, name: str) -> object:
+    """Return a member of a JSON object, None if it is missing."""
+    if not isinstance(message, dict):
+        return None
+    member: object = message.get(name)
+    return member
+
+
+def get_strings(value: object) -> list[str] | None:
+    """Return a JSON array of strings, None if it is not one."""
+    if not isinstance(value, list):
+        return None
+    items: list[object] = value
+    strings = [item for item in items if isinstance(item, str)]
+    if len(strings) != len(items):
+        return None
+    return strings
+
+
+def query_server(socket_path: str, args: list[str], files: list[str]
+                 ) -> tuple[int, str, str] | None:
+    """Run a command line on the server listening on a socket.
+
+    Args:
+        socket_path: the path of the socket of the server
+        args: the arguments of the command line
+        files: the absolute paths of the report files of the command line
+
+    Returns:
+        the exit status, the standard output and the standard error of the
+        command, or None if no server answered the query
+    """
+    if not os.path.exists(socket_path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(SERVE_TIMEOUT)
+            client.connect(socket_path)
+            client.sendall(encode_message({'args': args, 'files': files}))
+            with client.makefile('rb') as response_file:
+                response = read_message(response_file)
+    except OSError:
+        return None
+
+    status = get_member(response, 'status')
+    stdout = get_member(response, 'stdout')
+    stderr = get_member(response, 'stderr')
+    if not isinstance(status, int) or not isinstance(stdout, str) \
+            or not isinstance(stderr, str):
+        return None
+    return status, stdout, stderr
+
+
+def is_server_running(socket_path: str) -> bool:
+    """Return whether a server listens on a socket."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+    except OSError:
+        return False
+    return True
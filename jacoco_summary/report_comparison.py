@@ -0,0 +1,234 @@
+"""Compare the coverage of two reports."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+import heapq
+import math
+
+from .comparison_level import ComparisonLevel
+from .coverage import Coverage
+from .coverage_sorting import select_rows
+from .parse_plan import ParsePlan
+from .report import Report
+from .sort_key import SortKey
+
+
+class CoverageChange:
+    '''Coverage of an entry in a baseline report and in a current report.
+
+    The entry is added when it is not in the baseline, and removed when it is
+    not in the current report.
+    '''
+
+    __slots__ = ('name', 'baseline', 'current')
+
+    def __init__(self, name: str, baseline: Coverage | None,
+                 current: Coverage | None) -> None:
+        self.name = name
+        self.baseline = baseline
+        self.current = current
+
+    def get_deltas(self) -> tuple[float | None, float | None, float | None]:
+        """Return the change of the branch, line and method coverage, in
+        percentage points, None when it is not available in a report."""
+        if self.baseline is None or self.current is None:
+            return None, None, None
+        return (
+            get_delta(self.baseline.branch_missed,
+                      self.baseline.branch_covered,
+                      self.current.branch_missed,
+                      self.current.branch_covered),
+            get_delta(self.baseline.line_missed,
+                      self.baseline.line_covered,
+                      self.current.line_missed,
+                      self.current.line_covered),
+            get_delta(self.baseline.method_missed,
+                      self.baseline.method_covered,
+                      self.current.method_missed,
+                      self.current.method_covered),
+        )
+
+    def get_worst_delta(self) -> float:
+        """Return the lowest change of coverage, 0 if none is available."""
+        return min((delta for delta in self.get_deltas() if delta is not None),
+                   default=0)
+
+    def is_changed(self) -> bool:
+        """Return whether a counter changed between the two reports."""
+        if self.baseline is None or self.current is None:
+            return True
+        return get_coverage_counts(self.baseline) \
+            != get_coverage_counts(self.current)
+
+    def is_regression(self) -> bool:
+        return self.get_worst_delta() < 0
+
+
+def get_coverage_counts(coverage: Coverage
+                        ) -> tuple[int, int, int, int, int, int]:
+    return (
+        coverage.branch_missed,
+        coverage.branch_covered,
+        coverage.line_missed,
+        coverage.line_covered,
+        coverage.method_missed,
+        coverage.method_covered,
+    )
+
+
+def get_coverage_percentage(missed: int, covered: int) -> float | None:
+    """Return the percentage of covered items, None if there is no item."""
+    total = missed + covered
+    if total == 0:
+        return None
+    return 100 * covered / total
+
+
+def get_delta(baseline_missed: int, baseline_covered: int,
+              current_missed: int, current_covered: int) -> float | None:
+    """Return the change of a percentage of covered items, None if there is no
+    item in one of the reports."""
+    baseline = get_coverage_percentage(baseline_missed, baseline_covered)
+    current = get_coverage_percentage(current_missed, current_covered)
+    if baseline is None or current is None:
+        return None
+    return current - baseline
+
+
+def get_comparison_plan(level: ComparisonLevel) -> ParsePlan:
+    """Return the parts of the reports needed to compare them at a level."""
+    match level:
+        case ComparisonLevel.CLASS:
+            return ParsePlan.CLASSES
+
+        case ComparisonLevel.PACKAGE:
+            return ParsePlan.PACKAGE_COUNTERS
+
+        case ComparisonLevel.FILE:
+            return ParsePlan.SOURCE_FILES
+
+        case _:
+            assert False, 'unreachable'
+
+
+def get_entries(report: Report, level: ComparisonLevel
+                ) -> dict[str, Coverage]:
+    """Return the entries of a report at a level, by normalised name.
+
+    The classes and packages are named with dots and the source files with
+    their path. When several entries have the same name, the first one is
+    kept, like in the lookups of the report.
+    """
+    coverages: Sequence[Coverage]
+    match level:
+        case ComparisonLevel.CLASS:
+            coverages = report.get_classes()
+
+        case ComparisonLevel.PACKAGE:
+            coverages = report.packages
+
+        case ComparisonLevel.FILE:
+            coverages = report.get_source_files()
+
+        case _:
+            assert False, 'unreachable'
+
+    entries: dict[str, Coverage] = {}
+    for coverage in coverages:
+        entries.setdefault(coverage.get_name(), coverage)
+    return entries
+
+
+def compare_reports(baseline: Report, current: Report, level: ComparisonLevel
+                    ) -> list[CoverageChange]:
+    """Join the entries of two reports by name.
+
+    The entries of the current report come first, in their order, followed by
+    the entries removed from the baseline.
+
+    Args:
+        baseline: the report to compare with
+        current: the report to compare
+        level: the entries of the reports to compare
+    """
+    baseline_entries = get_entries(baseline, level)
+    current_entries = get_entries(current, level)
+    changes: list[CoverageChange] = [
+        CoverageChange(name, baseline_entries.get(name), coverage)
+        for name, coverage in current_entries.items()
+    ]
+    changes.extend(
+        CoverageChange(name, coverage, None)
+        for name, coverage in baseline_entries.items()
+        if name not in current_entries
+    )
+    return changes
+
+
+def get_change_order(change: CoverageChange) -> tuple[float, str]:
+    return change.get_worst_delta(), change.name
+
+
+def get_change_keys(changes: Sequence[CoverageChange], sort_key: SortKey,
+                     reverse: bool) -> list[float]:
+    """Return the numeric key of each change, the lowest keys being the worst
+    regressions, the changes without key being sorted last.
+
+    Args:
+        changes: the changes of entries in both reports
+        sort_key: the column to sort by, other than the name
+        reverse: whether the changes are sorted from the best improvement
+    """
+    missing = -math.inf if reverse else math.inf
+    keys: list[float] = []
+    for change in changes:
+        delta: float | None
+        match sort_key:
+            case SortKey.BRANCH:
+                delta = change.get_deltas()[0]
+
+            case SortKey.LINE:
+                delta = change.get_deltas()[1]
+
+            case SortKey.METHOD:
+                delta = change.get_deltas()[2]
+
+            case SortKey.MISSED_LINES:
+                delta = None
+                if change.baseline is not None and change.current is not None:
+                    delta = change.baseline.line_missed \
+                        - change.current.line_missed
+
+            case _:
+                assert False, 'unreachable'
+        keys.append(missing if delta is None else delta)
+    return keys
+
+
+def sort_changes(changes: Sequence[CoverageChange], top: int | None = None,
+                 sort_key: SortKey | None = None, reverse: bool = False
+                 ) -> list[CoverageChange]:
+    """Return the changes sorted from the worst regression to the best
+    improvement, then by name, or by a column.
+
+    Args:
+        changes: the changes to sort
+        top: the number of changes to keep, all by default
+        sort_key: the column to sort by, the worst change of the three
+            coverages by default, the missed lines sorting the most added
+            missed lines first
+        reverse: whether to reverse the order
+    """
+    if sort_key is SortKey.NAME:
+        names = [change.name for change in changes]
+        return select_rows(changes, names, reverse, top)
+    if sort_key is not None:
+        return select_rows(changes, get_change_keys(changes, sort_key,
+                                                    reverse),
+                           reverse, top)
+    if top is None:
+        return sorted(changes, key=get_change_order, reverse=reverse)
+    if reverse:
+        return heapq.nlargest(top, changes, key=get_change_order)
+    return heapq.nsmallest(top, changes, key=get_change_order)
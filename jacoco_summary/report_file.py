@@ -0,0 +1,163 @@
+"""Open the report files, decompressing them on the fly."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import gzip
+import io
+import lzma
+import mmap
+import sys
+from typing import TYPE_CHECKING, TextIO
+
+from .compression_format import MAGIC_NUMBER_SIZE, CompressionFormat
+from .config import STDIN_PATH
+
+if TYPE_CHECKING:
+    from _typeshed import WriteableBuffer
+
+
+# Raised while reading a corrupted or truncated compressed file, in addition
+# to OSError.
+DECOMPRESSION_ERRORS: tuple[type[Exception], ...] = (EOFError, lzma.LZMAError)
+if sys.version_info >= (3, 14):
+    from compression.zstd import ZstdError
+    DECOMPRESSION_ERRORS += (ZstdError,)
+
+
+def open_binary_file(xml_file_path: str) -> io.BufferedReader:
+    """Open a file in binary mode, the standard input for '-'.
+
+    The standard input is not closed with the returned file.
+    """
+    if xml_file_path == STDIN_PATH:
+        stdin: TextIO = sys.stdin
+        return open(stdin.fileno(), 'rb', closefd=False)
+    return open(xml_file_path, 'rb')
+
+
+def open_decompressed_file(file: io.BufferedReader,
+                           compression_format: CompressionFormat
+                           ) -> io.BufferedIOBase:
+    """Return a file reading the decompressed content of a file.
+
+    Raises:
+        OSError: if the compression is not supported by this Python version
+    """
+    match compression_format:
+        case CompressionFormat.GZIP:
+            return gzip.GzipFile(fileobj=file, mode='rb')
+
+        case CompressionFormat.XZ:
+            return lzma.LZMAFile(file)
+
+        case CompressionFormat.ZSTD:
+            if sys.version_info >= (3, 14):
+                # pylint: disable-next=import-outside-toplevel
+                from compression.zstd import ZstdFile
+                return ZstdFile(file)
+            raise OSError('zstd compressed reports need Python 3.14 or later')
+
+        case _:
+            assert False, 'unreachable'
+
+
+class PrefixedStream(io.RawIOBase):
+    '''Stream reading some bytes already read from a file, then the rest of
+    the file.
+
+    The file is not closed with the stream.
+    '''
+
+    def __init__(self, prefix: bytes, file: io.BufferedReader) -> None:
+        super().__init__()
+        self.prefix = prefix
+        self.file = file
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: WriteableBuffer) -> int:
+        with memoryview(buffer) as view, view.cast('B') as byte_view:
+            if not self.prefix:
+                return self.file.readinto1(byte_view)
+            size = min(len(byte_view), len(self.prefix))
+            byte_view[:size] = self.prefix[:size]
+            self.prefix = self.prefix[size:]
+            return size
+
+
+def peek_magic_number(file: io.BufferedReader
+                      ) -> tuple[bytes, io.BufferedReader]:
+    """Return the first bytes of a file, as many as the longest magic number,
+    without consuming its content.
+
+    A pipe may give fewer bytes per read, which are then read until there are
+    enough of them or the end of the file is reached, and a file reading them
+    again before the rest of the content is returned.
+
+    Returns:
+        the first bytes, fewer for a shorter file, and a file reading the
+        whole content
+    """
+    data = file.peek(MAGIC_NUMBER_SIZE)[:MAGIC_NUMBER_SIZE]
+    if len(data) == MAGIC_NUMBER_SIZE:
+        return data, file
+    data = file.read(MAGIC_NUMBER_SIZE)
+    return data, io.BufferedReader(PrefixedStream(data, file))
+
+
+@contextmanager
+def map_report_file(xml_file_path: str) -> Iterator[mmap.mmap | None]:
+    """Map an uncompressed report file in memory.
+
+    None is given for the standard input, the compressed files, the empty
+    files and the files that can't be mapped.
+
+    Args:
+        xml_file_path: the path of the file, '-' for the standard input
+
+    Raises:
+        OSError: if the file can't be opened
+    """
+    if xml_file_path == STDIN_PATH:
+        yield None
+        return
+    with open(xml_file_path, 'rb') as file:
+        try:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            yield None
+            return
+        with data:
+            if CompressionFormat.from_magic_number(
+                data[:MAGIC_NUMBER_SIZE]
+            ) is None:
+                yield data
+            else:
+                yield None
+
+
+@contextmanager
+def open_report_file(xml_file_path: str) -> Iterator[io.BufferedIOBase]:
+    """Open a report file for reading, decompressing it if it is compressed
+    with gzip, xz or zstd.
+
+    The content is decompressed while it is read, so nothing is written to
+    the disk and the memory used doesn't depend on the size of the file.
+
+    Args:
+        xml_file_path: the path of the file, '-' for the standard input
+
+    Raises:
+        OSError: if the file can't be opened
+    """
+    with open_binary_file(xml_file_path) as binary_file:
+        magic_number, file = peek_magic_number(binary_file)
+        compression_format = CompressionFormat.from_magic_number(magic_number)
+        if compression_format is None:
+            yield file
+            return
+        with open_decompressed_file(file, compression_format) as content:
+            yield content
@@ -0,0 +1,114 @@
+"""Load and merge several JaCoCo reports."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from xml.etree.ElementTree import ParseError
+
+from .config import STDIN_PATH
+from .parse_plan import ParsePlan
+from .report import Report
+from .report_cache import load_report
+from .report_file import DECOMPRESSION_ERRORS
+from .xml_parsing_exception import XmlParsingException
+
+if TYPE_CHECKING:
+    from .name_filter import NameFilter
+
+
+# The errors raised when a report file can't be loaded.
+LOADING_ERRORS: tuple[type[Exception], ...] = (
+    OSError,
+    ParseError,
+    XmlParsingException,
+) + DECOMPRESSION_ERRORS
+
+
+class ReportFileError(Exception):
+    '''Error raised when one of the report files can't be loaded.'''
+
+    def __init__(self, path: str, error: Exception) -> None:
+        super().__init__(f'{path}: {error}')
+        self.path = path
+        self.error = error
+
+
+def load_reports(paths: list[str], plan: ParsePlan = ParsePlan.ALL,
+                 use_cache: bool = True, jobs: int = 1,
+                 name_filter: NameFilter | None = None) -> Report:
+    """Load report files and merge them into one report.
+
+    Args:
+        paths: the paths of the report files, must not be empty
+        plan: the parts of the reports to build
+        use_cache: whether to read and update the cache of parsed reports
+        jobs: the maximum number of files parsed in parallel
+        name_filter: the filter of the entries to build, all of them by
+            default
+
+    Raises:
+        ReportFileError: if a file can't be loaded
+    """
+    return load_report_groups([paths], plan, use_cache, jobs, name_filter)[0]
+
+
+def load_report_groups(groups: list[list[str]],
+                       plan: ParsePlan = ParsePlan.ALL, use_cache: bool = True,
+                       jobs: int = 1, name_filter: NameFilter | None = None
+                       ) -> list[Report]:
+    """Load several groups of report files and merge each group into one
+    report.
+
+    The files of all the groups are parsed by the same pool of processes, so
+    the groups are loaded concurrently.
+
+    Args:
+        groups: the paths of the report files of each group, the groups must
+            not be empty
+        plan: the parts of the reports to build
+        use_cache: whether to read and update the cache of parsed reports
+        jobs: the maximum number of files parsed in parallel
+        name_filter: the filter of the entries to build, all of them by
+            default
+
+    Raises:
+        ReportFileError: if a file can't be loaded
+    """
+    assert all(groups), 'no report to load'
+
+    paths: list[str] = [path for group in groups for path in group]
+    reports: list[Report] = []
+    # The worker processes can't read the standard input of this process.
+    if jobs <= 1 or len(paths) == 1 or STDIN_PATH in paths:
+        for path in paths:
+            try:
+                reports.append(load_report(path, plan, use_cache,
+                                           name_filter))
+            except LOADING_ERRORS as error:
+                raise ReportFileError(path, error) from error
+    else:
+        # concurrent.futures imports multiprocessing and logging, which are
+        # only worth importing when several files are parsed
+        # pylint: disable-next=import-outside-toplevel
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(min(jobs, len(paths))) as executor:
+            futures = [executor.submit(load_report, path, plan, use_cache,
+                                       name_filter)
+                       for path in paths]
+            for path, future in zip(paths, futures):
+                try:
+                    reports.append(future.result())
+                except LOADING_ERRORS as error:
+                    executor.shutdown(cancel_futures=True)
+                    raise ReportFileError(path, error) from error
+
+    merged_reports: list[Report] = []
+    start = 0
+    for group in groups:
+        group_reports = reports[start:start + len(group)]
+        start += len(group)
+        if len(group_reports) == 1:
+            merged_reports.append(group_reports[0])
+        else:
+            merged_reports.append(Report.merge(group_reports))
+    return merged_reports
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import mmap
+import re
+from typing import TYPE_CHECKING
+from xml.etree.ElementTree import Element, ParseError, TreeBuilder
+from xml.parsers import expat
+
+from .package_coverage import PackageCoverage
+from .parse_plan import ParsePlan
+from .xml_parsing_exception import XmlParsingException
+
+if TYPE_CHECKING:
+    from .name_filter import NameFilter
+
+
+PACKAGE_START_TAG: bytes = b'<package '
+PACKAGE_END_TAG: bytes = b'</package>'
+# The start of a package element written by JaCoCo, with a name without any
+# entity.
+PACKAGE_NAME_PATTERN: re.Pattern[bytes] = \
+    re.compile(rb'<package\s+name="([^"&]*)"')
+# The tags of the elements whose subtree is skipped when they are filtered
+# out by their name.
+FILTERED_TAGS: frozenset[str] = frozenset({'package', 'class', 'sourcefile'})
+
+
+def find_package_ranges(data: bytes | mmap.mmap
+                        ) -> list[tuple[int, int]] | None:
+    """Return the start and the end offsets of the package elements of a
+    report, None if the document doesn't have the layout written by JaCoCo.
+
+    Args:
+        data: the content of the xml file
+    """
+    ranges: list[tuple[int, int]] = []
+    start = data.find(PACKAGE_START_TAG)
+    while start >= 0:
+        end = data.find(PACKAGE_END_TAG, start)
+        if end < 0:
+            return None
+        end += len(PACKAGE_END_TAG)
+        if ranges and data[ranges[-1][1]:start].strip():
+            # something else than whitespace between two packages
+            return None
+        ranges.append((start, end))
+        start = data.find(PACKAGE_START_TAG, end)
+    return ranges
+
+
+def get_package_name(data: bytes | mmap.mmap, start: int) -> str | None:
+    """Return the name of the package element starting at an offset, None
+    if it can't be read without parsing the element."""
+    match = PACKAGE_NAME_PATTERN.match(data, start)
+    if match is None:
+        return None
+    name_start, name_end = match.span(1)
+    try:
+        return data[name_start:name_end].decode()
+    except UnicodeDecodeError:
+        return None
+
+
+def get_skipped_tags(plan: ParsePlan) -> frozenset[str]:
+    """Return the tags of the elements that are not needed by a parse plan.
+
+    Args:
+        plan: the parts of the report to build
+    """
+    skipped_tags: set[str] = {'sessioninfo'}
+    if ParsePlan.CLASSES not in plan:
+        skipped_tags.add('class')
+    if ParsePlan.METHODS not in plan:
+        skipped_tags.add('method')
+    if ParsePlan.SOURCE_FILES not in plan:
+        skipped_tags.add('sourcefile')
+    if ParsePlan.LINES not in plan:
+        skipped_tags.add('line')
+    return frozenset(skipped_tags)
+
+
+class ReportParser:
+    '''Push parser that builds the packages of a report as they are closed.
+
+    The subtrees not needed by the parse plan, or filtered out by their name,
+    are skipped without creating any element, and each package element is
+    dropped once converted, so the memory used is bounded by the biggest
+    package instead of the whole document.
+    '''
+
+    def __init__(self, plan: ParsePlan = ParsePlan.ALL,
+                 name_filter: NameFilter | None = None) -> None:
+        """
+        Args:
+            plan: the parts of the report to build
+            name_filter: the filter of the packages, classes and source files
+                to build, all of them by default
+        """
+        self.plan = plan
+        self.name_filter = name_filter
+        self._skipped_tags = get_skipped_tags(plan)
+        self._filtered_tags = frozenset() if name_filter is None \
+            else FILTERED_TAGS
+        self._package_name = ''
+        self._package_included = True
+        self._skipped_tag: str | None = None
+        self._root: Element | None = None
+        # the number of open elements that are built, the report being at 1
+        self._depth = 0
+        self._packages: list[PackageCoverage] = []
+        self._builder = TreeBuilder()
+        self._parser = expat.ParserCreate()
+        self._parser.buffer_text = True
+        self._parser.StartElementHandler = self._start
+        self._parser.EndElementHandler = self._end
+
+    def _is_filtered_out(self, tag: str, attrib: dict[str, str]) -> bool:
+        assert self.name_filter is not None, 'no filter'
+        name = attrib.get('name', '')
+        match tag:
+            case 'package':
+                if not self.name_filter.accepts_package(name):
+                    return True
+                self._package_name = name
+                self._package_included = \
+                    self.name_filter.includes_package(name)
+                return False
+
+            case 'class':
+                return not self.name_filter.accepts(name,
+                                                    self._package_included)
+
+            case 'sourcefile':
+                return not self.name_filter.accepts(
+                    f'{self._package_name}/{name}',
+                    self._package_included
+                )
+
+            case _:
+                assert False, 'unreachable'
+
+    def _start(self, tag: str, attrib: dict[str, str]) -> None:
+        if tag in self._skipped_tags or (
+            tag in self._filtered_tags and self._is_filtered_out(tag, attrib)
+        ):
+            # JaCoCo elements are never nested in an element with the same
+            # tag, so only the end tags need to be watched until the end of
+            # the skipped subtree.
+            self._skipped_tag = tag
+            self._parser.StartElementHandler = None
+            self._parser.EndElementHandler = self._skip_end
+            return
+
+        element = self._builder.start(tag, attrib)
+        self._depth += 1
+        if self._root is None:
+            if tag != 'report':
+                raise XmlParsingException(element)
+            self._root = element
+
+    def _skip_end(self, tag: str) -> None:
+        if tag == self._skipped_tag:
+            self._skipped_tag = None
+            self._parser.StartElementHandler = self._start
+            self._parser.EndElementHandler = self._end
+
+    def _end(self, tag: str) -> None:
+        element = self._builder.end(tag)
+        self._depth -= 1
+        # only the packages of the report are converted, those of the groups
+        # of an aggregated report are left to be rejected with the groups
+        if tag == 'package' and self._depth == 1 \
+                and self._root is not None:
+            self._packages.append(
+                PackageCoverage.from_xml_element(element, self.plan)
+            )
+            self._root.remove(element)
+
+    def _parse(self, data: bytes, is_final: bool) -> None:
+        try:
+            self._parser.Parse(data, is_final)
+        except expat.ExpatError as error:
+            parse_error = ParseError(str(error))
+            parse_error.code = error.code
+            parse_error.position = error.lineno, error.offset
+            raise parse_error from None
+
+    def feed(self, data: bytes) -> None:
+        """Feed a chunk of the xml document to the parser.
+
+        Raises:
+            ParseError: if the document is not a valid xml document
+            XmlParsingException: if the document is not a JaCoCo report
+        """
+        self._parse(data, False)
+
+    def feed_filtered_document(self, data: bytes | mmap.mmap) -> bool:
+        """Feed a whole xml document to the parser, without the packages
+        rejected by its filter, which are not even tokenized.
+
+        Args:
+            data: the content of the xml file
+
+        Returns:
+            False, without feeding anything, if the document doesn't have the
+            layout written by JaCoCo
+
+        Raises:
+            ParseError: if the document is not a valid xml document
+            XmlParsingException: if the document is not a JaCoCo report
+        """
+        assert self.name_filter is not None, 'no filter'
+        ranges = find_package_ranges(data)
+        if not ranges:
+            return False
+        self.feed(data[:ranges[0][0]])
+        for start, end in ranges:
+            name = get_package_name(data, start)
+            if name is None or self.name_filter.accepts_package(name):
+                self.feed(data[start:end])
+        self.feed(data[ranges[-1][1]:])
+        return True
+
+    def read_packages(self) -> list[PackageCoverage]:
+        """Return the packages closed since the last call."""
+        packages = self._packages
+        self._packages = []
+        return packages
+
+    def close(self) -> Element:
+        """Finish the parsing and return the report element.
+
+        The returned element contains everything but the packages, which are
+        given by read_packages.
+
+        Raises:
+            ParseError: if the document is not a valid xml document
+        """
+        self._parse(b'', True)
+        assert self._root is not None, 'expat accepted an empty document'
+        return self._root
@@ -0,0 +1,22 @@
+"""Expand the paths of the report files given on the command line."""
+
+import glob
+
+
+def expand_report_paths(patterns: list[str]) -> list[str]:
+    """Return the report files matching a list of paths and glob patterns.
+
+    A pattern that doesn't match any file is kept as is, so that loading it
+    reports a missing file. The duplicated paths are removed.
+
+    Args:
+        patterns: the paths and the glob patterns, `**` matches any number
+            of directories
+    """
+    paths: dict[str, None] = {}
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) \
+            if glob.has_magic(pattern) else []
+        for path in matches or [pattern]:
+            paths.setdefault(path)
+    return list(paths)
@@ -0,0 +1,162 @@
+"""Answer the queries of the command line interface from reports kept in
+memory, over a Unix socket, with the protocol of report_client."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextlib import redirect_stderr, redirect_stdout
+import io
+import os
+import socketserver
+
+from .incremental_report_loader import IncrementalReportLoader
+from .parse_plan import ParsePlan
+from .report import Report
+from .report_client import (
+    Message,
+    encode_message,
+    get_member,
+    get_strings,
+    is_server_running,
+    read_message,
+)
+from .report_loader import ReportFileError
+from .report_watcher import load_watched_reports
+
+
+# The function running a command line with the given function loading the
+# reports, and returning its exit status.
+Query = Callable[[list[str], Callable[[], list[Report]]], int]
+
+
+class ReportRequestHandler(socketserver.StreamRequestHandler):
+    '''Handler answering one query of a client.'''
+
+    server: ReportServer
+
+    def handle(self) -> None:
+        response = self.server.answer(read_message(self.rfile))
+        try:
+            self.wfile.write(encode_message(response))
+        except ConnectionError:
+            # the client left without reading the response, like when
+            # checking whether the server is running
+            pass
+
+
+class ReportServer(socketserver.UnixStreamServer):
+    '''Server answering the queries on some report files.
+
+    The files are loaded by incremental loaders, which reparse the packages
+    that changed when a file is modified. The queries are answered one at a
+    time, since their output is captured by redirecting the standard output.
+    '''
+
+    def __init__(self, socket_path: str, paths: list[str],
+                 query: Query) -> None:
+        """
+        Args:
+            socket_path: the path of the socket to listen on
+            paths: the absolute paths of the report files, merged into one
+                report
+            query: the function running a command line
+        """
+        super().__init__(socket_path, ReportRequestHandler)
+        self.socket_path = socket_path
+        self.paths = paths
+        self.query = query
+        # the reports are kept for the life of the server, so their methods
+        # are stored in columns rather than as an object each
+        self.loaders: dict[str, IncrementalReportLoader] = {
+            path: IncrementalReportLoader(path,
+                                          ParsePlan.ALL | ParsePlan.COMPACT)
+            for path in paths
+        }
+        # the reports of the files the merged report was built from, so that
+        # it is only merged again when a loader returns a new report
+        self.file_reports: list[Report] = []
+        self.report: Report | None = None
+
+    def load_reports(self) -> list[Report]:
+        """Return the report, reloaded if one of its files changed.
+
+        The same report is returned while the files don't change, so the
+        indexes of its names are only built once.
+
+        Raises:
+            ReportFileError: if a file can't be loaded
+        """
+        file_reports = load_watched_reports([[path] for path in self.paths],
+                                            self.loaders)
+        if self.report is None or any(
+            file_report is not last_report
+            for file_report, last_report in zip(file_reports,
+                                                self.file_reports)
+        ):
+            self.report = file_reports[0] if len(file_reports) == 1 \
+                else Report.merge(file_reports)
+            self.file_reports = file_reports
+        return [self.report]
+
+    def answer(self, request: object) -> Message:
+        """Run the command line of a request and return the response."""
+        args = get_strings(get_member(request, 'args'))
+        files = get_strings(get_member(request, 'files'))
+        if not args or files is None:
+            return {'error': 'invalid request'}
+        if files != self.paths:
+            return {'error': 'the report files are not served'}
+
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                status = self.query(args, self.load_reports)
+            except SystemExit as error:
+                code = error.code
+                status = code if isinstance(code, int) else int(bool(code))
+        return {
+            'status': status,
+            'stdout': stdout.getvalue(),
+            'stderr': stderr.getvalue(),
+        }
+
+
+def create_server(socket_path: str, paths: list[str], query: Query
+                  ) -> ReportServer:
+    """Create a server listening on a socket, only accessible by the user.
+
+    A socket left by a server that stopped is removed.
+
+    Raises:
+        OSError: if the socket can't be created, or if a server already
+            listens on it
+    """
+    if is_server_running(socket_path):
+        raise OSError(f'a server already listens on {socket_path}')
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+    os.makedirs(os.path.dirname(socket_path), mode=0o700, exist_ok=True)
+    server = ReportServer(socket_path, paths, query)
+    os.chmod(socket_path, 0o600)
+    return server
+
+
+def serve_reports(server: ReportServer) -> None:
+    """Answer the queries until the process is interrupted, then remove the
+    socket of the server.
+
+    The reports are loaded before the first query, the errors being reported
+    to the clients.
+    """
+    try:
+        server.load_reports()
+    except ReportFileError:
+        pass
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.remove(server.socket_path)
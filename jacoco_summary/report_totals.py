@@ -0,0 +1,121 @@
+"""Read the counters of a report without parsing its packages."""
+
+from __future__ import annotations
+
+import mmap
+from xml.etree.ElementTree import ParseError, fromstring
+
+from .compression_format import MAGIC_NUMBER_SIZE, CompressionFormat
+from .config import STDIN_PATH
+from .parse_plan import ParsePlan
+from .report import Report
+
+
+REPORT_START_TAG: bytes = b'<report'
+REPORT_END_TAG: bytes = b'</report>'
+COUNTER_START_TAG: bytes = b'<counter '
+# The elements that can precede the counters of the report.
+TOTALS_PREVIOUS_TAGS: tuple[bytes, ...] = (
+    b'</package>',
+    b'<sessioninfo ',
+    REPORT_START_TAG,
+)
+
+
+def get_totals_plan(plan: ParsePlan) -> ParsePlan:
+    """Return the plan building only the counters of a report that a plan
+    builds."""
+    return ParsePlan.NAMES | (plan & ParsePlan.EXTRA_COUNTERS)
+
+
+def find_report_totals(data: bytes | mmap.mmap,
+                       plan: ParsePlan = ParsePlan.NAMES) -> Report | None:
+    """Return a report with only the counters of the report, read from the
+    start tag of the report and the counters at the end of the document.
+
+    JaCoCo writes the counters of the report as its last children, so they
+    are found by scanning the document backwards from the end tag of the
+    report, and the cost doesn't depend on the size of the document. The rest
+    of the document is not checked.
+
+    Args:
+        data: the content of the xml file
+        plan: the plan of the report, only its extra counters are loaded
+
+    Returns:
+        the report, or None if the document doesn't have the expected layout
+    """
+    end = data.rfind(REPORT_END_TAG)
+    if end < 0 or data[end + len(REPORT_END_TAG):].strip():
+        return None
+
+    counters_start = end
+    while True:
+        tag_start = data.rfind(b'<', 0, counters_start)
+        if tag_start < 0:
+            return None
+        if data[tag_start:tag_start + len(COUNTER_START_TAG)] \
+                != COUNTER_START_TAG:
+            break
+        counters_start = tag_start
+    previous_tag = data[tag_start:counters_start]
+    if not any(previous_tag.startswith(tag) for tag in TOTALS_PREVIOUS_TAGS):
+        return None
+
+    start = data.find(REPORT_START_TAG)
+    if start < 0 or start > tag_start:
+        return None
+    start_tag_end = data.find(b'>', start, counters_start)
+    if start_tag_end < 0:
+        return None
+
+    try:
+        element = fromstring(
+            data[start:start_tag_end + 1] + data[counters_start:end]
+            + REPORT_END_TAG
+        )
+    except ParseError:
+        return None
+    if element.tag != 'report' \
+            or any(child.tag != 'counter' for child in element):
+        return None
+    return Report.from_xml_element(element, get_totals_plan(plan))
+
+
+def read_report_totals(xml_file_path: str,
+                       plan: ParsePlan = ParsePlan.TOTALS) -> Report:
+    """Load the name and the counters of a report from a JaCoCo xml file.
+
+    The file is memory mapped and only its start and its end are read. If it
+    doesn't have the layout written by JaCoCo, is compressed or is the
+    standard input, it is parsed entirely.
+
+    Args:
+        xml_file_path: the path of the xml file to load, '-' for the standard
+            input
+        plan: the plan of the report, only its extra counters are loaded
+
+    Raises:
+        OSError: if the file can't be read
+        ParseError: if the file is not a valid xml file
+        XmlParsingException: if the file is not a JaCoCo report
+    """
+    report: Report | None = None
+    if xml_file_path != STDIN_PATH:
+        with open(xml_file_path, 'rb') as xml_file:
+            try:
+                with mmap.mmap(xml_file.fileno(), 0,
+                               access=mmap.ACCESS_READ) as data:
+                    if CompressionFormat.from_magic_number(
+                        data[:MAGIC_NUMBER_SIZE]
+                    ) is None:
+                        report = find_report_totals(data, plan)
+            except (OSError, ValueError):
+                # empty files and files that can't be mapped, like pipes
+                pass
+    if report is not None:
+        return report
+
+    report = Report.from_xml_file(xml_file_path, get_totals_plan(plan))
+    report.packages = []
+    return report
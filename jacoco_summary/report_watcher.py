@@ -0,0 +1,137 @@
+"""Reload and display the reports each time their files change."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+import sys
+import time
+from typing import TextIO
+
+from .config import WATCH_INTERVAL, WATCH_SETTLE_TIME
+from .incremental_report_loader import (
+    FileState,
+    IncrementalReportLoader,
+    get_file_state,
+)
+from .name_filter import NameFilter
+from .parse_plan import ParsePlan
+from .report import Report
+from .report_loader import LOADING_ERRORS, ReportFileError
+
+
+CLEAR_SCREEN: str = '\x1b[H\x1b[2J'
+
+
+def get_files_state(paths: Sequence[str]) -> list[FileState | None]:
+    """Return the state of some files, None for the missing ones."""
+    states: list[FileState | None] = []
+    for path in paths:
+        try:
+            states.append(get_file_state(path))
+        except OSError:
+            states.append(None)
+    return states
+
+
+def wait_for_change(paths: Sequence[str], states: list[FileState | None],
+                    interval: float = WATCH_INTERVAL,
+                    settle_time: float = WATCH_SETTLE_TIME,
+                    sleep: Callable[[float], None] = time.sleep
+                    ) -> list[FileState | None]:
+    """Poll some files until one of them changes, then until none of them
+    changed for the settle time, so that the files being written are not
+    read before their end.
+
+    Args:
+        paths: the paths of the files to watch
+        states: the states of the files when they were last read
+        interval: the time between two polls, in seconds
+        settle_time: the time without change after which a file is
+            considered written, in seconds
+        sleep: the function waiting between two polls
+
+    Returns:
+        the new states of the files
+    """
+    new_states = states
+    while new_states == states:
+        sleep(interval)
+        new_states = get_files_state(paths)
+    while True:
+        sleep(settle_time)
+        settled_states = get_files_state(paths)
+        if settled_states == new_states:
+            return settled_states
+        new_states = settled_states
+
+
+def load_watched_reports(groups: Sequence[Sequence[str]],
+                         loaders: dict[str, IncrementalReportLoader]
+                         ) -> list[Report]:
+    """Load and merge each group of report files with their loaders.
+
+    Raises:
+        ReportFileError: if a file can't be loaded
+    """
+    reports: list[Report] = []
+    for group in groups:
+        group_reports: list[Report] = []
+        for path in group:
+            try:
+                group_reports.append(loaders[path].load())
+            except LOADING_ERRORS as error:
+                raise ReportFileError(path, error) from error
+        if len(group_reports) == 1:
+            reports.append(group_reports[0])
+        else:
+            reports.append(Report.merge(group_reports))
+    return reports
+
+
+def watch_reports(groups: Sequence[Sequence[str]], plan: ParsePlan,
+                  display: Callable[[list[Report]], int],
+                  on_error: Callable[[ReportFileError], int],
+                  sleep: Callable[[float], None] = time.sleep,
+                  name_filter: NameFilter | None = None) -> int:
+    """Display the reports, then display them again each time one of their
+    files changes, until the process is interrupted.
+
+    The reports are kept in memory between two changes, and only the
+    packages that changed are parsed again.
+
+    Args:
+        groups: the paths of the report files of each report
+        plan: the parts of the reports to build
+        display: the function printing the reports and returning an exit
+            status
+        on_error: the function printing an error when a file can't be loaded
+            and returning an exit status
+        sleep: the function waiting between two polls of the files
+        name_filter: the filter of the entries to build, all of them by
+            default
+
+    Returns:
+        the exit status of the last display or error
+    """
+    loaders: dict[str, IncrementalReportLoader] = {
+        path: IncrementalReportLoader(path, plan, name_filter)
+        for group in groups for path in group
+    }
+    paths = list(loaders)
+    status = 0
+    try:
+        while True:
+            states = get_files_state(paths)
+            stdout: TextIO = sys.stdout
+            if stdout.isatty():
+                print(CLEAR_SCREEN, end='')
+            try:
+                reports = load_watched_reports(groups, loaders)
+            except ReportFileError as error:
+                status = on_error(error)
+            else:
+                status = display(reports)
+            stdout.flush()
+            wait_for_change(paths, states, sleep=sleep)
+    except KeyboardInterrupt:
+        return status
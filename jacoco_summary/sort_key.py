@@ -0,0 +1,9 @@
+from enum import Enum
+
+
+class SortKey(Enum):
+    NAME         = 'name'
+    BRANCH       = 'branch'
+    LINE         = 'line'
+    METHOD       = 'method'
+    MISSED_LINES = 'missed-lines'
@@ -3,13 +3,48 @@ from __future__ import annotations
 from xml.etree.ElementTree import Element
 
 from .coverage import Coverage
+from .extra_counters import ExtraCounters
+from .parse_plan import ParsePlan
+from .source_file_lines import SourceFileLines
 
 
 class SourceFileCoverage(Coverage):
 
+    __slots__ = ('lines',)
+
+    def __init__(
+        self,
+        name: str,
+        branch_missed: int = 0,
+        branch_covered: int = 0,
+        line_missed: int = 0,
+        line_covered: int = 0,
+        method_missed: int = 0,
+        method_covered: int = 0,
+        lines: SourceFileLines | None = None,
+        extra_counters: ExtraCounters | None = None
+    ) -> None:
+        super().__init__(
+            name,
+            branch_missed,
+            branch_covered,
+            line_missed,
+            line_covered,
+            method_missed,
+            method_covered,
+            extra_counters
+        )
+        # None when the lines were not loaded
+        self.lines = lines
+
     @classmethod
-    def from_xml_element(cls, element: Element) -> SourceFileCoverage:
-        base_instance = super().from_xml_element(element)
+    def from_xml_element(cls, element: Element,
+                         plan: ParsePlan = ParsePlan.ALL
+                         ) -> SourceFileCoverage:
+        base_instance = super().from_xml_element(element, plan)
+        lines: SourceFileLines | None = None
+        if ParsePlan.LINES in plan:
+            lines = SourceFileLines.from_xml_elements(element.findall('line'))
         return cls(
             base_instance.name,
             base_instance.branch_missed,
@@ -17,5 +52,7 @@ class SourceFileCoverage(Coverage):
             base_instance.line_missed,
             base_instance.line_covered,
             base_instance.method_missed,
-            base_instance.method_covered
+            base_instance.method_covered,
+            lines,
+            base_instance.extra_counters
         )
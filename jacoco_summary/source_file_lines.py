@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from xml.etree.ElementTree import Element
+
+from .line_status import LineStatus
+
+
+MAX_LINE_COUNT: int = 0xFFFF
+
+
+class LineCoverage:
+    '''Counters of a single line of a source file.'''
+
+    __slots__ = (
+        'number',
+        'missed_instructions',
+        'covered_instructions',
+        'missed_branches',
+        'covered_branches',
+    )
+
+    def __init__(
+        self,
+        number: int,
+        missed_instructions: int = 0,
+        covered_instructions: int = 0,
+        missed_branches: int = 0,
+        covered_branches: int = 0,
+    ) -> None:
+        self.number = number
+        self.missed_instructions = missed_instructions
+        self.covered_instructions = covered_instructions
+        self.missed_branches = missed_branches
+        self.covered_branches = covered_branches
+
+    def get_status(self) -> LineStatus:
+        return LineStatus.from_counters(
+            self.missed_instructions,
+            self.covered_instructions,
+            self.missed_branches,
+            self.covered_branches
+        )
+
+
+class SourceFileLines:
+    '''Line coverage of a source file stored in parallel arrays.
+
+    The lines are sorted by number and stored in one array per field instead
+    of one object per line: 4 bytes for the number and 2 bytes for each
+    counter. The counters are clamped to 65535, which is far above the number
+    of instructions or branches on a line. The line objects are created on
+    access.
+    '''
+
+    __slots__ = (
+        'numbers',
+        'missed_instructions',
+        'covered_instructions',
+        'missed_branches',
+        'covered_branches',
+    )
+
+    def __init__(self) -> None:
+        self.numbers = array('I')
+        self.missed_instructions = array('H')
+        self.covered_instructions = array('H')
+        self.missed_branches = array('H')
+        self.covered_branches = array('H')
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[LineCoverage]) -> SourceFileLines:
+        """Build the arrays of lines, the lines must be sorted by number."""
+        source_file_lines = cls()
+        for line in lines:
+            source_file_lines.append(line)
+        return source_file_lines
+
+    @classmethod
+    def from_xml_elements(cls, elements: Sequence[Element]
+                          ) -> SourceFileLines:
+        """Build the arrays from the line elements of a source file.
+
+        The values are appended to the arrays without creating line objects.
+        JaCoCo writes the lines sorted by number, they are only sorted here if
+        they are not.
+        """
+        source_file_lines = cls()
+        is_sorted = True
+        for element in elements:
+            attrib = element.attrib
+            number = int(attrib['nr'])
+            if source_file_lines.numbers and \
+                    source_file_lines.numbers[-1] >= number:
+                is_sorted = False
+            source_file_lines.append_counters(
+                number,
+                int(attrib['mi']),
+                int(attrib['ci']),
+                int(attrib['mb']),
+                int(attrib['cb'])
+            )
+        if is_sorted:
+            return source_file_lines
+        return cls.merge([source_file_lines])
+
+    @classmethod
+    def merge(cls, lines_list: Sequence[SourceFileLines]) -> SourceFileLines:
+        """Merge the lines of several reports of the same source file, the
+        counters of the lines with the same number are summed and the lines
+        are sorted by number."""
+        merged: dict[int, LineCoverage] = {}
+        for lines in lines_list:
+            for line in lines:
+                merged_line = merged.get(line.number)
+                if merged_line is None:
+                    merged[line.number] = line
+                    continue
+                merged_line.missed_instructions += line.missed_instructions
+                merged_line.covered_instructions += line.covered_instructions
+                merged_line.missed_branches += line.missed_branches
+                merged_line.covered_branches += line.covered_branches
+        return cls.from_lines(merged[number] for number in sorted(merged))
+
+    def append(self, line: LineCoverage) -> None:
+        """Add a line after the last one."""
+        assert not self.numbers or self.numbers[-1] < line.number, \
+               'the lines must be added by increasing number'
+        self.append_counters(
+            line.number,
+            line.missed_instructions,
+            line.covered_instructions,
+            line.missed_branches,
+            line.covered_branches
+        )
+
+    def append_counters(self, number: int, missed_instructions: int,
+                        covered_instructions: int, missed_branches: int,
+                        covered_branches: int) -> None:
+        """Add the values of a line at the end of the arrays, without checking
+        the order of the lines."""
+        self.numbers.append(number)
+        self.missed_instructions.append(
+            min(missed_instructions, MAX_LINE_COUNT)
+        )
+        self.covered_instructions.append(
+            min(covered_instructions, MAX_LINE_COUNT)
+        )
+        self.missed_branches.append(min(missed_branches, MAX_LINE_COUNT))
+        self.covered_branches.append(min(covered_branches, MAX_LINE_COUNT))
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def __getitem__(self, index: int) -> LineCoverage:
+        return LineCoverage(
+            self.numbers[index],
+            self.missed_instructions[index],
+            self.covered_instructions[index],
+            self.missed_branches[index],
+            self.covered_branches[index]
+        )
+
+    def __iter__(self) -> Iterator[LineCoverage]:
+        for i in range(len(self.numbers)):
+            yield self[i]
+
+    def get_line(self, number: int) -> LineCoverage | None:
+        """Return the line with a number, in O(log n).
+
+        Args:
+            number: the number of the line in the source file
+        """
+        index = bisect_left(self.numbers, number)
+        if index == len(self.numbers) or self.numbers[index] != number:
+            return None
+        return self[index]
+
+    def get_status(self, index: int) -> LineStatus:
+        """Return the status of the line at an index."""
+        return LineStatus.from_counters(
+            self.missed_instructions[index],
+            self.covered_instructions[index],
+            self.missed_branches[index],
+            self.covered_branches[index]
+        )
+
+    def get_ranges(self) -> Iterator[tuple[int, int, LineStatus]]:
+        """Yield the ranges of consecutive lines with the same status, as
+        their first and last line numbers and their status.
+
+        The lines without code are not in the report, so they don't split the
+        ranges.
+        """
+        if not self.numbers:
+            return
+        first = 0
+        status = self.get_status(0)
+        for i in range(1, len(self.numbers)):
+            line_status = self.get_status(i)
+            if line_status != status:
+                yield self.numbers[first], self.numbers[i - 1], status
+                first = i
+                status = line_status
+        yield self.numbers[first], self.numbers[-1], status
+
+    def get_ranges_coverage(self, ranges: Sequence[tuple[int, int]]
+                            ) -> tuple[int, int, list[tuple[int, int]]]:
+        """Return the coverage of the lines of the file in some ranges.
+
+        Each range is located with a bisection, so the cost depends on the
+        number of ranges and of lines in them, not on the size of the file. A
+        line counts as covered when one of its instructions is, like in the
+        LINE counter of JaCoCo.
+
+        Args:
+            ranges: the sorted ranges of line numbers, as their first and last
+                lines
+
+        Returns:
+            the numbers of covered and missed lines, and the ranges of
+            consecutive missed lines
+        """
+        covered = 0
+        missed = 0
+        missed_ranges: list[tuple[int, int]] = []
+        last_missed = -1
+        for first, last in ranges:
+            start = bisect_left(self.numbers, first)
+            stop = bisect_right(self.numbers, last, lo=start)
+            for i in range(start, stop):
+                if self.covered_instructions[i]:
+                    covered += 1
+                elif self.missed_instructions[i]:
+                    missed += 1
+                    if missed_ranges and last_missed == i - 1:
+                        missed_ranges[-1] = missed_ranges[-1][0], \
+                                            self.numbers[i]
+                    else:
+                        missed_ranges.append((self.numbers[i],
+                                              self.numbers[i]))
+                    last_missed = i
+        return covered, missed, missed_ranges
@@ -1,76 +1,371 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+import sys
+from typing import TextIO
 
+from .color import Color
 from .column_name import ColumnName
-from .coverage import Coverage
-from .utils import get_string_width
+from .config import PERCENTAGE_BAR_WIDTH
+from .coverage import BAR_COLUMNS, Coverage
+from .diff_coverage import DiffCoverage
+from .line_status import LineStatus
+from .report_comparison import (
+    CoverageChange,
+    get_coverage_percentage,
+)
+from .source_file_lines import SourceFileLines
+from .utils import (
+    format_line_range,
+    get_character_width,
+    get_percentage_bar_table,
+    get_string_width,
+)
 
 
-def generate_table(lines: Sequence[Coverage], columns_order: list[ColumnName]
-                 ) -> list[list[str]]:
+# The text replacing the beginning of the names truncated to fit a column.
+TRUNCATION_MARK: str = '…'
+LINE_STATUS_LABELS: dict[LineStatus, str] = {
+    LineStatus.NOT_COVERED: f'{Color.RED}not covered{Color.RESET}',
+    LineStatus.PARTLY_COVERED: f'{Color.YELLOW}partly covered{Color.RESET}',
+}
+
+
+def generate_table(lines: Sequence[Coverage], columns_order: list[ColumnName],
+                   bar_width: int = PERCENTAGE_BAR_WIDTH) -> list[list[str]]:
     tab: list[list[str]] = [[column.value for column in columns_order]]
     for coverage in lines:
-        tab.append([coverage.get_field(column) for column in columns_order])
+        tab.append([
+            coverage.get_field(column, bar_width) for column in columns_order
+        ])
     return tab
 
 
-def print_table_cell(cell_content: str, max_size: int) -> None:
-    print(
-        f'│ {cell_content}',
-        ' ' * (max_size - get_string_width(cell_content)),
-        end=''
+def generate_lines_table(lines: SourceFileLines) -> list[list[str]]:
+    """Return the table of the ranges of lines not fully covered."""
+    tab: list[list[str]] = [['Lines', 'Status']]
+    for first, last, status in lines.get_ranges():
+        label = LINE_STATUS_LABELS.get(status)
+        if label is None:
+            continue
+        tab.append([format_line_range(first, last), label])
+    return tab
+
+
+def generate_diff_table(files_coverage: Sequence[DiffCoverage],
+                        total: Coverage) -> list[list[str]]:
+    """Return the table of the coverage of the changed lines of some files.
+
+    Args:
+        files_coverage: the coverage of the changed lines of each file
+        total: the coverage of all the changed lines
+    """
+    tab: list[list[str]] = [['Name', 'Line', 'Missed lines']]
+    for file_coverage in files_coverage:
+        tab.append([
+            file_coverage.get_name(),
+            file_coverage.get_field(ColumnName.LINE),
+            ', '.join(format_line_range(first, last)
+                      for first, last in file_coverage.missed_lines),
+        ])
+    tab.append([total.get_name(), total.get_field(ColumnName.LINE), ''])
+    return tab
+
+
+def format_ratio(ratio: float | None) -> str:
+    if ratio is None:
+        return ' n/a'
+    return f'{ratio:3.0f}%'
+
+
+def format_coverage_change(baseline_missed: int, baseline_covered: int,
+                           current_missed: int, current_covered: int) -> str:
+    """Return the text of the change of a percentage of covered items, with
+    the difference in percentage points in green or red."""
+    baseline = get_coverage_percentage(baseline_missed, baseline_covered)
+    current = get_coverage_percentage(current_missed, current_covered)
+    text = f'{format_ratio(baseline)} → {format_ratio(current)}'
+    if baseline is None or current is None or current == baseline:
+        return text
+    color = Color.GREEN if current > baseline else Color.RED
+    return f'{text} {color}{current - baseline:+.1f}{Color.RESET}'
+
+
+def generate_comparison_table(changes: Sequence[CoverageChange]
+                              ) -> list[list[str]]:
+    """Return the table of the changes of coverage of entries in both
+    reports."""
+    tab: list[list[str]] = [[
+        ColumnName.NAME.value,
+        ColumnName.BRANCH.value,
+        ColumnName.LINE.value,
+        ColumnName.METHOD.value,
+    ]]
+    for change in changes:
+        assert change.baseline is not None and change.current is not None, \
+               'the entry must be in both reports'
+        baseline = change.baseline
+        current = change.current
+        tab.append([
+            change.name,
+            format_coverage_change(baseline.branch_missed,
+                                   baseline.branch_covered,
+                                   current.branch_missed,
+                                   current.branch_covered),
+            format_coverage_change(baseline.line_missed,
+                                   baseline.line_covered,
+                                   current.line_missed,
+                                   current.line_covered),
+            format_coverage_change(baseline.method_missed,
+                                   baseline.method_covered,
+                                   current.method_missed,
+                                   current.method_covered),
+        ])
+    return tab
+
+
+def render_table_cell(cell_content: str, max_size: int,
+                      cell_width: int | None = None) -> str:
+    if cell_width is None:
+        cell_width = get_string_width(cell_content)
+    return f'│ {cell_content} ' + ' ' * (max_size - cell_width)
+
+
+def render_table_end_line() -> str:
+    return '│\n'
+
+
+def render_table_border(columns_size: list[int], left: str, middle: str,
+                        right: str) -> str:
+    return (
+        left
+        + middle.join('─' * (size + 2) for size in columns_size)
+        + right
+        + '\n'
+    )
+
+
+def render_table_header(tab_header: list[str], columns_max_size: list[int]
+                      ) -> str:
+    return (
+        render_table_border(columns_max_size, '┌', '┬', '┐')
+        + render_table_body([tab_header], columns_max_size)
+        + render_table_border(columns_max_size, '├', '┼', '┤')
+    )
+
+
+def render_table_body(tab_body: Sequence[list[str]],
+                      columns_max_size: list[int],
+                      cells_width: Sequence[list[int]] | None = None) -> str:
+    """Return the text of the lines of a table.
+
+    Args:
+        tab_body: the cells of the lines
+        columns_max_size: the width of each column
+        cells_width: the displayed width of the cells if already known
+    """
+    if cells_width is None:
+        cells_width = [list(map(get_string_width, line)) for line in tab_body]
+    end_line = render_table_end_line()
+    return ''.join(
+        ''.join(
+            render_table_cell(column, columns_max_size[i], line_width[i])
+            for i, column in enumerate(line)
+        ) + end_line
+        for line, line_width in zip(tab_body, cells_width)
+    )
+
+
+def render_table_footer(columns_size: list[int]) -> str:
+    return render_table_border(columns_size, '└', '┴', '┘')
+
+
+def render_table(tab: list[list[str]]) -> str:
+    """Return the text of a table, the first line being the header.
+
+    The whole table is rendered in memory so it can be written at once, and
+    each cell is measured only once.
+    """
+    assert tab, 'try to render an empty table'
+
+    cells_width: list[list[int]] = [
+        list(map(get_string_width, line)) for line in tab
+    ]
+    columns_max_size: list[int] = [
+        max(line[j] for line in cells_width) for j in range(len(tab[0]))
+    ]
+
+    return (
+        render_table_header(tab[0], columns_max_size)
+        + render_table_body(tab[1:], columns_max_size, cells_width[1:])
+        + render_table_footer(columns_max_size)
     )
 
 
+def truncate_name(name: str, width: int) -> str:
+    """Return a name cut to a displayed width, its beginning being replaced by
+    an ellipsis when cut, so the class or file name at its end is kept."""
+    if get_string_width(name) <= width:
+        return name
+    kept_width = get_string_width(TRUNCATION_MARK)
+    start = len(name)
+    while start > 0:
+        character_width = get_character_width(name[start - 1])
+        if kept_width + character_width > width:
+            break
+        kept_width += character_width
+        start -= 1
+    return TRUNCATION_MARK + name[start:]
+
+
+def get_cells_width(coverages: Iterable[Coverage],
+                    columns_order: list[ColumnName],
+                    measure_names: bool = True,
+                    bar_width: int = PERCENTAGE_BAR_WIDTH) -> list[int]:
+    """Return the width of the widest cell of each column of the table of some
+    coverages.
+
+    Only the names and the counts are measured, the percentage bars all having
+    the same width.
+
+    Args:
+        coverages: the coverages of the lines
+        columns_order: the columns of the table
+        measure_names: whether to measure the names, their width being 0
+            otherwise
+        bar_width: the number of segments of the percentage bars
+    """
+    bar_cell_width = get_percentage_bar_table(bar_width).string_width
+    cells_width: list[int] = [
+        bar_cell_width if column in BAR_COLUMNS else 0
+        for column in columns_order
+    ]
+    measured_columns: list[tuple[int, ColumnName]] = [
+        (index, column)
+        for index, column in enumerate(columns_order)
+        if column not in BAR_COLUMNS
+        and (measure_names or column is not ColumnName.NAME)
+    ]
+    if not measured_columns:
+        return cells_width
+    for coverage in coverages:
+        for index, column in measured_columns:
+            cell_width = get_string_width(coverage.get_field(column))
+            if cell_width > cells_width[index]:
+                cells_width[index] = cell_width
+    return cells_width
+
+
+def get_terminal_names_width(columns_order: list[ColumnName],
+                             columns_size: list[int]) -> int:
+    """Return the width of the names column for a table to fit in the
+    terminal, never narrower than the header of the column.
+
+    Args:
+        columns_order: the columns of the table
+        columns_size: the width of each column
+    """
+    import shutil  # pylint: disable=import-outside-toplevel
+    # each column takes a separator and two spaces, the line one more border
+    others_width = sum(
+        size + 3
+        for size, column in zip(columns_size, columns_order)
+        if column is not ColumnName.NAME
+    )
+    return max(shutil.get_terminal_size().columns - others_width - 4,
+               get_string_width(ColumnName.NAME.value))
+
+
+def get_stream_columns_size(coverages: Iterable[Coverage],
+                            columns_order: list[ColumnName],
+                            names_width: int | None = None,
+                            fit_terminal: bool = False,
+                            bar_width: int = PERCENTAGE_BAR_WIDTH
+                            ) -> list[int]:
+    """Return the width of each column of a streamed table of some coverages,
+    measuring only their names and their counts.
+
+    Args:
+        coverages: the coverages of the lines
+        columns_order: the columns of the table
+        names_width: the width of the names column, the width of the longest
+            name by default
+        fit_terminal: whether to narrow the names column measured for the
+            table to fit in the terminal
+        bar_width: the number of segments of the percentage bars
+    """
+    cells_width = get_cells_width(coverages, columns_order,
+                                  names_width is None, bar_width)
+    if names_width is not None:
+        cells_width = [
+            names_width if column is ColumnName.NAME else cell_width
+            for column, cell_width in zip(columns_order, cells_width)
+        ]
+    columns_size: list[int] = [
+        max(get_string_width(column.value), cell_width)
+        for column, cell_width in zip(columns_order, cells_width)
+    ]
+    if names_width is None and fit_terminal \
+            and ColumnName.NAME in columns_order:
+        index = columns_order.index(ColumnName.NAME)
+        columns_size[index] = min(
+            columns_size[index],
+            get_terminal_names_width(columns_order, columns_size)
+        )
+    return columns_size
+
+
+def print_table_cell(cell_content: str, max_size: int) -> None:
+    sys.stdout.write(render_table_cell(cell_content, max_size))
+
+
 def print_table_end_line() -> None:
-    print('│')
+    sys.stdout.write(render_table_end_line())
 
 
 def print_table_header(tab_header: list[str], columns_max_size: list[int]
                      ) -> None:
-    print('┌', end='')
-    for i, column in enumerate(tab_header):
-        print('─' * (columns_max_size[i] + 2), end='')
-        if i != len(tab_header) - 1:
-            print('┬', end='')
-    print('┐')
-    for i, column in enumerate(tab_header):
-        print_table_cell(column, columns_max_size[i])
-    print_table_end_line()
-    print('├', end='')
-    for i, column in enumerate(tab_header):
-        print('─' * (columns_max_size[i] + 2), end='')
-        if i != len(tab_header) - 1:
-            print('┼', end='')
-    print('┤')
+    sys.stdout.write(render_table_header(tab_header, columns_max_size))
 
 
 def print_table_body(tab_body: list[list[str]], columns_max_size: list[int]
                    ) -> None:
-    for line in tab_body:
-        for i, column in enumerate(line):
-            print_table_cell(column, columns_max_size[i])
-        print_table_end_line()
+    sys.stdout.write(render_table_body(tab_body, columns_max_size))
 
 
 def print_table_footer(columns_size: list[int]) -> None:
-    print('└', end='')
-    for i, column in enumerate(columns_size):
-        print('─' * (column + 2), end='')
-        if i != len(columns_size) - 1:
-            print('┴', end='')
-    print('┘')
+    sys.stdout.write(render_table_footer(columns_size))
 
 
 def print_table(tab: list[list[str]]) -> None:
     assert tab, 'try to print an empty table'
+    sys.stdout.write(render_table(tab))
 
-    columns_max_size: list[int] = [
-        max(map(
-            get_string_width,
-            (line[j] for line in tab)
-        )) for j in range(len(tab[0]))
-    ]
 
-    print_table_header(tab.pop(0), columns_max_size)
-    print_table_body(tab, columns_max_size)
-    print_table_footer(columns_max_size)
+def print_coverage_table(coverages: Iterable[Coverage],
+                         columns_order: list[ColumnName],
+                         columns_size: list[int],
+                         bar_width: int = PERCENTAGE_BAR_WIDTH) -> None:
+    """Print the table of some coverages one line at a time, as they are
+    iterated.
+
+    The width of the columns is known before the first line, the longer names
+    being truncated, so neither the lines nor their text are kept in memory.
+
+    Args:
+        coverages: the coverages of the lines
+        columns_order: the columns of the table
+        columns_size: the width of each column, like the ones returned by
+            get_stream_columns_size
+        bar_width: the number of segments of the percentage bars
+    """
+    stdout: TextIO = sys.stdout
+    write = stdout.write
+    write(render_table_header([column.value for column in columns_order],
+                              columns_size))
+    for coverage in coverages:
+        write(render_table_body([[
+            truncate_name(coverage.get_name(), size)
+            if column is ColumnName.NAME
+            else coverage.get_field(column, bar_width)
+            for column, size in zip(columns_order, columns_size)
+        ]], columns_size))
+    write(render_table_footer(columns_size))
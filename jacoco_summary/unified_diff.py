@@ -0,0 +1,89 @@
+"""Parse the changed lines of a unified diff."""
+
+from collections.abc import Iterable
+import re
+
+
+HUNK_HEADER_PATTERN: re.Pattern[str] = re.compile(
+    r'@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@'
+)
+DIFF_PATH_PREFIXES: tuple[str, ...] = ('b/', 'w/', 'i/')
+
+
+def get_diff_path(header: str) -> str | None:
+    """Return the path of the new file of a '+++' header, or None if the file
+    is deleted.
+
+    Args:
+        header: the header line without the '+++ ' prefix
+    """
+    path = header.rstrip('\n').split('\t', 1)[0]
+    if path == '/dev/null':
+        return None
+    if path.startswith(DIFF_PATH_PREFIXES):
+        path = path[2:]
+    return path
+
+
+def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Return the ranges sorted, with the overlapping and adjacent ranges
+    merged."""
+    merged: list[tuple[int, int]] = []
+    for first, last in sorted(ranges):
+        if merged and first <= merged[-1][1] + 1:
+            if last > merged[-1][1]:
+                merged[-1] = merged[-1][0], last
+        else:
+            merged.append((first, last))
+    return merged
+
+
+def parse_unified_diff(lines: Iterable[str]
+                       ) -> dict[str, list[tuple[int, int]]]:
+    """Return the ranges of lines added or modified by a unified diff.
+
+    The ranges are numbered like in the new version of the files, each range
+    being its first and last line. The ranges of a file are sorted and don't
+    overlap. The removed lines are ignored, since they have no coverage.
+
+    Args:
+        lines: the lines of the diff, like the output of git diff
+    """
+    changed_lines: dict[str, list[tuple[int, int]]] = {}
+    ranges: list[tuple[int, int]] | None = None
+    line_number = 0
+    remaining_lines = 0
+    for line in lines:
+        if remaining_lines > 0:
+            if line.startswith('+'):
+                if ranges is not None:
+                    if ranges and ranges[-1][1] == line_number - 1:
+                        ranges[-1] = ranges[-1][0], line_number
+                    else:
+                        ranges.append((line_number, line_number))
+                line_number += 1
+                remaining_lines -= 1
+            elif line.startswith((' ', '\n')):
+                line_number += 1
+                remaining_lines -= 1
+            # the removed lines and '\ No newline at end of file' don't
+            # change the line numbers of the new file
+            continue
+
+        if line.startswith('+++ '):
+            path = get_diff_path(line[4:])
+            ranges = None if path is None else changed_lines.setdefault(path,
+                                                                        [])
+            continue
+
+        match = HUNK_HEADER_PATTERN.match(line)
+        if match is not None:
+            line_number = int(match.group(1))
+            count = match.group(2)
+            remaining_lines = 1 if count is None else int(count)
+
+    return {
+        path: merge_ranges(ranges)
+        for path, ranges in changed_lines.items()
+        if ranges
+    }
@@ -1,42 +1,155 @@
 """Utils functions."""
 
+from bisect import bisect_right
 import re
+import unicodedata
 
 from .color import Color
+from .config import PERCENTAGE_BAR_WIDTH, STRING_WIDTH_CACHE_SIZE
 
 
-def percentage_bar(value_missed: int, value_covered: int) -> str:
+COLOR_CODES: tuple[str, ...] = tuple(color.value for color in Color)
+ZERO_WIDTH_CATEGORIES: frozenset[str] = frozenset(('Mn', 'Me', 'Cf'))
+WIDE_EAST_ASIAN_WIDTHS: frozenset[str] = frozenset(('W', 'F'))
+
+
+class PercentageBarTable:
+    '''Lookup table of the percentage bars of a given width.
+
+    A bar only depends on its number of filled segments and its label on the
+    rounded percentage, so all of them are built once and a bar is then
+    formatted with a bisection and two list lookups.
+    '''
+
+    __slots__ = ('width', 'thresholds', 'bars', 'labels', 'not_available',
+                 'string_width')
+
+    def __init__(self, width: int) -> None:
+        assert width > 0, 'the width of a percentage bar must be positive'
+
+        self.width = width
+        # the percentage from which each segment is filled
+        self.thresholds: list[float] = [
+            i * (1 / width) for i in range(1, width + 1)
+        ]
+        self.bars: list[str] = [
+            self._build_bar(filled) for filled in range(width + 1)
+        ]
+        self.labels: list[str] = [
+            f'{Color.RESET} {percent:3d}%' for percent in range(101)
+        ]
+        self.not_available: str = f'{Color.GRAY}{"━" * width}{Color.RESET}  n/a'
+        # the displayed width of every bar of the table
+        self.string_width: int = get_string_width(self.not_available)
+
+    def _build_bar(self, filled: int) -> str:
+        if filled == 0:
+            return f'{Color.RED}{"━" * self.width}'
+        if filled == self.width:
+            return f'{Color.GREEN}{"━" * self.width}'
+        return (
+            f'{Color.GREEN}{"━" * filled}'
+            f'{Color.RED}╺{"━" * (self.width - filled - 1)}'
+        )
+
+    def format(self, value_missed: int, value_covered: int) -> str:
+        """Return the bar of the percentage of covered items.
+
+        Args:
+            value_missed: the number of items missed
+            value_covered: the number of items covered
+        """
+        total: int = value_missed + value_covered
+        if total == 0:
+            return self.not_available
+
+        percentage: float = value_covered / total
+        return (
+            self.bars[bisect_right(self.thresholds, percentage)]
+            + self.labels[round(percentage * 100)]
+        )
+
+
+_percentage_bar_tables: dict[int, PercentageBarTable] = {}
+
+
+def get_percentage_bar_table(width: int = PERCENTAGE_BAR_WIDTH
+                             ) -> PercentageBarTable:
+    """Return the lookup table of the percentage bars of a width, the table is
+    built on the first call for each width.
+
+    Args:
+        width: the number of segments of the bars
+    """
+    table = _percentage_bar_tables.get(width)
+    if table is None:
+        table = PercentageBarTable(width)
+        _percentage_bar_tables[width] = table
+    return table
+
+
+def percentage_bar(value_missed: int, value_covered: int,
+                   width: int = PERCENTAGE_BAR_WIDTH) -> str:
     """Return the progress bar corresponding to the percentage of number of
     covered items over total items.
 
     Args:
         value_missed: the number of items missed
         value_covered: the number of items covered.
+        width: the number of segments of the bar
     """
-    total: int = value_missed + value_covered
-    if total == 0:
-        return f'{Color.GRAY}━━━━━━━━━━{Color.RESET}  n/a'
-
-    percentage: float = value_covered / total
-    result: str = ''
-    first_red: bool = True
-    for i in range(1, 11):
-        if i * 0.1 <= percentage:
-            if i == 1:
-                result += str(Color.GREEN)
-            result += '━'
-        elif first_red and i != 1:
-            result += f'{Color.RED}╺'
-            first_red = False
-        else:
-            if i == 1:
-                result += str(Color.RED)
-                first_red = False
-            result += '━'
-    return result + f'{Color.RESET} {percentage * 100:3.0f}%'
+    return get_percentage_bar_table(width).format(value_missed, value_covered)
+
+
+def format_line_range(first: int, last: int) -> str:
+    """Return the text of a range of lines, a single line for one line."""
+    if first == last:
+        return str(first)
+    return f'{first}-{last}'
+
+
+def get_character_width(character: str) -> int:
+    """Return the number of terminal columns used to display a character.
+
+    Combining and format characters take no column and the East Asian wide
+    and fullwidth characters take two.
+    """
+    if unicodedata.category(character) in ZERO_WIDTH_CATEGORIES:
+        return 0
+    if unicodedata.east_asian_width(character) in WIDE_EAST_ASIAN_WIDTHS:
+        return 2
+    return 1
+
+
+_string_widths: dict[str, int] = {}
 
 
 def get_string_width(string: str) -> int:
     """Compute the displayed length of a string in charaters and ignore the
-    invisible charaters."""
-    return len(re.sub(r'\x1b\[[0-9]*m', '', string))
+    invisible charaters.
+
+    The widths of the strings with escape sequences or non ASCII characters
+    are cached, the cells of a table mostly being the same few percentage bars.
+    """
+    if string.isascii() and '\x1b' not in string:
+        return len(string)
+    width = _string_widths.get(string)
+    if width is None:
+        if len(_string_widths) >= STRING_WIDTH_CACHE_SIZE:
+            _string_widths.clear()
+        width = _compute_string_width(string)
+        _string_widths[string] = width
+    return width
+
+
+def _compute_string_width(string: str) -> int:
+    # The escape sequences of the Color enum are removed without a regex, any
+    # other sequence is removed by falling back to one.
+    if '\x1b' in string:
+        for code in COLOR_CODES:
+            string = string.replace(code, '')
+        if '\x1b' in string:
+            string = re.sub(r'\x1b\[[0-9]*m', '', string)
+    if string.isascii():
+        return len(string)
+    return sum(map(get_character_width, string))
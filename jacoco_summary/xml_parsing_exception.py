@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from xml.etree.ElementTree import Element
 
 
@@ -5,3 +7,8 @@ class XmlParsingException(Exception):
 
     def __init__(self, element: Element) -> None:
         super().__init__(f'unexpected element tag {repr(element.tag)}')
+        self.tag = element.tag
+
+    def __reduce__(self) -> tuple[type[XmlParsingException], tuple[Element]]:
+        # Rebuild from the tag so the exception can cross process boundaries.
+        return self.__class__, (Element(self.tag),)
@@ -5,4 +5,4 @@ set -xe
 mypy
 coverage run --branch -m pytest --verbose --no-header
 coverage report --show-missing --skip-covered --omit=test/*
-pylint jacoco_summary test
+pylint jacoco_summary benchmark test
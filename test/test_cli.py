@@ -1,11 +1,16 @@
 """Test the cli module."""
 
+# pylint: disable=too-many-lines
+
+import gzip
 from io import StringIO
 import os
 import shutil
 from typing import Callable
 import sys
+from tempfile import TemporaryDirectory
 from unittest import TestCase
+from unittest.mock import patch
 
 from jacoco_summary.cli import cli
 
@@ -15,67 +20,596 @@ class TestCli(TestCase):
     maxDiff = 10_000
 
     # pylint: disable=line-too-long
+    usage: str = (
+        'usage: cli [-h] [-f FILE] [-j N] [--no-cache] [--clear-cache] [--watch]\n'
+        '           [--include PATTERN] [--exclude PATTERN]\n'
+        '           [--format {table,csv,json,ndjson}]\n'
+        '           [--sort {name,branch,line,method,missed-lines}] [--reverse]\n'
+        '           [--top N] [--columns COLUMNS] [--stream | --no-stream]\n'
+        '           [--name-width N] [-v]\n'
+        '           {package,class,file,lines,diff,compare,summary,tree,record,history,serve} ...\n'
+    )
+    usage_package: str = (
+        'usage: cli package [-h] [-f FILE] [-j N] [--no-cache] [--clear-cache]\n'
+        '                   [--watch] [--include PATTERN] [--exclude PATTERN]\n'
+        '                   [--format {table,csv,json,ndjson}]\n'
+        '                   [--sort {name,branch,line,method,missed-lines}] [--reverse]\n'
+        '                   [--top N] [--columns COLUMNS] [--stream | --no-stream]\n'
+        '                   [--name-width N] [-l]\n'
+        '                   [PACKAGE]\n'
+    )
+    usage_class: str = (
+        'usage: cli class [-h] [-f FILE] [-j N] [--no-cache] [--clear-cache] [--watch]\n'
+        '                 [--include PATTERN] [--exclude PATTERN]\n'
+        '                 [--format {table,csv,json,ndjson}]\n'
+        '                 [--sort {name,branch,line,method,missed-lines}] [--reverse]\n'
+        '                 [--top N] [--columns COLUMNS] [--stream | --no-stream]\n'
+        '                 [--name-width N]\n'
+        '                 CLASS\n'
+    )
+    usage_file: str = (
+        'usage: cli file [-h] [-f FILE] [-j N] [--no-cache] [--clear-cache] [--watch]\n'
+        '                [--include PATTERN] [--exclude PATTERN]\n'
+        '                [--format {table,csv,json,ndjson}]\n'
+        '                [--sort {name,branch,line,method,missed-lines}] [--reverse]\n'
+        '                [--top N] [--columns COLUMNS] [--stream | --no-stream]\n'
+        '                [--name-width N] [-l]\n'
+        '                [JAVA_FILE]\n'
+    )
+    usage_lines: str = (
+        'usage: cli lines [-h] [-f FILE] [-j N] [--no-cache] [--clear-cache] [--watch]\n'
+        '                 [--include PATTERN] [--exclude PATTERN]\n'
+        '                 [--format {table,csv,json,ndjson}]\n'
+        '                 [--sort {name,branch,line,method,missed-lines}] [--reverse]\n'
+        '                 [--top N] [--columns COLUMNS] [--stream | --no-stream]\n'
+        '                 [--name-width N]\n'
+        '                 JAVA_FILE\n'
+    )
+    usage_diff: str = (
+        'usage: cli diff [-h] [-f FILE] [-j N] [--no-cache] [--clear-cache] [--watch]\n'
+        '                [--include PATTERN] [--exclude PATTERN]\n'
+        '                [--format {table,csv,json,ndjson}]\n'
+        '                [--sort {name,branch,line,method,missed-lines}] [--reverse]\n'
+        '                [--top N] [--columns COLUMNS] [--stream | --no-stream]\n'
+        '                [--name-width N] [--fail-under PERCENT]\n'
+        '                [DIFF_FILE]\n'
+    )
+    usage_compare: str = (
+        'usage: cli compare [-h] [-f FILE] [-j N] [--no-cache] [--clear-cache]\n'
+        '                   [--watch] [--include PATTERN] [--exclude PATTERN]\n'
+        '                   [--format {table,csv,json,ndjson}]\n'
+        '                   [--sort {name,branch,line,method,missed-lines}] [--reverse]\n'
+        '                   [--top N] [--columns COLUMNS] [--stream | --no-stream]\n'
+        '                   [--name-width N] [--level {class,package,file}]\n'
+        '                   [--only-regressions]\n'
+        '                   BASELINE\n'
+    )
+    usage_summary: str = (
+        'usage: cli summary [-h] [-f FILE] [-j N] [--no-cache] [--clear-cache]\n'
+        '                   [--watch] [--include PATTERN] [--exclude PATTERN]\n'
+        '                   [--format {table,csv,json,ndjson}]\n'
+        '                   [--sort {name,branch,line,method,missed-lines}] [--reverse]\n'
+        '                   [--top N] [--columns COLUMNS] [--stream | --no-stream]\n'
+        '                   [--name-width N] [--fail-under PERCENT]\n'
+    )
+    usage_serve: str = (
+        'usage: cli serve [-h] [-f FILE] [-j N] [--no-cache] [--clear-cache] [--watch]\n'
+        '                 [--include PATTERN] [--exclude PATTERN]\n'
+        '                 [--format {table,csv,json,ndjson}]\n'
+        '                 [--sort {name,branch,line,method,missed-lines}] [--reverse]\n'
+        '                 [--top N] [--columns COLUMNS] [--stream | --no-stream]\n'
+        '                 [--name-width N]\n'
+    )
+
     help: str = (
-        'usage: cli [-h] [-f FILE] [-v] {package,class,file} ...\n'
+        usage +
         '\n'
         'Display JaCoCo test coverage result in a fancy way.\n'
         '\n'
         'options:\n'
         '  -h, --help            show this help message and exit\n'
-        '  -f, --file FILE       the path JaCoCo report xml file to use\n'
+        '  -f, --file FILE       the path JaCoCo report xml file to use, can be a glob\n'
+        '                        pattern, - for the standard input, be compressed with\n'
+        '                        gzip, xz or zstd and be repeated to merge several\n'
+        '                        reports\n'
+        '  -j, --jobs N          the number of report files to parse in parallel\n'
+        "  --no-cache            don't read or write the cache of the parsed reports\n"
+        '  --clear-cache         remove the cache of the parsed reports\n'
+        '  --watch               keep running and print the output again each time a\n'
+        '                        report file changes\n'
+        '  --include PATTERN     only keep the packages, classes and source files whose\n'
+        '                        name, like com/acme/Main, or whose package name\n'
+        '                        matches a glob pattern, where ** matches across the\n'
+        '                        slashes, or a regular expression prefixed with re:,\n'
+        '                        can be repeated\n'
+        '  --exclude PATTERN     remove the packages, classes and source files whose\n'
+        '                        name or whose package name matches a pattern, can be\n'
+        '                        repeated\n'
+        '  --format {table,csv,json,ndjson}\n'
+        '                        the format of the output, csv, json and ndjson give\n'
+        '                        the counts and the ratios of covered items, table by\n'
+        '                        default\n'
+        '  --sort {name,branch,line,method,missed-lines}\n'
+        '                        the column to sort the rows by, from the worst\n'
+        '                        coverage or the most missed lines, the order of the\n'
+        '                        report by default\n'
+        '  --reverse             reverse the order of the rows\n'
+        '  --top N               only print the N first rows\n'
+        '  --columns COLUMNS     the comma separated columns of the coverage tables and\n'
+        '                        records, among name, the percentage bars branch, line,\n'
+        '                        method, instruction, complexity and class, and their\n'
+        '                        counts like line-missed and line-covered,\n'
+        '                        name,branch,line,method by default\n'
+        '  --stream, --no-stream\n'
+        '                        print the rows of the coverage tables as they are\n'
+        '                        formatted, the width of the names being measured\n'
+        '                        first, by default when the output is not a terminal\n'
+        '  --name-width N        the width of the names of the streamed tables, the\n'
+        '                        beginning of the longer names being truncated, implies\n'
+        '                        --stream\n'
         "  -v, --version         show program's version number and exit\n"
         '\n'
         'subcommands:\n'
-        '  {package,class,file}\n'
+        '  {package,class,file,lines,diff,compare,summary,tree,record,history,serve}\n'
         '    package             print the summary of a specific package\n'
         '    class               print the summary of a specific class\n'
         '    file                print the summary per files\n'
+        '    lines               print the lines of a file that are not fully covered\n'
+        '    diff                print the coverage of the lines changed by a diff\n'
+        '    compare             print the coverage changes since a baseline report\n'
+        '    summary             print the total coverage of the report\n'
+        '    tree                print the coverage of the hierarchy of the packages\n'
+        '    record              record the coverage of a build in the history\n'
+        '    history             print the coverage of the recorded builds\n'
+        '    serve               answer the other subcommands from the reports kept in\n'
+        '                        memory\n'
     )
-    # pylint: enable=line-too-long
 
     help_package: str = (
-        'usage: cli package [-h] [-f FILE] [-l] [PACKAGE]\n'
+        usage_package +
         '\n'
         'Print the summary of a specific package.\n'
         '\n'
         'positional arguments:\n'
-        '  PACKAGE              the name of the package to display\n'
+        '  PACKAGE               the name of the package to display\n'
         '\n'
         'options:\n'
-        '  -h, --help           show this help message and exit\n'
-        '  -f, --file FILE      the path JaCoCo report xml file to use\n'
-        '  -l, --list-packages  list packages in the report\n'
+        '  -h, --help            show this help message and exit\n'
+        '  -f, --file FILE       the path JaCoCo report xml file to use, can be a glob\n'
+        '                        pattern, - for the standard input, be compressed with\n'
+        '                        gzip, xz or zstd and be repeated to merge several\n'
+        '                        reports\n'
+        '  -j, --jobs N          the number of report files to parse in parallel\n'
+        "  --no-cache            don't read or write the cache of the parsed reports\n"
+        '  --clear-cache         remove the cache of the parsed reports\n'
+        '  --watch               keep running and print the output again each time a\n'
+        '                        report file changes\n'
+        '  --include PATTERN     only keep the packages, classes and source files whose\n'
+        '                        name, like com/acme/Main, or whose package name\n'
+        '                        matches a glob pattern, where ** matches across the\n'
+        '                        slashes, or a regular expression prefixed with re:,\n'
+        '                        can be repeated\n'
+        '  --exclude PATTERN     remove the packages, classes and source files whose\n'
+        '                        name or whose package name matches a pattern, can be\n'
+        '                        repeated\n'
+        '  --format {table,csv,json,ndjson}\n'
+        '                        the format of the output, csv, json and ndjson give\n'
+        '                        the counts and the ratios of covered items, table by\n'
+        '                        default\n'
+        '  --sort {name,branch,line,method,missed-lines}\n'
+        '                        the column to sort the rows by, from the worst\n'
+        '                        coverage or the most missed lines, the order of the\n'
+        '                        report by default\n'
+        '  --reverse             reverse the order of the rows\n'
+        '  --top N               only print the N first rows\n'
+        '  --columns COLUMNS     the comma separated columns of the coverage tables and\n'
+        '                        records, among name, the percentage bars branch, line,\n'
+        '                        method, instruction, complexity and class, and their\n'
+        '                        counts like line-missed and line-covered,\n'
+        '                        name,branch,line,method by default\n'
+        '  --stream, --no-stream\n'
+        '                        print the rows of the coverage tables as they are\n'
+        '                        formatted, the width of the names being measured\n'
+        '                        first, by default when the output is not a terminal\n'
+        '  --name-width N        the width of the names of the streamed tables, the\n'
+        '                        beginning of the longer names being truncated, implies\n'
+        '                        --stream\n'
+        '  -l, --list-packages   list packages in the report\n'
     )
 
     help_class: str = (
-        'usage: cli class [-h] [-f FILE] CLASS\n'
+        usage_class +
         '\n'
         'Print the summary of a specific class.\n'
         '\n'
         'positional arguments:\n'
-        '  CLASS            the name of the class to display\n'
+        '  CLASS                 the name of the class to display\n'
         '\n'
         'options:\n'
-        '  -h, --help       show this help message and exit\n'
-        '  -f, --file FILE  the path JaCoCo report xml file to use\n'
+        '  -h, --help            show this help message and exit\n'
+        '  -f, --file FILE       the path JaCoCo report xml file to use, can be a glob\n'
+        '                        pattern, - for the standard input, be compressed with\n'
+        '                        gzip, xz or zstd and be repeated to merge several\n'
+        '                        reports\n'
+        '  -j, --jobs N          the number of report files to parse in parallel\n'
+        "  --no-cache            don't read or write the cache of the parsed reports\n"
+        '  --clear-cache         remove the cache of the parsed reports\n'
+        '  --watch               keep running and print the output again each time a\n'
+        '                        report file changes\n'
+        '  --include PATTERN     only keep the packages, classes and source files whose\n'
+        '                        name, like com/acme/Main, or whose package name\n'
+        '                        matches a glob pattern, where ** matches across the\n'
+        '                        slashes, or a regular expression prefixed with re:,\n'
+        '                        can be repeated\n'
+        '  --exclude PATTERN     remove the packages, classes and source files whose\n'
+        '                        name or whose package name matches a pattern, can be\n'
+        '                        repeated\n'
+        '  --format {table,csv,json,ndjson}\n'
+        '                        the format of the output, csv, json and ndjson give\n'
+        '                        the counts and the ratios of covered items, table by\n'
+        '                        default\n'
+        '  --sort {name,branch,line,method,missed-lines}\n'
+        '                        the column to sort the rows by, from the worst\n'
+        '                        coverage or the most missed lines, the order of the\n'
+        '                        report by default\n'
+        '  --reverse             reverse the order of the rows\n'
+        '  --top N               only print the N first rows\n'
+        '  --columns COLUMNS     the comma separated columns of the coverage tables and\n'
+        '                        records, among name, the percentage bars branch, line,\n'
+        '                        method, instruction, complexity and class, and their\n'
+        '                        counts like line-missed and line-covered,\n'
+        '                        name,branch,line,method by default\n'
+        '  --stream, --no-stream\n'
+        '                        print the rows of the coverage tables as they are\n'
+        '                        formatted, the width of the names being measured\n'
+        '                        first, by default when the output is not a terminal\n'
+        '  --name-width N        the width of the names of the streamed tables, the\n'
+        '                        beginning of the longer names being truncated, implies\n'
+        '                        --stream\n'
     )
 
     help_file: str = (
-        'usage: cli file [-h] [-f FILE] [-l] [JAVA_FILE]\n'
+        usage_file +
         '\n'
         'Print the summary per files.\n'
         '\n'
         'positional arguments:\n'
-        '  JAVA_FILE         the path to a file in the report to display\n'
+        '  JAVA_FILE             the path to a file in the report to display\n'
+        '\n'
+        'options:\n'
+        '  -h, --help            show this help message and exit\n'
+        '  -f, --file FILE       the path JaCoCo report xml file to use, can be a glob\n'
+        '                        pattern, - for the standard input, be compressed with\n'
+        '                        gzip, xz or zstd and be repeated to merge several\n'
+        '                        reports\n'
+        '  -j, --jobs N          the number of report files to parse in parallel\n'
+        "  --no-cache            don't read or write the cache of the parsed reports\n"
+        '  --clear-cache         remove the cache of the parsed reports\n'
+        '  --watch               keep running and print the output again each time a\n'
+        '                        report file changes\n'
+        '  --include PATTERN     only keep the packages, classes and source files whose\n'
+        '                        name, like com/acme/Main, or whose package name\n'
+        '                        matches a glob pattern, where ** matches across the\n'
+        '                        slashes, or a regular expression prefixed with re:,\n'
+        '                        can be repeated\n'
+        '  --exclude PATTERN     remove the packages, classes and source files whose\n'
+        '                        name or whose package name matches a pattern, can be\n'
+        '                        repeated\n'
+        '  --format {table,csv,json,ndjson}\n'
+        '                        the format of the output, csv, json and ndjson give\n'
+        '                        the counts and the ratios of covered items, table by\n'
+        '                        default\n'
+        '  --sort {name,branch,line,method,missed-lines}\n'
+        '                        the column to sort the rows by, from the worst\n'
+        '                        coverage or the most missed lines, the order of the\n'
+        '                        report by default\n'
+        '  --reverse             reverse the order of the rows\n'
+        '  --top N               only print the N first rows\n'
+        '  --columns COLUMNS     the comma separated columns of the coverage tables and\n'
+        '                        records, among name, the percentage bars branch, line,\n'
+        '                        method, instruction, complexity and class, and their\n'
+        '                        counts like line-missed and line-covered,\n'
+        '                        name,branch,line,method by default\n'
+        '  --stream, --no-stream\n'
+        '                        print the rows of the coverage tables as they are\n'
+        '                        formatted, the width of the names being measured\n'
+        '                        first, by default when the output is not a terminal\n'
+        '  --name-width N        the width of the names of the streamed tables, the\n'
+        '                        beginning of the longer names being truncated, implies\n'
+        '                        --stream\n'
+        '  -l, --list-files      list files in the report\n'
+    )
+
+    help_lines: str = (
+        usage_lines +
+        '\n'
+        'Print the ranges of lines of a file that are not covered or partly covered.\n'
+        '\n'
+        'positional arguments:\n'
+        '  JAVA_FILE             the path to a file in the report to display\n'
+        '\n'
+        'options:\n'
+        '  -h, --help            show this help message and exit\n'
+        '  -f, --file FILE       the path JaCoCo report xml file to use, can be a glob\n'
+        '                        pattern, - for the standard input, be compressed with\n'
+        '                        gzip, xz or zstd and be repeated to merge several\n'
+        '                        reports\n'
+        '  -j, --jobs N          the number of report files to parse in parallel\n'
+        "  --no-cache            don't read or write the cache of the parsed reports\n"
+        '  --clear-cache         remove the cache of the parsed reports\n'
+        '  --watch               keep running and print the output again each time a\n'
+        '                        report file changes\n'
+        '  --include PATTERN     only keep the packages, classes and source files whose\n'
+        '                        name, like com/acme/Main, or whose package name\n'
+        '                        matches a glob pattern, where ** matches across the\n'
+        '                        slashes, or a regular expression prefixed with re:,\n'
+        '                        can be repeated\n'
+        '  --exclude PATTERN     remove the packages, classes and source files whose\n'
+        '                        name or whose package name matches a pattern, can be\n'
+        '                        repeated\n'
+        '  --format {table,csv,json,ndjson}\n'
+        '                        the format of the output, csv, json and ndjson give\n'
+        '                        the counts and the ratios of covered items, table by\n'
+        '                        default\n'
+        '  --sort {name,branch,line,method,missed-lines}\n'
+        '                        the column to sort the rows by, from the worst\n'
+        '                        coverage or the most missed lines, the order of the\n'
+        '                        report by default\n'
+        '  --reverse             reverse the order of the rows\n'
+        '  --top N               only print the N first rows\n'
+        '  --columns COLUMNS     the comma separated columns of the coverage tables and\n'
+        '                        records, among name, the percentage bars branch, line,\n'
+        '                        method, instruction, complexity and class, and their\n'
+        '                        counts like line-missed and line-covered,\n'
+        '                        name,branch,line,method by default\n'
+        '  --stream, --no-stream\n'
+        '                        print the rows of the coverage tables as they are\n'
+        '                        formatted, the width of the names being measured\n'
+        '                        first, by default when the output is not a terminal\n'
+        '  --name-width N        the width of the names of the streamed tables, the\n'
+        '                        beginning of the longer names being truncated, implies\n'
+        '                        --stream\n'
+    )
+
+    help_diff: str = (
+        usage_diff +
+        '\n'
+        'Print the coverage of the lines added or modified by a unified diff, like the\n'
+        'output of git diff.\n'
+        '\n'
+        'positional arguments:\n'
+        '  DIFF_FILE             the path to the unified diff, the standard input by\n'
+        '                        default\n'
+        '\n'
+        'options:\n'
+        '  -h, --help            show this help message and exit\n'
+        '  -f, --file FILE       the path JaCoCo report xml file to use, can be a glob\n'
+        '                        pattern, - for the standard input, be compressed with\n'
+        '                        gzip, xz or zstd and be repeated to merge several\n'
+        '                        reports\n'
+        '  -j, --jobs N          the number of report files to parse in parallel\n'
+        "  --no-cache            don't read or write the cache of the parsed reports\n"
+        '  --clear-cache         remove the cache of the parsed reports\n'
+        '  --watch               keep running and print the output again each time a\n'
+        '                        report file changes\n'
+        '  --include PATTERN     only keep the packages, classes and source files whose\n'
+        '                        name, like com/acme/Main, or whose package name\n'
+        '                        matches a glob pattern, where ** matches across the\n'
+        '                        slashes, or a regular expression prefixed with re:,\n'
+        '                        can be repeated\n'
+        '  --exclude PATTERN     remove the packages, classes and source files whose\n'
+        '                        name or whose package name matches a pattern, can be\n'
+        '                        repeated\n'
+        '  --format {table,csv,json,ndjson}\n'
+        '                        the format of the output, csv, json and ndjson give\n'
+        '                        the counts and the ratios of covered items, table by\n'
+        '                        default\n'
+        '  --sort {name,branch,line,method,missed-lines}\n'
+        '                        the column to sort the rows by, from the worst\n'
+        '                        coverage or the most missed lines, the order of the\n'
+        '                        report by default\n'
+        '  --reverse             reverse the order of the rows\n'
+        '  --top N               only print the N first rows\n'
+        '  --columns COLUMNS     the comma separated columns of the coverage tables and\n'
+        '                        records, among name, the percentage bars branch, line,\n'
+        '                        method, instruction, complexity and class, and their\n'
+        '                        counts like line-missed and line-covered,\n'
+        '                        name,branch,line,method by default\n'
+        '  --stream, --no-stream\n'
+        '                        print the rows of the coverage tables as they are\n'
+        '                        formatted, the width of the names being measured\n'
+        '                        first, by default when the output is not a terminal\n'
+        '  --name-width N        the width of the names of the streamed tables, the\n'
+        '                        beginning of the longer names being truncated, implies\n'
+        '                        --stream\n'
+        '  --fail-under PERCENT  exit with an error if the coverage of the changed\n'
+        '                        lines is under this percentage\n'
+    )
+
+    help_compare: str = (
+        usage_compare +
+        '\n'
+        'Print the coverage changes between a baseline report and the current one, and\n'
+        'the added and removed entries.\n'
+        '\n'
+        'positional arguments:\n'
+        '  BASELINE              the path to the JaCoCo report xml file to compare\n'
+        '                        with, can be a glob pattern\n'
+        '\n'
+        'options:\n'
+        '  -h, --help            show this help message and exit\n'
+        '  -f, --file FILE       the path JaCoCo report xml file to use, can be a glob\n'
+        '                        pattern, - for the standard input, be compressed with\n'
+        '                        gzip, xz or zstd and be repeated to merge several\n'
+        '                        reports\n'
+        '  -j, --jobs N          the number of report files to parse in parallel\n'
+        "  --no-cache            don't read or write the cache of the parsed reports\n"
+        '  --clear-cache         remove the cache of the parsed reports\n'
+        '  --watch               keep running and print the output again each time a\n'
+        '                        report file changes\n'
+        '  --include PATTERN     only keep the packages, classes and source files whose\n'
+        '                        name, like com/acme/Main, or whose package name\n'
+        '                        matches a glob pattern, where ** matches across the\n'
+        '                        slashes, or a regular expression prefixed with re:,\n'
+        '                        can be repeated\n'
+        '  --exclude PATTERN     remove the packages, classes and source files whose\n'
+        '                        name or whose package name matches a pattern, can be\n'
+        '                        repeated\n'
+        '  --format {table,csv,json,ndjson}\n'
+        '                        the format of the output, csv, json and ndjson give\n'
+        '                        the counts and the ratios of covered items, table by\n'
+        '                        default\n'
+        '  --sort {name,branch,line,method,missed-lines}\n'
+        '                        the column to sort the rows by, from the worst\n'
+        '                        coverage or the most missed lines, the order of the\n'
+        '                        report by default\n'
+        '  --reverse             reverse the order of the rows\n'
+        '  --top N               only print the N first rows\n'
+        '  --columns COLUMNS     the comma separated columns of the coverage tables and\n'
+        '                        records, among name, the percentage bars branch, line,\n'
+        '                        method, instruction, complexity and class, and their\n'
+        '                        counts like line-missed and line-covered,\n'
+        '                        name,branch,line,method by default\n'
+        '  --stream, --no-stream\n'
+        '                        print the rows of the coverage tables as they are\n'
+        '                        formatted, the width of the names being measured\n'
+        '                        first, by default when the output is not a terminal\n'
+        '  --name-width N        the width of the names of the streamed tables, the\n'
+        '                        beginning of the longer names being truncated, implies\n'
+        '                        --stream\n'
+        '  --level {class,package,file}\n'
+        '                        the entries of the reports to compare, classes by\n'
+        '                        default\n'
+        '  --only-regressions    only print the entries whose coverage decreased\n'
+    )
+
+    help_summary: str = (
+        usage_summary +
+        '\n'
+        'Print the total coverage of the report. Only the end of the report files is\n'
+        'read when they have the layout written by JaCoCo.\n'
+        '\n'
+        'options:\n'
+        '  -h, --help            show this help message and exit\n'
+        '  -f, --file FILE       the path JaCoCo report xml file to use, can be a glob\n'
+        '                        pattern, - for the standard input, be compressed with\n'
+        '                        gzip, xz or zstd and be repeated to merge several\n'
+        '                        reports\n'
+        '  -j, --jobs N          the number of report files to parse in parallel\n'
+        "  --no-cache            don't read or write the cache of the parsed reports\n"
+        '  --clear-cache         remove the cache of the parsed reports\n'
+        '  --watch               keep running and print the output again each time a\n'
+        '                        report file changes\n'
+        '  --include PATTERN     only keep the packages, classes and source files whose\n'
+        '                        name, like com/acme/Main, or whose package name\n'
+        '                        matches a glob pattern, where ** matches across the\n'
+        '                        slashes, or a regular expression prefixed with re:,\n'
+        '                        can be repeated\n'
+        '  --exclude PATTERN     remove the packages, classes and source files whose\n'
+        '                        name or whose package name matches a pattern, can be\n'
+        '                        repeated\n'
+        '  --format {table,csv,json,ndjson}\n'
+        '                        the format of the output, csv, json and ndjson give\n'
+        '                        the counts and the ratios of covered items, table by\n'
+        '                        default\n'
+        '  --sort {name,branch,line,method,missed-lines}\n'
+        '                        the column to sort the rows by, from the worst\n'
+        '                        coverage or the most missed lines, the order of the\n'
+        '                        report by default\n'
+        '  --reverse             reverse the order of the rows\n'
+        '  --top N               only print the N first rows\n'
+        '  --columns COLUMNS     the comma separated columns of the coverage tables and\n'
+        '                        records, among name, the percentage bars branch, line,\n'
+        '                        method, instruction, complexity and class, and their\n'
+        '                        counts like line-missed and line-covered,\n'
+        '                        name,branch,line,method by default\n'
+        '  --stream, --no-stream\n'
+        '                        print the rows of the coverage tables as they are\n'
+        '                        formatted, the width of the names being measured\n'
+        '                        first, by default when the output is not a terminal\n'
+        '  --name-width N        the width of the names of the streamed tables, the\n'
+        '                        beginning of the longer names being truncated, implies\n'
+        '                        --stream\n'
+        '  --fail-under PERCENT  exit with an error if the line coverage is under this\n'
+        '                        percentage, or if the report has no lines\n'
+    )
+
+    help_serve: str = (
+        usage_serve +
+        '\n'
+        'Keep the reports in memory, reloaded when their files change, and answer the\n'
+        'package, class, file and lines subcommands run with the same report files,\n'
+        'which use the server when it is running.\n'
         '\n'
         'options:\n'
-        '  -h, --help        show this help message and exit\n'
-        '  -f, --file FILE   the path JaCoCo report xml file to use\n'
-        '  -l, --list-files  list files in the report\n'
+        '  -h, --help            show this help message and exit\n'
+        '  -f, --file FILE       the path JaCoCo report xml file to use, can be a glob\n'
+        '                        pattern, - for the standard input, be compressed with\n'
+        '                        gzip, xz or zstd and be repeated to merge several\n'
+        '                        reports\n'
+        '  -j, --jobs N          the number of report files to parse in parallel\n'
+        "  --no-cache            don't read or write the cache of the parsed reports\n"
+        '  --clear-cache         remove the cache of the parsed reports\n'
+        '  --watch               keep running and print the output again each time a\n'
+        '                        report file changes\n'
+        '  --include PATTERN     only keep the packages, classes and source files whose\n'
+        '                        name, like com/acme/Main, or whose package name\n'
+        '                        matches a glob pattern, where ** matches across the\n'
+        '                        slashes, or a regular expression prefixed with re:,\n'
+        '                        can be repeated\n'
+        '  --exclude PATTERN     remove the packages, classes and source files whose\n'
+        '                        name or whose package name matches a pattern, can be\n'
+        '                        repeated\n'
+        '  --format {table,csv,json,ndjson}\n'
+        '                        the format of the output, csv, json and ndjson give\n'
+        '                        the counts and the ratios of covered items, table by\n'
+        '                        default\n'
+        '  --sort {name,branch,line,method,missed-lines}\n'
+        '                        the column to sort the rows by, from the worst\n'
+        '                        coverage or the most missed lines, the order of the\n'
+        '                        report by default\n'
+        '  --reverse             reverse the order of the rows\n'
+        '  --top N               only print the N first rows\n'
+        '  --columns COLUMNS     the comma separated columns of the coverage tables and\n'
+        '                        records, among name, the percentage bars branch, line,\n'
+        '                        method, instruction, complexity and class, and their\n'
+        '                        counts like line-missed and line-covered,\n'
+        '                        name,branch,line,method by default\n'
+        '  --stream, --no-stream\n'
+        '                        print the rows of the coverage tables as they are\n'
+        '                        formatted, the width of the names being measured\n'
+        '                        first, by default when the output is not a terminal\n'
+        '  --name-width N        the width of the names of the streamed tables, the\n'
+        '                        beginning of the longer names being truncated, implies\n'
+        '                        --stream\n'
     )
 
+    diff_table: str = (
+        '┌───────────────────┬─────────────────┬──────────────┐\n'
+        '│ Name              │ Line            │ Missed lines │\n'
+        '├───────────────────┼─────────────────┼──────────────┤\n'
+        '│ test1/Class2.java │ \x1b[32m━━━━━━━━\x1b[31m╺━\x1b[0m  80% │ 18           │\n'
+        '│ Total             │ \x1b[32m━━━━━━━━\x1b[31m╺━\x1b[0m  80% │              │\n'
+        '└───────────────────┴─────────────────┴──────────────┘\n'
+    )
+    summary_table: str = (
+        '┌───────┬─────────────────┬─────────────────┬─────────────────┐\n'
+        '│ Name  │ Branch          │ Line            │ Method          │\n'
+        '├───────┼─────────────────┼─────────────────┼─────────────────┤\n'
+        '│ test1 │ \x1b[32m━━━━━\x1b[31m╺━━━━\x1b[0m  50% │ \x1b[32m━━━━━\x1b[31m╺━━━━\x1b[0m  52% │ \x1b[32m━━━━━\x1b[31m╺━━━━\x1b[0m  54% │\n'
+        '└───────┴─────────────────┴─────────────────┴─────────────────┘\n'
+    )
+    # pylint: enable=line-too-long
+
     @classmethod
     def setUpClass(cls) -> None:
+        cache_home = cls.enterClassContext(TemporaryDirectory())  # pylint: disable=consider-using-with
+        # a server running on the test reports must not answer the tests
+        environ: dict[str, str] = {
+            'XDG_CACHE_HOME': cache_home,
+            'XDG_RUNTIME_DIR': cache_home,
+        }
+        cls.enterClassContext(patch.dict('os.environ', environ))
         if os.path.exists('target/site/jacoco'):
             shutil.rmtree('target')
         os.makedirs('target/site/jacoco')
@@ -135,7 +669,7 @@ class TestCli(TestCase):
             ['cli', '--unknown-option'],
             returncode=1,
             stderr=(  # pylint: disable=line-too-long
-                'usage: cli [-h] [-f FILE] [-v] {package,class,file} ...\n'
+                self.usage +
                 'cli: error: unrecognized arguments: --unknown-option\n'
             )  # pylint: enable=line-too-long
         )
@@ -217,7 +751,7 @@ class TestCli(TestCase):
             ['cli', '-f'],
             returncode=1,
             stderr=(  # pylint: disable=line-too-long
-                'usage: cli [-h] [-f FILE] [-v] {package,class,file} ...\n'
+                self.usage +
                 'cli: error: argument -f/--file: expected one argument\n'
             )  # # pylint: enable=line-too-long
         )
@@ -256,11 +790,76 @@ class TestCli(TestCase):
             ['cli', '--file'],
             returncode=1,
             stderr=(  # pylint: disable=line-too-long
-                'usage: cli [-h] [-f FILE] [-v] {package,class,file} ...\n'
+                self.usage +
                 'cli: error: argument -f/--file: expected one argument\n'
             )  # pylint: enable=line-too-long
         )
 
+    def test_cli_no_cache_option(self) -> None:
+        """Test cli --no-cache option."""
+        self.assert_command(
+            cli,
+            ['cli', '--no-cache'],
+            stdout=(  # pylint: disable=line-too-long
+                '┌──────────────┬─────────────────┬─────────────────┬─────────────────┐\n'
+                '│ Name         │ Branch          │ Line            │ Method          │\n'
+                '├──────────────┼─────────────────┼─────────────────┼─────────────────┤\n'
+                '│ test2.Class2 │ \x1b[30m━━━━━━━━━━\x1b[0m  n/a │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │\n'
+                '│ test2.Class1 │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │\n'
+                '│ test1.Class1 │ \x1b[32m━━━━━━━━━━\x1b[0m 100% │ \x1b[32m━━━━━━━━━━\x1b[0m 100% │ \x1b[32m━━━━━━━━━━\x1b[0m 100% │\n'
+                '│ test1.Class2 │ \x1b[32m━━━━━\x1b[31m╺━━━━\x1b[0m  50% │ \x1b[32m━━━━━\x1b[31m╺━━━━\x1b[0m  60% │ \x1b[32m━━━━━━━\x1b[31m╺━━\x1b[0m  75% │\n'
+                '└──────────────┴─────────────────┴─────────────────┴─────────────────┘\n'
+            )  # pylint: enable=line-too-long
+        )
+
+    def test_cli_clear_cache_option(self) -> None:
+        """Test cli --clear-cache option."""
+        self.assert_command(
+            cli,
+            ['cli', '--clear-cache'],
+            stdout=(  # pylint: disable=line-too-long
+                '┌──────────────┬─────────────────┬─────────────────┬─────────────────┐\n'
+                '│ Name         │ Branch          │ Line            │ Method          │\n'
+                '├──────────────┼─────────────────┼─────────────────┼─────────────────┤\n'
+                '│ test2.Class2 │ \x1b[30m━━━━━━━━━━\x1b[0m  n/a │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │\n'
+                '│ test2.Class1 │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │\n'
+                '│ test1.Class1 │ \x1b[32m━━━━━━━━━━\x1b[0m 100% │ \x1b[32m━━━━━━━━━━\x1b[0m 100% │ \x1b[32m━━━━━━━━━━\x1b[0m 100% │\n'
+                '│ test1.Class2 │ \x1b[32m━━━━━\x1b[31m╺━━━━\x1b[0m  50% │ \x1b[32m━━━━━\x1b[31m╺━━━━\x1b[0m  60% │ \x1b[32m━━━━━━━\x1b[31m╺━━\x1b[0m  75% │\n'
+                '└──────────────┴─────────────────┴─────────────────┴─────────────────┘\n'
+            )  # pylint: enable=line-too-long
+        )
+
+    def test_cli_file_option_several_files(self) -> None:
+        """Test cli -f option repeated with a glob pattern."""
+        self.assert_command(
+            cli,
+            ['cli', '-f', 'test/jacoco.xml', '-f', 'test/empty-c*.xml'],
+            stdout=(  # pylint: disable=line-too-long
+                '┌─────────────────┬─────────────────┬─────────────────┬─────────────────┐\n'
+                '│ Name            │ Branch          │ Line            │ Method          │\n'
+                '├─────────────────┼─────────────────┼─────────────────┼─────────────────┤\n'
+                '│ test2.Class2    │ \x1b[30m━━━━━━━━━━\x1b[0m  n/a │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │\n'
+                '│ test2.Class1    │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │\n'
+                '│ test1.Class1    │ \x1b[32m━━━━━━━━━━\x1b[0m 100% │ \x1b[32m━━━━━━━━━━\x1b[0m 100% │ \x1b[32m━━━━━━━━━━\x1b[0m 100% │\n'
+                '│ test1.Class2    │ \x1b[32m━━━━━\x1b[31m╺━━━━\x1b[0m  50% │ \x1b[32m━━━━━\x1b[31m╺━━━━\x1b[0m  60% │ \x1b[32m━━━━━━━\x1b[31m╺━━\x1b[0m  75% │\n'
+                '│ test.EmptyClass │ \x1b[30m━━━━━━━━━━\x1b[0m  n/a │ \x1b[30m━━━━━━━━━━\x1b[0m  n/a │ \x1b[30m━━━━━━━━━━\x1b[0m  n/a │\n'
+                '└─────────────────┴─────────────────┴─────────────────┴─────────────────┘\n'
+            )  # pylint: enable=line-too-long
+        )
+
+    def test_cli_jobs_option_invalid(self) -> None:
+        """Test cli --jobs option with an invalid value."""
+        self.assert_command(
+            cli,
+            ['cli', '--jobs', '0'],
+            returncode=1,
+            stderr=(
+                self.usage +
+                'cli: error: argument -j/--jobs: '
+                "invalid positive integer: '0'\n"
+            )
+        )
+
     def test_cli_parse_error(self) -> None:
         self.assert_command(
             cli,
@@ -288,8 +887,8 @@ class TestCli(TestCase):
             ['cli', 'unknown args'],
             returncode=1,
             stderr=(  # pylint: disable=line-too-long
-                'usage: cli [-h] [-f FILE] [-v] {package,class,file} ...\n'
-                "cli: error: argument subcommand: invalid choice: 'unknown args' (choose from package, class, file)\n"
+                self.usage +
+                "cli: error: argument subcommand: invalid choice: 'unknown args' (choose from package, class, file, lines, diff, compare, summary, tree, record, history, serve)\n"
             )  # pylint: enable=line-too-long
         )
 
@@ -322,7 +921,7 @@ class TestCli(TestCase):
             ['cli', 'package'],
             returncode=1,
             stderr=(  # pylint: disable=line-too-long
-                'usage: cli package [-h] [-f FILE] [-l] [PACKAGE]\n'
+                self.usage_package +
                 'cli package: error: the following arguments are required: PACKAGE\n'
             )  # pylint: enable=line-too-long
         )
@@ -350,7 +949,7 @@ class TestCli(TestCase):
             ['cli', 'package', 'test', '--unknown-option'],
             returncode=1,
             stderr=(  # pylint: disable=line-too-long
-                'usage: cli [-h] [-f FILE] [-v] {package,class,file} ...\n'
+                self.usage +
                 'cli: error: unrecognized arguments: --unknown-option\n'
             )  # pylint: enable=line-too-long
         )
@@ -429,7 +1028,7 @@ class TestCli(TestCase):
             ['cli', 'package', '-f'],
             returncode=1,
             stderr=(  # pylint: disable=line-too-long
-                'usage: cli [-h] [-f FILE] [-v] {package,class,file} ...\n'
+                self.usage +
                 'cli: error: argument -f/--file: expected one argument\n'
             )  # # pylint: enable=line-too-long
         )
@@ -471,7 +1070,7 @@ class TestCli(TestCase):
             ['cli', 'package', '--file'],
             returncode=1,
             stderr=(  # pylint: disable=line-too-long
-                'usage: cli [-h] [-f FILE] [-v] {package,class,file} ...\n'
+                self.usage +
                 'cli: error: argument -f/--file: expected one argument\n'
             )  # pylint: enable=line-too-long
         )
@@ -534,7 +1133,7 @@ class TestCli(TestCase):
             ['cli', 'class'],
             returncode=1,
             stderr=(  # pylint: disable=line-too-long
-                'usage: cli class [-h] [-f FILE] CLASS\n'
+                self.usage_class +
                 'cli class: error: the following arguments are required: CLASS\n'
             )  # pylint: enable=line-too-long
         )
@@ -625,7 +1224,7 @@ class TestCli(TestCase):
             ['cli', 'class', '-f'],
             returncode=1,
             stderr=(  # pylint: disable=line-too-long
-                'usage: cli [-h] [-f FILE] [-v] {package,class,file} ...\n'
+                self.usage +
                 'cli: error: argument -f/--file: expected one argument\n'
             )  # pylint: enable=line-too-long
         )
@@ -663,7 +1262,7 @@ class TestCli(TestCase):
             ['cli', 'class', '--file'],
             returncode=1,
             stderr=(  # pylint: disable=line-too-long
-                'usage: cli [-h] [-f FILE] [-v] {package,class,file} ...\n'
+                self.usage +
                 'cli: error: argument -f/--file: expected one argument\n'
             )  # pylint: enable=line-too-long
         )
@@ -768,7 +1367,7 @@ class TestCli(TestCase):
             ['cli', 'file', '-f'],
             returncode=1,
             stderr=(  # pylint: disable=line-too-long
-                'usage: cli [-h] [-f FILE] [-v] {package,class,file} ...\n'
+                self.usage +
                 'cli: error: argument -f/--file: expected one argument\n'
             )  # # pylint: enable=line-too-long
         )
@@ -808,7 +1407,7 @@ class TestCli(TestCase):
             ['cli', 'file', '--file'],
             returncode=1,
             stderr=(  # pylint: disable=line-too-long
-                'usage: cli [-h] [-f FILE] [-v] {package,class,file} ...\n'
+                self.usage +
                 'cli: error: argument -f/--file: expected one argument\n'
             )  # # pylint: enable=line-too-long
         )
@@ -846,3 +1445,746 @@ class TestCli(TestCase):
             stderr='cli: error: file \'FileThatDoesntExists.java\' doesn\'t exists\n'
             # pylint: enable=line-too-long
         )
+
+    def test_cli_lines_subcommand(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'lines', 'test1/Class2.java'],
+            stdout=(
+                '┌───────┬────────────────┐\n'
+                '│ Lines │ Status         │\n'
+                '├───────┼────────────────┤\n'
+                '│ 9     │ \x1b[33mpartly covered\x1b[0m │\n'
+                '│ 10    │ \x1b[31mnot covered\x1b[0m    │\n'
+                '│ 17    │ \x1b[33mpartly covered\x1b[0m │\n'
+                '│ 18    │ \x1b[31mnot covered\x1b[0m    │\n'
+                '│ 25-26 │ \x1b[31mnot covered\x1b[0m    │\n'
+                '└───────┴────────────────┘\n'
+            )
+        )
+
+    def test_cli_lines_subcommand_not_covered_file(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'lines', 'test2/Class1.java'],
+            stdout=(
+                '┌───────┬─────────────┐\n'
+                '│ Lines │ Status      │\n'
+                '├───────┼─────────────┤\n'
+                '│ 5-26  │ \x1b[31mnot covered\x1b[0m │\n'
+                '└───────┴─────────────┘\n'
+            )
+        )
+
+    def test_cli_lines_subcommand_covered_file(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'lines', 'test1/Class1.java'],
+            stdout='All the lines of this file are covered.\n'
+        )
+
+    def test_cli_lines_subcommand_no_args(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'lines'],
+            returncode=1,
+            stderr=(
+                self.usage_lines +
+                'cli lines: error: the following arguments are required: '
+                'JAVA_FILE\n'
+            )
+        )
+
+    def test_cli_lines_subcommand_help_long_option(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'lines', '--help'],
+            stdout=self.help_lines
+        )
+
+    def test_cli_lines_subcommand_source_file_doesnt_exists(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'lines', 'FileThatDoesntExists.java'],
+            returncode=1,
+            # pylint: disable=line-too-long
+            stderr='cli: error: file \'FileThatDoesntExists.java\' doesn\'t exists\n'
+            # pylint: enable=line-too-long
+        )
+
+    def test_cli_diff_subcommand(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'diff', 'test/changes.diff'],
+            stdout=self.diff_table
+        )
+
+    def test_cli_diff_subcommand_stdin(self) -> None:
+        sys_stdin = sys.stdin
+        with open('test/changes.diff', encoding='utf-8') as diff_file:
+            sys.stdin = StringIO(diff_file.read())
+        try:
+            self.assert_command(
+                cli,
+                ['cli', 'diff'],
+                stdout=self.diff_table
+            )
+        finally:
+            sys.stdin = sys_stdin
+
+    def test_cli_diff_subcommand_fail_under(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'diff', '--fail-under', '80', 'test/changes.diff'],
+            stdout=self.diff_table
+        )
+        self.assert_command(
+            cli,
+            ['cli', 'diff', '--fail-under', '80.5', 'test/changes.diff'],
+            returncode=1,
+            stdout=self.diff_table,
+            stderr='cli: error: the coverage of the changed lines is 80.00%, '
+                   'under 80.5%\n'
+        )
+
+    def test_cli_diff_subcommand_fail_under_invalid(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'diff', '--fail-under', '101', 'test/changes.diff'],
+            returncode=1,
+            stderr=(
+                self.usage_diff +
+                'cli diff: error: argument --fail-under: invalid percentage: '
+                "'101'\n"
+            )
+        )
+
+    def test_cli_diff_subcommand_no_changed_lines(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'diff', 'test/jacoco.xml'],
+            stdout='No changed lines found in the report.\n'
+        )
+
+    def test_cli_diff_subcommand_diff_file_doesnt_exists(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'diff', 'missing.diff'],
+            returncode=1,
+            stderr='cli: error: missing.diff: no such file or directory\n'
+        )
+
+    def test_cli_diff_subcommand_help_long_option(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'diff', '--help'],
+            stdout=self.help_diff
+        )
+
+    def test_cli_compare_subcommand(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'compare', 'test/baseline.xml'],
+            stdout=(  # pylint: disable=line-too-long
+                '┌──────────────┬───────────────────┬───────────────────┬─────────────┐\n'
+                '│ Name         │ Branch            │ Line              │ Method      │\n'
+                '├──────────────┼───────────────────┼───────────────────┼─────────────┤\n'
+                '│ test1.Class2 │ 100% →  50% \x1b[31m-50.0\x1b[0m │  80% →  60% \x1b[31m-20.0\x1b[0m │  75% →  75% │\n'
+                '│ test1.Class1 │  75% → 100% \x1b[32m+25.0\x1b[0m │  80% → 100% \x1b[32m+20.0\x1b[0m │ 100% → 100% │\n'
+                '└──────────────┴───────────────────┴───────────────────┴─────────────┘\n'
+                'Added:\n'
+                '  test2.Class1\n'
+                'Removed:\n'
+                '  test3.Removed\n'
+            )  # pylint: enable=line-too-long
+        )
+
+    def test_cli_compare_subcommand_only_regressions(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'compare', '--only-regressions', '--level', 'package',
+             'test/baseline.xml'],
+            stdout=(  # pylint: disable=line-too-long
+                '┌───────┬───────────────────┬─────────────┬─────────────┐\n'
+                '│ Name  │ Branch            │ Line        │ Method      │\n'
+                '├───────┼───────────────────┼─────────────┼─────────────┤\n'
+                '│ test1 │  88% →  75% \x1b[31m-12.5\x1b[0m │  80% →  80% │  88% →  88% │\n'
+                '└───────┴───────────────────┴─────────────┴─────────────┘\n'
+                'Removed:\n'
+                '  test3\n'
+            )  # pylint: enable=line-too-long
+        )
+
+    def test_cli_compare_subcommand_top(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'compare', '--level', 'file', '--top', '1',
+             'test/baseline.xml'],
+            stdout=(  # pylint: disable=line-too-long
+                '┌───────────────────┬───────────────────┬───────────────────┬─────────────┐\n'
+                '│ Name              │ Branch            │ Line              │ Method      │\n'
+                '├───────────────────┼───────────────────┼───────────────────┼─────────────┤\n'
+                '│ test1/Class2.java │ 100% →  50% \x1b[31m-50.0\x1b[0m │  80% →  60% \x1b[31m-20.0\x1b[0m │  75% →  75% │\n'
+                '└───────────────────┴───────────────────┴───────────────────┴─────────────┘\n'
+                'Added:\n'
+                '  test2/Class1.java\n'
+                'Removed:\n'
+                '  test3/Removed.java\n'
+            )  # pylint: enable=line-too-long
+        )
+
+    def test_cli_compare_subcommand_sort(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'compare', '--sort', 'line', '--reverse', '--top', '1',
+             'test/baseline.xml'],
+            stdout=(  # pylint: disable=line-too-long
+                '┌──────────────┬───────────────────┬───────────────────┬─────────────┐\n'
+                '│ Name         │ Branch            │ Line              │ Method      │\n'
+                '├──────────────┼───────────────────┼───────────────────┼─────────────┤\n'
+                '│ test1.Class1 │  75% → 100% \x1b[32m+25.0\x1b[0m │  80% → 100% \x1b[32m+20.0\x1b[0m │ 100% → 100% │\n'
+                '└──────────────┴───────────────────┴───────────────────┴─────────────┘\n'
+                'Added:\n'
+                '  test2.Class1\n'
+                'Removed:\n'
+                '  test3.Removed\n'
+            )  # pylint: enable=line-too-long
+        )
+
+    def test_cli_compare_subcommand_no_change(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'compare', 'test/jacoco.xml'],
+            stdout='No coverage change.\n'
+        )
+
+    def test_cli_compare_subcommand_baseline_doesnt_exists(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'compare', 'test/missing.xml'],
+            returncode=1,
+            stderr='cli: error: test/missing.xml: no such file or directory\n'
+        )
+
+    def test_cli_compare_subcommand_help_long_option(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'compare', '--help'],
+            stdout=self.help_compare
+        )
+
+    def test_cli_summary_subcommand(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'summary'],
+            stdout=self.summary_table
+        )
+
+    def test_cli_summary_subcommand_merge(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '-f', 'test/jacoco.xml', '-f', 'test/baseline.xml',
+             'summary'],
+            stdout=(  # pylint: disable=line-too-long
+                '┌───────┬─────────────────┬─────────────────┬─────────────────┐\n'
+                '│ Name  │ Branch          │ Line            │ Method          │\n'
+                '├───────┼─────────────────┼─────────────────┼─────────────────┤\n'
+                '│ test1 │ \x1b[32m━━━━━━\x1b[31m╺━━━\x1b[0m  65% │ \x1b[32m━━━━━━\x1b[31m╺━━━\x1b[0m  61% │ \x1b[32m━━━━━━\x1b[31m╺━━━\x1b[0m  65% │\n'
+                '└───────┴─────────────────┴─────────────────┴─────────────────┘\n'
+            )  # pylint: enable=line-too-long
+        )
+
+    def test_cli_summary_subcommand_fail_under(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'summary', '--fail-under', '51.6'],
+            stdout=self.summary_table
+        )
+        self.assert_command(
+            cli,
+            ['cli', 'summary', '--fail-under', '60'],
+            returncode=1,
+            stdout=self.summary_table,
+            stderr='cli: error: the line coverage is 51.61%, under 60%\n'
+        )
+
+    def test_cli_summary_subcommand_fail_under_empty(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '-f', 'test/empty.xml', '--format', 'csv', 'summary',
+             '--fail-under', '80'],
+            returncode=1,
+            stdout=(
+                'name,branch_missed,branch_covered,branch_ratio,line_missed,'
+                'line_covered,line_ratio,method_missed,method_covered,'
+                'method_ratio\n'
+                'test,0,0,,0,0,,0,0,\n'
+            ),
+            stderr="cli: error: the report has no lines, their coverage can't "
+                   'be checked\n'
+        )
+        self.assert_command(
+            cli,
+            ['cli', '-f', 'test/empty.xml', '--format', 'csv', 'summary'],
+            stdout=(
+                'name,branch_missed,branch_covered,branch_ratio,line_missed,'
+                'line_covered,line_ratio,method_missed,method_covered,'
+                'method_ratio\n'
+                'test,0,0,,0,0,,0,0,\n'
+            )
+        )
+
+    def test_cli_summary_subcommand_parse_error(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '-f', 'test/parse-error.xml', 'summary'],
+            returncode=1,
+            stderr='cli: error: test/parse-error.xml: failed to parse file: '
+                   'no element found: line 1, column 0\n'
+        )
+
+    def test_cli_summary_subcommand_help_long_option(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'summary', '--help'],
+            stdout=self.help_summary
+        )
+
+    def test_cli_stdin_report(self) -> None:
+        sys_stdin = sys.stdin
+        with TemporaryDirectory() as directory:
+            xml_file_path = os.path.join(directory, 'jacoco.xml.gz')
+            with open('test/jacoco.xml', 'rb') as xml_file:
+                content = gzip.compress(xml_file.read())
+            with open(xml_file_path, 'wb') as compressed_file:
+                compressed_file.write(content)
+            with open(xml_file_path, encoding='utf-8') as stdin:
+                sys.stdin = stdin
+                try:
+                    self.assert_command(
+                        cli,
+                        ['cli', '-f', '-', 'summary'],
+                        stdout=self.summary_table
+                    )
+                finally:
+                    sys.stdin = sys_stdin
+
+    def test_cli_stdin_read_twice(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '-f', '-', 'diff'],
+            returncode=1,
+            stderr='cli: error: the standard input can only be read once\n'
+        )
+
+    def test_cli_stdin_watch(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '-f', '-', '--watch'],
+            returncode=1,
+            stderr="cli: error: the standard input can't be watched\n"
+        )
+
+    def test_cli_format_csv(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--format', 'csv'],
+            stdout=(
+                'name,branch_missed,branch_covered,branch_ratio,line_missed,'
+                'line_covered,line_ratio,method_missed,method_covered,'
+                'method_ratio\n'
+                'test2.Class2,0,0,,1,0,0.0,1,0,0.0\n'
+                'test2.Class1,4,0,0.0,10,0,0.0,4,0,0.0\n'
+                'test1.Class1,0,4,1.0,0,10,1.0,0,4,1.0\n'
+                'test1.Class2,2,2,0.5,4,6,0.6,1,3,0.75\n'
+            )
+        )
+
+    def test_cli_format_csv_sort(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--format', 'csv', '--sort', 'missed-lines', '--top', '2',
+             'file'],
+            stdout=(
+                'name,branch_missed,branch_covered,branch_ratio,line_missed,'
+                'line_covered,line_ratio,method_missed,method_covered,'
+                'method_ratio\n'
+                'test2/Class1.java,4,0,0.0,10,0,0.0,4,0,0.0\n'
+                'test1/Class2.java,2,2,0.5,4,6,0.6,1,3,0.75\n'
+            )
+        )
+
+    def test_cli_sort_reverse(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--format', 'csv', '--sort', 'branch', '--reverse'],
+            stdout=(
+                'name,branch_missed,branch_covered,branch_ratio,line_missed,'
+                'line_covered,line_ratio,method_missed,method_covered,'
+                'method_ratio\n'
+                'test1.Class1,0,4,1.0,0,10,1.0,0,4,1.0\n'
+                'test1.Class2,2,2,0.5,4,6,0.6,1,3,0.75\n'
+                'test2.Class1,4,0,0.0,10,0,0.0,4,0,0.0\n'
+                'test2.Class2,0,0,,1,0,0.0,1,0,0.0\n'
+            )
+        )
+
+    def test_cli_sort_invalid(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--sort', 'size'],
+            returncode=1,
+            stderr=(
+                self.usage +
+                "cli: error: argument --sort: invalid choice: 'size' "
+                "(choose from name, branch, line, method, missed-lines)\n"
+            )
+        )
+
+    def test_cli_name_width(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--name-width', '12', 'file', '--top', '2'],
+            stdout=(  # pylint: disable=line-too-long
+                '┌──────────────┬─────────────────┬─────────────────┬─────────────────┐\n'
+                '│ Name         │ Branch          │ Line            │ Method          │\n'
+                '├──────────────┼─────────────────┼─────────────────┼─────────────────┤\n'
+                '│ …Class1.java │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │\n'
+                '│ …Class2.java │ \x1b[30m━━━━━━━━━━\x1b[0m  n/a │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │\n'
+                '└──────────────┴─────────────────┴─────────────────┴─────────────────┘\n'
+            )  # pylint: enable=line-too-long
+        )
+
+    def test_cli_stream(self) -> None:
+        """Test that the streamed tables are the same as the rendered ones
+        when the names aren't truncated."""
+        for option in '--stream', '--no-stream':
+            self.assert_command(cli, ['cli', option, 'summary'],
+                                stdout=self.summary_table)
+
+    def test_cli_columns(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--no-cache', '--columns', 'name,complexity,line-missed',
+             '--top', '2'],
+            stdout=(  # pylint: disable=line-too-long
+                '┌──────────────┬─────────────────┬─────────────┐\n'
+                '│ Name         │ Complexity      │ Line missed │\n'
+                '├──────────────┼─────────────────┼─────────────┤\n'
+                '│ test2.Class2 │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │ 1           │\n'
+                '│ test2.Class1 │ \x1b[31m━━━━━━━━━━\x1b[0m   0% │ 10          │\n'
+                '└──────────────┴─────────────────┴─────────────┘\n'
+            )  # pylint: enable=line-too-long
+        )
+
+    def test_cli_columns_csv(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--format', 'csv', '--columns',
+             'name,instruction-missed,instruction-covered,class', 'file'],
+            stdout=(
+                'name,instruction_missed,instruction_covered,class_missed,'
+                'class_covered,class_ratio\n'
+                'test2/Class1.java,21,0,1,0,0.0\n'
+                'test2/Class2.java,3,0,1,0,0.0\n'
+                'test1/Class1.java,0,21,0,1,1.0\n'
+                'test1/Class2.java,9,12,0,1,1.0\n'
+            )
+        )
+
+    def test_cli_columns_summary(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--format', 'csv', '--columns', 'name,complexity',
+             'summary'],
+            stdout=(
+                'name,complexity_missed,complexity_covered,complexity_ratio\n'
+                'test1,10,9,0.47368421052631576\n'
+            )
+        )
+
+    def test_cli_columns_invalid(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--columns', 'name,size'],
+            returncode=1,
+            stderr=(
+                self.usage +
+                "cli: error: argument --columns: invalid column: 'size' "
+                '(choose from name, branch, line, method, instruction, '
+                'complexity, class, branch-missed, branch-covered, '
+                'line-missed, line-covered, method-missed, method-covered, '
+                'instruction-missed, instruction-covered, complexity-missed, '
+                'complexity-covered, class-missed, class-covered)\n'
+            )
+        )
+
+    def test_cli_tree(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--columns', 'name,line-missed,line-covered', 'tree',
+             '--depth', '2'],
+            stdout=(
+                '┌────────────┬─────────────┬──────────────┐\n'
+                '│ Name       │ Line missed │ Line covered │\n'
+                '├────────────┼─────────────┼──────────────┤\n'
+                '│ test1      │ 15          │ 16           │\n'
+                '│   test1    │ 4           │ 16           │\n'
+                '│     Class1 │ 0           │ 10           │\n'
+                '│     Class2 │ 4           │ 6            │\n'
+                '│   test2    │ 11          │ 0            │\n'
+                '│     Class2 │ 1           │ 0            │\n'
+                '│     Class1 │ 10          │ 0            │\n'
+                '└────────────┴─────────────┴──────────────┘\n'
+            )
+        )
+
+    def test_cli_tree_csv(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--format', 'csv', '--columns', 'name,method', 'tree'],
+            stdout=(
+                'name,method_missed,method_covered,method_ratio\n'
+                'test1,6,7,0.5384615384615384\n'
+                'test1,1,7,0.875\n'
+                'test1.Class1,0,4,1.0\n'
+                'test1.Class1.<init>,0,1,1.0\n'
+                'test1.Class1.method1,0,1,1.0\n'
+                'test1.Class1.method2,0,1,1.0\n'
+                'test1.Class1.method3,0,1,1.0\n'
+                'test1.Class2,1,3,0.75\n'
+                'test1.Class2.<init>,0,1,1.0\n'
+                'test1.Class2.method1,0,1,1.0\n'
+                'test1.Class2.method2,0,1,1.0\n'
+                'test1.Class2.method3,1,0,0.0\n'
+                'test2,5,0,0.0\n'
+                'test2.Class2,1,0,0.0\n'
+                'test2.Class2.<init>,1,0,0.0\n'
+                'test2.Class1,4,0,0.0\n'
+                'test2.Class1.<init>,1,0,0.0\n'
+                'test2.Class1.method1,1,0,0.0\n'
+                'test2.Class1.method2,1,0,0.0\n'
+                'test2.Class1.method3,1,0,0.0\n'
+            )
+        )
+
+    def test_cli_tree_sort(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--format', 'csv', '--sort', 'line', '--top', '1',
+             '--columns', 'name,line', 'tree', '--depth', '2'],
+            stdout=(
+                'name,line_missed,line_covered,line_ratio\n'
+                'test1,15,16,0.5161290322580645\n'
+                'test2,11,0,0.0\n'
+                'test2.Class2,1,0,0.0\n'
+            )
+        )
+
+    def test_cli_tree_depth(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--format', 'csv', '--columns', 'name,line,instruction',
+             '--exclude', 'test2/Class1', 'tree', '--depth', '1'],
+            stdout=(
+                'name,line_missed,line_covered,line_ratio,instruction_missed,'
+                'instruction_covered,instruction_ratio\n'
+                'test1,5,16,0.7619047619047619,12,33,0.7333333333333333\n'
+                'test1,4,16,0.8,9,33,0.7857142857142857\n'
+                'test2,1,0,0.0,3,0,0.0\n'
+            )
+        )
+
+    def test_cli_record_json(self) -> None:
+        with TemporaryDirectory() as directory:
+            self.assert_command(
+                cli,
+                ['cli', '--format', 'json', 'record', '41', '--commit', 'abc',
+                 '--database', os.path.join(directory, 'history.sqlite3')],
+                stdout=(
+                    '[\n'
+                    '{"build_id": "41", "commit": "abc", "entries": 7}\n'
+                    ']\n'
+                )
+            )
+
+    def test_cli_history(self) -> None:
+        with TemporaryDirectory() as directory:
+            database_path = os.path.join(directory, 'history.sqlite3')
+            for build_id in '41', '42':
+                self.assert_command(
+                    cli,
+                    ['cli', 'record', build_id, '--commit', 'abc',
+                     '--database', database_path],
+                    stdout=f"Recorded 7 entries for the build '{build_id}'.\n"
+                )
+            self.assert_command(
+                cli,
+                ['cli', '--format', 'csv', '--columns', 'name,line',
+                 'history', '--database', database_path],
+                stdout=(
+                    'name,line_missed,line_covered,line_ratio\n'
+                    '41,15,16,0.5161290322580645\n'
+                    '42,15,16,0.5161290322580645\n'
+                )
+            )
+            self.assert_command(
+                cli,
+                ['cli', '--format', 'csv', '--columns', 'name,complexity',
+                 'history', 'test1.Class2', '--last', '1', '--database',
+                 database_path],
+                stdout=(
+                    'name,complexity_missed,complexity_covered,'
+                    'complexity_ratio\n'
+                    '42,3,3,0.5\n'
+                )
+            )
+            self.assert_command(
+                cli,
+                ['cli', 'history', 'test1.Class2', '--level', 'package',
+                 '--database', database_path],
+                returncode=1,
+                stderr="cli: error: package 'test1.Class2' was never "
+                       'recorded\n'
+            )
+
+    def test_cli_history_missing_database(self) -> None:
+        with TemporaryDirectory() as directory:
+            database_path = os.path.join(directory, 'history.sqlite3')
+            self.assert_command(
+                cli,
+                ['cli', 'history', '--database', database_path],
+                returncode=1,
+                stderr=f'cli: error: {database_path}: no such file or '
+                       'directory\n'
+            )
+            self.assertFalse(os.path.exists(database_path))
+
+    def test_cli_include_exclude(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--format', 'csv', '--include', 'test1/**', '--exclude',
+             '**/Class2*', 'file'],
+            stdout=(
+                'name,branch_missed,branch_covered,branch_ratio,line_missed,'
+                'line_covered,line_ratio,method_missed,method_covered,'
+                'method_ratio\n'
+                'test1/Class1.java,0,4,1.0,0,10,1.0,0,4,1.0\n'
+            )
+        )
+
+    def test_cli_include_regex(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--format', 'csv', '--include', 're:test2/Class\\d',
+             'package', '-l'],
+            stdout='name\ntest2\n'
+        )
+
+    def test_cli_exclude_summary(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--format', 'csv', '--exclude', 'test2', 'summary'],
+            stdout=(
+                'name,branch_missed,branch_covered,branch_ratio,line_missed,'
+                'line_covered,line_ratio,method_missed,method_covered,'
+                'method_ratio\n'
+                'test1,2,6,0.75,4,16,0.8,1,7,0.875\n'
+            )
+        )
+
+    def test_cli_include_invalid_regex(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--include', 're:test[1'],
+            returncode=1,
+            stderr=(
+                "cli: error: invalid regular expression: 're:test[1', "
+                'unterminated character set\n'
+            )
+        )
+
+    def test_cli_format_json(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', 'summary', '--format', 'json'],
+            stdout=(
+                '[\n'
+                '{"name": "test1", "branch_missed": 6, "branch_covered": 6, '
+                '"branch_ratio": 0.5, "line_missed": 15, "line_covered": 16, '
+                '"line_ratio": 0.5161290322580645, "method_missed": 6, '
+                '"method_covered": 7, "method_ratio": 0.5384615384615384}\n'
+                ']\n'
+            )
+        )
+
+    def test_cli_format_ndjson(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--format', 'ndjson', 'lines', 'test1/Class2.java'],
+            stdout=(  # pylint: disable=line-too-long
+                '{"first_line": 9, "last_line": 9, "status": "partly covered"}\n'
+                '{"first_line": 10, "last_line": 10, "status": "not covered"}\n'
+                '{"first_line": 17, "last_line": 17, "status": "partly covered"}\n'
+                '{"first_line": 18, "last_line": 18, "status": "not covered"}\n'
+                '{"first_line": 25, "last_line": 26, "status": "not covered"}\n'
+            )  # pylint: enable=line-too-long
+        )
+
+    def test_cli_format_list(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--format', 'json', 'package', '--list-packages'],
+            stdout='[\n{"name": "test1"},\n{"name": "test2"}\n]\n'
+        )
+
+    def test_cli_format_empty(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '-f', 'test/empty.xml', '--format', 'json'],
+            stdout='[\n]\n'
+        )
+
+    def test_cli_format_diff(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--format', 'csv', 'diff', '--fail-under', '90',
+             'test/changes.diff'],
+            returncode=1,
+            stdout=(
+                'name,line_missed,line_covered,line_ratio,missed_lines\n'
+                'test1/Class2.java,1,4,0.8,18\n'
+            ),
+            stderr='cli: error: the coverage of the changed lines is 80.00%, '
+                   'under 90%\n'
+        )
+
+    def test_cli_format_compare(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--format', 'csv', 'compare', '--level', 'package',
+             'test/baseline.xml'],
+            stdout=(
+                'name,change,baseline_branch_missed,baseline_branch_covered,'
+                'current_branch_missed,current_branch_covered,branch_delta,'
+                'baseline_line_missed,baseline_line_covered,'
+                'current_line_missed,current_line_covered,line_delta,'
+                'baseline_method_missed,baseline_method_covered,'
+                'current_method_missed,current_method_covered,method_delta\n'
+                'test1,changed,1,7,2,6,-0.125,4,16,4,16,0.0,1,7,1,7,0.0\n'
+                'test2,changed,0,0,4,0,,1,0,11,0,0.0,1,0,5,0,0.0\n'
+                'test3,removed,0,0,0,0,,1,1,0,0,,0,1,0,0,\n'
+            )
+        )
+
+    def test_cli_format_invalid(self) -> None:
+        self.assert_command(
+            cli,
+            ['cli', '--format', 'xml'],
+            returncode=1,
+            stderr=(
+                self.usage +
+                "cli: error: argument --format: invalid choice: 'xml' "
+                "(choose from table, csv, json, ndjson)\n"
+            )
+        )
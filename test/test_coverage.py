@@ -2,7 +2,10 @@ from unittest import TestCase
 from xml.etree.ElementTree import fromstring
 
 from jacoco_summary.column_name import ColumnName
-from jacoco_summary.coverage import Coverage
+from jacoco_summary.counter_type import CounterType
+from jacoco_summary.coverage import Coverage, get_columns_plan
+from jacoco_summary.extra_counters import ExtraCounters
+from jacoco_summary.parse_plan import ParsePlan
 
 
 class TestCoverage(TestCase):
@@ -53,6 +56,14 @@ class TestCoverage(TestCase):
         self.assertEqual(coverage.line_covered, 5)
         self.assertEqual(coverage.method_missed, 8)
         self.assertEqual(coverage.method_covered, 9)
+        self.assertEqual(coverage.get_counter(CounterType.INSTRUCTION), (0, 1))
+        self.assertEqual(coverage.get_counter(CounterType.COMPLEXITY), (6, 7))
+        self.assertEqual(coverage.get_counter(CounterType.CLASS), (10, 11))
+
+        coverage = Coverage.from_xml_element(element, ParsePlan.CLASSES)
+        self.assertEqual(coverage.line_missed, 4)
+        self.assertIsNone(coverage.extra_counters)
+        self.assertEqual(coverage.get_counter(CounterType.COMPLEXITY), (0, 0))
 
     def test_get_name(self) -> None:
         coverage = Coverage('test coverage', 1, 2, 3, 4, 5, 6)
@@ -68,3 +79,46 @@ class TestCoverage(TestCase):
         self.assertEqual(coverage.get_field(ColumnName.METHOD),
                          '\x1b[32m━━━━━\x1b[31m╺━━━━\x1b[0m  55%')
         self.assertRaises(AssertionError, coverage.get_field, -1)
+
+    def test_get_field_counts(self) -> None:
+        coverage = Coverage('test coverage', 1, 2, 3, 4, 5, 6,
+                            ExtraCounters(7, 8, 9, 10, 11, 12))
+        self.assertEqual(coverage.get_field(ColumnName.INSTRUCTION),
+                         '\x1b[32m━━━━━\x1b[31m╺━━━━\x1b[0m  53%')
+        self.assertEqual(coverage.get_field(ColumnName.CLASS, 4),
+                         '\x1b[32m━━\x1b[31m╺━\x1b[0m  52%')
+        self.assertEqual(coverage.get_field(ColumnName.LINE_MISSED), '3')
+        self.assertEqual(coverage.get_field(ColumnName.METHOD_COVERED), '6')
+        self.assertEqual(coverage.get_field(ColumnName.COMPLEXITY_MISSED),
+                         '9')
+        self.assertEqual(coverage.get_field(ColumnName.CLASS_COVERED), '12')
+        self.assertEqual(
+            Coverage('no extra counters').get_field(ColumnName.CLASS_MISSED),
+            '0'
+        )
+
+    def test_add_counters(self) -> None:
+        coverage = Coverage('test coverage', 1, 2, 3, 4, 5, 6)
+        coverage.add_counters(Coverage('other', 1, 1, 1, 1, 1, 1))
+        self.assertEqual(coverage.get_counter(CounterType.LINE), (4, 5))
+        self.assertIsNone(coverage.extra_counters)
+
+        coverage.add_counters(Coverage('other', extra_counters=ExtraCounters(
+            1, 2, 3, 4, 5, 6
+        )))
+        coverage.add_counters(Coverage('other', extra_counters=ExtraCounters(
+            1, 1, 1, 1, 1, 1
+        )))
+        self.assertEqual(coverage.get_counter(CounterType.INSTRUCTION), (2, 3))
+        self.assertEqual(coverage.get_counter(CounterType.COMPLEXITY), (4, 5))
+        self.assertEqual(coverage.get_counter(CounterType.CLASS), (6, 7))
+
+    def test_get_columns_plan(self) -> None:
+        self.assertEqual(
+            get_columns_plan([ColumnName.NAME, ColumnName.LINE_MISSED]),
+            ParsePlan.NAMES
+        )
+        self.assertEqual(
+            get_columns_plan([ColumnName.NAME, ColumnName.COMPLEXITY]),
+            ParsePlan.EXTRA_COUNTERS
+        )
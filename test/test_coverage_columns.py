@@ -0,0 +1,112 @@
+from collections.abc import Iterable
+import pickle
+from unittest import TestCase
+from xml.etree.ElementTree import fromstring
+
+from jacoco_summary.class_coverage import ClassCoverage
+from jacoco_summary.counter_type import CounterType
+from jacoco_summary.coverage_columns import (
+    CoverageColumns,
+    CoverageColumnsView,
+)
+from jacoco_summary.extra_counters import ExtraCounters
+from jacoco_summary.method_coverage import MethodCoverage
+from jacoco_summary.package_coverage import PackageCoverage
+from jacoco_summary.parse_plan import ParsePlan
+
+
+def get_names(methods: Iterable[MethodCoverage]) -> list[str]:
+    return [method.name for method in methods]
+
+
+class TestCoverageColumns(TestCase):
+
+    def setUp(self) -> None:
+        self.columns = CoverageColumns(MethodCoverage)
+        self.columns.append(MethodCoverage('method1', 1, 2, 3, 4, 5, 6))
+        self.columns.append(MethodCoverage('method2', 7, 8, 9, 10, 11, 12))
+        self.columns.append(MethodCoverage('method3'))
+        self.columns.append(MethodCoverage(
+            'method4',
+            extra_counters=ExtraCounters(13, 14, 15, 16, 17, 18)
+        ))
+
+    def test_len(self) -> None:
+        self.assertEqual(len(self.columns), 4)
+
+    def test_get_row(self) -> None:
+        method = self.columns.get_row(1)
+        self.assertIsInstance(method, MethodCoverage)
+        self.assertEqual(method.name, 'method2')
+        self.assertEqual(method.branch_missed, 7)
+        self.assertEqual(method.branch_covered, 8)
+        self.assertEqual(method.line_missed, 9)
+        self.assertEqual(method.line_covered, 10)
+        self.assertEqual(method.method_missed, 11)
+        self.assertEqual(method.method_covered, 12)
+        self.assertIsNone(method.extra_counters)
+
+    def test_get_row_extra_counters(self) -> None:
+        method = self.columns.get_row(3)
+        self.assertEqual(method.get_counter(CounterType.INSTRUCTION), (13, 14))
+        self.assertEqual(method.get_counter(CounterType.CLASS), (17, 18))
+        # the counters of the rows are copies
+        method.add_counters(method)
+        self.assertEqual(
+            self.columns.get_row(3).get_counter(CounterType.CLASS),
+            (17, 18)
+        )
+
+    def test_view(self) -> None:
+        view = self.columns.view(1, 3)
+        self.assertEqual(len(view), 2)
+        self.assertEqual(view[0].name, 'method2')
+        self.assertEqual(view[-1].name, 'method3')
+        expected_names: list[str] = ['method2', 'method3']
+        self.assertEqual(get_names(view), expected_names)
+        self.assertEqual(get_names(view[::-1]), expected_names[::-1])
+
+    def test_view_index_error(self) -> None:
+        view = self.columns.view(0, 2)
+        with self.assertRaises(IndexError):
+            view[2]  # pylint: disable=pointless-statement
+        with self.assertRaises(IndexError):
+            view[-3]  # pylint: disable=pointless-statement
+
+    def test_pickle(self) -> None:
+        view: object = pickle.loads(pickle.dumps(self.columns.view(0, 1)))
+        assert isinstance(view, CoverageColumnsView)
+        self.assertEqual(len(view), 1)
+
+    def test_coverage_has_no_dict(self) -> None:
+        self.assertFalse(hasattr(MethodCoverage('method'), '__dict__'))
+        self.assertFalse(hasattr(ClassCoverage('Class'), '__dict__'))
+        self.assertFalse(hasattr(PackageCoverage('package'), '__dict__'))
+
+    def test_package_compact_plan(self) -> None:
+        element = fromstring(
+            '<package name="package1">\n'
+            '    <class name="package1/Class1" sourcefilename="Class1.java">\n'
+            '        <method name="method1" desc="()V" line="1">\n'
+            '            <counter type="LINE" missed="1" covered="2"/>\n'
+            '        </method>\n'
+            '        <method name="method2" desc="()V" line="2">\n'
+            '            <counter type="LINE" missed="3" covered="4"/>\n'
+            '        </method>\n'
+            '    </class>\n'
+            '    <class name="package1/Class2" sourcefilename="Class2.java">\n'
+            '        <method name="method3" desc="()V" line="1">\n'
+            '            <counter type="LINE" missed="5" covered="6"/>\n'
+            '        </method>\n'
+            '    </class>\n'
+            '</package>\n'
+        )
+        package = PackageCoverage.from_xml_element(
+            element,
+            ParsePlan.ALL | ParsePlan.COMPACT
+        )
+        class1, class2 = package.classes
+        expected_names: list[str] = ['method1', 'method2']
+        self.assertEqual(get_names(class1.methods), expected_names)
+        self.assertEqual(len(class2.methods), 1)
+        self.assertEqual(class2.methods[0].line_covered, 6)
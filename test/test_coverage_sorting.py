@@ -0,0 +1,69 @@
+from unittest import TestCase
+
+from jacoco_summary.coverage import Coverage
+from jacoco_summary.coverage_sorting import select_rows, sort_coverages
+from jacoco_summary.sort_key import SortKey
+
+
+class TestCoverageSorting(TestCase):
+
+    coverages: list[Coverage] = [
+        Coverage('b', 2, 2, 5, 5, 1, 1),
+        Coverage('a', 0, 0, 0, 10, 0, 2),
+        Coverage('d', 4, 0, 10, 0, 2, 0),
+        Coverage('c', 1, 3, 5, 5, 0, 2),
+    ]
+
+    def assert_names(self, coverages: list[Coverage],
+                     expected: list[str]) -> None:
+        names = [coverage.name for coverage in coverages]
+        self.assertEqual(names, expected)
+
+    def test_select_rows(self) -> None:
+        rows: list[str] = ['a', 'b', 'c', 'd', 'e', 'f']
+        keys: list[float] = [3, 1, 2, 1, 3, 0]
+        for reverse in False, True:
+            sorted_rows = select_rows(rows, keys, reverse)
+            for top in range(len(rows) + 2):
+                with self.subTest(reverse=reverse, top=top):
+                    # the rows with the same key keep their order, whether
+                    # they are selected with a heap or a full sort
+                    selected_rows = select_rows(rows, keys, reverse, top)
+                    self.assertEqual(selected_rows, sorted_rows[:top])
+        expected: list[str] = ['f', 'b', 'd', 'c', 'a', 'e']
+        sorted_rows = select_rows(rows, keys)
+        self.assertEqual(sorted_rows, expected)
+
+    def test_sort_coverages_default_order(self) -> None:
+        self.assert_names(sort_coverages(self.coverages),
+                          ['b', 'a', 'd', 'c'])
+        self.assert_names(sort_coverages(self.coverages, reverse=True, top=2),
+                          ['c', 'd'])
+
+    def test_sort_coverages_name(self) -> None:
+        self.assert_names(sort_coverages(self.coverages, SortKey.NAME),
+                          ['a', 'b', 'c', 'd'])
+        self.assert_names(sort_coverages(self.coverages, SortKey.NAME,
+                                         reverse=True, top=1),
+                          ['d'])
+
+    def test_sort_coverages_ratio(self) -> None:
+        # the coverages without branches are last in both directions
+        self.assert_names(sort_coverages(self.coverages, SortKey.BRANCH),
+                          ['d', 'b', 'c', 'a'])
+        self.assert_names(sort_coverages(self.coverages, SortKey.BRANCH,
+                                         reverse=True),
+                          ['c', 'b', 'd', 'a'])
+        self.assert_names(sort_coverages(self.coverages, SortKey.LINE, top=3),
+                          ['d', 'b', 'c'])
+        self.assert_names(sort_coverages(self.coverages, SortKey.METHOD,
+                                         reverse=True, top=2),
+                          ['a', 'c'])
+
+    def test_sort_coverages_missed_lines(self) -> None:
+        self.assert_names(sort_coverages(self.coverages,
+                                         SortKey.MISSED_LINES),
+                          ['d', 'b', 'c', 'a'])
+        self.assert_names(sort_coverages(self.coverages, SortKey.MISSED_LINES,
+                                         top=0),
+                          [])
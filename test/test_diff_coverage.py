@@ -0,0 +1,44 @@
+from unittest import TestCase
+
+from jacoco_summary.diff_coverage import find_source_file, get_diff_coverage
+from jacoco_summary.parse_plan import ParsePlan
+from jacoco_summary.report import Report
+
+
+class TestDiffCoverage(TestCase):
+
+    report: Report
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.report = Report.from_xml_file(
+            'test/jacoco.xml',
+            ParsePlan.SOURCE_FILES | ParsePlan.LINES
+        )
+
+    def test_find_source_file(self) -> None:
+        for path in ('test1/Class2.java', 'src/main/java/test1/Class2.java'):
+            with self.subTest(path=path):
+                source_file = find_source_file(self.report, path)
+                assert source_file is not None
+                self.assertEqual(source_file.name, 'test1/Class2.java')
+
+    def test_find_source_file_not_found(self) -> None:
+        self.assertIsNone(find_source_file(self.report, 'Class2.java'))
+        self.assertIsNone(find_source_file(self.report,
+                                           'src/xtest1/Class2.java'))
+        self.assertIsNone(find_source_file(self.report, 'README.md'))
+
+    def test_get_diff_coverage(self) -> None:
+        files_coverage = get_diff_coverage(self.report, {
+            'src/test1/Class2.java': [(5, 6), (9, 10), (16, 26)],
+            'src/test2/Class1.java': [(1, 4), (27, 30)],
+            'README.md': [(1, 1)],
+        })
+        self.assertEqual(len(files_coverage), 1)
+        file_coverage = files_coverage[0]
+        self.assertEqual(file_coverage.name, 'test1/Class2.java')
+        self.assertEqual(file_coverage.line_covered, 5)
+        self.assertEqual(file_coverage.line_missed, 4)
+        expected: list[tuple[int, int]] = [(10, 10), (18, 18), (25, 26)]
+        self.assertEqual(file_coverage.missed_lines, expected)
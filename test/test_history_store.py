@@ -0,0 +1,116 @@
+import os
+import sqlite3
+from tempfile import TemporaryDirectory
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from jacoco_summary.history_level import HistoryLevel
+from jacoco_summary.history_store import (
+    get_build_name,
+    get_history_path,
+    open_history,
+    query_history,
+    record_report,
+)
+from jacoco_summary.parse_plan import ParsePlan
+from jacoco_summary.report import Report
+
+
+class TestHistoryStore(TestCase):
+
+    def get_database_path(self) -> str:
+        directory = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        return os.path.join(directory.name, 'history', 'history.sqlite3')
+
+    def test_get_history_path(self) -> None:
+        environ: dict[str, str] = {'XDG_DATA_HOME': '/data'}
+        with patch.dict('os.environ', environ):
+            self.assertEqual(get_history_path(),
+                             '/data/jacoco-summary/history.sqlite3')
+
+    def test_record_report(self) -> None:
+        database_path = self.get_database_path()
+        report = Report.from_xml_file(
+            'test/jacoco.xml',
+            ParsePlan.PACKAGE_COUNTERS | ParsePlan.CLASSES
+            | ParsePlan.EXTRA_COUNTERS
+        )
+        with open_history(database_path) as connection:
+            self.assertEqual(
+                record_report(connection, report, '1', 'abc', 1_000), 7
+            )
+            self.assertEqual(record_report(connection, report, '2', None,
+                                           2_000), 7)
+            # recording a build again replaces it
+            self.assertEqual(record_report(connection, report, '1', 'def',
+                                           3_000), 7)
+
+            history = query_history(connection, HistoryLevel.REPORT,
+                                    detailed_names=False)
+            assert history is not None
+            build_ids = [coverage.name for coverage in history]
+            expected_build_ids: list[str] = ['2', '1']
+            self.assertEqual(build_ids, expected_build_ids)
+            self.assertEqual(history[0].line_missed, 15)
+            self.assertEqual(history[0].line_covered, 16)
+            assert history[0].extra_counters is not None
+            self.assertEqual(history[0].extra_counters.complexity_missed, 10)
+
+            class_history = query_history(connection, HistoryLevel.CLASS,
+                                          'test1.Class2', last=1,
+                                          detailed_names=False)
+            assert class_history is not None
+            self.assertEqual(len(class_history), 1)
+            self.assertEqual(class_history[0].name, '1')
+            self.assertEqual(class_history[0].line_missed, 4)
+
+            package_history = query_history(connection, HistoryLevel.PACKAGE,
+                                            'test2')
+            assert package_history is not None
+            self.assertEqual(len(package_history), 2)
+            self.assertEqual(package_history[1].line_missed, 11)
+
+            self.assertIsNone(query_history(connection, HistoryLevel.PACKAGE,
+                                            'test1.Class2'))
+
+    def test_query_history_backfilled(self) -> None:
+        report = Report.from_xml_file('test/jacoco.xml',
+                                      ParsePlan.PACKAGE_COUNTERS)
+        with open_history(self.get_database_path()) as connection:
+            for build_id, timestamp in ('3', 3_000), ('1', 1_000), \
+                    ('2', 2_000), ('2b', 2_000):
+                record_report(connection, report, build_id, None, timestamp)
+            history = query_history(connection, HistoryLevel.REPORT,
+                                    last=3, detailed_names=False)
+        assert history is not None
+        build_ids = [coverage.name for coverage in history]
+        expected_build_ids: list[str] = ['2', '2b', '3']
+        self.assertEqual(build_ids, expected_build_ids)
+
+    def test_get_build_name(self) -> None:
+        local_time = time.strftime('%Y-%m-%d %H:%M', time.localtime(0))
+        self.assertEqual(get_build_name('12', '0123456789abcdef', 0),
+                         f'12 0123456789 {local_time}')
+        self.assertEqual(get_build_name('12', None, 0), f'12 {local_time}')
+
+    def test_open_history_missing(self) -> None:
+        database_path = self.get_database_path()
+        with self.assertRaises(FileNotFoundError):
+            with open_history(database_path, create=False):
+                pass
+        self.assertFalse(os.path.exists(database_path))
+
+    def test_open_history_unsupported_version(self) -> None:
+        database_path = self.get_database_path()
+        with open_history(database_path) as connection:
+            connection.execute('PRAGMA user_version = 1000')
+        with self.assertRaisesRegex(ValueError, 'unsupported history version'):
+            with open_history(database_path):
+                pass
+
+    def test_open_history_not_database(self) -> None:
+        with self.assertRaises(sqlite3.DatabaseError):
+            with open_history('test/jacoco.xml', create=False):
+                pass
@@ -0,0 +1,118 @@
+import gzip
+import os
+import shutil
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from jacoco_summary.incremental_report_loader import IncrementalReportLoader
+from jacoco_summary.name_filter import NameFilter
+from jacoco_summary.parse_plan import ParsePlan
+from jacoco_summary.report import Report
+
+
+class TestIncrementalReportLoader(TestCase):
+
+    def copy_report(self, name: str = 'jacoco.xml') -> str:
+        directory = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        xml_file_path = os.path.join(directory.name, name)
+        shutil.copyfile('test/jacoco.xml', xml_file_path)
+        return xml_file_path
+
+    def change_package_line_counter(self, xml_file_path: str) -> None:
+        """Change the line counter of the package test1, and the modification
+        time of the file."""
+        with open(xml_file_path, 'rb') as xml_file:
+            data = xml_file.read()
+        package_start = data.find(b'<package name="test1"')
+        package_end = data.find(b'</package>', package_start)
+        counter_start = data.rfind(b'<counter type="LINE"', 0, package_end)
+        counter_end = data.find(b'/>', counter_start) + 2
+        data = data[:counter_start] \
+            + b'<counter type="LINE" missed="100" covered="200"/>' \
+            + data[counter_end:]
+        with open(xml_file_path, 'wb') as xml_file:
+            xml_file.write(data)
+        stat = os.stat(xml_file_path)
+        os.utime(xml_file_path,
+                 ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_load(self) -> None:
+        xml_file_path = self.copy_report()
+        loader = IncrementalReportLoader(xml_file_path)
+
+        report = loader.load()
+        self.assertEqual(loader.parsed_packages, 2)
+        self.assertEqual(report.name, 'test1')
+        self.assertEqual(report.line_missed, 15)
+        self.assertEqual(report.line_covered, 16)
+        package_names = [package.name for package in report.packages]
+        expected_package_names: list[str] = ['test2', 'test1']
+        self.assertEqual(package_names, expected_package_names)
+        class_names = [class_.name for class_ in report.get_classes()]
+        expected_class_names = [
+            class_.name
+            for class_ in Report.from_xml_file(xml_file_path).get_classes()
+        ]
+        self.assertEqual(class_names, expected_class_names)
+
+        self.assertIs(loader.load(), report)
+
+    def test_load_changed_package(self) -> None:
+        xml_file_path = self.copy_report()
+        loader = IncrementalReportLoader(xml_file_path)
+        report = loader.load()
+
+        self.change_package_line_counter(xml_file_path)
+        changed_report = loader.load()
+        self.assertIsNot(changed_report, report)
+        self.assertEqual(loader.parsed_packages, 1)
+        self.assertIs(changed_report.packages[0], report.packages[0])
+        self.assertIsNot(changed_report.packages[1], report.packages[1])
+        self.assertEqual(changed_report.packages[1].line_missed, 100)
+        self.assertEqual(changed_report.packages[1].line_covered, 200)
+
+    def test_load_filtered(self) -> None:
+        xml_file_path = self.copy_report()
+        loader = IncrementalReportLoader(xml_file_path, ParsePlan.ALL,
+                                         NameFilter(['test1/**']))
+        report = loader.load()
+        # the package test2 is skipped without being parsed
+        self.assertEqual(loader.parsed_packages, 1)
+        package_names: list[str] = ['test1']
+        self.assertEqual(report.get_packages_names(), package_names)
+        # the counters of the report only count the kept package
+        self.assertEqual(report.line_missed, 4)
+        self.assertEqual(report.line_covered, 16)
+
+        self.change_package_line_counter(xml_file_path)
+        changed_report = loader.load()
+        self.assertEqual(loader.parsed_packages, 1)
+        self.assertEqual(changed_report.line_missed, 4)
+
+    def test_load_compressed_file(self) -> None:
+        directory = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        xml_file_path = os.path.join(directory.name, 'jacoco.xml.gz')
+        with open('test/jacoco.xml', 'rb') as xml_file, \
+                gzip.open(xml_file_path, 'wb') as compressed_file:
+            shutil.copyfileobj(xml_file, compressed_file)
+
+        loader = IncrementalReportLoader(xml_file_path)
+        report = loader.load()
+        self.assertIsNone(loader.parsed_packages)
+        self.assertEqual(report.line_covered, 16)
+        self.assertEqual(len(report.packages), 2)
+
+    def test_load_totals(self) -> None:
+        xml_file_path = self.copy_report()
+        loader = IncrementalReportLoader(xml_file_path, ParsePlan.TOTALS)
+        report = loader.load()
+        self.assertIsNone(loader.parsed_packages)
+        self.assertEqual(report.line_covered, 16)
+        self.assertEqual(len(report.packages), 0)
+
+    def test_load_missing_file(self) -> None:
+        loader = IncrementalReportLoader('test/missing.xml')
+        with self.assertRaises(FileNotFoundError):
+            loader.load()
@@ -0,0 +1,24 @@
+from unittest import TestCase
+
+from jacoco_summary.line_status import LineStatus
+
+
+class TestLineStatus(TestCase):
+
+    def test_from_counter(self) -> None:
+        self.assertEqual(LineStatus.from_counter(0, 0), LineStatus.EMPTY)
+        self.assertEqual(LineStatus.from_counter(2, 0), LineStatus.NOT_COVERED)
+        self.assertEqual(LineStatus.from_counter(0, 2),
+                         LineStatus.FULLY_COVERED)
+        self.assertEqual(LineStatus.from_counter(1, 1),
+                         LineStatus.PARTLY_COVERED)
+
+    def test_from_counters(self) -> None:
+        self.assertEqual(LineStatus.from_counters(0, 3, 0, 2),
+                         LineStatus.FULLY_COVERED)
+        self.assertEqual(LineStatus.from_counters(3, 0, 2, 0),
+                         LineStatus.NOT_COVERED)
+        self.assertEqual(LineStatus.from_counters(0, 3, 1, 1),
+                         LineStatus.PARTLY_COVERED)
+        self.assertEqual(LineStatus.from_counters(0, 3, 2, 0),
+                         LineStatus.PARTLY_COVERED)
@@ -0,0 +1,148 @@
+import re
+from unittest import TestCase
+
+from jacoco_summary.name_filter import (
+    NameFilter,
+    get_filter_plan,
+    get_literal_prefix,
+    glob_to_regex,
+)
+from jacoco_summary.parse_plan import ParsePlan
+from jacoco_summary.report import Report
+from jacoco_summary.report_comparison import get_coverage_counts
+
+
+class TestNameFilter(TestCase):
+
+    def test_glob_to_regex(self) -> None:
+        cases: list[tuple[str, str, bool]] = [
+            ('com/acme/*', 'com/acme/Main', True),
+            ('com/acme/*', 'com/acme/billing/Main', False),
+            ('com/acme/**', 'com/acme/billing/Main', True),
+            ('com/acme/**', 'com/acme', True),
+            ('com/acme/**', 'com/acmeco', False),
+            ('**/*Test', 'Test', True),
+            ('**/*Test', 'com/acme/MainTest', True),
+            ('**/*Test', 'com/acme/MainTest.java', False),
+            ('com/**/Main', 'com/Main', True),
+            ('com/**/Main', 'com/acme/billing/Main', True),
+            ('com/acme/Main?', 'com/acme/Main1', True),
+            ('com/acme/Main?', 'com/acme/Main/', False),
+            ('com/acme/[!M]*', 'com/acme/Main', False),
+            ('com/acme/[MN]ain', 'com/acme/Nain', True),
+            ('com/acme/Main$Inner', 'com/acme/Main$Inner', True),
+            ('com/acme/[', 'com/acme/[', True),
+        ]
+        for pattern, name, expected in cases:
+            with self.subTest(pattern=pattern, name=name):
+                match = re.fullmatch(glob_to_regex(pattern), name)
+                self.assertEqual(match is not None, expected)
+
+    def test_get_literal_prefix(self) -> None:
+        cases: list[tuple[str, str]] = [
+            ('com/acme/**', 'com/acme/'),
+            ('com/acme/Main', 'com/acme/Main'),
+            ('**/*Test', ''),
+            ('re:com/acme/.*', 'com/acme/'),
+            ('re:com/acmes?/.*', 'com/acme'),
+            ('re:com/(acme|billing)/.*', ''),
+            ('re:com\\.acme', 'com'),
+        ]
+        for pattern, expected in cases:
+            with self.subTest(pattern=pattern):
+                self.assertEqual(get_literal_prefix(pattern), expected)
+
+    def test_get_filter_plan(self) -> None:
+        self.assertEqual(get_filter_plan(ParsePlan.TOTALS), ParsePlan.CLASSES)
+        self.assertEqual(get_filter_plan(ParsePlan.NAMES), ParsePlan.CLASSES)
+        self.assertEqual(
+            get_filter_plan(ParsePlan.PACKAGE_COUNTERS),
+            ParsePlan.PACKAGE_COUNTERS | ParsePlan.CLASSES
+        )
+        self.assertEqual(get_filter_plan(ParsePlan.SOURCE_FILES),
+                         ParsePlan.SOURCE_FILES)
+
+    def test_accepts_package(self) -> None:
+        name_filter = NameFilter(['com/acme/billing/**', 're:org/.*Test'],
+                                 ['com/acme/billing/internal'])
+        self.assertTrue(name_filter.accepts_package('com/acme/billing'))
+        self.assertTrue(name_filter.accepts_package('com/acme/billing/tax'))
+        self.assertTrue(name_filter.accepts_package('org/acme'))
+        # the names of its entries may start with the prefix
+        self.assertTrue(name_filter.accepts_package('com/acme'))
+        self.assertFalse(name_filter.accepts_package('com/acme/shipping'))
+        self.assertFalse(name_filter.accepts_package('com/acmeco'))
+        self.assertFalse(
+            name_filter.accepts_package('com/acme/billing/internal')
+        )
+
+    def test_accepts(self) -> None:
+        name_filter = NameFilter(['com/acme', 'org/**/*Test'], ['**/*IT'])
+        self.assertTrue(name_filter.accepts('org/acme/MainTest', False))
+        self.assertFalse(name_filter.accepts('org/acme/Main', False))
+        self.assertFalse(name_filter.accepts('org/acme/MainIT', False))
+        # the entries of an included package are kept unless excluded
+        self.assertTrue(name_filter.accepts('com/acme/Main', True))
+        self.assertFalse(name_filter.accepts('com/acme/MainIT', True))
+
+        exclude_filter = NameFilter(excludes=['**/*Test'])
+        self.assertTrue(exclude_filter.accepts('com/acme/Main', False))
+        self.assertFalse(exclude_filter.accepts('com/acme/MainTest', False))
+
+    def test_invalid_pattern(self) -> None:
+        with self.assertRaisesRegex(ValueError,
+                                    "invalid regular expression: 're:\\('"):
+            NameFilter(['re:('])
+        with self.assertRaisesRegex(ValueError, 'invalid patterns'):
+            NameFilter(['re:(?P<a>a)'], ['re:(?P<a>b)'])
+
+    def test_get_key(self) -> None:
+        self.assertNotEqual(NameFilter(['a']).get_key(),
+                            NameFilter(excludes=['a']).get_key())
+        self.assertEqual(NameFilter(['a'], ['b']).get_key(),
+                         NameFilter(('a',), ('b',)).get_key())
+
+    def test_filter_report(self) -> None:
+        report = Report.from_xml_file('test/jacoco.xml')
+        filtered_report = NameFilter(excludes=['**/Class1*']) \
+            .filter_report(report)
+        self.assertEqual(filtered_report.name, 'test1')
+        class_names = [java_class.name
+                       for java_class in filtered_report.get_classes()]
+        expected_class_names: list[str] = ['test2/Class2', 'test1/Class2']
+        self.assertEqual(class_names, expected_class_names)
+        file_names: list[str] = filtered_report.get_source_files_names()
+        expected_file_names: list[str] = ['test2/Class2.java',
+                                          'test1/Class2.java']
+        self.assertEqual(file_names, expected_file_names)
+        # the counters of the packages and of the report are the sums of the
+        # kept classes
+        self.assertEqual(filtered_report.line_missed, 5)
+        self.assertEqual(filtered_report.line_covered, 6)
+        self.assertEqual(filtered_report.packages[0].line_missed, 1)
+
+        filtered_report = NameFilter(['test2']).filter_report(report)
+        package_names = filtered_report.get_packages_names()
+        expected_package_names: list[str] = ['test2']
+        self.assertEqual(package_names, expected_package_names)
+        self.assertEqual(len(filtered_report.get_classes()), 2)
+
+    def test_filter_report_same_as_parser(self) -> None:
+        name_filter = NameFilter(['re:test1/.*2.*', 'test2/**'],
+                                 ['**/Class1*'])
+        for plan in ParsePlan.ALL, ParsePlan.CLASSES, ParsePlan.SOURCE_FILES:
+            with self.subTest(plan=plan):
+                parsed_report = Report.from_xml_file('test/jacoco.xml', plan,
+                                                     name_filter)
+                filtered_report = name_filter.filter_report(
+                    Report.from_xml_file('test/jacoco.xml', plan)
+                )
+                parsed_classes = [java_class.name for java_class
+                                  in parsed_report.get_classes()]
+                filtered_classes = [java_class.name for java_class
+                                    in filtered_report.get_classes()]
+                self.assertEqual(parsed_classes, filtered_classes)
+                self.assertEqual(parsed_report.get_source_files_names(),
+                                 filtered_report.get_source_files_names())
+                self.assertEqual(get_coverage_counts(parsed_report),
+                                 get_coverage_counts(filtered_report))
@@ -0,0 +1,149 @@
+import gzip
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from jacoco_summary.class_coverage import ClassCoverage
+from jacoco_summary.method_coverage import MethodCoverage
+from jacoco_summary.package_coverage import PackageCoverage
+from jacoco_summary.package_tree import (
+    build_package_tree,
+    get_min_package_depth,
+    get_package_depth,
+    get_tree_plan,
+    get_tree_rows,
+)
+from jacoco_summary.parse_plan import ParsePlan
+from jacoco_summary.report import Report
+from jacoco_summary.sort_key import SortKey
+
+
+def create_report() -> Report:
+    """Create a report with the packages com/acme, com/acme/util and org."""
+    main_class = ClassCoverage('com/acme/Main', line_missed=1, line_covered=2,
+                               methods=[MethodCoverage('main', line_missed=1,
+                                                       line_covered=2)])
+    return Report('report', packages=[
+        PackageCoverage('com/acme', line_missed=1, line_covered=2,
+                        classes=[main_class]),
+        PackageCoverage('org', line_missed=4, line_covered=8,
+                        classes=[ClassCoverage('org/Outer$Inner',
+                                               line_missed=4,
+                                               line_covered=8)]),
+        PackageCoverage('com/acme/util', line_missed=16, line_covered=32),
+    ])
+
+
+class TestPackageTree(TestCase):
+
+    def test_get_package_depth(self) -> None:
+        self.assertEqual(get_package_depth(''), 0)
+        self.assertEqual(get_package_depth('org'), 1)
+        self.assertEqual(get_package_depth('com/acme/util'), 3)
+
+    def test_get_min_package_depth(self) -> None:
+        self.assertEqual(get_min_package_depth(['test/jacoco.xml']), 1)
+        self.assertIsNone(get_min_package_depth(['test/empty.xml']))
+        self.assertIsNone(get_min_package_depth(['test/missing.xml']))
+
+    def test_get_min_package_depth_compressed_file(self) -> None:
+        with TemporaryDirectory() as directory:
+            xml_file_path = os.path.join(directory, 'jacoco.xml.gz')
+            with open('test/jacoco.xml', 'rb') as xml_file, \
+                    gzip.open(xml_file_path, 'wb') as compressed_file:
+                compressed_file.write(xml_file.read())
+            self.assertIsNone(get_min_package_depth([xml_file_path]))
+
+    def test_get_tree_plan(self) -> None:
+        all_plan = ParsePlan.PACKAGE_COUNTERS | ParsePlan.CLASSES \
+            | ParsePlan.METHODS
+        for max_depth, expected_plan in (
+            (None, all_plan),
+            (1, ParsePlan.PACKAGE_COUNTERS),
+            (2, ParsePlan.PACKAGE_COUNTERS | ParsePlan.CLASSES),
+            (3, all_plan),
+        ):
+            with self.subTest(max_depth=max_depth):
+                plan = get_tree_plan(['test/jacoco.xml'], max_depth)
+                self.assertEqual(plan, expected_plan)
+        self.assertEqual(get_tree_plan(['-'], 1), all_plan)
+
+    def test_build_package_tree(self) -> None:
+        tree = build_package_tree(create_report())
+        self.assertEqual(tree.name, 'report')
+        self.assertEqual((tree.line_missed, tree.line_covered), (21, 42))
+        com = tree.children['com']
+        children_names = list(tree.children)
+        expected_children_names: list[str] = ['com', 'org']
+        self.assertEqual(children_names, expected_children_names)
+        self.assertEqual((com.line_missed, com.line_covered), (17, 34))
+        acme = com.children['acme']
+        self.assertEqual(acme.path, 'com/acme')
+        package_names = [package.name for package in acme.packages]
+        expected_package_names: list[str] = ['com/acme']
+        self.assertEqual(package_names, expected_package_names)
+        util = acme.children['util']
+        self.assertEqual(util.path, 'com/acme/util')
+        self.assertEqual((util.line_missed, util.line_covered), (16, 32))
+
+    def test_build_package_tree_max_depth(self) -> None:
+        tree = build_package_tree(create_report(), 1)
+        com = tree.children['com']
+        self.assertEqual(len(com.children), 0)
+        package_names = [package.name for package in com.packages]
+        expected_package_names: list[str] = ['com/acme', 'com/acme/util']
+        self.assertEqual(package_names, expected_package_names)
+        self.assertEqual((com.line_missed, com.line_covered), (17, 34))
+
+    def test_get_tree_rows(self) -> None:
+        tree = build_package_tree(create_report())
+        rows = get_tree_rows(tree)
+        rows_names = [(row.get_name(), row.line_missed) for row in rows]
+        expected_rows_names: list[tuple[str, int]] = [
+            ('report', 21),
+            ('  com', 17),
+            ('    acme', 17),
+            ('      Main', 1),
+            ('        main', 1),
+            ('      util', 16),
+            ('  org', 4),
+            ('    Outer.Inner', 4),
+        ]
+        self.assertEqual(rows_names, expected_rows_names)
+
+    def test_get_tree_rows_full_names(self) -> None:
+        tree = build_package_tree(create_report())
+        names = [row.get_name() for row in get_tree_rows(tree, indent=False)]
+        expected_names: list[str] = [
+            'report', 'com', 'com.acme', 'com.acme.Main',
+            'com.acme.Main.main', 'com.acme.util', 'org', 'org.Outer.Inner',
+        ]
+        self.assertEqual(names, expected_names)
+
+    def test_get_tree_rows_sorted(self) -> None:
+        tree = build_package_tree(create_report())
+        names = [row.get_name()
+                 for row in get_tree_rows(tree, sort_key=SortKey.NAME,
+                                          reverse=True, top=1)]
+        expected_names: list[str] = ['report', '  org', '    Outer.Inner']
+        self.assertEqual(names, expected_names)
+        names = [row.get_name()
+                 for row in get_tree_rows(tree, sort_key=SortKey.MISSED_LINES,
+                                          reverse=True)]
+        expected_names = ['report', '  org', '    Outer.Inner', '  com',
+                          '    acme', '      Main', '        main',
+                          '      util']
+        self.assertEqual(names, expected_names)
+
+    def test_get_tree_rows_max_depth(self) -> None:
+        expected_names: list[str]
+        for max_depth, expected_names in (
+            (0, ['report']),
+            (1, ['report', '  com', '  org']),
+            (2, ['report', '  com', '    acme', '  org', '    Outer.Inner']),
+        ):
+            with self.subTest(max_depth=max_depth):
+                tree = build_package_tree(create_report(), max_depth)
+                names = [row.get_name()
+                         for row in get_tree_rows(tree, max_depth)]
+                self.assertEqual(names, expected_names)
@@ -0,0 +1,165 @@
+"""Test the records module."""
+
+from io import StringIO
+from unittest import TestCase
+
+from jacoco_summary.column_name import ColumnName
+from jacoco_summary.config import COLUMNS_ORDER
+from jacoco_summary.coverage import Coverage
+from jacoco_summary.extra_counters import ExtraCounters
+from jacoco_summary.diff_coverage import DiffCoverage
+from jacoco_summary.output_format import OutputFormat
+from jacoco_summary.records import (
+    COVERAGE_FIELDS,
+    Record,
+    generate_comparison_records,
+    generate_coverage_records,
+    generate_diff_records,
+    generate_lines_records,
+    get_coverage_field_names,
+    get_ratio_delta,
+    write_records,
+)
+from jacoco_summary.report_comparison import CoverageChange
+from jacoco_summary.source_file_lines import LineCoverage, SourceFileLines
+
+
+class TestRecords(TestCase):
+
+    def test_get_ratio_delta(self) -> None:
+        self.assertEqual(get_ratio_delta(2, 8, 4, 6), -0.2)
+        self.assertEqual(get_ratio_delta(1, 3, 0, 4), 0.25)
+        self.assertIsNone(get_ratio_delta(0, 0, 0, 4))
+        self.assertIsNone(get_ratio_delta(1, 3, 0, 0))
+
+    def test_generate_coverage_records(self) -> None:
+        expected: list[Record] = [
+            ('Class1', 0, 0, None, 1, 3, 0.75, 0, 2, 1.0),
+        ]
+        records: list[Record] = list(generate_coverage_records([
+            Coverage('Class1', 0, 0, 1, 3, 0, 2),
+        ], COLUMNS_ORDER))
+        self.assertEqual(records, expected)
+
+    def test_generate_coverage_records_columns(self) -> None:
+        columns: list[ColumnName] = [
+            ColumnName.COMPLEXITY,
+            ColumnName.NAME,
+            ColumnName.LINE_COVERED,
+            ColumnName.COMPLEXITY_MISSED,
+        ]
+        expected_fields: tuple[str, ...] = (
+            'complexity_missed',
+            'complexity_covered',
+            'complexity_ratio',
+            'name',
+            'line_covered',
+        )
+        self.assertEqual(get_coverage_field_names(columns), expected_fields)
+        self.assertEqual(get_coverage_field_names(COLUMNS_ORDER),
+                         COVERAGE_FIELDS)
+        expected: list[Record] = [
+            (1, 3, 0.75, 'Class1', 3),
+            (0, 0, None, 'Class2', 0),
+        ]
+        records: list[Record] = list(generate_coverage_records([
+            Coverage('Class1', 0, 0, 1, 3, 0, 2,
+                     ExtraCounters(complexity_missed=1, complexity_covered=3)),
+            Coverage('Class2'),
+        ], columns))
+        self.assertEqual(records, expected)
+
+    def test_generate_lines_records(self) -> None:
+        expected: list[Record] = [
+            (2, 2, 'partly covered'),
+            (3, 5, 'not covered'),
+        ]
+        records: list[Record] = list(generate_lines_records(
+            SourceFileLines.from_lines([
+                LineCoverage(1, 0, 1, 0, 0),
+                LineCoverage(2, 0, 1, 1, 1),
+                LineCoverage(3, 2, 0, 0, 0),
+                LineCoverage(5, 1, 0, 0, 0),
+            ])
+        ))
+        self.assertEqual(records, expected)
+
+    def test_generate_diff_records(self) -> None:
+        expected: list[Record] = [('File1.java', 3, 1, 0.25, '3-4, 9')]
+        records: list[Record] = list(generate_diff_records([
+            DiffCoverage('File1.java', line_missed=3, line_covered=1,
+                         missed_lines=[(3, 4), (9, 9)]),
+        ]))
+        self.assertEqual(records, expected)
+
+    def test_generate_comparison_records(self) -> None:
+        expected: list[Record] = [
+            ('Class1', 'changed', 0, 4, 2, 2, -0.5, 2, 8, 4, 6, -0.2,
+             1, 3, 1, 3, 0.0),
+            ('Class2', 'added', 0, 0, 1, 1, None, 0, 0, 0, 0, None,
+             0, 0, 0, 1, None),
+            ('Class3', 'removed', 0, 0, 0, 0, None, 1, 0, 0, 0, None,
+             0, 0, 0, 0, None),
+        ]
+        records: list[Record] = list(generate_comparison_records([
+            CoverageChange('Class1', Coverage('Class1', 0, 4, 2, 8, 1, 3),
+                           Coverage('Class1', 2, 2, 4, 6, 1, 3)),
+            CoverageChange('Class2', None,
+                           Coverage('Class2', 1, 1, method_covered=1)),
+            CoverageChange('Class3', Coverage('Class3', line_missed=1), None),
+        ]))
+        self.assertEqual(records, expected)
+
+    def test_write_records(self) -> None:
+        records: list[Record] = [
+            ('Class1', 0, 0, None, 1, 3, 0.75, 0, 2, 1.0),
+            ('a, "b"', 1, 0, 0.0, 0, 0, None, 0, 0, None),
+        ]
+        expected: dict[OutputFormat, str] = {
+            OutputFormat.CSV: (
+                'name,branch_missed,branch_covered,branch_ratio,line_missed,'
+                'line_covered,line_ratio,method_missed,method_covered,'
+                'method_ratio\n'
+                'Class1,0,0,,1,3,0.75,0,2,1.0\n'
+                '"a, ""b""",1,0,0.0,0,0,,0,0,\n'
+            ),
+            OutputFormat.JSON: (
+                '[\n'
+                '{"name": "Class1", "branch_missed": 0, "branch_covered": 0, '
+                '"branch_ratio": null, "line_missed": 1, "line_covered": 3, '
+                '"line_ratio": 0.75, "method_missed": 0, "method_covered": 2, '
+                '"method_ratio": 1.0},\n'
+                '{"name": "a, \\"b\\"", "branch_missed": 1, '
+                '"branch_covered": 0, "branch_ratio": 0.0, "line_missed": 0, '
+                '"line_covered": 0, "line_ratio": null, "method_missed": 0, '
+                '"method_covered": 0, "method_ratio": null}\n'
+                ']\n'
+            ),
+            OutputFormat.NDJSON: (
+                '{"name": "Class1", "branch_missed": 0, "branch_covered": 0, '
+                '"branch_ratio": null, "line_missed": 1, "line_covered": 3, '
+                '"line_ratio": 0.75, "method_missed": 0, "method_covered": 2, '
+                '"method_ratio": 1.0}\n'
+                '{"name": "a, \\"b\\"", "branch_missed": 1, '
+                '"branch_covered": 0, "branch_ratio": 0.0, "line_missed": 0, '
+                '"line_covered": 0, "line_ratio": null, "method_missed": 0, '
+                '"method_covered": 0, "method_ratio": null}\n'
+            ),
+        }
+        for output_format, output in expected.items():
+            with self.subTest(output_format=output_format):
+                file = StringIO()
+                write_records(records, COVERAGE_FIELDS, output_format, file)
+                self.assertEqual(file.getvalue(), output)
+
+    def test_write_records_empty(self) -> None:
+        expected: dict[OutputFormat, str] = {
+            OutputFormat.CSV: 'name\n',
+            OutputFormat.JSON: '[\n]\n',
+            OutputFormat.NDJSON: '',
+        }
+        for output_format, output in expected.items():
+            with self.subTest(output_format=output_format):
+                file = StringIO()
+                write_records([], ('name',), output_format, file)
+                self.assertEqual(file.getvalue(), output)
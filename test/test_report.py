@@ -2,6 +2,7 @@ from unittest import TestCase
 from xml.etree.ElementTree import fromstring, ParseError
 
 from jacoco_summary.class_coverage import ClassCoverage
+from jacoco_summary.coverage import Coverage
 from jacoco_summary.report import Report
 from jacoco_summary.package_coverage import PackageCoverage
 from jacoco_summary.source_file_coverage import SourceFileCoverage
@@ -66,6 +67,39 @@ class TestReport(TestCase):
         self.assertEqual(report.method_covered, 7)
         self.assertEqual(len(report.packages), 2)
 
+    def test_from_xml_file_same_as_from_xml_element(self) -> None:
+        def fields(report: Report) -> list[tuple[str | int, ...]]:
+            coverages: list[Coverage] = [report]
+            coverages.extend(report.packages)
+            for java_class in report.get_classes():
+                coverages.append(java_class)
+                coverages.extend(java_class.methods)
+            coverages.extend(report.get_source_files())
+            return [(
+                coverage.name,
+                coverage.branch_missed,
+                coverage.branch_covered,
+                coverage.line_missed,
+                coverage.line_covered,
+                coverage.method_missed,
+                coverage.method_covered,
+            ) for coverage in coverages]
+
+        streamed = Report.from_xml_file('test/jacoco.xml')
+        with open('test/jacoco.xml', encoding='utf-8') as file:
+            parsed = Report.from_xml_element(fromstring(file.read()))
+        self.assertEqual(fields(streamed), fields(parsed))
+
+    def test_from_xml_file_xml_parsing_error(self) -> None:
+        with self.assertRaises(XmlParsingException) as cm:
+            Report.from_xml_file('test/xml-parsing-error.xml')
+        self.assertEqual(str(cm.exception), "unexpected element tag 'badtag'")
+
+    def test_from_xml_file_grouped_report(self) -> None:
+        with self.assertRaises(XmlParsingException) as cm:
+            Report.from_xml_file('test/group.xml')
+        self.assertEqual(str(cm.exception), "unexpected element tag 'group'")
+
     def test_from_xml_file_empty(self) -> None:
         report = Report.from_xml_file('test/empty.xml')
         self.assertEqual(report.branch_missed, 0)
@@ -133,6 +167,20 @@ class TestReport(TestCase):
         self.assertIs(self.report.get_class('Class3'), self.class3)
         self.assertIsNone(self.report.get_class('Class4'))
 
+    def test_get_class_duplicated_name(self) -> None:
+        duplicated_class = ClassCoverage('Class1')
+        self.report.packages = self.report.packages + [
+            PackageCoverage('package3', classes=[duplicated_class])
+        ]
+        self.assertIs(self.report.get_class('Class1'), self.class1)
+
+    def test_get_class_packages_assigned(self) -> None:
+        self.assertIsNone(self.report.get_class('Class4'))
+        class4 = ClassCoverage('package3/Class4')
+        self.report.packages = [PackageCoverage('package3', classes=[class4])]
+        self.assertIs(self.report.get_class('package3.Class4'), class4)
+        self.assertIsNone(self.report.get_class('Class1'))
+
     def test_get_classes(self) -> None:
         classes = self.report.get_classes()
         self.assertEqual(len(classes), 3)
@@ -145,6 +193,12 @@ class TestReport(TestCase):
         self.assertIs(self.report.get_package('package2'), self.package2)
         self.assertIsNone(self.report.get_package('package3'))
 
+    def test_get_package_packages_assigned(self) -> None:
+        self.assertIs(self.report.get_package('package1'), self.package1)
+        self.report.packages = [self.package2]
+        self.assertIsNone(self.report.get_package('package1'))
+        self.assertIs(self.report.get_package('package2'), self.package2)
+
     def test_get_packages_names(self) -> None:
         expected_packages = ['package1', 'package2']
         self.assertEqual(self.report.get_packages_names(), expected_packages)
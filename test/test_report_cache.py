@@ -0,0 +1,117 @@
+import os
+import shutil
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from jacoco_summary.name_filter import NameFilter
+from jacoco_summary.parse_plan import ParsePlan
+from jacoco_summary.report_cache import (
+    clear_cache,
+    evict_cache,
+    get_cache_directory,
+    get_cache_file_path,
+    get_cache_key,
+    load_report,
+    read_cache,
+)
+
+
+class TestReportCache(TestCase):
+
+    def setUp(self) -> None:
+        directory = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        environ: dict[str, str] = {
+            'XDG_CACHE_HOME': os.path.join(self.directory, 'cache'),
+        }
+        self.enterContext(patch.dict('os.environ', environ))
+        self.xml_file = os.path.join(self.directory, 'jacoco.xml')
+        shutil.copyfile('test/jacoco.xml', self.xml_file)
+
+    def get_cache_files(self) -> list[str]:
+        if not os.path.exists(get_cache_directory()):
+            return []
+        return sorted(os.listdir(get_cache_directory()))
+
+    def test_get_cache_directory(self) -> None:
+        self.assertEqual(
+            get_cache_directory(),
+            os.path.join(self.directory, 'cache', 'jacoco-summary')
+        )
+
+    def test_get_cache_key_depends_on_plan(self) -> None:
+        key_all = get_cache_key(self.xml_file, ParsePlan.ALL)
+        key_names = get_cache_key(self.xml_file, ParsePlan.NAMES)
+        self.assertNotEqual(key_all, key_names)
+        self.assertNotEqual(get_cache_file_path(key_all),
+                            get_cache_file_path(key_names))
+
+    def test_get_cache_key_depends_on_filter(self) -> None:
+        key = get_cache_key(self.xml_file, ParsePlan.ALL)
+        key_filtered = get_cache_key(self.xml_file, ParsePlan.ALL,
+                                     NameFilter(['test1/**']))
+        self.assertNotEqual(key, key_filtered)
+        self.assertNotEqual(get_cache_file_path(key),
+                            get_cache_file_path(key_filtered))
+
+    def test_get_cache_key_file_doesnt_exists(self) -> None:
+        with self.assertRaises(FileNotFoundError):
+            get_cache_key(os.path.join(self.directory, 'missing.xml'),
+                          ParsePlan.ALL)
+
+    def test_load_report_uses_cache(self) -> None:
+        report = load_report(self.xml_file)
+        self.assertEqual(len(self.get_cache_files()), 1)
+        cached_report = read_cache(get_cache_key(self.xml_file, ParsePlan.ALL))
+        assert cached_report is not None
+        self.assertIsNot(cached_report, report)
+        self.assertEqual(cached_report.line_missed, report.line_missed)
+        self.assertEqual(cached_report.get_packages_names(),
+                         report.get_packages_names())
+        self.assertEqual(len(cached_report.get_classes()),
+                         len(report.get_classes()))
+
+    def test_load_report_without_cache(self) -> None:
+        load_report(self.xml_file, use_cache=False)
+        self.assertEqual(len(self.get_cache_files()), 0)
+
+    def test_load_report_totals_not_cached(self) -> None:
+        report = load_report(self.xml_file, ParsePlan.TOTALS)
+        self.assertEqual(report.line_missed, 15)
+        self.assertEqual(len(self.get_cache_files()), 0)
+
+    def test_load_report_file_changed(self) -> None:
+        load_report(self.xml_file)
+        shutil.copyfile('test/empty.xml', self.xml_file)
+        report = load_report(self.xml_file)
+        self.assertEqual(len(report.packages), 0)
+        self.assertEqual(len(self.get_cache_files()), 1)
+
+    def test_load_report_corrupted_cache(self) -> None:
+        load_report(self.xml_file)
+        cache_file = get_cache_file_path(get_cache_key(self.xml_file,
+                                                       ParsePlan.ALL))
+        with open(cache_file, 'wb') as file:
+            file.write(b'not a pickle')
+        report = load_report(self.xml_file)
+        self.assertEqual(len(report.packages), 2)
+
+    def test_evict_cache(self) -> None:
+        load_report(self.xml_file, ParsePlan.ALL)
+        load_report(self.xml_file, ParsePlan.NAMES)
+        self.assertEqual(len(self.get_cache_files()), 2)
+        oldest = get_cache_file_path(get_cache_key(self.xml_file,
+                                                   ParsePlan.ALL))
+        os.utime(oldest, ns=(0, 0))
+        newest = get_cache_file_path(get_cache_key(self.xml_file,
+                                                   ParsePlan.NAMES))
+        evict_cache(os.path.getsize(newest))
+        expected_files: list[str] = [os.path.basename(newest)]
+        self.assertEqual(self.get_cache_files(), expected_files)
+
+    def test_clear_cache(self) -> None:
+        load_report(self.xml_file)
+        clear_cache()
+        self.assertEqual(len(self.get_cache_files()), 0)
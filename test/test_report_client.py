@@ -0,0 +1,45 @@
+import io
+from unittest import TestCase
+from unittest.mock import patch
+
+from jacoco_summary.report_client import (
+    get_member,
+    get_socket_path,
+    get_strings,
+    read_message,
+)
+
+
+class TestReportClient(TestCase):
+
+    def test_get_socket_path(self) -> None:
+        runtime_environ: dict[str, str] = {'XDG_RUNTIME_DIR': '/run/user/1'}
+        with patch.dict('os.environ', runtime_environ):
+            self.assertEqual(get_socket_path(),
+                             '/run/user/1/jacoco-summary.sock')
+        cache_environ: dict[str, str] = {
+            'XDG_RUNTIME_DIR': '',
+            'XDG_CACHE_HOME': '/cache',
+        }
+        with patch.dict('os.environ', cache_environ):
+            self.assertEqual(get_socket_path(),
+                             '/cache/jacoco-summary/jacoco-summary.sock')
+
+    def test_read_message(self) -> None:
+        message = read_message(io.BytesIO(b'{"args": ["a", "b"]}\n'))
+        expected_strings: list[str] = ['a', 'b']
+        self.assertEqual(get_strings(get_member(message, 'args')),
+                         expected_strings)
+        self.assertIsNone(get_member(message, 'files'))
+
+        for data in b'', b'{"args": []}', b'{"args"\n':
+            with self.subTest(data=data):
+                self.assertIsNone(read_message(io.BytesIO(data)))
+
+    def test_get_strings(self) -> None:
+        self.assertIsNone(get_strings(None))
+        self.assertIsNone(get_strings('a'))
+        self.assertIsNone(get_strings(['a', 1]))
+        self.assertIsNone(get_strings(()))
+        empty_strings: list[str] = []
+        self.assertEqual(get_strings(empty_strings), empty_strings)
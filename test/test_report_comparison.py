@@ -0,0 +1,142 @@
+from unittest import TestCase
+
+from jacoco_summary.comparison_level import ComparisonLevel
+from jacoco_summary.coverage import Coverage
+from jacoco_summary.parse_plan import ParsePlan
+from jacoco_summary.report import Report
+from jacoco_summary.report_comparison import (
+    CoverageChange,
+    compare_reports,
+    get_comparison_plan,
+    get_delta,
+    sort_changes,
+)
+from jacoco_summary.sort_key import SortKey
+
+
+class TestReportComparison(TestCase):
+
+    baseline: Report
+    current: Report
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.baseline = Report.from_xml_file('test/baseline.xml')
+        cls.current = Report.from_xml_file('test/jacoco.xml')
+
+    def test_get_delta(self) -> None:
+        self.assertEqual(get_delta(1, 3, 0, 4), 25)
+        self.assertEqual(get_delta(0, 4, 2, 2), -50)
+        self.assertIsNone(get_delta(0, 0, 1, 1))
+        self.assertIsNone(get_delta(1, 1, 0, 0))
+
+    def test_coverage_change(self) -> None:
+        change = CoverageChange(
+            'Class1',
+            Coverage('Class1', 0, 4, 2, 8, 1, 3),
+            Coverage('Class1', 2, 2, 4, 6, 1, 3)
+        )
+        expected: tuple[float | None, float | None, float | None] = (
+            -50, -20, 0
+        )
+        self.assertEqual(change.get_deltas(), expected)
+        self.assertEqual(change.get_worst_delta(), -50)
+        self.assertTrue(change.is_changed())
+        self.assertTrue(change.is_regression())
+
+    def test_coverage_change_unchanged(self) -> None:
+        change = CoverageChange(
+            'Class1',
+            Coverage('Class1', line_missed=1),
+            Coverage('Class1', line_missed=1)
+        )
+        self.assertFalse(change.is_changed())
+        self.assertFalse(change.is_regression())
+
+    def test_coverage_change_added(self) -> None:
+        change = CoverageChange('Class1', None, Coverage('Class1'))
+        expected: tuple[float | None, float | None, float | None] = (
+            None, None, None
+        )
+        self.assertEqual(change.get_deltas(), expected)
+        self.assertEqual(change.get_worst_delta(), 0)
+        self.assertTrue(change.is_changed())
+        self.assertFalse(change.is_regression())
+
+    def test_get_comparison_plan(self) -> None:
+        self.assertEqual(get_comparison_plan(ComparisonLevel.CLASS),
+                         ParsePlan.CLASSES)
+        self.assertEqual(get_comparison_plan(ComparisonLevel.PACKAGE),
+                         ParsePlan.PACKAGE_COUNTERS)
+        self.assertEqual(get_comparison_plan(ComparisonLevel.FILE),
+                         ParsePlan.SOURCE_FILES)
+
+    def test_compare_reports(self) -> None:
+        expected_names: dict[ComparisonLevel, list[str]] = {
+            ComparisonLevel.CLASS: [
+                'test2.Class2', 'test2.Class1', 'test1.Class1',
+                'test1.Class2', 'test3.Removed',
+            ],
+            ComparisonLevel.PACKAGE: ['test2', 'test1', 'test3'],
+            ComparisonLevel.FILE: [
+                'test2/Class1.java', 'test2/Class2.java', 'test1/Class1.java',
+                'test1/Class2.java', 'test3/Removed.java',
+            ],
+        }
+        for level, names in expected_names.items():
+            with self.subTest(level=level):
+                changes = compare_reports(self.baseline, self.current, level)
+                changes_names: list[str] = [change.name for change in changes]
+                self.assertEqual(changes_names, names)
+                self.assertIsNone(changes[-1].current)
+
+    def test_compare_reports_same_report(self) -> None:
+        changes = compare_reports(self.current, self.current,
+                                  ComparisonLevel.CLASS)
+        self.assertEqual(len(changes), 4)
+        self.assertFalse(any(change.is_changed() for change in changes))
+
+    def test_sort_changes(self) -> None:
+        changes = compare_reports(self.baseline, self.current,
+                                  ComparisonLevel.CLASS)
+        expected: list[str] = [
+            'test1.Class2', 'test1.Class1', 'test2.Class1', 'test2.Class2',
+            'test3.Removed',
+        ]
+        sorted_names: list[str] = [
+            change.name for change in sort_changes(changes)
+        ]
+        self.assertEqual(sorted_names, expected)
+        top_names: list[str] = [
+            change.name for change in sort_changes(changes, 2)
+        ]
+        self.assertEqual(top_names, expected[:2])
+
+    def test_sort_changes_sort_key(self) -> None:
+        changes = compare_reports(self.baseline, self.current,
+                                  ComparisonLevel.CLASS)
+        # the added and removed entries, without delta, are last in both
+        # directions
+        cases: list[tuple[SortKey, bool, list[str]]] = [
+            (SortKey.NAME, True, ['test3.Removed', 'test2.Class2']),
+            (SortKey.LINE, False, ['test1.Class2', 'test2.Class2']),
+            (SortKey.LINE, True, ['test1.Class1', 'test2.Class2']),
+            (SortKey.MISSED_LINES, False, ['test1.Class2', 'test2.Class2']),
+            (SortKey.BRANCH, True, ['test1.Class1', 'test1.Class2']),
+        ]
+        for sort_key, reverse, expected in cases:
+            with self.subTest(sort_key=sort_key, reverse=reverse):
+                sorted_names = [
+                    change.name
+                    for change in sort_changes(changes, None, sort_key,
+                                               reverse)
+                ]
+                self.assertEqual(sorted_names[:2], expected)
+                self.assertEqual(sorted_names[-1], 'test3.Removed'
+                                 if sort_key is not SortKey.NAME
+                                 else 'test1.Class1')
+                top_names = [
+                    change.name
+                    for change in sort_changes(changes, 2, sort_key, reverse)
+                ]
+                self.assertEqual(top_names, expected)
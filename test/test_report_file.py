@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import gzip
+import io
+import lzma
+import os
+import sys
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING
+from unittest import TestCase
+from unittest.mock import patch
+
+from jacoco_summary.compression_format import CompressionFormat
+from jacoco_summary.report_file import open_report_file
+
+if TYPE_CHECKING:
+    from _typeshed import WriteableBuffer
+
+
+class TrickleStream(io.RawIOBase):
+    '''Stream giving one byte per read, like a pipe written slowly.'''
+
+    def __init__(self, content: bytes) -> None:
+        super().__init__()
+        self.content = content
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: WriteableBuffer) -> int:
+        with memoryview(buffer) as view, view.cast('B') as byte_view:
+            size = min(len(byte_view), len(self.content), 1)
+            byte_view[:size] = self.content[:size]
+            self.content = self.content[size:]
+            return size
+
+
+class TestReportFile(TestCase):
+
+    content: bytes
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        with open('test/jacoco.xml', 'rb') as xml_file:
+            cls.content = xml_file.read()
+
+    def write_file(self, content: bytes) -> str:
+        directory = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        file_path = os.path.join(directory.name, 'jacoco.xml')
+        with open(file_path, 'wb') as file:
+            file.write(content)
+        return file_path
+
+    def test_compression_format_from_magic_number(self) -> None:
+        self.assertEqual(
+            CompressionFormat.from_magic_number(gzip.compress(b'')),
+            CompressionFormat.GZIP
+        )
+        self.assertEqual(
+            CompressionFormat.from_magic_number(lzma.compress(b'')),
+            CompressionFormat.XZ
+        )
+        self.assertEqual(
+            CompressionFormat.from_magic_number(b'\x28\xb5\x2f\xfd\x00'),
+            CompressionFormat.ZSTD
+        )
+        self.assertIsNone(CompressionFormat.from_magic_number(b'<?xml'))
+        self.assertIsNone(CompressionFormat.from_magic_number(b''))
+
+    def test_open_report_file(self) -> None:
+        for name, content in (
+            ('plain', self.content),
+            ('gzip', gzip.compress(self.content)),
+            ('xz', lzma.compress(self.content)),
+        ):
+            with self.subTest(name=name):
+                with open_report_file(self.write_file(content)) as file:
+                    self.assertEqual(file.read(), self.content)
+
+    def test_open_report_file_stdin(self) -> None:
+        sys_stdin = sys.stdin
+        with open(self.write_file(gzip.compress(self.content)),
+                  encoding='utf-8') as stdin:
+            sys.stdin = stdin
+            try:
+                with open_report_file('-') as file:
+                    self.assertEqual(file.read(), self.content)
+            finally:
+                sys.stdin = sys_stdin
+            self.assertFalse(stdin.closed)
+
+    def test_open_report_file_trickled(self) -> None:
+        for name, content in (
+            ('plain', self.content),
+            ('gzip', gzip.compress(self.content)),
+            ('xz', lzma.compress(self.content)),
+            ('short', b'\x1f'),
+        ):
+            with self.subTest(name=name):
+                stream = io.BufferedReader(TrickleStream(content))
+                with patch('jacoco_summary.report_file.open_binary_file',
+                           return_value=stream):
+                    with open_report_file('-') as file:
+                        data = file.read()
+                self.assertEqual(data, content if name == 'short'
+                                 else self.content)
+
+    def test_open_report_file_truncated(self) -> None:
+        with self.assertRaises(EOFError):
+            with open_report_file(
+                self.write_file(gzip.compress(self.content)[:100])
+            ) as file:
+                file.read()
+
+    def test_open_report_file_zstd_unsupported(self) -> None:
+        if sys.version_info >= (3, 14):
+            self.skipTest('zstd is supported')
+        with self.assertRaises(OSError) as cm:
+            with open_report_file(self.write_file(b'\x28\xb5\x2f\xfd\x00')):
+                pass
+        self.assertEqual(str(cm.exception),
+                         'zstd compressed reports need Python 3.14 or later')
@@ -0,0 +1,81 @@
+from io import StringIO
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from benchmark.report_generator import ReportGenerator, XML_HEADER
+from jacoco_summary.coverage import Coverage
+from jacoco_summary.report import Report
+
+
+class TestReportGenerator(TestCase):
+
+    @staticmethod
+    def generate(generator: ReportGenerator) -> str:
+        output = StringIO()
+        generator.write(output)
+        return output.getvalue()
+
+    def load(self, generator: ReportGenerator) -> Report:
+        directory = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'jacoco.xml')
+        with open(path, 'w', encoding='utf-8') as report_file:
+            generator.write(report_file)
+        return Report.from_xml_file(path)
+
+    def assert_counters_sum(self, total: Coverage, parts: list[Coverage]
+                            ) -> None:
+        expected = Coverage(total.name)
+        for part in parts:
+            expected.add_counters(part)
+        self.assertEqual(
+            (total.branch_missed, total.branch_covered, total.line_missed,
+             total.line_covered, total.method_missed, total.method_covered),
+            (expected.branch_missed, expected.branch_covered,
+             expected.line_missed, expected.line_covered,
+             expected.method_missed, expected.method_covered)
+        )
+
+    def test_write(self) -> None:
+        report = self.load(ReportGenerator(packages=3, classes=4, methods=2,
+                                           lines=3))
+
+        self.assertEqual(len(report.packages), 3)
+        self.assertEqual(len(report.get_classes()), 12)
+        self.assertEqual(len(report.get_source_files()), 12)
+        java_class = report.get_class('com.example.p2.Class3')
+        assert java_class is not None
+        method_names: list[str] = [method.name
+                                   for method in java_class.methods]
+        expected_names: list[str] = ['<init>', 'method1']
+        self.assertEqual(method_names, expected_names)
+
+    def test_write_counters(self) -> None:
+        report = self.load(ReportGenerator(packages=2, classes=5))
+
+        self.assert_counters_sum(report, list(report.packages))
+        for package in report.packages:
+            self.assert_counters_sum(package, list(package.classes))
+            self.assert_counters_sum(package, list(package.source_files))
+            for java_class in package.classes:
+                self.assert_counters_sum(java_class, list(java_class.methods))
+
+    def test_write_header(self) -> None:
+        content = self.generate(ReportGenerator(packages=1, classes=1))
+
+        self.assertTrue(content.startswith(XML_HEADER))
+        self.assertIn('<sessioninfo ', content)
+
+    def test_write_reproducible(self) -> None:
+        generator = ReportGenerator(packages=2, classes=2)
+
+        self.assertEqual(self.generate(generator), self.generate(generator))
+        self.assertEqual(
+            self.generate(generator),
+            self.generate(ReportGenerator(packages=2, classes=2))
+        )
+        self.assertNotEqual(
+            self.generate(generator),
+            self.generate(ReportGenerator(packages=2, classes=2, seed=1))
+        )
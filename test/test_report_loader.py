@@ -0,0 +1,134 @@
+import gzip
+import os
+import pickle
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+from xml.etree.ElementTree import Element, ParseError
+
+from jacoco_summary.name_filter import NameFilter
+from jacoco_summary.report_loader import (
+    ReportFileError,
+    load_report_groups,
+    load_reports,
+)
+from jacoco_summary.xml_parsing_exception import XmlParsingException
+
+
+class TestReportLoader(TestCase):
+
+    def setUp(self) -> None:
+        cache_home = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(cache_home.cleanup)
+        environ: dict[str, str] = {'XDG_CACHE_HOME': cache_home.name}
+        self.enterContext(patch.dict('os.environ', environ))
+
+    def test_load_reports_single(self) -> None:
+        report = load_reports(['test/jacoco.xml'])
+        self.assertEqual(report.line_missed, 15)
+        self.assertEqual(len(report.packages), 2)
+
+    def test_load_reports_merge(self) -> None:
+        for jobs in 1, 2:
+            with self.subTest(jobs=jobs):
+                report = load_reports(
+                    ['test/jacoco.xml', 'test/empty-class.xml',
+                     'test/jacoco.xml'],
+                    jobs=jobs
+                )
+                self.assertEqual(report.name, 'test1')
+                self.assertEqual(report.line_missed, 30)
+                self.assertEqual(report.branch_missed, 18)
+                expected_packages: list[str] = ['test2', 'test1', 'test']
+                self.assertEqual(report.get_packages_names(),
+                                 expected_packages)
+                java_class = report.get_class('test1.Class2')
+                assert java_class is not None
+                self.assertEqual(java_class.line_covered, 12)
+                self.assertEqual(len(java_class.methods), 4)
+                self.assertEqual(java_class.methods[1].line_covered, 4)
+                source_file = report.get_source_file('test1/Class2.java')
+                assert source_file is not None
+                self.assertEqual(source_file.line_missed, 8)
+                assert source_file.lines is not None
+                self.assertEqual(len(source_file.lines), 10)
+                line = source_file.lines.get_line(9)
+                assert line is not None
+                self.assertEqual(line.missed_branches, 2)
+                self.assertEqual(line.covered_branches, 2)
+
+    def test_load_report_groups(self) -> None:
+        for jobs in 1, 2:
+            with self.subTest(jobs=jobs):
+                reports = load_report_groups(
+                    [['test/jacoco.xml', 'test/jacoco.xml'],
+                     ['test/baseline.xml']],
+                    jobs=jobs
+                )
+                self.assertEqual(len(reports), 2)
+                self.assertEqual(reports[0].name, 'test1')
+                self.assertEqual(reports[0].line_missed, 30)
+                self.assertEqual(reports[1].name, 'baseline')
+                self.assertEqual(reports[1].line_missed, 6)
+
+    def test_load_report_groups_filtered(self) -> None:
+        for jobs in 1, 2:
+            with self.subTest(jobs=jobs):
+                reports = load_report_groups(
+                    [['test/jacoco.xml'], ['test/baseline.xml']],
+                    jobs=jobs,
+                    name_filter=NameFilter(['test1'])
+                )
+                package_names: list[str] = ['test1']
+                self.assertEqual(reports[0].get_packages_names(),
+                                 package_names)
+                self.assertEqual(reports[0].line_missed, 4)
+                self.assertEqual(reports[1].get_packages_names(),
+                                 package_names)
+
+    def test_load_reports_file_error(self) -> None:
+        for jobs in 1, 2:
+            with self.subTest(jobs=jobs):
+                with self.assertRaises(ReportFileError) as cm:
+                    load_reports(['test/jacoco.xml', 'test/parse-error.xml'],
+                                 jobs=jobs)
+                self.assertEqual(cm.exception.path, 'test/parse-error.xml')
+                self.assertIsInstance(cm.exception.error, ParseError)
+
+    def test_load_reports_compressed(self) -> None:
+        with TemporaryDirectory() as directory:
+            compressed_path = os.path.join(directory, 'jacoco.xml.gz')
+            truncated_path = os.path.join(directory, 'truncated.xml.gz')
+            with open('test/jacoco.xml', 'rb') as xml_file:
+                content = gzip.compress(xml_file.read())
+            with open(compressed_path, 'wb') as compressed_file:
+                compressed_file.write(content)
+            with open(truncated_path, 'wb') as truncated_file:
+                truncated_file.write(content[:100])
+
+            for jobs in 1, 2:
+                with self.subTest(jobs=jobs):
+                    report = load_reports([compressed_path, 'test/jacoco.xml'],
+                                          jobs=jobs)
+                    self.assertEqual(report.line_missed, 30)
+                    with self.assertRaises(ReportFileError) as cm:
+                        load_reports([compressed_path, truncated_path],
+                                     jobs=jobs)
+                    self.assertEqual(cm.exception.path, truncated_path)
+                    self.assertIsInstance(cm.exception.error, EOFError)
+
+    def test_load_reports_xml_parsing_error(self) -> None:
+        with self.assertRaises(ReportFileError) as cm:
+            load_reports(['test/jacoco.xml', 'test/xml-parsing-error.xml'],
+                         jobs=2)
+        self.assertIsInstance(cm.exception.error, XmlParsingException)
+        self.assertEqual(str(cm.exception),
+                         'test/xml-parsing-error.xml: '
+                         "unexpected element tag 'badtag'")
+
+    def test_xml_parsing_exception_pickle(self) -> None:
+        exception: object = pickle.loads(
+            pickle.dumps(XmlParsingException(Element('badtag')))
+        )
+        assert isinstance(exception, XmlParsingException)
+        self.assertEqual(str(exception), "unexpected element tag 'badtag'")
@@ -0,0 +1,195 @@
+from unittest import TestCase
+from xml.etree.ElementTree import ParseError
+
+from jacoco_summary.name_filter import NameFilter
+from jacoco_summary.parse_plan import ParsePlan
+from jacoco_summary.report_parser import (
+    ReportParser,
+    find_package_ranges,
+    get_package_name,
+    get_skipped_tags,
+)
+from jacoco_summary.xml_parsing_exception import XmlParsingException
+
+
+class TestReportParser(TestCase):
+
+    xml: bytes = (
+        b'<report name="test_project">'
+        b'<sessioninfo id="sessionid" start="0" dump="0"/>'
+        b'<package name="package1">'
+        b'<class name="package1/Class1" sourcefilename="Class1.java">'
+        b'<method name="method1" desc="()V" line="1">'
+        b'<counter type="LINE" missed="1" covered="2"/>'
+        b'</method>'
+        b'<counter type="LINE" missed="1" covered="2"/>'
+        b'</class>'
+        b'<sourcefile name="Class1.java">'
+        b'<line nr="1" mi="0" ci="2" mb="0" cb="0"/>'
+        b'<counter type="LINE" missed="1" covered="2"/>'
+        b'</sourcefile>'
+        b'<counter type="LINE" missed="1" covered="2"/>'
+        b'</package>'
+        b'<package name="package2"/>'
+        b'<counter type="LINE" missed="3" covered="4"/>'
+        b'</report>'
+    )
+
+    def test_get_skipped_tags(self) -> None:
+        names_tags: set[str] = {
+            'sessioninfo', 'class', 'method', 'sourcefile', 'line'
+        }
+        self.assertEqual(get_skipped_tags(ParsePlan.NAMES), names_tags)
+        classes_tags: set[str] = {'sessioninfo', 'method', 'sourcefile', 'line'}
+        self.assertEqual(get_skipped_tags(ParsePlan.CLASSES), classes_tags)
+        all_tags: set[str] = {'sessioninfo'}
+        self.assertEqual(get_skipped_tags(ParsePlan.ALL), all_tags)
+
+    def test_feed_by_chunks(self) -> None:
+        parser = ReportParser()
+        names: list[str] = []
+        for i in range(0, len(self.xml), 7):
+            parser.feed(self.xml[i:i + 7])
+            names.extend(package.name for package in parser.read_packages())
+        root = parser.close()
+        names.extend(package.name for package in parser.read_packages())
+        expected_names: list[str] = ['package1', 'package2']
+        self.assertEqual(names, expected_names)
+        self.assertEqual(root.attrib['name'], 'test_project')
+        self.assertEqual(len(root), 1)
+        self.assertEqual(root[0].tag, 'counter')
+
+    def test_plan_all(self) -> None:
+        parser = ReportParser(ParsePlan.ALL)
+        parser.feed(self.xml)
+        parser.close()
+        package = parser.read_packages()[0]
+        self.assertEqual(package.line_covered, 2)
+        self.assertEqual(len(package.classes), 1)
+        self.assertEqual(len(package.classes[0].methods), 1)
+        self.assertEqual(len(package.source_files), 1)
+
+    def test_plan_names(self) -> None:
+        parser = ReportParser(ParsePlan.NAMES)
+        parser.feed(self.xml)
+        parser.close()
+        package = parser.read_packages()[0]
+        self.assertEqual(package.name, 'package1')
+        self.assertEqual(package.line_covered, 0)
+        self.assertEqual(len(package.classes), 0)
+        self.assertEqual(len(package.source_files), 0)
+
+    def test_plan_classes(self) -> None:
+        parser = ReportParser(ParsePlan.CLASSES)
+        parser.feed(self.xml)
+        parser.close()
+        package = parser.read_packages()[0]
+        self.assertEqual(package.line_covered, 0)
+        self.assertEqual(len(package.classes), 1)
+        self.assertEqual(package.classes[0].line_covered, 2)
+        self.assertEqual(len(package.classes[0].methods), 0)
+        self.assertEqual(len(package.source_files), 0)
+
+    def test_name_filter(self) -> None:
+        parser = ReportParser(ParsePlan.ALL, NameFilter(['package1/**']))
+        parser.feed(self.xml)
+        parser.close()
+        packages = parser.read_packages()
+        self.assertEqual(len(packages), 1)
+        self.assertEqual(len(packages[0].classes), 1)
+        self.assertEqual(len(packages[0].source_files), 1)
+
+        parser = ReportParser(ParsePlan.ALL,
+                              NameFilter(excludes=['**/Class1*']))
+        parser.feed(self.xml)
+        parser.close()
+        packages = parser.read_packages()
+        self.assertEqual(len(packages), 2)
+        self.assertEqual(len(packages[0].classes), 0)
+        self.assertEqual(len(packages[0].source_files), 0)
+
+    def test_find_package_ranges(self) -> None:
+        data = (
+            b'<report name="r"><sessioninfo id="s" start="1" dump="2"/>'
+            b'<package name="a"><class name="a/A"/></package>\n'
+            b'<package name="b"></package>'
+            b'<counter type="LINE" missed="1" covered="2"/></report>'
+        )
+        ranges = find_package_ranges(data)
+        assert ranges is not None
+        self.assertEqual(len(ranges), 2)
+        self.assertEqual(data[ranges[0][0]:ranges[0][1]],
+                         b'<package name="a"><class name="a/A"/></package>')
+        self.assertEqual(data[ranges[1][0]:ranges[1][1]],
+                         b'<package name="b"></package>')
+
+        self.assertEqual(find_package_ranges(b'<report name="r"/>'),
+                         ranges[:0])
+
+    def test_find_package_ranges_unexpected_layout(self) -> None:
+        for data in (
+            b'<report name="r"><package name="a"></report>',
+            b'<report name="r"><package name="a"></package><!-- comment -->'
+            b'<package name="b"></package></report>',
+        ):
+            with self.subTest(data=data):
+                self.assertIsNone(find_package_ranges(data))
+
+    def test_get_package_name(self) -> None:
+        data = b'<report><package name="com/acme"></package></report>'
+        self.assertEqual(get_package_name(data, 8), 'com/acme')
+        self.assertIsNone(get_package_name(b'<package name="a&amp;b">', 0))
+        self.assertIsNone(get_package_name(data, 0))
+
+    def test_feed_filtered_document(self) -> None:
+        data = (
+            b'<report name="test_project">'
+            b'<package name="package1"><class name="package1/A"/></package>\n'
+            b'<package name="package2"><class name="package2/A"/></package>'
+            b'<counter type="LINE" missed="3" covered="4"/>'
+            b'</report>'
+        )
+        parser = ReportParser(ParsePlan.ALL, NameFilter(['package2']))
+        self.assertTrue(parser.feed_filtered_document(data))
+        root = parser.close()
+        names = [package.name for package in parser.read_packages()]
+        expected_names: list[str] = ['package2']
+        self.assertEqual(names, expected_names)
+        self.assertEqual(root.attrib['name'], 'test_project')
+        self.assertEqual(root[0].tag, 'counter')
+
+        parser = ReportParser(ParsePlan.ALL, NameFilter(['package2']))
+        self.assertFalse(
+            parser.feed_filtered_document(b'<report name="r"></report>')
+        )
+
+    def test_not_a_report(self) -> None:
+        parser = ReportParser()
+        with self.assertRaises(XmlParsingException) as cm:
+            parser.feed(b'<test name="test"></test>')
+        self.assertEqual(str(cm.exception), "unexpected element tag 'test'")
+
+    def test_grouped_packages(self) -> None:
+        """Test that the packages of the groups of an aggregated report are
+        left in their groups."""
+        parser = ReportParser()
+        parser.feed(b'<report name="r"><group name="g">'
+                    b'<package name="package1"/></group></report>')
+        self.assertEqual(len(parser.read_packages()), 0)
+        report = parser.close()
+        self.assertEqual(len(report), 1)
+        self.assertEqual(report[0].tag, 'group')
+        self.assertEqual(report[0][0].tag, 'package')
+
+    def test_parse_error(self) -> None:
+        parser = ReportParser()
+        with self.assertRaises(ParseError) as cm:
+            parser.feed(b'<report name="test"><package></report>')
+        self.assertEqual(cm.exception.position, (1, 31))
+
+    def test_close_empty_document(self) -> None:
+        parser = ReportParser()
+        with self.assertRaises(ParseError) as cm:
+            parser.close()
+        self.assertEqual(str(cm.exception),
+                         'no element found: line 1, column 0')
@@ -0,0 +1,26 @@
+from unittest import TestCase
+
+from jacoco_summary.report_paths import expand_report_paths
+
+
+class TestReportPaths(TestCase):
+
+    def test_expand_report_paths(self) -> None:
+        expected: list[str] = [
+            'test/empty-class.xml',
+            'test/empty-package.xml',
+            'test/empty.xml',
+            'test/missing.xml',
+        ]
+        self.assertEqual(
+            expand_report_paths([
+                'test/empty*.xml',
+                'test/empty.xml',
+                'test/missing.xml',
+            ]),
+            expected
+        )
+
+    def test_expand_report_paths_no_match(self) -> None:
+        expected: list[str] = ['test/*.missing']
+        self.assertEqual(expand_report_paths(['test/*.missing']), expected)
@@ -0,0 +1,184 @@
+import io
+import os
+import shutil
+import socket
+from tempfile import TemporaryDirectory
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+from jacoco_summary.cli import cli
+from jacoco_summary.coverage_columns import CoverageColumnsView
+from jacoco_summary.report_client import get_member, query_server, read_message
+from jacoco_summary.report_server import ReportServer, create_server
+
+
+class TestReportServer(TestCase):
+
+    def start_server(self, paths: list[str]) -> ReportServer:
+        directory = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        server = create_server(os.path.join(directory.name, 'run', 'socket'),
+                               paths, cli)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+
+        def stop_server() -> None:
+            server.shutdown()
+            thread.join()
+            server.server_close()
+
+        self.addCleanup(stop_server)
+        return server
+
+    def test_query_server(self) -> None:
+        xml_file_path = os.path.abspath('test/jacoco.xml')
+        server = self.start_server([xml_file_path])
+
+        response = query_server(server.socket_path,
+                                ['cli', '--format', 'csv', 'package', '-l'],
+                                [xml_file_path])
+        self.assertEqual(response, (0, 'name\ntest1\ntest2\n', ''))
+
+        response = query_server(server.socket_path,
+                                ['cli', 'class', 'test1.Missing'],
+                                [xml_file_path])
+        self.assertEqual(
+            response,
+            (1, '', "cli: error: class 'test1.Missing' doesn't exists\n")
+        )
+
+        response = query_server(server.socket_path, ['cli', 'package'],
+                                [xml_file_path])
+        assert response is not None
+        self.assertEqual(response[0], 1)
+        self.assertIn('the following arguments are required: PACKAGE',
+                      response[2])
+
+    def test_query_server_compact_methods(self) -> None:
+        xml_file_path = os.path.abspath('test/jacoco.xml')
+        server = self.start_server([xml_file_path])
+        java_class = server.load_reports()[0].packages[0].classes[0]
+        self.assertIsInstance(java_class.methods, CoverageColumnsView)
+
+        response = query_server(
+            server.socket_path,
+            ['cli', '--format', 'csv', '--columns', 'name,line,instruction',
+             'class', 'test1.Class2'],
+            [xml_file_path]
+        )
+        self.assertEqual(response, (
+            0,
+            'name,line_missed,line_covered,line_ratio,instruction_missed,'
+            'instruction_covered,instruction_ratio\n'
+            '<init>,0,2,1.0,0,3,1.0\n'
+            'method1,1,2,0.6666666666666666,1,3,0.75\n'
+            'method2,1,2,0.6666666666666666,4,6,0.6\n'
+            'method3,2,0,0.0,4,0,0.0\n',
+            ''
+        ))
+
+    def test_load_reports_merged_once(self) -> None:
+        with TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, name)
+                     for name in ('jacoco.xml', 'baseline.xml')]
+            shutil.copyfile('test/jacoco.xml', paths[0])
+            shutil.copyfile('test/baseline.xml', paths[1])
+            server = create_server(os.path.join(directory, 'socket'), paths,
+                                   cli)
+            self.addCleanup(server.server_close)
+
+            report = server.load_reports()[0]
+            self.assertIs(server.load_reports()[0], report)
+            self.assertIsNotNone(report.get_package('test1'))
+
+            shutil.copyfile('test/jacoco.xml', paths[1])
+            os.utime(paths[1], ns=(0, 0))
+            self.assertIsNot(server.load_reports()[0], report)
+
+    def test_query_server_filtered(self) -> None:
+        xml_file_path = os.path.abspath('test/jacoco.xml')
+        server = self.start_server([xml_file_path])
+        response = query_server(
+            server.socket_path,
+            ['cli', '--format', 'csv', '--exclude', 'test1/**', 'file', '-l'],
+            [xml_file_path]
+        )
+        self.assertEqual(
+            response,
+            (0, 'name\ntest2/Class1.java\ntest2/Class2.java\n', '')
+        )
+
+    def test_query_server_not_served(self) -> None:
+        xml_file_path = os.path.abspath('test/jacoco.xml')
+        server = self.start_server([xml_file_path])
+
+        self.assertIsNone(query_server(
+            server.socket_path,
+            ['cli', 'package', '-l'],
+            [os.path.abspath('test/baseline.xml')]
+        ))
+        response = query_server(server.socket_path, ['cli', 'serve'],
+                                [xml_file_path])
+        self.assertEqual(response, (
+            1,
+            '',
+            'cli: error: only the package, class, file and lines subcommands '
+            'can be served\n'
+        ))
+        self.assertIsNone(query_server(server.socket_path + '.missing',
+                                       ['cli', 'package', '-l'],
+                                       [xml_file_path]))
+
+    def test_query_server_invalid_request(self) -> None:
+        server = self.start_server([os.path.abspath('test/jacoco.xml')])
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(server.socket_path)
+            client.sendall(b'{"args": "cli"}\n')
+            with client.makefile('rb') as response_file:
+                response = read_message(response_file)
+        self.assertEqual(get_member(response, 'error'), 'invalid request')
+
+    def test_query_server_loading_error(self) -> None:
+        xml_file_path = os.path.abspath('test/parse-error.xml')
+        server = self.start_server([xml_file_path])
+        response = query_server(server.socket_path, ['cli'], [xml_file_path])
+        assert response is not None
+        self.assertEqual(response[0], 1)
+        self.assertIn('failed to parse file', response[2])
+
+    def test_create_server(self) -> None:
+        server = self.start_server([os.path.abspath('test/jacoco.xml')])
+        self.assertEqual(os.stat(server.socket_path).st_mode & 0o777, 0o600)
+        with self.assertRaisesRegex(OSError, 'a server already listens on'):
+            create_server(server.socket_path, [], cli)
+
+    def test_create_server_stale_socket(self) -> None:
+        with TemporaryDirectory() as directory:
+            socket_path = os.path.join(directory, 'socket')
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+                stale.bind(socket_path)
+            server = create_server(socket_path, [], cli)
+            server.server_close()
+
+    def test_cli_uses_server(self) -> None:
+        xml_file_path = os.path.abspath('test/jacoco.xml')
+        server = self.start_server([xml_file_path])
+        runtime_directory = os.path.dirname(server.socket_path)
+        os.rename(server.socket_path,
+                  os.path.join(runtime_directory, 'jacoco-summary.sock'))
+
+        environ: dict[str, str] = {'XDG_RUNTIME_DIR': runtime_directory}
+        load_target = 'jacoco_summary.report_loader.load_report_groups'
+        with patch.dict('os.environ', environ), \
+                patch(load_target) as load, \
+                patch('sys.stdout', new=io.StringIO()) as fake_stdout:
+            status = cli(['cli', '-f', 'test/jacoco.xml', '--format', 'csv',
+                          'file', '-l'])
+        self.assertEqual(status, 0)
+        self.assertEqual(
+            fake_stdout.getvalue(),
+            'name\ntest1/Class1.java\ntest1/Class2.java\ntest2/Class1.java\n'
+            'test2/Class2.java\n'
+        )
+        load.assert_not_called()
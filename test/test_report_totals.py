@@ -0,0 +1,115 @@
+import gzip
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from xml.etree.ElementTree import ParseError
+
+from jacoco_summary.counter_type import CounterType
+from jacoco_summary.parse_plan import ParsePlan
+from jacoco_summary.report_totals import find_report_totals, read_report_totals
+from jacoco_summary.xml_parsing_exception import XmlParsingException
+
+
+REPORT_START: bytes = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    b'<!DOCTYPE report PUBLIC "-//JACOCO//DTD Report 1.1//EN" "report.dtd">'
+    b'<report name="a &amp; b">'
+    b'<sessioninfo id="session" start="1" dump="2"/>'
+)
+REPORT_COUNTERS: bytes = (
+    b'<counter type="INSTRUCTION" missed="1" covered="2"/>\n'
+    b'<counter type="BRANCH" missed="3" covered="4"/>\n'
+    b'<counter type="LINE" missed="5" covered="6"/>\n'
+    b'<counter type="METHOD" missed="7" covered="8"/>\n'
+)
+
+
+class TestReportTotals(TestCase):
+
+    def write_report(self, content: bytes) -> str:
+        directory = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        xml_file_path = os.path.join(directory.name, 'jacoco.xml')
+        with open(xml_file_path, 'wb') as xml_file:
+            xml_file.write(content)
+        return xml_file_path
+
+    def test_find_report_totals(self) -> None:
+        for previous in (
+            b'',
+            b'<package name="p"><counter type="LINE" missed="1" covered="1"/>'
+            b'</package>\n',
+        ):
+            with self.subTest(previous=previous):
+                report = find_report_totals(
+                    REPORT_START + previous + REPORT_COUNTERS
+                    + b'</report>\n'
+                )
+                assert report is not None
+                self.assertEqual(report.name, 'a & b')
+                self.assertEqual(report.branch_missed, 3)
+                self.assertEqual(report.branch_covered, 4)
+                self.assertEqual(report.line_missed, 5)
+                self.assertEqual(report.line_covered, 6)
+                self.assertEqual(report.method_missed, 7)
+                self.assertEqual(report.method_covered, 8)
+                self.assertEqual(len(report.packages), 0)
+
+    def test_find_report_totals_unexpected_layout(self) -> None:
+        for content in (
+            b'',
+            REPORT_START + REPORT_COUNTERS,
+            REPORT_START + REPORT_COUNTERS + b'</report><!-- end -->',
+            REPORT_START + b'<group name="g"></group>' + REPORT_COUNTERS
+            + b'</report>',
+            REPORT_START + REPORT_COUNTERS + b'<counter type="LINE">'
+            b'</counter></report>',
+            b'<report name="a" ' + REPORT_COUNTERS + b'</report>',
+        ):
+            with self.subTest(content=content):
+                self.assertIsNone(find_report_totals(content))
+
+    def test_read_report_totals(self) -> None:
+        report = read_report_totals('test/jacoco.xml')
+        self.assertEqual(report.name, 'test1')
+        self.assertEqual(report.line_missed, 15)
+        self.assertEqual(report.line_covered, 16)
+        self.assertEqual(len(report.packages), 0)
+        self.assertIsNone(report.extra_counters)
+
+    def test_read_report_totals_extra_counters(self) -> None:
+        plan = ParsePlan.TOTALS | ParsePlan.EXTRA_COUNTERS
+        for xml_file_path in 'test/jacoco.xml', self.write_report(
+            REPORT_START + REPORT_COUNTERS + b'</report><!-- end -->'
+        ):
+            with self.subTest(xml_file_path=xml_file_path):
+                report = read_report_totals(xml_file_path, plan)
+                self.assertIsNotNone(report.extra_counters)
+        report = read_report_totals('test/jacoco.xml', plan)
+        self.assertEqual(report.get_counter(CounterType.COMPLEXITY), (10, 9))
+
+    def test_read_report_totals_fallback(self) -> None:
+        report = read_report_totals(self.write_report(
+            REPORT_START + REPORT_COUNTERS + b'</report><!-- end -->'
+        ))
+        self.assertEqual(report.name, 'a & b')
+        self.assertEqual(report.line_missed, 5)
+        self.assertEqual(len(report.packages), 0)
+
+    def test_read_report_totals_compressed(self) -> None:
+        with open('test/jacoco.xml', 'rb') as xml_file:
+            xml_file_path = self.write_report(gzip.compress(xml_file.read()))
+        report = read_report_totals(xml_file_path)
+        self.assertEqual(report.name, 'test1')
+        self.assertEqual(report.line_missed, 15)
+        self.assertEqual(len(report.packages), 0)
+
+    def test_read_report_totals_errors(self) -> None:
+        with self.assertRaises(ParseError):
+            read_report_totals(self.write_report(b''))
+        with self.assertRaises(ParseError):
+            read_report_totals('test/parse-error.xml')
+        with self.assertRaises(XmlParsingException):
+            read_report_totals('test/no-report.xml')
+        with self.assertRaises(FileNotFoundError):
+            read_report_totals('test/missing.xml')
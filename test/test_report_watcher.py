@@ -0,0 +1,148 @@
+import io
+import os
+import shutil
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from jacoco_summary.incremental_report_loader import FileState
+from jacoco_summary.parse_plan import ParsePlan
+from jacoco_summary.report import Report
+from jacoco_summary.report_loader import ReportFileError
+from jacoco_summary.report_watcher import (
+    get_files_state,
+    wait_for_change,
+    watch_reports,
+)
+
+
+class FakeSleep:
+    '''Sleep function running an action at each call instead of waiting.'''
+
+    def __init__(self, actions: list[str], xml_file_path: str) -> None:
+        self.actions = actions
+        self.xml_file_path = xml_file_path
+        self.delays: list[float] = []
+        self.size = 0
+
+    def __call__(self, delay: float) -> None:
+        self.delays.append(delay)
+        action = self.actions.pop(0) if self.actions else 'interrupt'
+        match action:
+            case 'wait':
+                pass
+
+            case 'write':
+                # grow the file like a report being written
+                self.size += 1
+                with open(self.xml_file_path, 'ab') as xml_file:
+                    xml_file.write(b' ' * self.size)
+
+            case 'remove':
+                os.remove(self.xml_file_path)
+
+            case 'interrupt':
+                raise KeyboardInterrupt()
+
+            case _:
+                assert False, 'unreachable'
+
+
+class TestReportWatcher(TestCase):
+
+    def copy_report(self) -> str:
+        directory = TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(directory.cleanup)
+        xml_file_path = os.path.join(directory.name, 'jacoco.xml')
+        shutil.copyfile('test/jacoco.xml', xml_file_path)
+        return xml_file_path
+
+    def test_get_files_state(self) -> None:
+        xml_file_path = self.copy_report()
+        states = get_files_state([xml_file_path, 'test/missing.xml'])
+        self.assertEqual(len(states), 2)
+        self.assertIsNotNone(states[0])
+        self.assertIsNone(states[1])
+
+    def test_wait_for_change(self) -> None:
+        xml_file_path = self.copy_report()
+        states = get_files_state([xml_file_path])
+        sleep = FakeSleep(['wait', 'write', 'write', 'write', 'wait'],
+                          xml_file_path)
+        new_states = wait_for_change([xml_file_path], states, 1, 2, sleep)
+        self.assertEqual(new_states, get_files_state([xml_file_path]))
+        self.assertNotEqual(new_states, states)
+        # the writes are debounced until the file doesn't change for the
+        # settle time
+        expected_delays: list[float] = [1, 1, 2, 2, 2]
+        self.assertEqual(sleep.delays, expected_delays)
+
+    def test_wait_for_change_removed_file(self) -> None:
+        xml_file_path = self.copy_report()
+        states = get_files_state([xml_file_path])
+        sleep = FakeSleep(['remove', 'wait'], xml_file_path)
+        new_states = wait_for_change([xml_file_path], states, 1, 2, sleep)
+        expected_states: list[FileState | None] = [None]
+        self.assertEqual(new_states, expected_states)
+
+    def test_watch_reports(self) -> None:
+        xml_file_path = self.copy_report()
+        sleep = FakeSleep(['wait', 'write', 'wait'], xml_file_path)
+        displayed_reports: list[list[Report]] = []
+
+        def display(reports: list[Report]) -> int:
+            displayed_reports.append(reports)
+            return len(displayed_reports)
+
+        def on_error(error: ReportFileError) -> int:
+            self.fail(str(error))
+
+        with patch('sys.stdout', new=io.StringIO()):
+            status = watch_reports([[xml_file_path]], ParsePlan.ALL, display,
+                                   on_error, sleep)
+        self.assertEqual(status, 2)
+        self.assertEqual(len(displayed_reports), 2)
+        self.assertEqual(len(displayed_reports[0]), 1)
+        # only the counters of the report are reparsed, since the packages
+        # didn't change
+        self.assertIsNot(displayed_reports[1][0], displayed_reports[0][0])
+        self.assertIs(displayed_reports[1][0].packages[0],
+                      displayed_reports[0][0].packages[0])
+
+    def test_watch_reports_merged(self) -> None:
+        xml_file_path = self.copy_report()
+        sleep = FakeSleep([], xml_file_path)
+        displayed_reports: list[list[Report]] = []
+
+        def display(reports: list[Report]) -> int:
+            displayed_reports.append(reports)
+            return 0
+
+        def on_error(error: ReportFileError) -> int:
+            self.fail(str(error))
+
+        with patch('sys.stdout', new=io.StringIO()):
+            status = watch_reports([[xml_file_path, 'test/baseline.xml']],
+                                   ParsePlan.ALL, display, on_error, sleep)
+        self.assertEqual(status, 0)
+        self.assertEqual(len(displayed_reports), 1)
+        self.assertEqual(len(displayed_reports[0]), 1)
+
+    def test_watch_reports_error(self) -> None:
+        xml_file_path = self.copy_report()
+        sleep = FakeSleep(['remove', 'wait'], xml_file_path)
+        errors: list[ReportFileError] = []
+
+        def display(reports: list[Report]) -> int:
+            return len(reports) - 1
+
+        def on_error(error: ReportFileError) -> int:
+            errors.append(error)
+            return 1
+
+        with patch('sys.stdout', new=io.StringIO()):
+            status = watch_reports([[xml_file_path]], ParsePlan.ALL, display,
+                                   on_error, sleep)
+        self.assertEqual(status, 1)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0].path, xml_file_path)
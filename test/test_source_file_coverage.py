@@ -1,6 +1,7 @@
 from unittest import TestCase
 from xml.etree.ElementTree import fromstring
 
+from jacoco_summary.parse_plan import ParsePlan
 from jacoco_summary.source_file_coverage import SourceFileCoverage
 
 
@@ -27,3 +28,20 @@ class TestSourceFileCoverage(TestCase):
         self.assertEqual(coverage.line_covered, 5)
         self.assertEqual(coverage.method_missed, 8)
         self.assertEqual(coverage.method_covered, 9)
+        assert coverage.lines is not None
+        self.assertEqual(len(coverage.lines), 2)
+        line = coverage.lines.get_line(6)
+        assert line is not None
+        self.assertEqual(line.covered_instructions, 1)
+
+    def test_create_from_xml_file_without_lines(self) -> None:
+        element = fromstring(
+            '<sourcefile name="Class1.java">\n'
+            '    <line nr="5" mi="0" ci="2" mb="0" cb="0"/>\n'
+            '    <counter type="LINE" missed="0" covered="1"/>\n'
+            '</sourcefile>\n'
+        )
+        coverage = SourceFileCoverage.from_xml_element(element,
+                                                       ParsePlan.SOURCE_FILES)
+        self.assertEqual(coverage.line_covered, 1)
+        self.assertIsNone(coverage.lines)
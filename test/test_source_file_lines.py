@@ -0,0 +1,112 @@
+from unittest import TestCase
+from xml.etree.ElementTree import fromstring
+
+from jacoco_summary.line_status import LineStatus
+from jacoco_summary.source_file_lines import (
+    LineCoverage,
+    SourceFileLines,
+)
+
+
+class TestSourceFileLines(TestCase):
+
+    def setUp(self) -> None:
+        self.lines = SourceFileLines.from_lines([
+            LineCoverage(3, 0, 2, 0, 0),
+            LineCoverage(4, 0, 1, 1, 1),
+            LineCoverage(7, 2, 0, 0, 0),
+            LineCoverage(8, 1, 0, 2, 0),
+            LineCoverage(12, 0, 4, 0, 2),
+        ])
+
+    @staticmethod
+    def get_numbers(lines: SourceFileLines) -> list[int]:
+        return [line.number for line in lines]
+
+    def test_create_from_xml_elements(self) -> None:
+        element = fromstring(
+            '<sourcefile name="Class1.java">\n'
+            '    <line nr="5" mi="0" ci="2" mb="0" cb="0"/>\n'
+            '    <line nr="6" mi="1" ci="0" mb="2" cb="0"/>\n'
+            '    <line nr="9" mi="70000" ci="0" mb="0" cb="0"/>\n'
+            '</sourcefile>\n'
+        )
+        lines = SourceFileLines.from_xml_elements(element.findall('line'))
+        expected_numbers: list[int] = [5, 6, 9]
+        self.assertEqual(self.get_numbers(lines), expected_numbers)
+        self.assertEqual(lines[1].missed_branches, 2)
+        self.assertEqual(lines[2].missed_instructions, 0xFFFF)
+
+    def test_create_from_unsorted_xml_elements(self) -> None:
+        element = fromstring(
+            '<sourcefile name="Class1.java">\n'
+            '    <line nr="9" mi="1" ci="0" mb="0" cb="0"/>\n'
+            '    <line nr="5" mi="0" ci="2" mb="0" cb="0"/>\n'
+            '</sourcefile>\n'
+        )
+        lines = SourceFileLines.from_xml_elements(element.findall('line'))
+        expected_numbers: list[int] = [5, 9]
+        self.assertEqual(self.get_numbers(lines), expected_numbers)
+        self.assertEqual(lines[1].missed_instructions, 1)
+
+    def test_get_line(self) -> None:
+        line = self.lines.get_line(8)
+        assert line is not None
+        self.assertEqual(line.number, 8)
+        self.assertEqual(line.missed_instructions, 1)
+        self.assertEqual(line.missed_branches, 2)
+        self.assertEqual(line.get_status(), LineStatus.NOT_COVERED)
+
+        self.assertIsNone(self.lines.get_line(1))
+        self.assertIsNone(self.lines.get_line(5))
+        self.assertIsNone(self.lines.get_line(13))
+
+    def test_get_ranges(self) -> None:
+        expected: list[tuple[int, int, LineStatus]] = [
+            (3, 3, LineStatus.FULLY_COVERED),
+            (4, 4, LineStatus.PARTLY_COVERED),
+            (7, 8, LineStatus.NOT_COVERED),
+            (12, 12, LineStatus.FULLY_COVERED),
+        ]
+        ranges: list[tuple[int, int, LineStatus]] = list(
+            self.lines.get_ranges()
+        )
+        self.assertEqual(ranges, expected)
+
+    def test_get_ranges_empty(self) -> None:
+        self.assertEqual(len(list(SourceFileLines().get_ranges())), 0)
+
+    def test_get_ranges_coverage(self) -> None:
+        covered, missed, missed_ranges = self.lines.get_ranges_coverage(
+            [(1, 3), (5, 8), (10, 20)]
+        )
+        self.assertEqual(covered, 2)
+        self.assertEqual(missed, 2)
+        expected: list[tuple[int, int]] = [(7, 8)]
+        self.assertEqual(missed_ranges, expected)
+
+    def test_get_ranges_coverage_no_lines(self) -> None:
+        covered, missed, missed_ranges = self.lines.get_ranges_coverage(
+            [(1, 2), (5, 6), (13, 20)]
+        )
+        self.assertEqual(covered, 0)
+        self.assertEqual(missed, 0)
+        self.assertEqual(len(missed_ranges), 0)
+
+    def test_merge(self) -> None:
+        other = SourceFileLines.from_lines([
+            LineCoverage(4, 0, 1, 0, 2),
+            LineCoverage(5, 1, 0, 0, 0),
+        ])
+        merged = SourceFileLines.merge([self.lines, other])
+        expected_numbers: list[int] = [3, 4, 5, 7, 8, 12]
+        self.assertEqual(self.get_numbers(merged), expected_numbers)
+        line = merged.get_line(4)
+        assert line is not None
+        self.assertEqual(line.covered_instructions, 2)
+        self.assertEqual(line.missed_branches, 1)
+        self.assertEqual(line.covered_branches, 3)
+        self.assertEqual(len(self.lines), 5, 'the lines must not be modified')
+
+    def test_append_unsorted(self) -> None:
+        self.assertRaises(AssertionError, self.lines.append, LineCoverage(12))
@@ -0,0 +1,69 @@
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from benchmark.startup import (
+    SCENARIOS,
+    StartupMeasure,
+    check_measure,
+    get_environment,
+    measure_scenario,
+    parse_import_times,
+)
+
+
+IMPORT_TIME_OUTPUT: str = '''\
+import time: self [us] | cumulative | imported package
+import time:       150 |        150 |   _io
+import time:       726 |        876 | jacoco_summary
+import time:        61 |        937 |     jacoco_summary.config
+Coverage 100%
+'''
+
+
+class TestStartup(TestCase):
+
+    def test_parse_import_times(self) -> None:
+        expected: dict[str, int] = {
+            '_io': 150,
+            'jacoco_summary': 726,
+            'jacoco_summary.config': 61,
+        }
+        self.assertEqual(parse_import_times(IMPORT_TIME_OUTPUT), expected)
+
+    def test_startup_measure_json(self) -> None:
+        measure = StartupMeasure(0.1, 0.02, ['a', 'b'])
+        copy = StartupMeasure.from_json(measure.to_json())
+        self.assertEqual(copy.seconds, 0.1)
+        self.assertEqual(copy.import_seconds, 0.02)
+        self.assertEqual(copy.modules, measure.modules)
+
+        for invalid in None, {'seconds': 1, 'import_seconds': 1}, \
+                {'seconds': 1, 'import_seconds': 1, 'modules': [1]}:
+            with self.subTest(invalid=invalid):
+                with self.assertRaises(ValueError):
+                    StartupMeasure.from_json(invalid)
+
+    def test_check_measure(self) -> None:
+        budget = StartupMeasure(0.1, 0.02, ['a', 'b'])
+        self.assertFalse(
+            check_measure(StartupMeasure(0.14, 0.01, ['a']), budget, 1.5)
+        )
+        expected: list[str] = [
+            'new modules: c, d',
+            'time 2.00x the budget',
+            'import time 1.60x the budget',
+        ]
+        self.assertEqual(
+            check_measure(StartupMeasure(0.2, 0.032, ['a', 'd', 'c']), budget,
+                          1.5),
+            expected
+        )
+
+    def test_version_imports(self) -> None:
+        with TemporaryDirectory() as directory:
+            measure = measure_scenario(SCENARIOS['version'],
+                                       get_environment(directory), 1)
+        self.assertIn('jacoco_summary.cli', measure.modules)
+        for module in ('jacoco_summary.report', 'jacoco_summary.table',
+                       'xml.etree.ElementTree', 'concurrent.futures'):
+            self.assertNotIn(module, measure.modules)
@@ -1,20 +1,36 @@
 """Test the table module."""
 
 from io import StringIO
+import os
 import sys
 from typing import Callable, ParamSpec
 from unittest import TestCase
+from unittest.mock import patch
 
+from jacoco_summary.column_name import ColumnName
 from jacoco_summary.coverage import Coverage
+from jacoco_summary.diff_coverage import DiffCoverage
 from jacoco_summary.config import COLUMNS_ORDER
+from jacoco_summary.report_comparison import CoverageChange
+from jacoco_summary.source_file_lines import LineCoverage, SourceFileLines
 from jacoco_summary.table import (
+    format_coverage_change,
+    generate_comparison_table,
+    generate_diff_table,
+    generate_lines_table,
     generate_table,
+    get_cells_width,
+    get_stream_columns_size,
+    get_terminal_names_width,
+    print_coverage_table,
     print_table_cell,
     print_table_end_line,
     print_table_header,
     print_table_body,
     print_table_footer,
-    print_table
+    print_table,
+    render_table,
+    truncate_name,
 )
 
 
@@ -80,6 +96,66 @@ class TestTable(TestCase):
             Coverage('Item 5', 1, 0, 1, 1, 0, 1)
         ], COLUMNS_ORDER), expected)
 
+    def test_generate_table_bar_width(self) -> None:
+        """Test generating a table with a custom bar width."""
+        expected = [
+            ['Name', 'Line'],
+            ['Item 1', '\x1b[32m━━\x1b[31m╺\x1b[0m  67%'],
+        ]
+        self.assertEqual(generate_table([
+            Coverage('Item 1', 0, 0, 1, 2, 0, 0),
+        ], [ColumnName.NAME, ColumnName.LINE], 3), expected)
+
+    def test_generate_lines_table(self) -> None:
+        """Test generating the table of the lines not fully covered."""
+        expected = [
+            ['Lines', 'Status'],
+            ['2', '\x1b[33mpartly covered\x1b[0m'],
+            ['3-5', '\x1b[31mnot covered\x1b[0m'],
+        ]
+        self.assertEqual(generate_lines_table(SourceFileLines.from_lines([
+            LineCoverage(1, 0, 1, 0, 0),
+            LineCoverage(2, 0, 1, 1, 1),
+            LineCoverage(3, 2, 0, 0, 0),
+            LineCoverage(5, 1, 0, 0, 0),
+            LineCoverage(6, 0, 3, 0, 0),
+        ])), expected)
+
+    def test_generate_diff_table(self) -> None:
+        """Test generating the table of the coverage of changed lines."""
+        expected = [
+            ['Name', 'Line', 'Missed lines'],
+            ['File1.java', '\x1b[32m━━━━━━\x1b[31m╺━━━\x1b[0m  67%', '3-4, 9'],
+            ['Total', '\x1b[32m━━━━━━\x1b[31m╺━━━\x1b[0m  67%', ''],
+        ]
+        self.assertEqual(generate_diff_table(
+            [DiffCoverage('File1.java', line_missed=3, line_covered=6,
+                          missed_lines=[(3, 4), (9, 9)])],
+            Coverage('Total', line_missed=3, line_covered=6)
+        ), expected)
+
+    def test_format_coverage_change(self) -> None:
+        """Test formatting the change of a percentage of covered items."""
+        self.assertEqual(format_coverage_change(1, 3, 0, 4),
+                         ' 75% → 100% \x1b[32m+25.0\x1b[0m')
+        self.assertEqual(format_coverage_change(0, 4, 2, 2),
+                         '100% →  50% \x1b[31m-50.0\x1b[0m')
+        self.assertEqual(format_coverage_change(1, 3, 2, 6), ' 75% →  75%')
+        self.assertEqual(format_coverage_change(0, 0, 1, 0), ' n/a →   0%')
+
+    def test_generate_comparison_table(self) -> None:
+        """Test generating the table of the changes of coverage."""
+        expected = [
+            ['Name', 'Branch', 'Line', 'Method'],
+            ['Class1', '100% →  50% \x1b[31m-50.0\x1b[0m',
+             ' 80% →  60% \x1b[31m-20.0\x1b[0m', ' 75% →  75%'],
+        ]
+        self.assertEqual(generate_comparison_table([CoverageChange(
+            'Class1',
+            Coverage('Class1', 0, 4, 2, 8, 1, 3),
+            Coverage('Class1', 2, 2, 4, 6, 1, 3)
+        )]), expected)
+
     def test_generate_table_empty_table(self) -> None:
         """Test generating an empty table."""
         expected = [['Name', 'Branch', 'Line', 'Method']]
@@ -163,3 +239,137 @@ class TestTable(TestCase):
 
         empty_table: list[str] = []
         self.assertRaises(AssertionError, print_table, empty_table)
+
+    def test_render_table(self) -> None:
+        tab: list[list[str]] = [
+            ['column 1', 'column 2'],
+            ['cell 1', 'big cell 2'],
+        ]
+        self.assertEqual(
+            render_table(tab),
+            '┌──────────┬────────────┐\n'
+            '│ column 1 │ column 2   │\n'
+            '├──────────┼────────────┤\n'
+            '│ cell 1   │ big cell 2 │\n'
+            '└──────────┴────────────┘\n'
+        )
+        self.assertEqual(len(tab), 2, 'the table must not be modified')
+
+    def test_render_table_header_only(self) -> None:
+        self.assertEqual(
+            render_table([['column 1']]),
+            '┌──────────┐\n'
+            '│ column 1 │\n'
+            '├──────────┤\n'
+            '└──────────┘\n'
+        )
+
+    def test_render_table_wide_characters(self) -> None:
+        self.assertEqual(
+            render_table([['column'], ['日本語.Test']]),
+            '┌─────────────┐\n'
+            '│ column      │\n'
+            '├─────────────┤\n'
+            '│ 日本語.Test │\n'
+            '└─────────────┘\n'
+        )
+
+    def test_truncate_name(self) -> None:
+        self.assertEqual(truncate_name('com/acme/Main', 13), 'com/acme/Main')
+        self.assertEqual(truncate_name('com/acme/Main', 10), '…acme/Main')
+        self.assertEqual(truncate_name('com/acme/Main', 1), '…')
+        # a wide character doesn't fit in the last column
+        self.assertEqual(truncate_name('日本語/Test', 8), '…語/Test')
+        self.assertEqual(truncate_name('日本語/Test', 7), '…/Test')
+
+    def test_get_cells_width(self) -> None:
+        coverages = [
+            Coverage('Item 1', line_missed=12),
+            Coverage('日本語.Test', line_missed=3, line_covered=1000),
+        ]
+        columns: list[ColumnName] = [
+            ColumnName.NAME,
+            ColumnName.LINE,
+            ColumnName.LINE_MISSED,
+            ColumnName.LINE_COVERED,
+        ]
+        expected: list[int] = [11, 15, 2, 4]
+        self.assertEqual(get_cells_width(coverages, columns), expected)
+        expected = [0, 8, 2, 4]
+        self.assertEqual(get_cells_width(coverages, columns, False, 3),
+                         expected)
+        expected = [0, 15, 0, 0]
+        self.assertEqual(get_cells_width([], columns), expected)
+
+    def test_get_stream_columns_size(self) -> None:
+        coverages = [Coverage('Item 1', line_missed=12)]
+        columns: list[ColumnName] = [
+            ColumnName.NAME,
+            ColumnName.LINE,
+            ColumnName.LINE_MISSED,
+        ]
+        expected: list[int] = [6, 15, 11]
+        self.assertEqual(get_stream_columns_size(coverages, columns),
+                         expected)
+        expected = [20, 15, 11]
+        self.assertEqual(get_stream_columns_size(coverages, columns, 20),
+                         expected)
+        expected = [4, 15, 11]
+        self.assertEqual(get_stream_columns_size(coverages, columns, 2),
+                         expected)
+        with patch('shutil.get_terminal_size',
+                   return_value=os.terminal_size((41, 24))):
+            expected = [5, 15, 11]
+            self.assertEqual(
+                get_stream_columns_size(coverages, columns, fit_terminal=True),
+                expected
+            )
+
+    def test_get_terminal_names_width(self) -> None:
+        columns_size: list[int] = [0, 15, 15, 15]
+        with patch('shutil.get_terminal_size',
+                   return_value=os.terminal_size((80, 24))):
+            self.assertEqual(
+                get_terminal_names_width(COLUMNS_ORDER, columns_size),
+                22
+            )
+        with patch('shutil.get_terminal_size',
+                   return_value=os.terminal_size((40, 24))):
+            self.assertEqual(
+                get_terminal_names_width(COLUMNS_ORDER, columns_size),
+                4
+            )
+
+    def test_print_coverage_table(self) -> None:
+        """Test that a streamed table is the same as a rendered table when
+        the names fit."""
+        coverages = [
+            Coverage('Item 1', 0, 0, 0, 0, 0, 0),
+            Coverage('Item 2', 0, 1, 0, 1, 0, 1),
+            Coverage('Item 4', 1, 1, 1, 1, 1, 1),
+        ]
+        self.assert_print(
+            render_table(generate_table(coverages, COLUMNS_ORDER)),
+            print_coverage_table,
+            iter(coverages),
+            COLUMNS_ORDER,
+            get_stream_columns_size(coverages, COLUMNS_ORDER)
+        )
+
+    def test_print_coverage_table_truncated(self) -> None:
+        self.assert_print(
+            '┌────────┬─────────────┬─────────────┐\n'
+            '│ Name   │ Line        │ Line missed │\n'
+            '├────────┼─────────────┼─────────────┤\n'
+            '│ …lass1 │ \x1b[31m━━━━━━\x1b[0m   0% │ 1           │\n'
+            '│ Class2 │ \x1b[32m━━━━━━\x1b[0m 100% │ 0           │\n'
+            '└────────┴─────────────┴─────────────┘\n',
+            print_coverage_table,
+            [
+                Coverage('test/Class1', line_missed=1),
+                Coverage('Class2', line_covered=1),
+            ],
+            [ColumnName.NAME, ColumnName.LINE, ColumnName.LINE_MISSED],
+            [6, 11, 11],
+            6
+        )
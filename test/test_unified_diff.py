@@ -0,0 +1,67 @@
+from unittest import TestCase
+
+from jacoco_summary.unified_diff import (
+    get_diff_path,
+    merge_ranges,
+    parse_unified_diff,
+)
+
+
+class TestUnifiedDiff(TestCase):
+
+    def test_get_diff_path(self) -> None:
+        self.assertEqual(get_diff_path('b/src/Main.java\n'), 'src/Main.java')
+        self.assertEqual(get_diff_path('src/Main.java\t2024-01-01\n'),
+                         'src/Main.java')
+        self.assertIsNone(get_diff_path('/dev/null\n'))
+
+    def test_merge_ranges(self) -> None:
+        expected: list[tuple[int, int]] = [(1, 5), (7, 7), (9, 12)]
+        self.assertEqual(
+            merge_ranges([(9, 10), (1, 2), (3, 4), (7, 7), (2, 5), (11, 12)]),
+            expected
+        )
+
+    def test_parse_unified_diff(self) -> None:
+        with open('test/changes.diff', encoding='utf-8') as diff_file:
+            changed_lines = parse_unified_diff(diff_file)
+        expected: dict[str, list[tuple[int, int]]] = {
+            'src/main/java/test1/Class2.java': [(5, 6), (9, 9), (16, 18)],
+            'README.md': [(1, 1)],
+        }
+        self.assertEqual(changed_lines, expected)
+
+    def test_parse_unified_diff_new_and_deleted_files(self) -> None:
+        changed_lines = parse_unified_diff([
+            '--- /dev/null\n',
+            '+++ b/New.java\n',
+            '@@ -0,0 +1,2 @@\n',
+            '+class New {\n',
+            '+}\n',
+            '--- a/Old.java\n',
+            '+++ /dev/null\n',
+            '@@ -1,2 +0,0 @@\n',
+            '-class Old {\n',
+            '-}\n',
+            '--- a/Same.java\n',
+            '+++ b/Same.java\n',
+            '@@ -3 +3 @@\n',
+            '-    int a;\n',
+            '+    int b;\n',
+        ])
+        expected: dict[str, list[tuple[int, int]]] = {
+            'New.java': [(1, 2)],
+            'Same.java': [(3, 3)],
+        }
+        self.assertEqual(changed_lines, expected)
+
+    def test_parse_unified_diff_removed_lines_only(self) -> None:
+        changed_lines = parse_unified_diff([
+            '--- a/Main.java\n',
+            '+++ b/Main.java\n',
+            '@@ -1,3 +1,2 @@\n',
+            ' class Main {\n',
+            '-    int a;\n',
+            ' }\n',
+        ])
+        self.assertEqual(len(changed_lines), 0)
@@ -2,7 +2,12 @@
 
 from unittest import TestCase
 
-from jacoco_summary.utils import get_string_width, percentage_bar
+from jacoco_summary.utils import (
+    get_character_width,
+    get_percentage_bar_table,
+    get_string_width,
+    percentage_bar,
+)
 
 
 class TestPercentageBar(TestCase):
@@ -43,6 +48,46 @@ class TestPercentageBar(TestCase):
             '\x1b[30m━━━━━━━━━━\x1b[0m  n/a'
         )
 
+    def test_percentage_bar_width(self) -> None:
+        """Test percentage_bar with a custom width."""
+        self.assertEqual(
+            percentage_bar(3, 1, 4),
+            '\x1b[32m━\x1b[31m╺━━\x1b[0m  25%'
+        )
+        self.assertEqual(
+            percentage_bar(0, 0, 4),
+            '\x1b[30m━━━━\x1b[0m  n/a'
+        )
+
+    def test_percentage_bar_rounding(self) -> None:
+        """Test percentage_bar fills a segment only once it is reached."""
+        self.assertEqual(
+            percentage_bar(1001, 999),
+            '\x1b[32m━━━━\x1b[31m╺━━━━━\x1b[0m  50%'
+        )
+
+
+class TestPercentageBarTable(TestCase):
+    """Test the get_percentage_bar_table function."""
+
+    def test_get_percentage_bar_table(self) -> None:
+        """Test the tables are built once per width."""
+        table = get_percentage_bar_table(12)
+        self.assertIs(get_percentage_bar_table(12), table)
+        self.assertIsNot(get_percentage_bar_table(13), table)
+        self.assertEqual(table.width, 12)
+        self.assertEqual(len(table.bars), 13)
+
+    def test_string_width(self) -> None:
+        """Test the displayed width of the bars of a table."""
+        table = get_percentage_bar_table(7)
+        self.assertEqual(table.string_width, 12)
+        for missed, covered in ((0, 0), (0, 1), (1, 0), (1, 2)):
+            self.assertEqual(
+                get_string_width(table.format(missed, covered)),
+                table.string_width
+            )
+
 
 class TestGetStringWidth(TestCase):
     """Test the get_string_width function."""
@@ -57,3 +102,31 @@ class TestGetStringWidth(TestCase):
             get_string_width('\x1b[32mHello, \x1b[33mWorld!\x1b[0m'),
             13
         )
+
+    def test_get_string_width_with_color(self) -> None:
+        """Test get_string_width with the escape sequences of the colors."""
+        self.assertEqual(
+            get_string_width('\x1b[32m━━━━━\x1b[31m╺━━━━\x1b[0m  50%'),
+            15
+        )
+
+    def test_get_string_width_with_wide_characters(self) -> None:
+        """Test get_string_width with East Asian wide characters."""
+        self.assertEqual(get_string_width('日本語'), 6)
+        self.assertEqual(get_string_width('ＡＢ.c'), 6)
+
+    def test_get_string_width_with_combining_characters(self) -> None:
+        """Test get_string_width with combining characters."""
+        self.assertEqual(get_string_width('e\u0301te\u0301'), 3)
+
+
+class TestGetCharacterWidth(TestCase):
+    """Test the get_character_width function."""
+
+    def test_get_character_width(self) -> None:
+        """Test get_character_width with the kinds of characters."""
+        self.assertEqual(get_character_width('a'), 1)
+        self.assertEqual(get_character_width('━'), 1)
+        self.assertEqual(get_character_width('語'), 2)
+        self.assertEqual(get_character_width('\u0301'), 0)
+        self.assertEqual(get_character_width('\u200d'), 0)